@@ -145,6 +145,56 @@ namespace ast_common
         std::string constant_number;
     };
 
+    // value of a number token, with its scale factor suffix if any
+    inline double number_value(std::string value)
+    {
+        switch(value.back())
+        {
+            case 'u': case 'U':
+                value.pop_back();
+                value += "e-6";
+                break;
+            case 'n': case 'N':
+                value.pop_back();
+                value += "e-9";
+                break;
+            case 'p': case 'P':
+                value.pop_back();
+                value += "e-12";
+                break;
+            case 'f': case 'F':
+                value.pop_back();
+                value += "e-15";
+                break;
+            case 'a': case 'A':
+                value.pop_back();
+                value += "e-18";
+                break;
+            case 'm': case 'M':
+                value.pop_back();
+                value += "e-3";
+                break;
+            case 'k': case 'K':
+                value.pop_back();
+                value += "e3";
+                break;
+            case 'x': case 'X':
+                value.pop_back();
+                value += "e6";
+                break;
+            case 'g': case 'G':
+                value.pop_back();
+                value += "e9";
+                break;
+        }
+
+        std::istringstream in_value(value);
+        double v;
+        in_value >> v;
+
+        return v;
+    }
+
     template <typename Grammar>
     struct evaluator;
 
@@ -514,53 +564,7 @@ namespace ast_common
 
         double operator()(number const& x) 
         { 
-            std::string value = x.constant_number;
-
-            switch(value.back())
-            {
-                case 'u': case 'U':
-                    value.pop_back();
-                    value += "e-6";
-                    break;
-                case 'n': case 'N':
-                    value.pop_back();
-                    value += "e-9";
-                    break;
-                case 'p': case 'P':
-                    value.pop_back();
-                    value += "e-12";
-                    break;
-                case 'f': case 'F':
-                    value.pop_back();
-                    value += "e-15";
-                    break;
-                case 'a': case 'A':
-                    value.pop_back();
-                    value += "e-18";
-                    break;
-                case 'm': case 'M':
-                    value.pop_back();
-                    value += "e-3";
-                    break;
-                case 'k': case 'K':
-                    value.pop_back();
-                    value += "e3";
-                    break;
-                case 'x': case 'X':
-                    value.pop_back();
-                    value += "e6";
-                    break;
-                case 'g': case 'G':
-                    value.pop_back();
-                    value += "e9";
-                    break;
-            }
-
-            std::istringstream in_value(value);
-            double v;
-            in_value >> v;
-
-            return v; 
+            return number_value(x.constant_number);
         }
 
         double operator()(operation const& x, double lhs)
@@ -106,4 +106,20 @@ BOOST_PYTHON_MODULE(SpiritExprCommon)
     boost::python::class_<HSPICEExprBoostParser>("HSPICEExprBoostParser")
         .def("parseExpr", &HSPICEExprBoostParser::parseExpr)
         ;
+
+    boost::python::class_<ParamEvaluator, boost::noncopyable>("ParamEvaluator", boost::python::no_init)
+        .def("define", &ParamEvaluator::define)
+        .def("define_function", &ParamEvaluator::define_function)
+        .def("evaluate", &ParamEvaluator::evaluate)
+        .def("evaluate_params", &ParamEvaluator::evaluate_params)
+        .def("evaluate_expressions", &ParamEvaluator::evaluate_expressions)
+        .def("clear", &ParamEvaluator::clear)
+        .def("__len__", &ParamEvaluator::param_count)
+        ;
+
+    boost::python::class_<HSPICEParamEvaluator, boost::python::bases<ParamEvaluator>, boost::noncopyable>("HSPICEParamEvaluator")
+        ;
+
+    boost::python::class_<SpectreParamEvaluator, boost::python::bases<ParamEvaluator>, boost::noncopyable>("SpectreParamEvaluator")
+        ;
 }
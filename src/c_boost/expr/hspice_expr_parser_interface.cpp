@@ -67,3 +67,20 @@ BoostParsedExpr HSPICEExprBoostParser::parseExpr(std::string expr)
 
     return parsedExpr;
 }
+
+
+bool HSPICEParamEvaluator::parse(const std::string& text, ast_common::root& top) const
+{
+    typedef std::string::const_iterator iterator_type;
+    typedef HSPICEArithmeticGrammar<iterator_type> grammar;
+
+    // building the grammar costs more than parsing a parameter, so it is
+    // built once
+    static const grammar g;
+
+    std::string::const_iterator start = text.begin();
+    std::string::const_iterator end = text.end();
+    bool r = phrase_parse(start, end, g, boost::spirit::ascii::space, top);
+
+    return r && start == end;
+}
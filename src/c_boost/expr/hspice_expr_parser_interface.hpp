@@ -27,6 +27,7 @@
 #include "ast_common.hpp"
 #include "boost_expr_parser_common.h"
 #include "expr_parser_interface.hpp"
+#include "param_evaluator.hpp"
 
 #include <boost/algorithm/string.hpp>
 #include <boost/python.hpp>
@@ -55,4 +56,15 @@ class HSPICEExprBoostParser
 };
 
 
+// ParamEvaluator for HSPICE expressions; names are case insensitive
+class HSPICEParamEvaluator : public ParamEvaluator
+{
+    public:
+        HSPICEParamEvaluator() : ParamEvaluator(true) { }
+
+    protected:
+        bool parse(const std::string& text, ast_common::root& top) const;
+};
+
+
 #endif
@@ -0,0 +1,673 @@
+//-------------------------------------------------------------------------
+//   Copyright 2002-2020 National Technology & Engineering Solutions of
+//   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+//   NTESS, the U.S. Government retains certain rights in this software.
+//
+//   This file is part of the Xyce(TM) XDM Netlist Translator.
+//
+//   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+//   it under the terms of the GNU General Public License as published by
+//   the Free Software Foundation, either version 3 of the License, or
+//   (at your option) any later version.
+//
+//   Xyce(TM) XDM is distributed in the hope that it will be useful,
+//   but WITHOUT ANY WARRANTY; without even the implied warranty of
+//   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+//   GNU General Public License for more details.
+//
+//   You should have received a copy of the GNU General Public License
+//   along with the Xyce(TM) XDM Netlist Translator.
+//   If not, see <http://www.gnu.org/licenses/>.
+//-------------------------------------------------------------------------
+
+
+#include "param_evaluator.hpp"
+
+#include <boost/algorithm/string.hpp>
+
+#include <cmath>
+#include <limits>
+#include <utility>
+
+
+namespace
+{
+    const double not_a_constant = std::numeric_limits<double>::quiet_NaN();
+
+    // user functions calling each other deeper than this are taken to recurse
+    const int max_call_depth = 256;
+
+    // removes the braces or quotes around a whole expression
+    std::string strip_delimiters(std::string text)
+    {
+        boost::trim(text);
+        if(text.size() >= 2 && ((text.front() == '{' && text.back() == '}') ||
+                                (text.front() == '\'' && text.back() == '\'')))
+        {
+            text = text.substr(1, text.size() - 2);
+            boost::trim(text);
+        }
+        return text;
+    }
+
+    // splits "name(arg, ...)" into the name and its top level arguments
+    void split_call(const std::string& text, std::string& name, std::vector<std::string>& args)
+    {
+        size_t open = text.find('(');
+        name = boost::trim_copy(text.substr(0, open));
+        if(open == std::string::npos)
+        {
+            return;
+        }
+
+        size_t close = text.rfind(')');
+        if(close == std::string::npos || close < open)
+        {
+            close = text.size();
+        }
+
+        int depth = 0;
+        std::string current;
+        for(size_t i = open + 1; i < close; i++)
+        {
+            char c = text[i];
+            if(c == '(')
+            {
+                depth++;
+            }
+            else if(c == ')')
+            {
+                depth--;
+            }
+            else if(c == ',' && depth == 0)
+            {
+                args.push_back(boost::trim_copy(current));
+                current.clear();
+                continue;
+            }
+            current += c;
+        }
+
+        boost::trim(current);
+        if(!current.empty() || !args.empty())
+        {
+            args.push_back(current);
+        }
+    }
+
+    int binary_op_code(const std::string& op)
+    {
+        if(op == "+") return compiled_expr::ADD_OP;
+        if(op == "-") return compiled_expr::SUBTRACT_OP;
+        if(op == "*") return compiled_expr::MULTIPLY_OP;
+        if(op == "/") return compiled_expr::DIVIDE_OP;
+        if(op == "**" || op == "^") return compiled_expr::POWER_OP;
+        if(op == "||") return compiled_expr::OR_OP;
+        if(op == "&&") return compiled_expr::AND_OP;
+        if(op == "!=") return compiled_expr::NOT_EQUAL_OP;
+        if(op == "==") return compiled_expr::EQUAL_OP;
+        if(op == ">=") return compiled_expr::GREATER_EQUAL_OP;
+        if(op == "<=") return compiled_expr::LESS_EQUAL_OP;
+        if(op == ">") return compiled_expr::GREATER_OP;
+        if(op == "<") return compiled_expr::LESS_OP;
+        return -1;
+    }
+
+    // the built in functions with a value when translating; agauss and aunif
+    // are random, so have none
+    int builtin_code(const std::string& name)
+    {
+        static const std::pair<const char*, int> builtins[] = {
+            {"exp", compiled_expr::EXP_FUNC}, {"log", compiled_expr::LOG_FUNC},
+            {"log10", compiled_expr::LOG10_FUNC}, {"cos", compiled_expr::COS_FUNC},
+            {"sin", compiled_expr::SIN_FUNC}, {"tan", compiled_expr::TAN_FUNC},
+            {"acos", compiled_expr::ACOS_FUNC}, {"asin", compiled_expr::ASIN_FUNC},
+            {"atan", compiled_expr::ATAN_FUNC}, {"cosh", compiled_expr::COSH_FUNC},
+            {"sinh", compiled_expr::SINH_FUNC}, {"tanh", compiled_expr::TANH_FUNC},
+            {"sqrt", compiled_expr::SQRT_FUNC}, {"max", compiled_expr::MAX_FUNC},
+            {"min", compiled_expr::MIN_FUNC}, {"int", compiled_expr::INT_FUNC},
+            {"abs", compiled_expr::ABS_FUNC}, {"sgn", compiled_expr::SGN_FUNC},
+            {"pow", compiled_expr::POW_FUNC}, {"pwr", compiled_expr::PWR_FUNC}
+        };
+
+        for(size_t i = 0; i < sizeof(builtins) / sizeof(builtins[0]); i++)
+        {
+            if(boost::iequals(builtins[i].first, name))
+            {
+                return builtins[i].second;
+            }
+        }
+        return -1;
+    }
+
+    size_t builtin_arg_count(int code)
+    {
+        switch(code)
+        {
+            case compiled_expr::MAX_FUNC: case compiled_expr::MIN_FUNC:
+            case compiled_expr::POW_FUNC: case compiled_expr::PWR_FUNC:
+                return 2;
+        }
+        return 1;
+    }
+
+    double apply_binary(int op, double lhs, double rhs)
+    {
+        switch(op)
+        {
+            case compiled_expr::ADD_OP: return lhs + rhs;
+            case compiled_expr::SUBTRACT_OP: return lhs - rhs;
+            case compiled_expr::MULTIPLY_OP: return lhs * rhs;
+            case compiled_expr::DIVIDE_OP: return lhs / rhs;
+            case compiled_expr::POWER_OP: return pow(lhs, rhs);
+        }
+
+        // comparisons and logical operators have no value for an unknown operand
+        if(std::isnan(lhs) || std::isnan(rhs))
+        {
+            return not_a_constant;
+        }
+
+        switch(op)
+        {
+            case compiled_expr::OR_OP: return lhs || rhs;
+            case compiled_expr::AND_OP: return lhs && rhs;
+            case compiled_expr::NOT_EQUAL_OP: return lhs != rhs;
+            case compiled_expr::EQUAL_OP: return lhs == rhs;
+            case compiled_expr::GREATER_EQUAL_OP: return lhs >= rhs;
+            case compiled_expr::LESS_EQUAL_OP: return lhs <= rhs;
+            case compiled_expr::GREATER_OP: return lhs > rhs;
+            case compiled_expr::LESS_OP: return lhs < rhs;
+        }
+        return not_a_constant;
+    }
+
+    // same results as ast_common::evaluator, except for pow below
+    double apply_builtin(int code, const std::vector<double>& a)
+    {
+        switch(code)
+        {
+            case compiled_expr::EXP_FUNC: return exp(a[0]);
+            case compiled_expr::LOG_FUNC: return log(a[0]);
+            case compiled_expr::LOG10_FUNC: return log10(a[0]);
+            case compiled_expr::COS_FUNC: return cos(a[0]);
+            case compiled_expr::SIN_FUNC: return sin(a[0]);
+            case compiled_expr::TAN_FUNC: return tan(a[0]);
+            case compiled_expr::ACOS_FUNC: return acos(a[0]);
+            case compiled_expr::ASIN_FUNC: return asin(a[0]);
+            case compiled_expr::ATAN_FUNC: return atan(a[0]);
+            case compiled_expr::COSH_FUNC: return cosh(a[0]);
+            case compiled_expr::SINH_FUNC: return sinh(a[0]);
+            case compiled_expr::TANH_FUNC: return tanh(a[0]);
+            case compiled_expr::SQRT_FUNC: return sqrt(a[0]);
+            case compiled_expr::MAX_FUNC: return std::max(a[0], a[1]);
+            case compiled_expr::MIN_FUNC: return std::min(a[0], a[1]);
+            case compiled_expr::INT_FUNC: return int(a[0]);
+            case compiled_expr::ABS_FUNC: return std::abs(a[0]);
+            case compiled_expr::SGN_FUNC: return a[0] < 0 ? -1 : (a[0] > 0 ? 1 : 0);
+            case compiled_expr::POW_FUNC:
+                // HSPICE truncates the exponent and Xyce does not, so the
+                // value of pow with a fractional exponent depends on which
+                // simulator reads the expression: it is left unfolded
+                if(a[1] != floor(a[1]))
+                {
+                    return not_a_constant;
+                }
+                return pow(a[0], a[1]);
+            case compiled_expr::PWR_FUNC:
+                return a[0] < 0 ? -1 * pow(std::abs(a[0]), a[1]) : pow(std::abs(a[0]), a[1]);
+        }
+        return not_a_constant;
+    }
+
+    compiled_expr constant_node(double value)
+    {
+        compiled_expr node;
+        node.kind = compiled_expr::CONSTANT;
+        node.value = value;
+        return node;
+    }
+
+    void collect_params(const compiled_expr& e, std::vector<int>& found)
+    {
+        if(e.kind == compiled_expr::PARAM)
+        {
+            found.push_back(e.index);
+        }
+        for(size_t i = 0; i < e.args.size(); i++)
+        {
+            collect_params(e.args[i], found);
+        }
+    }
+
+    boost::python::object to_python(double value)
+    {
+        if(std::isnan(value))
+        {
+            return boost::python::object();
+        }
+        return boost::python::object(value);
+    }
+}
+
+
+// Turns the AST into a compiled_expr.  The text the AST keeps for function
+// calls, built in functions and ternaries is parsed and compiled here, once.
+struct expr_compiler
+{
+    typedef compiled_expr result_type;
+
+    ParamEvaluator& engine;
+    const std::vector<std::string>* arg_names;
+
+    expr_compiler(ParamEvaluator& engine, const std::vector<std::string>* arg_names)
+        : engine(engine), arg_names(arg_names) { }
+
+    compiled_expr operator()(ast_common::nil) { return compiled_expr(); }
+
+    compiled_expr operator()(ast_common::variable const& x)
+    {
+        compiled_expr node;
+        std::string name = engine.normalize(boost::trim_copy(x.var_name));
+        if(arg_names != NULL)
+        {
+            for(size_t i = 0; i < arg_names->size(); i++)
+            {
+                if((*arg_names)[i] == name)
+                {
+                    node.kind = compiled_expr::ARGUMENT;
+                    node.index = static_cast<int>(i);
+                    return node;
+                }
+            }
+        }
+        node.kind = compiled_expr::PARAM;
+        node.index = engine.param_index(name);
+        return node;
+    }
+
+    compiled_expr operator()(ast_common::number const& x)
+    {
+        return constant_node(engine.number_value(x.constant_number));
+    }
+
+    compiled_expr operator()(ast_common::unary const& x)
+    {
+        compiled_expr operand = boost::apply_visitor(*this, x.operand_);
+        if(x.sign != '-')
+        {
+            return operand;
+        }
+        compiled_expr node;
+        node.kind = compiled_expr::NEGATE;
+        node.args.push_back(operand);
+        return node;
+    }
+
+    compiled_expr binary(const std::string& op, compiled_expr lhs, compiled_expr rhs)
+    {
+        compiled_expr node;
+        int code = binary_op_code(op);
+        if(code < 0)
+        {
+            return node;
+        }
+        node.kind = compiled_expr::BINARY;
+        node.index = code;
+        node.args.push_back(lhs);
+        node.args.push_back(rhs);
+        return node;
+    }
+
+    compiled_expr operator()(ast_common::expr const& x)
+    {
+        compiled_expr state = boost::apply_visitor(*this, x.first);
+        BOOST_FOREACH(ast_common::operation const& oper, x.rest)
+        {
+            state = binary(oper.op, state, boost::apply_visitor(*this, oper.operand_));
+        }
+        return state;
+    }
+
+    compiled_expr operator()(ast_common::boolExpr const& x)
+    {
+        compiled_expr state = boost::apply_visitor(*this, x.first);
+        BOOST_FOREACH(ast_common::boolOperation const& oper, x.rest)
+        {
+            state = binary(oper.op, state, boost::apply_visitor(*this, oper.operand_));
+        }
+        return state;
+    }
+
+    compiled_expr operator()(ast_common::assignment const& x)
+    {
+        return boost::apply_visitor(*this, x.rhs);
+    }
+
+    compiled_expr operator()(ast_common::funcAssignment const& x)
+    {
+        return compiled_expr();
+    }
+
+    compiled_expr operator()(ast_common::funcEval const& x)
+    {
+        std::string name;
+        std::vector<std::string> args;
+        split_call(x.func_name, name, args);
+
+        compiled_expr node;
+        node.kind = compiled_expr::CALL;
+        node.index = engine.function_index(engine.normalize(name));
+        node.args.resize(args.size());
+        for(size_t i = 0; i < args.size(); i++)
+        {
+            engine.compile(args[i], arg_names, node.args[i]);
+        }
+        return node;
+    }
+
+    compiled_expr operator()(ast_common::builtIn const& x)
+    {
+        std::string name;
+        std::vector<std::string> args;
+        split_call(x.func_name, name, args);
+
+        compiled_expr node;
+        if(x.func_name.find('(') == std::string::npos)
+        {
+            if(boost::iequals("pi", name))
+            {
+                return constant_node(M_PI);
+            }
+            return node;
+        }
+
+        int code = builtin_code(name);
+        if(code < 0 || args.size() != builtin_arg_count(code))
+        {
+            return node;
+        }
+
+        node.kind = compiled_expr::BUILTIN;
+        node.index = code;
+        node.args.resize(args.size());
+        for(size_t i = 0; i < args.size(); i++)
+        {
+            engine.compile(args[i], arg_names, node.args[i]);
+        }
+        return node;
+    }
+
+    compiled_expr operator()(ast_common::ternary const& x)
+    {
+        compiled_expr node;
+        node.kind = compiled_expr::TERNARY;
+        node.args.resize(3);
+        engine.compile(x.conditional, arg_names, node.args[0]);
+        engine.compile(x.left, arg_names, node.args[1]);
+        engine.compile(x.right, arg_names, node.args[2]);
+        return node;
+    }
+
+    compiled_expr operator()(ast_common::root const& x)
+    {
+        return boost::apply_visitor(*this, x.first);
+    }
+};
+
+
+ParamEvaluator::ParamEvaluator(bool case_insensitive)
+    : case_insensitive(case_insensitive), epoch(1)
+{
+}
+
+std::string ParamEvaluator::normalize(std::string name) const
+{
+    if(case_insensitive)
+    {
+        boost::to_upper(name);
+    }
+    return name;
+}
+
+int ParamEvaluator::param_index(const std::string& name)
+{
+    std::unordered_map<std::string, int>::const_iterator found = param_slots.find(name);
+    if(found != param_slots.end())
+    {
+        return found->second;
+    }
+
+    param_slot slot;
+    slot.defined = false;
+    slot.value = not_a_constant;
+    slot.epoch = 0;
+    slot.evaluating = false;
+    params.push_back(slot);
+    param_slots[name] = static_cast<int>(params.size()) - 1;
+    return static_cast<int>(params.size()) - 1;
+}
+
+int ParamEvaluator::function_index(const std::string& name)
+{
+    std::unordered_map<std::string, int>::const_iterator found = function_slots.find(name);
+    if(found != function_slots.end())
+    {
+        return found->second;
+    }
+
+    function_slot slot;
+    slot.defined = false;
+    slot.arg_count = 0;
+    functions.push_back(slot);
+    function_slots[name] = static_cast<int>(functions.size()) - 1;
+    return static_cast<int>(functions.size()) - 1;
+}
+
+bool ParamEvaluator::compile(const std::string& text, const std::vector<std::string>* arg_names, compiled_expr& out)
+{
+    ast_common::root top;
+    std::string stripped = strip_delimiters(text);
+    if(stripped.empty() || !parse(stripped, top))
+    {
+        out = compiled_expr();
+        return false;
+    }
+
+    expr_compiler compiler(*this, arg_names);
+    out = compiler(top);
+    return true;
+}
+
+bool ParamEvaluator::define(std::string name, std::string expression)
+{
+    // compiled into a local first, as compiling may add parameter slots
+    compiled_expr expr;
+    bool ok = compile(expression, NULL, expr);
+
+    param_slot& slot = params[param_index(normalize(boost::trim_copy(name)))];
+    slot.defined = true;
+    slot.expr = expr;
+    slot.depends_on.clear();
+    collect_params(slot.expr, slot.depends_on);
+
+    // every memoized value may depend on this one
+    epoch++;
+    return ok;
+}
+
+bool ParamEvaluator::define_function(std::string name, boost::python::list const& arg_names, std::string body)
+{
+    std::vector<std::string> names;
+    for(int i = 0; i < boost::python::len(arg_names); i++)
+    {
+        names.push_back(normalize(boost::trim_copy(std::string(boost::python::extract<std::string>(arg_names[i])))));
+    }
+
+    compiled_expr expr;
+    bool ok = compile(body, &names, expr);
+
+    function_slot& slot = functions[function_index(normalize(boost::trim_copy(name)))];
+    slot.defined = true;
+    slot.arg_count = static_cast<int>(names.size());
+    slot.body = expr;
+
+    epoch++;
+    return ok;
+}
+
+void ParamEvaluator::clear()
+{
+    params.clear();
+    param_slots.clear();
+    functions.clear();
+    function_slots.clear();
+    epoch++;
+}
+
+double ParamEvaluator::param_value(int slot)
+{
+    if(params[slot].epoch == epoch)
+    {
+        return params[slot].value;
+    }
+
+    // the parameters a parameter depends on are evaluated before it, with an
+    // explicit stack, so long .PARAM chains do not recurse
+    std::vector<std::pair<int, size_t> > stack;
+    stack.push_back(std::make_pair(slot, size_t(0)));
+    params[slot].evaluating = true;
+    while(!stack.empty())
+    {
+        int current = stack.back().first;
+        if(stack.back().second < params[current].depends_on.size())
+        {
+            int dependency = params[current].depends_on[stack.back().second++];
+            param_slot& next = params[dependency];
+            if(next.epoch != epoch && !next.evaluating)
+            {
+                next.evaluating = true;
+                stack.push_back(std::make_pair(dependency, size_t(0)));
+            }
+            continue;
+        }
+
+        param_slot& p = params[current];
+        p.value = p.defined ? eval(p.expr, NULL, 0) : not_a_constant;
+        p.epoch = epoch;
+        p.evaluating = false;
+        stack.pop_back();
+    }
+    return params[slot].value;
+}
+
+double ParamEvaluator::eval(const compiled_expr& e, const std::vector<double>* frame, int depth)
+{
+    switch(e.kind)
+    {
+        case compiled_expr::CONSTANT:
+            return e.value;
+
+        case compiled_expr::PARAM:
+            // a parameter still being evaluated is part of a cycle
+            if(params[e.index].evaluating)
+            {
+                return not_a_constant;
+            }
+            return param_value(e.index);
+
+        case compiled_expr::ARGUMENT:
+            if(frame == NULL || e.index >= static_cast<int>(frame->size()))
+            {
+                return not_a_constant;
+            }
+            return (*frame)[e.index];
+
+        case compiled_expr::NEGATE:
+            return -eval(e.args[0], frame, depth);
+
+        case compiled_expr::BINARY:
+        {
+            double lhs = eval(e.args[0], frame, depth);
+            return apply_binary(e.index, lhs, eval(e.args[1], frame, depth));
+        }
+
+        case compiled_expr::BUILTIN:
+        {
+            std::vector<double> values(e.args.size());
+            for(size_t i = 0; i < e.args.size(); i++)
+            {
+                values[i] = eval(e.args[i], frame, depth);
+                if(std::isnan(values[i]))
+                {
+                    return not_a_constant;
+                }
+            }
+            return apply_builtin(e.index, values);
+        }
+
+        case compiled_expr::CALL:
+        {
+            const function_slot& function = functions[e.index];
+            if(!function.defined || function.arg_count != static_cast<int>(e.args.size()) || depth >= max_call_depth)
+            {
+                return not_a_constant;
+            }
+            std::vector<double> values(e.args.size());
+            for(size_t i = 0; i < e.args.size(); i++)
+            {
+                values[i] = eval(e.args[i], frame, depth);
+                if(std::isnan(values[i]))
+                {
+                    return not_a_constant;
+                }
+            }
+            return eval(function.body, &values, depth + 1);
+        }
+
+        case compiled_expr::TERNARY:
+        {
+            double conditional = eval(e.args[0], frame, depth);
+            if(std::isnan(conditional))
+            {
+                return not_a_constant;
+            }
+            return conditional != 0 ? eval(e.args[1], frame, depth) : eval(e.args[2], frame, depth);
+        }
+
+        default:
+            return not_a_constant;
+    }
+}
+
+boost::python::object ParamEvaluator::evaluate(std::string name)
+{
+    std::unordered_map<std::string, int>::const_iterator found = param_slots.find(normalize(boost::trim_copy(name)));
+    if(found == param_slots.end())
+    {
+        return boost::python::object();
+    }
+    return to_python(param_value(found->second));
+}
+
+boost::python::list ParamEvaluator::evaluate_params(boost::python::list const& names)
+{
+    boost::python::list results;
+    for(int i = 0; i < boost::python::len(names); i++)
+    {
+        results.append(evaluate(boost::python::extract<std::string>(names[i])));
+    }
+    return results;
+}
+
+boost::python::list ParamEvaluator::evaluate_expressions(boost::python::list const& expressions)
+{
+    boost::python::list results;
+    for(int i = 0; i < boost::python::len(expressions); i++)
+    {
+        compiled_expr expr;
+        compile(boost::python::extract<std::string>(expressions[i]), NULL, expr);
+        results.append(to_python(eval(expr, NULL, 0)));
+    }
+    return results;
+}
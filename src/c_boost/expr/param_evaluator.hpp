@@ -0,0 +1,159 @@
+//-------------------------------------------------------------------------
+//   Copyright 2002-2020 National Technology & Engineering Solutions of
+//   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+//   NTESS, the U.S. Government retains certain rights in this software.
+//
+//   This file is part of the Xyce(TM) XDM Netlist Translator.
+//
+//   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+//   it under the terms of the GNU General Public License as published by
+//   the Free Software Foundation, either version 3 of the License, or
+//   (at your option) any later version.
+//
+//   Xyce(TM) XDM is distributed in the hope that it will be useful,
+//   but WITHOUT ANY WARRANTY; without even the implied warranty of
+//   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+//   GNU General Public License for more details.
+//
+//   You should have received a copy of the GNU General Public License
+//   along with the Xyce(TM) XDM Netlist Translator.
+//   If not, see <http://www.gnu.org/licenses/>.
+//-------------------------------------------------------------------------
+
+
+#ifndef PARAM_EVALUATOR_HPP
+#define PARAM_EVALUATOR_HPP
+
+
+#include "ast_common.hpp"
+
+#include <boost/python.hpp>
+
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+
+// An expression compiled from the AST of the arithmetic grammars.  Unlike
+// the AST, the arguments of function calls and the parts of a ternary are
+// compiled too, so evaluating it never parses text.
+struct compiled_expr
+{
+    enum node_kind
+    {
+        CONSTANT,       // value
+        PARAM,          // index is the parameter slot
+        ARGUMENT,       // index is the argument of the enclosing function
+        NEGATE,         // args[0]
+        BINARY,         // index is the binary_op, args[0] op args[1]
+        BUILTIN,        // index is the builtin_func, args are its arguments
+        CALL,           // index is the function slot, args are its arguments
+        TERNARY,        // args[0] ? args[1] : args[2]
+        NON_CONSTANT    // anything that has no value when translating
+    };
+
+    enum binary_op
+    {
+        ADD_OP, SUBTRACT_OP, MULTIPLY_OP, DIVIDE_OP, POWER_OP, OR_OP, AND_OP,
+        NOT_EQUAL_OP, EQUAL_OP, GREATER_EQUAL_OP, LESS_EQUAL_OP, GREATER_OP,
+        LESS_OP
+    };
+
+    enum builtin_func
+    {
+        EXP_FUNC, LOG_FUNC, LOG10_FUNC, COS_FUNC, SIN_FUNC, TAN_FUNC, ACOS_FUNC,
+        ASIN_FUNC, ATAN_FUNC, COSH_FUNC, SINH_FUNC, TANH_FUNC, SQRT_FUNC,
+        MAX_FUNC, MIN_FUNC, INT_FUNC, ABS_FUNC, SGN_FUNC, POW_FUNC, PWR_FUNC
+    };
+
+    node_kind kind;
+    double value;
+    int index;
+    std::vector<compiled_expr> args;
+
+    compiled_expr() : kind(NON_CONSTANT), value(0), index(0) { }
+};
+
+
+// Compiles .PARAM and .FUNC definitions once, then evaluates parameters and
+// expressions as often as needed.  Parameter values are memoized until the
+// next definition.  A value that depends on anything unknown when
+// translating (an undefined name such as TEMPER or an instance parameter, a
+// random function, a dependency cycle or an expression that does not parse)
+// is not a constant, and is returned to Python as None.
+//
+// The grammar specific part, parsing text into the AST, is left to the
+// dialect subclasses.
+class ParamEvaluator
+{
+    public:
+        explicit ParamEvaluator(bool case_insensitive);
+        virtual ~ParamEvaluator() { }
+
+        // Defines or redefines a parameter.  Returns false if the expression
+        // did not parse, the parameter is then not a constant
+        bool define(std::string name, std::string expression);
+
+        // Defines or redefines a function of the named arguments
+        bool define_function(std::string name, boost::python::list const& arg_names, std::string body);
+
+        // Value of a parameter, None if it is not a constant
+        boost::python::object evaluate(std::string name);
+
+        // Values of a list of parameters
+        boost::python::list evaluate_params(boost::python::list const& names);
+
+        // Values of a list of expressions, which may use the parameters and
+        // functions defined
+        boost::python::list evaluate_expressions(boost::python::list const& expressions);
+
+        // Removes all definitions
+        void clear();
+
+        int param_count() const { return static_cast<int>(params.size()); }
+
+    protected:
+        // Parses text into the AST, returns false if it does not parse
+        virtual bool parse(const std::string& text, ast_common::root& top) const = 0;
+
+        // Value of a number of the grammar, with its scale factor
+        virtual double number_value(const std::string& text) const { return ast_common::number_value(text); }
+
+    private:
+        struct param_slot
+        {
+            bool defined;
+            compiled_expr expr;
+            std::vector<int> depends_on;
+            double value;
+            unsigned epoch;
+            bool evaluating;
+        };
+
+        struct function_slot
+        {
+            bool defined;
+            int arg_count;
+            compiled_expr body;
+        };
+
+        friend struct expr_compiler;
+
+        bool case_insensitive;
+        unsigned epoch;
+        std::vector<param_slot> params;
+        std::unordered_map<std::string, int> param_slots;
+        std::vector<function_slot> functions;
+        std::unordered_map<std::string, int> function_slots;
+
+        std::string normalize(std::string name) const;
+        int param_index(const std::string& name);
+        int function_index(const std::string& name);
+
+        bool compile(const std::string& text, const std::vector<std::string>* arg_names, compiled_expr& out);
+        double param_value(int slot);
+        double eval(const compiled_expr& e, const std::vector<double>* frame, int depth);
+};
+
+
+#endif
@@ -168,12 +168,12 @@ struct SpectreArithmeticGrammar : boost::spirit::qi::grammar<Iterator,
         number = 
             hold[numeric >> -(char_(".") >> -numeric) >> no_case[char_("e") >> -(char_("-") | char_("+")) >> numeric]] | 
             hold[numeric >> -(char_(".") >> -numeric) >> no_case[char_("fHsV")]] |
-            hold[numeric >> -(char_(".") >> -numeric) >> no_case[char_("PTGMKafpnumck")]] >> no_case[char_("fHsV")] |
+            hold[numeric >> -(char_(".") >> -numeric) >> no_case[char_("PTGMKafpnumck")] >> no_case[char_("fHsV")]] |
             hold[numeric >> -(char_(".") >> -numeric) >> no_case[char_("PTGMKafpnumck")]] |
             hold[numeric >> -(char_(".") >> -numeric)] |
             hold[char_(".") >> numeric >> no_case[char_("e") >> -(char_("-") | char_("+")) >> numeric]] | 
             hold[char_(".") >> numeric >> no_case[char_("fHsV")]] |
-            hold[char_(".") >> numeric >> char_("PTGMKkcmunpfa")] >> no_case[char_("fHsV")] |
+            hold[char_(".") >> numeric >> char_("PTGMKkcmunpfa") >> no_case[char_("fHsV")]] |
             hold[char_(".") >> numeric >> char_("PTGMKkcmunpfa")] |
             hold[char_(".") >> numeric]
             ;
@@ -67,3 +67,51 @@ BoostParsedExpr SpectreExprBoostParser::parseExpr(std::string expr)
 
     return parsedExpr;
 }
+
+
+bool SpectreParamEvaluator::parse(const std::string& text, ast_common::root& top) const
+{
+    typedef std::string::const_iterator iterator_type;
+    typedef SpectreArithmeticGrammar<iterator_type> grammar;
+
+    // building the grammar costs more than parsing a parameter, so it is
+    // built once
+    static const grammar g;
+
+    std::string::const_iterator start = text.begin();
+    std::string::const_iterator end = text.end();
+    bool r = phrase_parse(start, end, g, boost::spirit::ascii::space, top);
+
+    return r && start == end;
+}
+
+
+// Spectre scale factors are case sensitive (M is mega, m is milli), and may
+// be followed by a unit letter, as in 10uH
+double SpectreParamEvaluator::number_value(const std::string& text) const
+{
+    static const std::string scale_factors = "TGMKkcmunpfaP";
+    static const double scales[] = {1e12, 1e9, 1e6, 1e3, 1e3, 1e-2, 1e-3, 1e-6, 1e-9, 1e-12, 1e-15, 1e-18, 1e15};
+
+    std::string mantissa = text;
+    if(mantissa.size() > 1 && isalpha(mantissa.back()) && isalpha(mantissa[mantissa.size() - 2]))
+    {
+        mantissa.pop_back();
+    }
+
+    double scale = 1;
+    if(!mantissa.empty() && isalpha(mantissa.back()))
+    {
+        size_t found = scale_factors.find(mantissa.back());
+        if(found != std::string::npos)
+        {
+            scale = scales[found];
+        }
+        mantissa.pop_back();
+    }
+
+    std::istringstream in_value(mantissa);
+    double v;
+    in_value >> v;
+    return v * scale;
+}
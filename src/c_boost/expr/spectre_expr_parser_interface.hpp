@@ -28,6 +28,7 @@
 #include "ast_common.hpp"
 #include "boost_expr_parser_common.h"
 #include "expr_parser_interface.hpp"
+#include "param_evaluator.hpp"
 
 #include <boost/algorithm/string.hpp>
 #include <boost/python.hpp>
@@ -52,4 +53,16 @@ class SpectreExprBoostParser
 };
 
 
+// ParamEvaluator for Spectre expressions; names are case sensitive
+class SpectreParamEvaluator : public ParamEvaluator
+{
+    public:
+        SpectreParamEvaluator() : ParamEvaluator(false) { }
+
+    protected:
+        bool parse(const std::string& text, ast_common::root& top) const;
+        double number_value(const std::string& text) const;
+};
+
+
 #endif
@@ -32,7 +32,7 @@ using namespace adm_boost_common;
 template <typename Iterator>
 struct hspice_parser : qi::grammar<Iterator, std::vector<netlist_statement_object>()>
 {
-    qi::rule<Iterator, std::vector<netlist_statement_object>()> netlist_line, analog_device, data_line, directive, transient, transient_or_ac_dc, table, abm_expression, control_expression, value_expression, param_value_pair, function_expression, measure_param_value_pair,
+    qi::rule<Iterator, std::vector<netlist_statement_object>()> netlist_line, data_line, transient, transient_or_ac_dc, table, abm_expression, control_expression, value_expression, param_value_pair, function_expression, measure_param_value_pair,
         vol_expression, cur_expression, circuit_params, poly, pulse_trans, sin_trans, exp_trans, pwl_trans, sffm_trans;
 
     qi::rule<Iterator, std::vector<netlist_statement_object>()> bjt, capacitor, current_ctrl_current_src, current_ctrl_switch, current_ctrl_voltage_src, digital_dev, diode, inductor, port, resistor, indep_current_src,
@@ -43,6 +43,17 @@ struct hspice_parser : qi::grammar<Iterator, std::vector<netlist_statement_objec
         nodeset_dir, op_dir, options_dir, param_dir, print_dir, save_dir, subckt_dir, temp_dir, tran_dir, four_dir, lin_dir, data_dir,
         if_dir, else_dir, elseif_dir, endif_dir;
 
+    // First character dispatch. The leading device letter, or the first letter of a directive keyword, selects the
+    // rule (or the ordered family of rules sharing that letter) to try, so a line only runs the rules that can match it.
+    typedef qi::rule<Iterator, std::vector<netlist_statement_object>()> statement_rule;
+
+    qi::symbols<char, statement_rule*> device_table, directive_table;
+
+    qi::rule<Iterator, std::vector<netlist_statement_object>(), qi::locals<statement_rule*> > analog_device, directive;
+
+    statement_rule switch_devices, d_directives, e_directives, g_directives, i_directives, l_directives, m_directives, o_directives, p_directives,
+        s_directives, t_directives;
+
     qi::rule<Iterator, netlist_statement_object()> AREA_VALUE, TRANSCONDUCTANCE_VALUE, COUPLING_VALUE, FUND_FREQ_VALUE, GAIN_VALUE,
         GENERAL_VALUE, CONTROL_DEV_VALUE, POSNODE, NEGNODE, DRAINNODE, GATENODE, SOURCENODE, ANODE, POSCONTROLNODE,
         NEGCONTROLNODE, COLLECTORNODE, BASENODE, EMITTERNODE, COLLECTORPRIMENODE, BASEPRIMENODE, EMITTERPRIMENODE, POSSWITCHNODE,
@@ -848,11 +859,39 @@ struct hspice_parser : qi::grammar<Iterator, std::vector<netlist_statement_objec
 
         // DIRECTIVES ////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
 
-        directive =
-            ac_dir | data_dir | dcvolt_dir | dc_dir | eom_dir | ends_dir | endl_dir | enddata_dir | endif_dir | end_dir | global_param_dir | global_dir | hb_dir | inc_dir | ic_dir | lib_dir |
-            lin_dir | measure_dir | model_dir | four_dir | nodeset_dir | options_dir | op_dir | print_dir | param_dir | save_dir | subckt_dir | temp_dir |
-            tran_dir | if_dir | elseif_dir | else_dir
-        ;
+        // keys are lower case for no_case matching. Rules sharing a letter keep their relative order, so that
+        // e.g. .ENDS is still tried before .END
+        directive_table.add
+            (".a", &ac_dir)
+            (".d", &d_directives)
+            (".e", &e_directives)
+            (".f", &four_dir)
+            (".g", &g_directives)
+            (".h", &hb_dir)
+            (".i", &i_directives)
+            (".l", &l_directives)
+            (".m", &m_directives)
+            (".n", &nodeset_dir)
+            (".o", &o_directives)
+            (".p", &p_directives)
+            (".s", &s_directives)
+            (".t", &t_directives)
+            ;
+
+        directive %=
+            &no_case[directive_table [_a = boost::spirit::_1]] >> qi::lazy(*_a)
+            ;
+
+        d_directives = data_dir | dcvolt_dir | dc_dir;
+        e_directives = eom_dir | ends_dir | endl_dir | enddata_dir | endif_dir | end_dir | elseif_dir | else_dir;
+        g_directives = global_param_dir | global_dir;
+        i_directives = inc_dir | ic_dir | if_dir;
+        l_directives = lib_dir | lin_dir;
+        m_directives = measure_dir | model_dir | subckt_dir;
+        o_directives = options_dir | op_dir;
+        p_directives = print_dir | param_dir;
+        s_directives = save_dir | subckt_dir;
+        t_directives = temp_dir | tran_dir;
 
         ac_dir_type =
             qi::as_string[no_case[lit(".AC")]] [symbol_adder(_val, boost::spirit::_1, vector_of<data_model_type>(adm_boost_common::DIRECTIVE_TYPE))]
@@ -1152,9 +1191,37 @@ struct hspice_parser : qi::grammar<Iterator, std::vector<netlist_statement_objec
         // ANALOG DEVICES  ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
 
 
-        analog_device =
-            (bjt | capacitor | digital_dev | diode | generic_switch | current_ctrl_current_src | current_ctrl_switch | current_ctrl_voltage_src | indep_current_src | indep_voltage_src | inductor | jfet | lossless_trans_line | lossy_trans_line | mesfet | mosfet | mututal_inductor | non_linear_dep_src | port | resistor | subcircuit | voltage_ctrl_current_src | voltage_ctrl_switch | voltage_ctrl_voltage_src)
-            ;
+        device_table.add
+            ("b", &non_linear_dep_src)
+            ("c", &capacitor)
+            ("d", &diode)
+            ("e", &voltage_ctrl_voltage_src)
+            ("f", &current_ctrl_current_src)
+            ("g", &voltage_ctrl_current_src)
+            ("h", &current_ctrl_voltage_src)
+            ("i", &indep_current_src)
+            ("j", &jfet)
+            ("k", &mututal_inductor)
+            ("l", &inductor)
+            ("m", &mosfet)
+            ("o", &lossy_trans_line)
+            ("p", &port)
+            ("q", &bjt)
+            ("r", &resistor)
+            ("s", &switch_devices)
+            ("t", &lossless_trans_line)
+            ("v", &indep_voltage_src)
+            ("w", &current_ctrl_switch)
+            ("x", &subcircuit)
+            ("y", &digital_dev)
+            ("z", &mesfet)
+            ;
+
+        analog_device %=
+            &no_case[device_table [_a = boost::spirit::_1]] >> qi::lazy(*_a)
+            ;
+
+        switch_devices = generic_switch | voltage_ctrl_switch;
 
         bjt_dev_type =
             qi::as_string[no_case[char_("Q")]] [symbol_adder(_val, boost::spirit::_1, vector_of<data_model_type>(adm_boost_common::DEVICE_ID))]
@@ -31,10 +31,19 @@ struct pspice_parser : qi::grammar<Iterator, std::vector<netlist_statement_objec
 {
     qi::rule<Iterator, std::vector<netlist_statement_object>()> aliases_dir, distribution_dir, endaliases_dir, loadbias_dir, mc_dir, noise_dir,
         plot_dir, savebias_dir, stimulus_dir, text_dir, tf_dir, vector_dir, watch_dir, wcase_dir, pspice_start, lib_dir, options_dir, print_dir,
-        probe_dir, temp_dir, tran_dir, analog_device, directive, probe_64_dir, nodeset_dir, autoconverge_dir, resistor, table,
+        probe_dir, temp_dir, tran_dir, probe_64_dir, nodeset_dir, autoconverge_dir, resistor, table,
         current_ctrl_current_src, current_ctrl_voltage_src, voltage_ctrl_current_src, voltage_ctrl_voltage_src,
         temperature_coefficient_inst_params;
 
+    // First character dispatch, as in xyce_parser. Lines whose letter is not in a table fall through to the base parser.
+    typedef qi::rule<Iterator, std::vector<netlist_statement_object>()> statement_rule;
+
+    qi::symbols<char, statement_rule*> device_table, directive_table;
+
+    qi::rule<Iterator, std::vector<netlist_statement_object>(), qi::locals<statement_rule*> > analog_device, directive;
+
+    statement_rule a_directives, l_directives, n_directives, p_directives, s_directives, t_directives, w_directives;
+
     qi::rule<Iterator, netlist_statement_object()> aliases_dir_type, distribution_dir_type, endaliases_dir_type, loadbias_dir_type, mc_dir_type,
         noise_dir_type, plot_dir_type, savebias_dir_type, stimulus_dir_type, text_dir_type, tf_dir_type, vector_dir_type, watch_dir_type,
         wcase_dir_type, tran_op_type, probe_dir_type,  probe_csdf_type, temp_dir_type, output_variable, TEMP_VALUE, probe_64_dir_type, nodeset_dir_type,
@@ -109,11 +118,32 @@ struct pspice_parser : qi::grammar<Iterator, std::vector<netlist_statement_objec
 
         // DIRECTIVES ////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
 
-        directive =
-            probe_64_dir | lib_dir | options_dir | print_dir | probe_dir | temp_dir | tran_dir | aliases_dir | distribution_dir | endaliases_dir |
-            loadbias_dir | mc_dir | noise_dir | plot_dir | savebias_dir | stimulus_dir | text_dir | tf_dir | vector_dir | watch_dir |
-            wcase_dir | nodeset_dir | autoconverge_dir
-            ;
+        directive_table.add
+            (".a", &a_directives)
+            (".d", &distribution_dir)
+            (".e", &endaliases_dir)
+            (".l", &l_directives)
+            (".m", &mc_dir)
+            (".n", &n_directives)
+            (".o", &options_dir)
+            (".p", &p_directives)
+            (".s", &s_directives)
+            (".t", &t_directives)
+            (".v", &vector_dir)
+            (".w", &w_directives)
+            ;
+
+        directive %=
+            &no_case[directive_table [_a = boost::spirit::_1]] >> qi::lazy(*_a)
+            ;
+
+        a_directives = aliases_dir | autoconverge_dir;
+        l_directives = lib_dir | loadbias_dir;
+        n_directives = noise_dir | nodeset_dir;
+        p_directives = probe_64_dir | print_dir | probe_dir | plot_dir;
+        s_directives = savebias_dir | stimulus_dir;
+        t_directives = temp_dir | tran_dir | text_dir | tf_dir;
+        w_directives = watch_dir | wcase_dir;
 
         lib_dir =
             base_parser.lib_dir_type >>  base_parser.white_space >> base_parser.filename
@@ -310,8 +340,15 @@ struct pspice_parser : qi::grammar<Iterator, std::vector<netlist_statement_objec
         // ANALOG DEVICES  ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
 
 
-        analog_device =
-            (resistor | current_ctrl_voltage_src | voltage_ctrl_current_src | voltage_ctrl_voltage_src)
+        device_table.add
+            ("e", &voltage_ctrl_voltage_src)
+            ("g", &voltage_ctrl_current_src)
+            ("h", &current_ctrl_voltage_src)
+            ("r", &resistor)
+            ;
+
+        analog_device %=
+            &no_case[device_table [_a = boost::spirit::_1]] >> qi::lazy(*_a)
             ;
 
         resistor =
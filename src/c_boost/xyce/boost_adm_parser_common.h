@@ -31,12 +31,13 @@
 #include <boost/spirit/include/phoenix_fusion.hpp>
 #include <boost/spirit/include/phoenix_stl.hpp>
 #include <boost/spirit/include/phoenix_object.hpp>
+#include <boost/container/small_vector.hpp>
 
 #include <vector>
 #include <iostream>
 
 namespace adm_boost_common {
-enum data_model_type
+enum data_model_type : unsigned char
 {
     DEVICE_ID, DEVICE_NAME, DIRECTIVE_TYPE, POSNODE, NEGNODE, GENERALNODE, VALUE, OPTION_PKG_TYPE_VALUE, MODEL_NAME, TRANS_FUNC_TYPE, TRANS_REF_NAME,
     PARAM_NAME, PARAM_VALUE, OUTPUT_VARIABLE, ANALYSIS_TYPE, FUNCTION_NAME, EXPRESSION, SWEEP_TYPE, INLINE_COMMENT, PARAMS_HEADER, ON, OFF,
@@ -75,12 +76,16 @@ static const char* data_model_type_strs[] = {"DEVICE_ID", "DEVICE_NAME", "DIRECT
     "BINNED_MODEL_NAME", "DC_SWEEP_DEV", "DC_SWEEP_PARAM", "DC_SWEEP_START", "DC_SWEEP_STOP", "DC_SWEEP_STEP"
 };
 
+// A token rarely has more than a couple of candidate types, so they are kept inline in the token. This saves a heap
+// allocation for every token built, and for every copy hold[] makes of a partially parsed line when it backtracks.
+typedef boost::container::small_vector<data_model_type, 4> candidate_type_set;
+
 struct netlist_statement_object {
-    std::vector<data_model_type> candidate_types;
+    candidate_type_set candidate_types;
     std::string value;
 };
 
-inline std::ostream& operator<< (std::ostream& os, const netlist_statement_object nso) {
+inline std::ostream& operator<< (std::ostream& os, const netlist_statement_object& nso) {
     std::cout << "{" << nso.value << ", [";
 
     for(int i = 0; i < nso.candidate_types.size()-1; i++)
@@ -92,7 +97,7 @@ inline std::ostream& operator<< (std::ostream& os, const netlist_statement_objec
     return os;
 }
 
-inline std::string getDataModelTypeStr(const netlist_statement_object nso) {
+inline std::string getDataModelTypeStr(const netlist_statement_object& nso) {
     std::string dataStr;
     dataStr = data_model_type_strs[nso.candidate_types[nso.candidate_types.size()-1]];
 
@@ -38,22 +38,22 @@ HSPICENetlistBoostParser::open(std::string filenm, bool top_level_file) {
 
 void
 HSPICENetlistBoostParser::close() {
+        parallel.stop();
+        ahead.stop();
         reader.close();
     }
 
 
-BoostParsedLine
-HSPICENetlistBoostParser::next() {
+bool
+HSPICENetlistBoostParser::read(NetlistLine& parsedLine) {
 
-        typedef hspice_parser<iterator_type> hspice_parser;
-        hspice_parser g;
+        const hspice_parser<iterator_type>& g = grammar<hspice_parser<iterator_type> >();
 
         if(!reader.hasNext(g)) {
-            PyErr_SetString(PyExc_StopIteration, "No more data.");
-            boost::python::throw_error_already_set();
+            return false;
         }
 
-        BoostParsedLine parsedLine = reader.next(g);
+        parsedLine = reader.next(g);
 
         if(is_top_level_file && parsedLine.linenums[0] == 1)  {
             adm_boost_common::netlist_statement_object titleNSO;
@@ -63,21 +63,20 @@ HSPICENetlistBoostParser::next() {
             std::vector<adm_boost_common::netlist_statement_object> v;
             v.push_back(titleNSO);
 
-            convert_to_parsed_objects(v, parsedLine);
+            parsedLine.parsedObjects = v;
         } else {
             parseLine(parsedLine);
         }
 
-        return parsedLine;
+        return true;
     }
 
 void
-HSPICENetlistBoostParser::parseLine(BoostParsedLine & parsedLine) {
+HSPICENetlistBoostParser::parseLine(NetlistLine & parsedLine) {
 
         //setup parser objects
         //typedef std::string::const_iterator iterator_type;
-        typedef hspice_parser<iterator_type> hspice_parser;
-        hspice_parser g;
+        const hspice_parser<iterator_type>& g = grammar<hspice_parser<iterator_type> >();
 
         std::string::const_iterator start = parsedLine.sourceLine.begin();
         std::string::const_iterator end = parsedLine.sourceLine.end();
@@ -95,7 +94,7 @@ HSPICENetlistBoostParser::parseLine(BoostParsedLine & parsedLine) {
             //}
             //std::cout << "\n\n" << std::flush;
 
-            convert_to_parsed_objects(netlist_parse_results, parsedLine);
+            parsedLine.parsedObjects.swap(netlist_parse_results);
         } else {
             //std::cout << "HSpice Parsing failed: \n" << parsedLine.sourceLine << std::endl;
             //for(int i = 0; i < netlist_parse_results.size(); i++) {
@@ -113,7 +112,7 @@ HSPICENetlistBoostParser::parseLine(BoostParsedLine & parsedLine) {
             end = parsedLine.sourceLine.end();
             bool comment_readable = phrase_parse(start, end, g, boost::spirit::ascii::space, netlist_parse_results);
             if (comment_readable){
-                convert_to_parsed_objects(netlist_parse_results, parsedLine);
+                parsedLine.parsedObjects.swap(netlist_parse_results);
             } else {
                 std::cout << "\nHSpice Parsing failed around line " + getLineNumsString (parsedLine) +
                     " and line(s) could not be converted to comment\n" << std::endl;
@@ -29,19 +29,23 @@
 #include "xyce_parser_interface.hpp"
 
 #include <boost/algorithm/string.hpp>
+#include <boost/iostreams/filter/gzip.hpp>
+#include <boost/iostreams/filter/zstd.hpp>
+#include <boost/iostreams/filtering_stream.hpp>
 
+#include <sys/stat.h>
+
+#include <algorithm>
 #include <fstream>
 #include <iostream>
 
-std::string getLineNumsString (BoostParsedLine parsedLine) {
+std::string getLineNumsString (const NetlistLine& parsedLine) {
     std::string lineNumsString = "[";
 
-    for (int i = 0; i < len(parsedLine.linenums); i++) {
-        // extracts the line number from the boost python list
-        std::string num = boost::python::extract<std::string>(
-            boost::python::object(parsedLine.linenums[i]).attr("__str__")())();
+    for (size_t i = 0; i < parsedLine.linenums.size(); i++) {
+        std::string num = std::to_string(parsedLine.linenums[i]);
         // add a comma if not the last element
-        if (i != len(parsedLine.linenums) - 1) {
+        if (i != parsedLine.linenums.size() - 1) {
             num += ",";
         }
         lineNumsString += num;
@@ -50,52 +54,495 @@ std::string getLineNumsString (BoostParsedLine parsedLine) {
     return lineNumsString ;
 }
 
-void convert_to_parsed_objects(std::vector<adm_boost_common::netlist_statement_object> netlist_parse_results, BoostParsedLine parsedLine) {
+void convert_to_parsed_objects(const std::vector<adm_boost_common::netlist_statement_object>& netlist_parse_results, BoostParsedLine& parsedLine) {
 
     for(int i = 0; i < netlist_parse_results.size(); i++) {
 
-        boost::python::list typeList;
+        const adm_boost_common::netlist_statement_object& nso = netlist_parse_results[i];
+        ParseObject obj;
 
-        for(int j = 0; j < netlist_parse_results[i].candidate_types.size(); j++) {
-            typeList.append(netlist_parse_results[i].candidate_types[j]);
+        for(int j = 0; j < nso.candidate_types.size(); j++) {
+            obj.types.append(nso.candidate_types[j]);
         }
 
-        ParseObject obj;
-        obj.value = netlist_parse_results[i].value;
-        obj.types = typeList;
+        obj.value = nso.value;
 
         parsedLine.parsedObjects.append(obj);
     }
 }
 
+BoostParsedLine convert_to_python(const NetlistLine& line) {
+    BoostParsedLine parsedLine;
+    for (size_t i = 0; i < line.linenums.size(); i++) {
+        parsedLine.linenums.append(line.linenums[i]);
+    }
+    parsedLine.filename = line.filename;
+    parsedLine.sourceLine = line.sourceLine;
+    parsedLine.errorType = line.errorType;
+    parsedLine.errorMessage = line.errorMessage;
+    convert_to_parsed_objects(line.parsedObjects, parsedLine);
+    return parsedLine;
+}
+
+
+// Longest value whose key is interned.  Longer values are expressions or
+// comments, which are not looked up by name
+static const size_t MAX_INTERNED_KEY_LENGTH = 64;
+
+// Keys are interned with PyUnicode_InternInPlace and no reference is kept
+// here, so a key is freed once no parsed object or reader table holds it.
+// Long running --serve and --batch processes see many netlists, and keeping
+// every name they ever parsed would grow without bound
+
+static bool is_ascii(const std::string& value) {
+    for (size_t i = 0; i < value.size(); i++) {
+        if (static_cast<unsigned char>(value[i]) >= 0x80) {
+            return false;
+        }
+    }
+    return true;
+}
+
+static boost::python::object make_key(const std::string& value) {
+    // non-ASCII text is upper cased by Python, so keys match str.upper()
+    if (!is_ascii(value)) {
+        return boost::python::str(value).upper();
+    }
+
+    std::string upper = value;
+    for (size_t i = 0; i < upper.size(); i++) {
+        if (upper[i] >= 'a' && upper[i] <= 'z') {
+            upper[i] -= 'a' - 'A';
+        }
+    }
+
+    if (upper.size() > MAX_INTERNED_KEY_LENGTH || upper.find_first_of(" \t") != std::string::npos) {
+        return boost::python::str(upper);
+    }
+
+    PyObject* key = PyUnicode_FromStringAndSize(upper.data(), upper.size());
+    if (key == NULL) {
+        boost::python::throw_error_already_set();
+    }
+    PyUnicode_InternInPlace(&key);
+    return boost::python::object(boost::python::handle<>(key));
+}
+
+boost::python::object parsed_object_key(ParseObject& obj) {
+    if (obj.key.is_none()) {
+        obj.key = make_key(obj.value);
+    }
+    return obj.key;
+}
+
+static std::string get_parsed_object_value(const ParseObject& obj) {
+    return obj.value;
+}
+
+// a new value has a new key
+static void set_parsed_object_value(ParseObject& obj, const std::string& value) {
+    obj.value = value;
+    obj.key = boost::python::object();
+}
+
+
+// Suffixes of the compressed copies of a netlist file, see stored_path
+static const char* COMPRESSED_SUFFIXES[] = {".gz", ".zst"};
+
+// A regular file, as os.path.isfile has it on the Python side, so a
+// directory is not taken for a netlist file
+static bool file_exists(const std::string& path) {
+    struct stat status;
+    return stat(path.c_str(), &status) == 0 && (status.st_mode & S_IFMT) == S_IFREG;
+}
+
+std::string
+stored_path(const std::string& filename) {
+    if (file_exists(filename)) {
+        return filename;
+    }
+    for (size_t i = 0; i < sizeof(COMPRESSED_SUFFIXES) / sizeof(COMPRESSED_SUFFIXES[0]); i++) {
+        std::string path = filename + COMPRESSED_SUFFIXES[i];
+        if (file_exists(path)) {
+            return path;
+        }
+    }
+    return filename;
+}
+
+std::string
+file_compression(const std::string& path) {
+    std::ifstream input(path.c_str(), std::ifstream::in | std::ifstream::binary);
+    unsigned char magic[4] = {0, 0, 0, 0};
+    input.read(reinterpret_cast<char*>(magic), sizeof(magic));
+    if (input.gcount() >= 2 && magic[0] == 0x1f && magic[1] == 0x8b) {
+        return "gzip";
+    }
+    if (input.gcount() == 4 && magic[0] == 0x28 && magic[1] == 0xb5 && magic[2] == 0x2f && magic[3] == 0xfd) {
+        return "zstd";
+    }
+    return "";
+}
 
 bool
 NetlistLineReader::open(std::string filenm) {
     filename = filenm;
-    inputStream = new std::ifstream(filename.c_str(), std::ifstream::in );
+    std::string path = stored_path(filename);
+    compression = file_compression(path);
+    if (compression.empty()) {
+        inputFile = new std::ifstream(path.c_str(), std::ifstream::in );
+        inputStream = inputFile;
+    } else {
+        inputFile = new std::ifstream(path.c_str(), std::ifstream::in | std::ifstream::binary);
+        boost::iostreams::filtering_istream* decompressed = new boost::iostreams::filtering_istream();
+        if (compression == "gzip") {
+            decompressed->push(boost::iostreams::gzip_decompressor());
+        } else {
+            decompressed->push(boost::iostreams::zstd_decompressor());
+        }
+        decompressed->push(*inputFile);
+        // a file that can not be decompressed is an error, rather than the
+        // end of the lines
+        decompressed->exceptions(std::ios_base::badbit);
+        inputStream = decompressed;
+    }
 
     tmp_line = "";
     title = "";
     current_line_num = 0;
+    ranges.clear();
+    range_index = 0;
 
     return inputStream->good();
 }
 
+void
+NetlistLineReader::set_ranges(boost::python::list const& range_list) {
+    std::vector<LineRange> line_ranges;
+    for(int i = 0; i < boost::python::len(range_list); i++) {
+        LineRange range;
+        range.start = boost::python::extract<long long>(range_list[i][0]);
+        range.end = boost::python::extract<long long>(range_list[i][1]);
+        range.first_line = boost::python::extract<int>(range_list[i][2]);
+        line_ranges.push_back(range);
+    }
+    set_ranges(line_ranges);
+}
+
+void
+NetlistLineReader::set_ranges(std::vector<LineRange> const& line_ranges) {
+    if (!compression.empty() && !line_ranges.empty()) {
+        throw std::logic_error("a compressed file cannot be read in ranges");
+    }
+    ranges = line_ranges;
+    range_index = 0;
+
+    if (!ranges.empty()) {
+        inputStream->clear();
+        inputStream->seekg(ranges[0].start);
+        current_line_num = ranges[0].first_line - 1;
+    }
+}
+
 void
 NetlistLineReader::close() {
     //if(inputStream->good()) {
-    inputStream->close();
-    inputStream->clear();
-    delete inputStream;
+    if (inputStream != inputFile) {
+        delete inputStream;
+    }
+    inputFile->close();
+    inputFile->clear();
+    delete inputFile;
     //}
 }
 
 
+void
+ParseAhead::start(std::function<bool (NetlistLine&)> read_line, size_t queue_size) {
+    stop();
+    queue.clear();
+    error = std::exception_ptr();
+    capacity = queue_size;
+    finished = false;
+    stopping = false;
+    worker = std::thread(&ParseAhead::run, this, read_line);
+}
+
+void
+ParseAhead::run(std::function<bool (NetlistLine&)> read_line) {
+    while (true) {
+        NetlistLine line;
+        bool more;
+        try {
+            more = read_line(line);
+        } catch (...) {
+            std::lock_guard<std::mutex> lock(mutex);
+            error = std::current_exception();
+            finished = true;
+            lines_ready.notify_all();
+            return;
+        }
+
+        std::unique_lock<std::mutex> lock(mutex);
+        if (!more) {
+            finished = true;
+            lines_ready.notify_all();
+            return;
+        }
+        space_ready.wait(lock, [this] { return stopping || queue.size() < capacity; });
+        if (stopping) {
+            return;
+        }
+        queue.push_back(std::move(line));
+        lines_ready.notify_all();
+    }
+}
+
+void
+ParseAhead::take(std::vector<NetlistLine>& out, size_t max_lines) {
+    std::unique_lock<std::mutex> lock(mutex);
+    lines_ready.wait(lock, [this] { return !queue.empty() || finished; });
+    while (!queue.empty() && out.size() < max_lines) {
+        out.push_back(std::move(queue.front()));
+        queue.pop_front();
+    }
+    space_ready.notify_all();
+
+    if (out.empty() && error) {
+        std::exception_ptr rethrown = error;
+        error = std::exception_ptr();
+        std::rethrow_exception(rethrown);
+    }
+}
+
+void
+ParseAhead::stop() {
+    if (!worker.joinable()) {
+        return;
+    }
+    {
+        std::lock_guard<std::mutex> lock(mutex);
+        stopping = true;
+    }
+    space_ready.notify_all();
+    worker.join();
+    queue.clear();
+}
+
+
+// true if a line may be continued on the next one.  Inline comments are
+// not stripped, so any line with a backslash may be
+static bool may_continue(const std::string& line) {
+    return line.find('\\') != std::string::npos;
+}
+
+std::vector<std::streamoff>
+statement_starts(const std::string& filename, std::streamoff chunk_bytes) {
+    std::vector<std::streamoff> starts(1, 0);
+    std::ifstream input(filename.c_str(), std::ifstream::in | std::ifstream::binary);
+    input.seekg(0, std::ifstream::end);
+    std::streamoff size = input.tellg();
+
+    std::string line;
+    for (std::streamoff offset = chunk_bytes; offset < size; offset += chunk_bytes) {
+        if (offset <= starts.back()) {
+            continue;
+        }
+        input.clear();
+        input.seekg(offset);
+        // the line at the offset may be part of a continued one, so the
+        // search starts at the statement after it
+        getline(input, line);
+        bool continued = true;
+        std::streamoff line_start = input.tellg();
+        while (getline(input, line)) {
+            boost::trim(line);
+            if (!line.empty() && !boost::starts_with(line, "*") && !boost::starts_with(line, "//") &&
+                !boost::starts_with(line, "$")) {
+                if (!continued && !boost::starts_with(line, "+") && !boost::starts_with(line, ")")) {
+                    starts.push_back(line_start);
+                    break;
+                }
+                continued = may_continue(line);
+            }
+            line_start = input.tellg();
+        }
+    }
+    return starts;
+}
+
+// newlines in a range of a file
+static int count_lines(const std::string& filename, const LineRange& range) {
+    std::ifstream input(filename.c_str(), std::ifstream::in | std::ifstream::binary);
+    input.seekg(range.start);
+    std::vector<char> block(1 << 20);
+    std::streamoff left = range.end - range.start;
+    int count = 0;
+    while (left > 0 && input.good()) {
+        input.read(&block[0], std::min<std::streamoff>(left, block.size()));
+        std::streamsize read = input.gcount();
+        if (read <= 0) {
+            break;
+        }
+        count += std::count(block.begin(), block.begin() + read, '\n');
+        left -= read;
+    }
+    return count;
+}
+
+
+void
+ParallelParse::start(const std::string& filenm, std::function<void (ParsedChunk&)> parse,
+                     std::streamoff chunk_bytes, size_t threads) {
+    stop();
+    filename = stored_path(filenm);
+    parse_chunk = parse;
+
+    std::vector<std::streamoff> starts = statement_starts(filename, chunk_bytes);
+    std::ifstream input(filename.c_str(), std::ifstream::in | std::ifstream::binary);
+    input.seekg(0, std::ifstream::end);
+    std::streamoff size = input.tellg();
+
+    chunks.assign(starts.size(), ParsedChunk());
+    for (size_t i = 0; i < starts.size(); i++) {
+        chunks[i].range.start = starts[i];
+        chunks[i].range.end = i + 1 < starts.size() ? starts[i + 1] : size;
+        chunks[i].range.first_line = 1;
+        chunks[i].last = i + 1 == starts.size();
+    }
+
+    taken = 0;
+    next_chunk = 0;
+    window = 2 * threads;
+    line_offset = 0;
+    state = 0;
+    stopping = false;
+    active = true;
+    for (size_t i = 0; i < std::min(threads, chunks.size()); i++) {
+        workers.push_back(std::thread(&ParallelParse::run, this));
+    }
+}
+
+void
+ParallelParse::run() {
+    while (true) {
+        size_t index;
+        {
+            std::unique_lock<std::mutex> lock(mutex);
+            window_open.wait(lock, [this] { return stopping || next_chunk >= chunks.size() || next_chunk < taken + window; });
+            if (stopping || next_chunk >= chunks.size()) {
+                return;
+            }
+            index = next_chunk++;
+        }
+
+        // the chunk is only touched by this thread until it is parsed
+        ParsedChunk& chunk = chunks[index];
+        try {
+            if (!chunk.last) {
+                chunk.line_count = count_lines(filename, chunk.range);
+            }
+            parse_chunk(chunk);
+        } catch (...) {
+            chunk.error = std::current_exception();
+        }
+
+        std::lock_guard<std::mutex> lock(mutex);
+        chunk.parsed = true;
+        chunk_parsed.notify_all();
+    }
+}
+
+void
+ParallelParse::take(std::vector<NetlistLine>& out, size_t max_lines) {
+    while (out.size() < max_lines && taken < chunks.size()) {
+        ParsedChunk& chunk = chunks[taken];
+        if (!chunk.checked) {
+            {
+                std::unique_lock<std::mutex> lock(mutex);
+                if (!chunk.parsed && !out.empty()) {
+                    return;
+                }
+                chunk_parsed.wait(lock, [&chunk] { return chunk.parsed; });
+            }
+
+            if (chunk.start_state != state) {
+                chunk.start_state = state;
+                chunk.lines.clear();
+                chunk.error = std::exception_ptr();
+                try {
+                    parse_chunk(chunk);
+                } catch (...) {
+                    chunk.error = std::current_exception();
+                }
+            }
+            if (chunk.error) {
+                // the lines after the error are not read
+                std::exception_ptr rethrown = chunk.error;
+                {
+                    std::lock_guard<std::mutex> lock(mutex);
+                    stopping = true;
+                    taken = chunks.size();
+                }
+                window_open.notify_all();
+                std::rethrow_exception(rethrown);
+            }
+            state = chunk.end_state;
+            chunk.checked = true;
+        }
+
+        while (chunk.next_line < chunk.lines.size() && out.size() < max_lines) {
+            NetlistLine& line = chunk.lines[chunk.next_line++];
+            for (size_t i = 0; i < line.linenums.size(); i++) {
+                line.linenums[i] += line_offset;
+            }
+            out.push_back(std::move(line));
+        }
+
+        if (chunk.next_line == chunk.lines.size()) {
+            line_offset += chunk.line_count;
+            std::vector<NetlistLine>().swap(chunk.lines);
+            {
+                std::lock_guard<std::mutex> lock(mutex);
+                taken++;
+            }
+            window_open.notify_all();
+        }
+    }
+}
+
+void
+ParallelParse::stop() {
+    {
+        std::lock_guard<std::mutex> lock(mutex);
+        stopping = true;
+    }
+    window_open.notify_all();
+    for (size_t i = 0; i < workers.size(); i++) {
+        workers[i].join();
+    }
+    workers.clear();
+    chunks.clear();
+    active = false;
+}
+
+
+// reads only the given parts of the opened file, see NetlistLineReader::set_ranges
+template <typename Parser>
+void set_parser_ranges(Parser& parser, boost::python::list const& range_list) {
+    if (parser.ahead.running() || parser.parallel.running()) {
+        throw std::logic_error("ranges must be set before reading ahead");
+    }
+    parser.reader.set_ranges(range_list);
+}
+
+
 BOOST_PYTHON_MODULE(SpiritCommon)
 {
     boost::python::class_<ParseObject>("ParseObject")
-        .def_readwrite("value", &ParseObject::value)
+        .add_property("value", &get_parsed_object_value, &set_parsed_object_value)
         .def_readonly("types", &ParseObject::types)
+        .add_property("key", &parsed_object_key)
         ;
 
     boost::python::class_<BoostParsedLine>("BoostParsedLine")
@@ -237,43 +684,63 @@ BOOST_PYTHON_MODULE(SpiritCommon)
         .value("BINNED_MODEL_NAME", adm_boost_common::BINNED_MODEL_NAME)
         ;
 
-    boost::python::class_<TSPICENetlistBoostParser>("TSPICENetlistBoostParser")
+    boost::python::class_<TSPICENetlistBoostParser, boost::noncopyable>("TSPICENetlistBoostParser")
         .def("open", &TSPICENetlistBoostParser::open)
         .def("close", &TSPICENetlistBoostParser::close)
-        .def("next", &TSPICENetlistBoostParser::next)
-        .def("__next__", &TSPICENetlistBoostParser::next)
+        .def("next", &next_line<TSPICENetlistBoostParser>)
+        .def("next_lines", &next_lines<TSPICENetlistBoostParser>)
+        .def("set_ranges", &set_parser_ranges<TSPICENetlistBoostParser>)
+        .def("parse_ahead", &start_parse_ahead<TSPICENetlistBoostParser>)
+        .def("parse_parallel", &start_parse_parallel<TSPICENetlistBoostParser>)
+        .def("__next__", &next_line<TSPICENetlistBoostParser>)
         .def("__iter__", pass_through)
         ;
 
-    boost::python::class_<SpectreNetlistBoostParser>("SpectreNetlistBoostParser")
+    boost::python::class_<SpectreNetlistBoostParser, boost::noncopyable>("SpectreNetlistBoostParser")
         .def("open", &SpectreNetlistBoostParser::open)
         .def("close", &SpectreNetlistBoostParser::close)
-        .def("next", &SpectreNetlistBoostParser::next)
-        .def("__next__", &SpectreNetlistBoostParser::next)
+        .def("next", &next_line<SpectreNetlistBoostParser>)
+        .def("next_lines", &next_lines<SpectreNetlistBoostParser>)
+        .def("set_ranges", &set_parser_ranges<SpectreNetlistBoostParser>)
+        .def("parse_ahead", &start_parse_ahead<SpectreNetlistBoostParser>)
+        .def("parse_parallel", &start_parse_parallel<SpectreNetlistBoostParser>)
+        .def("__next__", &next_line<SpectreNetlistBoostParser>)
         .def("__iter__", pass_through)
         ;
 
-    boost::python::class_<HSPICENetlistBoostParser>("HSPICENetlistBoostParser")
+    boost::python::class_<HSPICENetlistBoostParser, boost::noncopyable>("HSPICENetlistBoostParser")
         .def("open", &HSPICENetlistBoostParser::open)
         .def("close", &HSPICENetlistBoostParser::close)
-        .def("next", &HSPICENetlistBoostParser::next)
-        .def("__next__", &HSPICENetlistBoostParser::next)
+        .def("next", &next_line<HSPICENetlistBoostParser>)
+        .def("next_lines", &next_lines<HSPICENetlistBoostParser>)
+        .def("set_ranges", &set_parser_ranges<HSPICENetlistBoostParser>)
+        .def("parse_ahead", &start_parse_ahead<HSPICENetlistBoostParser>)
+        .def("parse_parallel", &start_parse_parallel<HSPICENetlistBoostParser>)
+        .def("__next__", &next_line<HSPICENetlistBoostParser>)
         .def("__iter__", pass_through)
         ;
 
-    boost::python::class_<PSPICENetlistBoostParser>("PSPICENetlistBoostParser")
+    boost::python::class_<PSPICENetlistBoostParser, boost::noncopyable>("PSPICENetlistBoostParser")
         .def("open", &PSPICENetlistBoostParser::open)
         .def("close", &PSPICENetlistBoostParser::close)
-        .def("next", &PSPICENetlistBoostParser::next)
-        .def("__next__", &PSPICENetlistBoostParser::next)
+        .def("next", &next_line<PSPICENetlistBoostParser>)
+        .def("next_lines", &next_lines<PSPICENetlistBoostParser>)
+        .def("set_ranges", &set_parser_ranges<PSPICENetlistBoostParser>)
+        .def("parse_ahead", &start_parse_ahead<PSPICENetlistBoostParser>)
+        .def("parse_parallel", &start_parse_parallel<PSPICENetlistBoostParser>)
+        .def("__next__", &next_line<PSPICENetlistBoostParser>)
         .def("__iter__", pass_through)
         ;
 
-    boost::python::class_<XyceNetlistBoostParser>("XyceNetlistBoostParser")
+    boost::python::class_<XyceNetlistBoostParser, boost::noncopyable>("XyceNetlistBoostParser")
         .def("open", &XyceNetlistBoostParser::open)
         .def("close", &XyceNetlistBoostParser::close)
-        .def("next", &XyceNetlistBoostParser::next)
-        .def("__next__", &XyceNetlistBoostParser::next)
+        .def("next", &next_line<XyceNetlistBoostParser>)
+        .def("next_lines", &next_lines<XyceNetlistBoostParser>)
+        .def("set_ranges", &set_parser_ranges<XyceNetlistBoostParser>)
+        .def("parse_ahead", &start_parse_ahead<XyceNetlistBoostParser>)
+        .def("parse_parallel", &start_parse_parallel<XyceNetlistBoostParser>)
+        .def("__next__", &next_line<XyceNetlistBoostParser>)
         .def("__iter__", pass_through)
         ;
 
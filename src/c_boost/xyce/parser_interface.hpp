@@ -28,7 +28,14 @@
 #include <boost/python.hpp>
 #include "boost_adm_parser_common.h"
 #include <boost/algorithm/string.hpp>
+#include <condition_variable>
+#include <deque>
+#include <exception>
+#include <functional>
+#include <mutex>
+#include <stdexcept>
 #include <string>
+#include <thread>
 #include <vector>
 #include <queue>
 #include <fstream>
@@ -53,15 +60,45 @@ struct BoostParsedLine {
 };
 
 
+// A line read from a netlist and the objects the grammar parsed it into.
+// It holds no Python objects, so lines can be read and parsed without the
+// GIL, see ParseAhead.  convert_to_python gives the BoostParsedLine of it
+struct NetlistLine {
+    std::vector<int> linenums;
+    std::string filename;
+    std::string sourceLine;
+    std::string errorType;
+    std::string errorMessage;
+    std::vector<adm_boost_common::netlist_statement_object> parsedObjects;
+};
+
+
 struct ParseObject {
     std::string value;
     boost::python::list types;
+    // value in upper case, made on first use, see parsed_object_key
+    boost::python::object key;
 };
 
 
+// Returns the value of a parsed object in upper case, the key the readers
+// look names up by in case insensitive dialects.  Keys short enough to be
+// names are interned, so every spelling of a name shares one Python string
+boost::python::object parsed_object_key(ParseObject& obj);
+
+
 // Takes in a parsed line object and returns the associated line numbers from the original
 // file as a string (e.g. "[45,46,47]")
-std::string getLineNumsString (BoostParsedLine parsedLine);
+std::string getLineNumsString (const NetlistLine& parsedLine);
+
+// The grammar of a dialect.  A grammar sets up several hundred rules, so it is
+// built once and shared by every parser of the dialect rather than rebuilt for
+// each line read
+template <typename Grammar>
+const Grammar& grammar() {
+    static const Grammar g;
+    return g;
+}
 
 // Identifies if an inline comment is present based on grammar, 
 // returns the line with the inline comment stripped from it
@@ -70,16 +107,16 @@ std::string stripInlineCommentString(std::string line, Grammar const&g) {
     std::string::const_iterator start = line.begin();
     std::string::const_iterator end = line.end();
     std::string currentInlineComment = "";
-    std::string inlineCommentIdentifier = "INLINE_COMMENT";
     std::vector<std::string> results;
     std::string rtnLine;
     std::vector<adm_boost_common::netlist_statement_object> netlist_parse_results;
 
     bool r = phrase_parse(start, end, g, boost::spirit::ascii::space, netlist_parse_results);
     for(int i = 0; i < netlist_parse_results.size(); i++) {
-        std::string dataModelType = adm_boost_common::getDataModelTypeStr(netlist_parse_results[i]);
+        // compare the type directly rather than building its name for every token
+        const adm_boost_common::candidate_type_set& types = netlist_parse_results[i].candidate_types;
 
-        if (dataModelType == inlineCommentIdentifier){
+        if (!types.empty() && types.back() == adm_boost_common::INLINE_COMMENT){
             currentInlineComment = netlist_parse_results[i].value;
         }
      }
@@ -93,32 +130,94 @@ std::string stripInlineCommentString(std::string line, Grammar const&g) {
     return rtnLine;
 }
 
+// A part of a file to be read: byte offsets [start, end) and the number
+// of the line at start
+struct LineRange {
+    std::streamoff start;
+    std::streamoff end;
+    int first_line;
+};
+
+// The path a netlist file is read from: the file itself, or when there is
+// no regular file by that name, a compressed copy of it named with one of
+// COMPRESSED_SUFFIXES
+std::string stored_path(const std::string& filename);
+
+// "gzip" or "zstd" for a file compressed with them, by its magic bytes, and
+// "" for any other file
+std::string file_compression(const std::string& path);
+
 struct NetlistLineReader {
 
-    std::ifstream * inputStream;
+    // the lines of the file, decompressed if it is compressed
+    std::istream * inputStream;
+    std::ifstream * inputFile;
     std::string filename;
+    // see file_compression.  A compressed file is read without seeking, so
+    // it can not be read in ranges
+    std::string compression;
     std::string title;
 
     std::string tmp_line;
     int current_line_num;
 
-    std::queue<BoostParsedLine> lines;
+    std::queue<NetlistLine> lines;
+
+    // parts of the file to read, in file order.  Empty to read all of it
+    std::vector<LineRange> ranges;
+    size_t range_index;
 
+    // Opens a netlist file, which keeps the name filenm in the lines read
+    // when it is read from a compressed copy, see stored_path
     bool open(std::string filenm);
 
     void close();
 
+    // Restricts reading to a list of (start, end, first line) tuples
+    void set_ranges(boost::python::list const& range_list);
+
+    void set_ranges(std::vector<LineRange> const& line_ranges);
+
+    // true while there are lines left to read
+    bool more_lines() {
+        if (ranges.empty()) {
+            return !inputStream->eof();
+        }
+        if (range_index + 1 < ranges.size()) {
+            return true;
+        }
+        return inputStream->good() && inputStream->tellg() < ranges[range_index].end;
+    }
+
+    // reads the next line, moving on to the start of the next range once
+    // the current one has been read
+    void get_next_line(std::string& line) {
+        while (!ranges.empty() && range_index + 1 < ranges.size() &&
+               (!inputStream->good() || inputStream->tellg() >= ranges[range_index].end)) {
+            range_index++;
+            inputStream->clear();
+            inputStream->seekg(ranges[range_index].start);
+            current_line_num = ranges[range_index].first_line - 1;
+        }
+        // only a compressed file throws, when it is corrupt or truncated
+        try {
+            getline(*inputStream, line);
+        } catch (std::exception const& e) {
+            throw std::runtime_error("error reading " + filename + ": " + e.what());
+        }
+    }
+
     template <typename Grammar>
     void read_next_parsable_line(Grammar const& g) {
     
-        BoostParsedLine parsedLine;
+        NetlistLine parsedLine;
         parsedLine.filename = filename;
         std::string currentRtnLine, nextRtnLine;
     
-        if(!inputStream->good()) {
+        if(!inputStream->good() || !more_lines()) {
             if(tmp_line != "") {
                 parsedLine.sourceLine = tmp_line;
-                parsedLine.linenums.append(current_line_num);
+                parsedLine.linenums.push_back(current_line_num);
                 lines.push(parsedLine);
             }
             tmp_line = "";
@@ -129,8 +228,8 @@ struct NetlistLineReader {
     
         if(tmp_line.empty()) {
             //find start of next parsable line
-            while(line_next.empty() && !inputStream->eof()) {
-                getline(*inputStream, line_next);
+            while(line_next.empty() && more_lines()) {
+                get_next_line(line_next);
                 boost::trim(line_next);
                 current_line_num++;
             }
@@ -140,7 +239,7 @@ struct NetlistLineReader {
         }
     
         parsedLine.sourceLine = line_next;
-        parsedLine.linenums.append(current_line_num);
+        parsedLine.linenums.push_back(current_line_num);
 
         bool foundEnd = false;
         std::string origCommandLine = "";
@@ -148,9 +247,9 @@ struct NetlistLineReader {
         std::string tmpCommandLine;
         std::vector<std::string> results;
 
-        while(!foundEnd && !inputStream->eof()) {
+        while(!foundEnd && more_lines()) {
     
-            getline(*inputStream, line_next);
+            get_next_line(line_next);
             boost::trim(line_next);
             current_line_num++;
     
@@ -159,10 +258,10 @@ struct NetlistLineReader {
             if(line_next.empty()) continue;
 
             if(boost::starts_with(line_next, "*") || boost::starts_with(line_next, "//") || boost::starts_with(line_next, "$")) {
-                BoostParsedLine commentLine;
+                NetlistLine commentLine;
                 commentLine.filename = filename;
                 commentLine.sourceLine = line_next;
-                commentLine.linenums.append(current_line_num);
+                commentLine.linenums.push_back(current_line_num);
                 lines.push(commentLine);
                 tmp_line = "";
             }
@@ -195,7 +294,7 @@ struct NetlistLineReader {
                     parsedLine.sourceLine = parsedLine.sourceLine + " " + results[1];
                 }
                 boost::trim_right(parsedLine.sourceLine);
-                parsedLine.linenums.append(current_line_num);
+                parsedLine.linenums.push_back(current_line_num);
                 tmp_line = "";
             }
             // must check case of "\\" continuation first in order to avoid going into "\" block mistakenly
@@ -212,7 +311,7 @@ struct NetlistLineReader {
                     tmpOrigCommandLine = parsedLine.sourceLine;
                 } 
                 boost::trim_right(parsedLine.sourceLine);
-                parsedLine.linenums.append(current_line_num);
+                parsedLine.linenums.push_back(current_line_num);
             }
             // Block to check for line continuation using "\" character.
             // Same as in two blocks above: need to save original, first portion of the line with 
@@ -249,13 +348,19 @@ struct NetlistLineReader {
                         parsedLine.sourceLine = parsedLine.sourceLine + " " + results[1];
                     }
                     boost::trim_right(parsedLine.sourceLine);
-                    parsedLine.linenums.append(current_line_num);
+                    parsedLine.linenums.push_back(current_line_num);
                 }
                 else {
                     foundEnd = true;
                 }
             }
         }
+
+        // the last line read is part of this line unless it starts the next
+        // one, as when a range ends with a continued line
+        if(!foundEnd) {
+            tmp_line = "";
+        }
     
         lines.push(parsedLine);
     }
@@ -268,9 +373,9 @@ struct NetlistLineReader {
 
 
     template <typename Grammar>
-    BoostParsedLine next(Grammar const& g){
+    NetlistLine next(Grammar const& g){
         read_next_parsable_line(g);
-        BoostParsedLine rtn = lines.front();
+        NetlistLine rtn = lines.front();
         lines.pop();
         return rtn;
     }
@@ -278,11 +383,269 @@ struct NetlistLineReader {
 };
 
 
+// Reads and parses the lines of a netlist ahead of the caller on a native
+// thread, into a queue of at most queue_size lines.  The thread holds no
+// Python objects and runs without the GIL, so reading and parsing overlap
+// with the Python processing of the lines already read
+class ParseAhead {
+public:
+    ParseAhead() : capacity(1), finished(false), stopping(false) {}
+
+    ~ParseAhead() { stop(); }
+
+    // Starts the thread, which calls read_line until it returns false
+    void start(std::function<bool (NetlistLine&)> read_line, size_t queue_size);
+
+    bool running() const { return worker.joinable(); }
+
+    // Moves up to max_lines lines to out, waiting for at least one unless
+    // all of them have been taken.  Rethrows an exception of read_line.
+    // Call without the GIL
+    void take(std::vector<NetlistLine>& out, size_t max_lines);
+
+    // Stops the thread, dropping the lines not taken yet
+    void stop();
+
+private:
+    void run(std::function<bool (NetlistLine&)> read_line);
+
+    std::thread worker;
+    std::mutex mutex;
+    std::condition_variable lines_ready;
+    std::condition_variable space_ready;
+    std::deque<NetlistLine> queue;
+    std::exception_ptr error;
+    size_t capacity;
+    bool finished;
+    bool stopping;
+};
+
+
+// A part of a netlist parsed on its own by ParallelParse
+struct ParsedChunk {
+    // lines are numbered from 1 within the chunk, ParallelParse::take
+    // numbers them in the file
+    LineRange range;
+    bool last;
+    // newlines in the range
+    int line_count;
+    // the parser state the chunk was parsed from and the state it left,
+    // see parse_state
+    int start_state;
+    int end_state;
+    std::vector<NetlistLine> lines;
+    std::exception_ptr error;
+    bool parsed;
+    // set once the consumer has checked the chunk's start state
+    bool checked;
+    size_t next_line;
+
+    ParsedChunk() : last(false), line_count(0), start_state(0), end_state(0), parsed(false), checked(false), next_line(0) {}
+};
+
+// Offsets of the statements of a file about chunk_bytes apart, starting
+// with 0.  A statement starts a line that is not a comment, does not start
+// with "+" or ")" and does not follow a line ending with a "\" continuation
+std::vector<std::streamoff> statement_starts(const std::string& filename, std::streamoff chunk_bytes);
+
+// Parses a file in chunks split at statement boundaries, on native threads
+// that run without the GIL.  The chunks are parsed at most two per thread
+// ahead of the consumer, and their lines are taken in file order.
+//
+// A chunk is parsed assuming its parser starts in the initial state, see
+// parse_state.  When the chunk before it left the parser in another state,
+// as inside a Spectre statistics block, the consumer parses it again from
+// that state
+class ParallelParse {
+public:
+    ParallelParse() : taken(0), next_chunk(0), window(1), line_offset(0), state(0), active(false), stopping(false) {}
+
+    ~ParallelParse() { stop(); }
+
+    // Splits the file into chunks of about chunk_bytes and starts threads
+    // that parse them with parse_chunk
+    void start(const std::string& filenm, std::function<void (ParsedChunk&)> parse_chunk,
+               std::streamoff chunk_bytes, size_t threads);
+
+    bool running() const { return active; }
+
+    // Moves up to max_lines lines to out in file order, waiting for at least
+    // one unless all of them have been taken.  Rethrows an exception of
+    // parse_chunk.  Call without the GIL
+    void take(std::vector<NetlistLine>& out, size_t max_lines);
+
+    // Stops the threads, dropping the lines not taken yet
+    void stop();
+
+private:
+    void run();
+
+    std::string filename;
+    std::function<void (ParsedChunk&)> parse_chunk;
+    std::vector<std::thread> workers;
+    std::mutex mutex;
+    std::condition_variable chunk_parsed;
+    std::condition_variable window_open;
+    std::vector<ParsedChunk> chunks;
+    // the chunk the consumer takes lines from, and the next one to parse
+    size_t taken;
+    size_t next_chunk;
+    size_t window;
+    // lines of the chunks taken, and the parser state they left
+    int line_offset;
+    int state;
+    bool active;
+    bool stopping;
+};
+
+
 ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
 // PYTHON INTERFACE
 //////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
 
-void convert_to_parsed_objects(std::vector<adm_boost_common::netlist_statement_object> netlist_parse_results, BoostParsedLine parsedLine);
+void convert_to_parsed_objects(const std::vector<adm_boost_common::netlist_statement_object>& netlist_parse_results, BoostParsedLine& parsedLine);
+
+// The Python form of a line, made with the GIL held
+BoostParsedLine convert_to_python(const NetlistLine& line);
+
+// Releases the GIL for as long as it exists
+class ReleaseGIL {
+public:
+    ReleaseGIL() : state(PyEval_SaveThread()) {}
+    ~ReleaseGIL() { PyEval_RestoreThread(state); }
+private:
+    PyThreadState* state;
+};
+
+// The parsers below are the dialect parsers, which have a NetlistLineReader
+// reader, a ParseAhead ahead, a ParallelParse parallel and a
+// read(NetlistLine&) method that reads and parses the next line, returning
+// false at the end of the file
+
+// The state a parser carries from one line to the next, which a chunk of a
+// file parsed on its own must start from.  None for most dialects
+template <typename Parser>
+int parse_state(const Parser& parser) {
+    return 0;
+}
+
+template <typename Parser>
+void set_parse_state(Parser& parser, int state) {
+}
+
+// Parses a chunk of a file with a parser of its own, see ParallelParse
+template <typename Parser>
+void parse_chunk(const std::string& filename, bool top_level_file, ParsedChunk& chunk) {
+    Parser parser;
+    // only the chunk at the start of the file has the title line
+    if (!parser.open(filename, top_level_file && chunk.range.start == 0)) {
+        throw std::runtime_error("cannot open " + filename);
+    }
+    try {
+        parser.reader.set_ranges(std::vector<LineRange>(1, chunk.range));
+        set_parse_state(parser, chunk.start_state);
+        NetlistLine line;
+        while (parser.read(line)) {
+            chunk.lines.push_back(std::move(line));
+            line = NetlistLine();
+        }
+        chunk.end_state = parse_state(parser);
+    } catch (...) {
+        parser.close();
+        throw;
+    }
+    parser.close();
+}
+
+// Starts parsing the opened file in chunks of about chunk_bytes on threads
+// threads, see ParallelParse
+template <typename Parser>
+void start_parse_parallel(Parser& parser, int threads, long long chunk_bytes) {
+    if (threads < 1) {
+        throw std::invalid_argument("parse threads must be at least 1");
+    }
+    if (chunk_bytes < 1) {
+        throw std::invalid_argument("parse chunk size must be at least 1 byte");
+    }
+    if (!parser.reader.ranges.empty()) {
+        throw std::logic_error("a file read in ranges cannot be parsed in chunks");
+    }
+    if (!parser.reader.compression.empty()) {
+        throw std::logic_error("a compressed file cannot be parsed in chunks");
+    }
+    parser.ahead.stop();
+    std::string filename = parser.reader.filename;
+    bool top_level_file = parser.is_top_level_file;
+    parser.parallel.start(filename,
+                          [filename, top_level_file](ParsedChunk& chunk) { parse_chunk<Parser>(filename, top_level_file, chunk); },
+                          chunk_bytes, threads);
+}
+
+// Starts reading ahead, see ParseAhead
+template <typename Parser>
+void start_parse_ahead(Parser& parser, int queue_size) {
+    if (queue_size < 1) {
+        throw std::invalid_argument("parse ahead queue size must be at least 1");
+    }
+    parser.ahead.start([&parser](NetlistLine& line) { return parser.read(line); }, queue_size);
+}
+
+// The next line, for __next__
+template <typename Parser>
+BoostParsedLine next_line(Parser& parser) {
+    NetlistLine line;
+    bool found;
+    if (parser.parallel.running() || parser.ahead.running()) {
+        std::vector<NetlistLine> lines;
+        {
+            ReleaseGIL release;
+            if (parser.parallel.running()) {
+                parser.parallel.take(lines, 1);
+            } else {
+                parser.ahead.take(lines, 1);
+            }
+        }
+        found = !lines.empty();
+        if (found) {
+            line = std::move(lines[0]);
+        }
+    } else {
+        found = parser.read(line);
+    }
+
+    if (!found) {
+        PyErr_SetString(PyExc_StopIteration, "No more data.");
+        boost::python::throw_error_already_set();
+    }
+    return convert_to_python(line);
+}
+
+// A list of the next lines, at most max_lines of them.  When reading ahead
+// or in chunks, only the lines already read are taken once there is one.
+// Empty at the end of the file
+template <typename Parser>
+boost::python::list next_lines(Parser& parser, int max_lines) {
+    std::vector<NetlistLine> lines;
+    if (parser.parallel.running()) {
+        ReleaseGIL release;
+        parser.parallel.take(lines, max_lines < 1 ? 1 : max_lines);
+    } else if (parser.ahead.running()) {
+        ReleaseGIL release;
+        parser.ahead.take(lines, max_lines < 1 ? 1 : max_lines);
+    } else {
+        NetlistLine line;
+        while (int(lines.size()) < max_lines && parser.read(line)) {
+            lines.push_back(std::move(line));
+            line = NetlistLine();
+        }
+    }
+
+    boost::python::list parsedLines;
+    for (size_t i = 0; i < lines.size(); i++) {
+        parsedLines.append(convert_to_python(lines[i]));
+    }
+    return parsedLines;
+}
 
 
 inline boost::python::object pass_through(boost::python::object const& o) { return o; }
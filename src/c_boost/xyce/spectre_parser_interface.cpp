@@ -35,21 +35,21 @@ SpectreNetlistBoostParser::open(std::string filenm, bool top_level_file) {
 
 void
 SpectreNetlistBoostParser::close() {
+        parallel.stop();
+        ahead.stop();
         reader.close();
     }
 
-BoostParsedLine
-SpectreNetlistBoostParser::next() {
+bool
+SpectreNetlistBoostParser::read(NetlistLine& parsedLine) {
 
-        typedef spectre_parser<iterator_type> spectre_parser;
-        spectre_parser g;
+        const spectre_parser<iterator_type>& g = grammar<spectre_parser<iterator_type> >();
 
         if(!reader.hasNext(g)) {
-            PyErr_SetString(PyExc_StopIteration, "No more data.");
-            boost::python::throw_error_already_set();
+            return false;
         }
 
-        BoostParsedLine parsedLine = reader.next(g);
+        parsedLine = reader.next(g);
 
         // BUGZILLA-2089
         // We need to parse out 'statistics' lines, but statistics lines can have nested
@@ -79,7 +79,7 @@ SpectreNetlistBoostParser::next() {
                 }
             }
 
-            return parsedLine;
+            return true;
         }
 
         if(is_top_level_file && parsedLine.linenums[0] == 1)  {
@@ -90,21 +90,20 @@ SpectreNetlistBoostParser::next() {
             std::vector<adm_boost_common::netlist_statement_object> v;
             v.push_back(titleNSO);
 
-            convert_to_parsed_objects(v, parsedLine);
+            parsedLine.parsedObjects = v;
         } else {
             parseLine(parsedLine);
         }
 
-        return parsedLine;
+        return true;
     }
 
 void
-SpectreNetlistBoostParser::parseLine(BoostParsedLine & parsedLine) {
+SpectreNetlistBoostParser::parseLine(NetlistLine & parsedLine) {
 
         //setup parser objects
         //typedef std::string::const_iterator iterator_type;
-        typedef spectre_parser<iterator_type> spectre_parser;
-        spectre_parser g;
+        const spectre_parser<iterator_type>& g = grammar<spectre_parser<iterator_type> >();
 
         std::string::const_iterator start = parsedLine.sourceLine.begin();
         std::string::const_iterator end = parsedLine.sourceLine.end();
@@ -122,7 +121,7 @@ SpectreNetlistBoostParser::parseLine(BoostParsedLine & parsedLine) {
                std::cout << netlist_parse_results[i] << std::endl;
                }
                */
-            convert_to_parsed_objects(netlist_parse_results, parsedLine);
+            parsedLine.parsedObjects.swap(netlist_parse_results);
         } else {
 
             netlist_parse_results.clear();
@@ -134,7 +133,7 @@ SpectreNetlistBoostParser::parseLine(BoostParsedLine & parsedLine) {
             parsedLine.errorMessage = parsedLine.sourceLine;
             bool comment_readable = phrase_parse(start, end, g, boost::spirit::ascii::space, netlist_parse_results);
             if (comment_readable){
-                convert_to_parsed_objects(netlist_parse_results, parsedLine);
+                parsedLine.parsedObjects.swap(netlist_parse_results);
             } else {
                 std::cout << "\nBoost Parsing failed around line " + getLineNumsString (parsedLine) +
                     " and line(s) could not be converted to comment\n" << std::endl;
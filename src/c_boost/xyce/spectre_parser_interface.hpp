@@ -32,18 +32,36 @@
 struct SpectreNetlistBoostParser {
 
     NetlistLineReader reader;
+    ParseAhead ahead;
+    ParallelParse parallel;
     bool is_top_level_file = true;
 
     bool open(std::string filenm, bool top_level_file);
 
     void close();
 
-    BoostParsedLine next();
+    // reads and parses the next line, false at the end of the file
+    bool read(NetlistLine& parsedLine);
 
-    void parseLine(BoostParsedLine & parsedLine);
+    void parseLine(NetlistLine & parsedLine);
+
+    // how deeply nested in the curly brackets of a statistics block the
+    // next line is
+    int statistics_depth() const { return bracketCount; }
+
+    void set_statistics_depth(int depth) { bracketCount = depth; }
 
     private:
     int bracketCount = 0;
 };
 
+// a chunk of a file may start inside a statistics block, see ParallelParse
+inline int parse_state(const SpectreNetlistBoostParser& parser) {
+    return parser.statistics_depth();
+}
+
+inline void set_parse_state(SpectreNetlistBoostParser& parser, int state) {
+    parser.set_statistics_depth(state);
+}
+
 #endif
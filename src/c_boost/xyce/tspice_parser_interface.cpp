@@ -40,22 +40,22 @@ TSPICENetlistBoostParser::open(std::string filenm, bool top_level_file) {
 
 void
 TSPICENetlistBoostParser::close() {
+        parallel.stop();
+        ahead.stop();
         reader.close();
     }
 
 
-BoostParsedLine
-TSPICENetlistBoostParser::next() {
+bool
+TSPICENetlistBoostParser::read(NetlistLine& parsedLine) {
 
-        typedef tspice_parser<iterator_type> tspice_parser;
-        tspice_parser g;
+        const tspice_parser<iterator_type>& g = grammar<tspice_parser<iterator_type> >();
 
         if(!reader.hasNext(g)) {
-            PyErr_SetString(PyExc_StopIteration, "No more data.");
-            boost::python::throw_error_already_set();
+            return false;
         }
 
-        BoostParsedLine parsedLine = reader.next(g);
+        parsedLine = reader.next(g);
 
         if(is_top_level_file && parsedLine.linenums[0] == 1)  {
             netlist_statement_object titleNSO;
@@ -65,21 +65,20 @@ TSPICENetlistBoostParser::next() {
             std::vector<netlist_statement_object> v;
             v.push_back(titleNSO);
 
-            convert_to_parsed_objects(v, parsedLine);
+            parsedLine.parsedObjects = v;
         } else {
             parseLine(parsedLine);
         }
 
-        return parsedLine;
+        return true;
     }
 
 void
-TSPICENetlistBoostParser::parseLine(BoostParsedLine & parsedLine) {
+TSPICENetlistBoostParser::parseLine(NetlistLine & parsedLine) {
 
         //setup parser objects
         //typedef std::string::const_iterator iterator_type;
-        typedef tspice_parser<iterator_type> tspice_parser;
-        tspice_parser g;
+        const tspice_parser<iterator_type>& g = grammar<tspice_parser<iterator_type> >();
 
         std::string::const_iterator start = parsedLine.sourceLine.begin();
         std::string::const_iterator end = parsedLine.sourceLine.end();
@@ -95,7 +94,7 @@ TSPICENetlistBoostParser::parseLine(BoostParsedLine & parsedLine) {
               std::cout << netlist_parse_results[i] << std::endl;
               }*/
 
-            convert_to_parsed_objects(netlist_parse_results, parsedLine);
+            parsedLine.parsedObjects.swap(netlist_parse_results);
         } else {
             netlist_parse_results.clear();
             // if parsing the string failed, we turn it into a comment and report the line numbers
@@ -106,7 +105,7 @@ TSPICENetlistBoostParser::parseLine(BoostParsedLine & parsedLine) {
             end = parsedLine.sourceLine.end();
             bool comment_readable = phrase_parse(start, end, g, boost::spirit::ascii::space, netlist_parse_results);
             if (comment_readable){
-                convert_to_parsed_objects(netlist_parse_results, parsedLine);
+                parsedLine.parsedObjects.swap(netlist_parse_results);
             } else {
                 std::cout << "\nBoost Parsing failed around line " + getLineNumsString (parsedLine) +
                     " and line(s) could not be converted to comment\n" << std::endl;
@@ -32,6 +32,8 @@
 struct TSPICENetlistBoostParser {
 
     NetlistLineReader reader;
+    ParseAhead ahead;
+    ParallelParse parallel;
     bool is_top_level_file = true;
     std::string filename = " ";
 
@@ -39,9 +41,10 @@ struct TSPICENetlistBoostParser {
 
     void close();
 
-    BoostParsedLine next();
+    // reads and parses the next line, false at the end of the file
+    bool read(NetlistLine& parsedLine);
 
-    void parseLine(BoostParsedLine & parsedLine);
+    void parseLine(NetlistLine & parsedLine);
 };
 
 
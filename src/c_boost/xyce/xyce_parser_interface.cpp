@@ -34,22 +34,22 @@ XyceNetlistBoostParser::open(std::string filenm, bool top_level_file) {
 
 void
 XyceNetlistBoostParser::close() {
+    parallel.stop();
+    ahead.stop();
     reader.close();
 }
 
 
-BoostParsedLine
-XyceNetlistBoostParser::next() {
+bool
+XyceNetlistBoostParser::read(NetlistLine& parsedLine) {
 
-    typedef xyce_parser<iterator_type> xyce_parser;
-    xyce_parser g;
+    const xyce_parser<iterator_type>& g = grammar<xyce_parser<iterator_type> >();
 
     if(!reader.hasNext(g)) {
-        PyErr_SetString(PyExc_StopIteration, "No more data.");
-        boost::python::throw_error_already_set();
+        return false;
     }
 
-    BoostParsedLine parsedLine = reader.next(g);
+    parsedLine = reader.next(g);
 
     if(is_top_level_file && parsedLine.linenums[0] == 1) {
         adm_boost_common::netlist_statement_object titleNSO;
@@ -59,21 +59,20 @@ XyceNetlistBoostParser::next() {
         std::vector<adm_boost_common::netlist_statement_object> v;
         v.push_back(titleNSO);
 
-        convert_to_parsed_objects(v, parsedLine);
+        parsedLine.parsedObjects = v;
     } else {
         parseLine(parsedLine);
     }
 
-    return parsedLine;
+    return true;
 }
 
 void
-XyceNetlistBoostParser::parseLine(BoostParsedLine & parsedLine) {
+XyceNetlistBoostParser::parseLine(NetlistLine & parsedLine) {
 
     //setup parser objects
     //typedef std::string::const_iterator iterator_type;
-    typedef xyce_parser<iterator_type> xyce_parser;
-    xyce_parser g;
+    const xyce_parser<iterator_type>& g = grammar<xyce_parser<iterator_type> >();
 
     std::string::const_iterator start = parsedLine.sourceLine.begin();
     std::string::const_iterator end = parsedLine.sourceLine.end();
@@ -90,7 +89,7 @@ XyceNetlistBoostParser::parseLine(BoostParsedLine & parsedLine) {
         //}
         //std::cout << "\n\n" << std::flush;
 
-        convert_to_parsed_objects(netlist_parse_results, parsedLine);
+        parsedLine.parsedObjects.swap(netlist_parse_results);
     } else {
         //std::cout << "Xyce Parsing failed: \n" << parsedLine.sourceLine << std::endl;
         //for(int i = 0; i < netlist_parse_results.size(); i++) {
@@ -108,7 +107,7 @@ XyceNetlistBoostParser::parseLine(BoostParsedLine & parsedLine) {
         parsedLine.errorMessage = parsedLine.sourceLine;
         bool comment_readable = phrase_parse(start, end, g, boost::spirit::ascii::space, netlist_parse_results);
         if (comment_readable){
-            convert_to_parsed_objects(netlist_parse_results, parsedLine);
+            parsedLine.parsedObjects.swap(netlist_parse_results);
         } else {
             std::cout << "\nXyce Parsing failed around line " + getLineNumsString (parsedLine) +
                 " and line(s) could not be converted to comment\n" << std::endl;
@@ -32,15 +32,18 @@
 struct XyceNetlistBoostParser {
 
     NetlistLineReader reader;
+    ParseAhead ahead;
+    ParallelParse parallel;
     bool is_top_level_file = true;
 
     bool open(std::string filenm, bool top_level_file);
 
     void close();
 
-    BoostParsedLine next();
+    // reads and parses the next line, false at the end of the file
+    bool read(NetlistLine& parsedLine);
 
-    void parseLine(BoostParsedLine & parsedLine);
+    void parseLine(NetlistLine & parsedLine);
 };
 
 
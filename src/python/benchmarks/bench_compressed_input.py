@@ -0,0 +1,128 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+"""
+Compressed input benchmark.  For each dialect, writes a device heavy
+netlist and gzip and zstd compressed copies of it, then times parsing each
+with the SpiritCommon Boost parser, which decompresses as it reads, and
+checks that all of them give the same lines.  Only parsing is timed.
+
+zstd copies are written with the zstandard module or the zstd command, and
+left out when neither is available.
+
+Requires built SpiritCommon and SpiritExprCommon modules on the path.  Run
+from src/python:
+
+    python benchmarks/bench_compressed_input.py --devices 100000
+"""
+
+
+import argparse
+import gzip
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_decks import write_deck
+from xdm.inout.readers import BoostParserInterface
+from xdm.inout.translation import LanguageDefinitions, parser_interface
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "xdm", "inout", "xml", "schema")
+
+DIALECTS = ["hspice", "pspice", "spectre", "xyce", "tspice"]
+
+
+def gzip_copy(deck):
+    with open(deck, 'rb') as src, gzip.open(deck + ".gz", 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+    return deck + ".gz"
+
+
+def zstd_copy(deck):
+    if zstandard is not None:
+        with open(deck, 'rb') as src, open(deck + ".zst", 'wb') as dst:
+            zstandard.ZstdCompressor().copy_stream(src, dst)
+    elif shutil.which("zstd"):
+        subprocess.check_call(["zstd", "-q", "-f", deck, "-o", deck + ".zst"])
+    else:
+        return None
+    return deck + ".zst"
+
+
+def parse(dialect, deck, languages):
+    reader = parser_interface(dialect)(deck, languages.get(dialect))
+    start = time.perf_counter()
+    lines = [(tuple(line.linenums), line.sourceline, len(line.parsed_objects))
+             for line in BoostParserInterface.parsed_lines(reader.internal_parser)]
+    return time.perf_counter() - start, lines
+
+
+def time_parse(dialect, deck, languages, repeats):
+    best = None
+    for _ in range(repeats):
+        elapsed, lines = parse(dialect, deck, languages)
+        best = elapsed if best is None else min(best, elapsed)
+    return best, lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="compressed input benchmark")
+    parser.add_argument('--devices', type=int, default=100000, help='devices in each netlist')
+    parser.add_argument('--dialect', nargs='+', default=DIALECTS, choices=DIALECTS, help='dialects to time')
+    parser.add_argument('--repeats', type=int, default=3, help='parses timed, the best is reported')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.CRITICAL)
+    languages = LanguageDefinitions(SCHEMA_DIR)
+    work_dir = tempfile.mkdtemp(prefix="xdm_compressed_bench")
+    try:
+        for dialect in args.dialect:
+            deck = write_deck(work_dir, dialect, args.devices, "compressed input benchmark deck")
+            plain, plain_lines = time_parse(dialect, deck, languages, args.repeats)
+            megabytes = os.path.getsize(deck) / 1e6
+            print("%-8s plain %7.1f MB            %7.2f s  %6.1f MB/s" % (dialect, megabytes, plain, megabytes / plain))
+            for name, copy in (("gzip", gzip_copy), ("zstd", zstd_copy)):
+                compressed = copy(deck)
+                if compressed is None:
+                    print("%-8s %-5s no compressor, left out" % (dialect, name))
+                    continue
+                elapsed, lines = time_parse(dialect, compressed, languages, args.repeats)
+                print("%-8s %-5s %7.1f MB on disk %7.2f s  %6.1f MB/s  %5.2fx%s" %
+                      (dialect, name, os.path.getsize(compressed) / 1e6, elapsed, megabytes / elapsed,
+                       plain / elapsed, "" if lines == plain_lines else "  LINES DIFFER"))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
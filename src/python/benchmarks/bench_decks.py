@@ -0,0 +1,82 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+
+"""
+Device heavy flat netlists shared by the parsing benchmarks.  Each dialect
+gets the same resistors, capacitors, mosfets and subcircuit instances,
+written in its own syntax.
+"""
+
+
+import os
+
+EXTENSIONS = {"hspice": ".sp", "spectre": ".scs", "tspice": ".sp"}
+
+
+def spice_deck(f, devices, title, subckt_params, diffusion_params=True):
+    f.write("* %s\n" % title)
+    f.write(".subckt cell a b %sw=1u\nrcell a b 1k\n.ends\n" % subckt_params)
+    f.write(".model nch nmos level=1 vto=0.5\n")
+    for i in range(devices // 4):
+        f.write("r%d n%d n%d 1k tc1=0.001\n" % (i, i, i + 1))
+        f.write("c%d n%d 0 1p\n" % (i, i))
+        f.write("m%d n%d g%d 0 0 nch w=1u l=0.1u\n" % (i, i, i))
+        if diffusion_params:
+            f.write("+ ad=1p as=1p pd=1u ps=1u\n")
+        f.write("x%d n%d n%d cell %sw=2u\n" % (i, i, i + 1, subckt_params))
+    f.write(".tran 1n 10n\n.end\n")
+
+
+def spectre_deck(f, devices, title, diffusion_params=True, statistics=False):
+    f.write("// %s\nsimulator lang=spectre\n" % title)
+    f.write("subckt cell a b\nparameters w=1u\nr1 (a b) resistor r=1k\nends cell\n")
+    f.write("model nch bsim4 type=n\n")
+    for i in range(devices // 4):
+        f.write("r%d (n%d n%d) resistor r=1k tc1=0.001\n" % (i, i, i + 1))
+        f.write("c%d (n%d 0) capacitor c=1p\n" % (i, i))
+        if diffusion_params:
+            f.write("m%d (n%d g%d 0 0) nch w=1u l=0.1u \\\n ad=1p as=1p pd=1u ps=1u\n" % (i, i, i))
+        else:
+            f.write("m%d (n%d g%d 0 0) nch w=1u l=0.1u\n" % (i, i, i))
+        f.write("x%d (n%d n%d) cell w=2u\n" % (i, i, i + 1))
+        if statistics and i % 1000 == 0:
+            f.write("statistics {\n  process {\n    vary w dist=gauss std=0.1\n  }\n}\n")
+    f.write("tran1 tran stop=10n\n")
+
+
+def write_deck(work_dir, dialect, devices, title, diffusion_params=True, statistics=False):
+    """
+    Writes a netlist of about devices devices in dialect to work_dir and
+    returns its path.  diffusion_params adds a continuation line of
+    diffusion parameters to each mosfet, statistics adds a Spectre
+    statistics block every 1000 cells
+    """
+    deck = os.path.join(work_dir, dialect + EXTENSIONS.get(dialect, ".cir"))
+    with open(deck, "w") as f:
+        if dialect == "spectre":
+            spectre_deck(f, devices, title, diffusion_params, statistics)
+        else:
+            spice_deck(f, devices, title, "params: " if dialect in ("pspice", "xyce") else "", diffusion_params)
+    return deck
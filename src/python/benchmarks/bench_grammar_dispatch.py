@@ -0,0 +1,116 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+"""
+Benchmark for the netlist grammars.  For each dialect, writes a netlist made
+of one statement type repeated many times, parses it with the SpiritCommon
+Boost parser and reports the parse time per statement.  Statement types
+late in the old ordered alternatives (resistors, .TRAN, .PARAM) show the
+effect of the first character dispatch in the grammars.
+
+Requires a built SpiritCommon module on the path.  Run from src/python:
+
+    python benchmarks/bench_grammar_dispatch.py --dialect hspice --count 20000
+"""
+
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import SpiritCommon
+
+
+PARSERS = {
+    "hspice": SpiritCommon.HSPICENetlistBoostParser,
+    "pspice": SpiritCommon.PSPICENetlistBoostParser,
+    "tspice": SpiritCommon.TSPICENetlistBoostParser,
+    "xyce": SpiritCommon.XyceNetlistBoostParser,
+}
+
+# one representative line per statement type, {0} is replaced by a counter
+STATEMENTS = [
+    ("bjt", "Q{0} c b e qmod"),
+    ("capacitor", "C{0} a 0 1p"),
+    ("diode", "D{0} a k dmod"),
+    ("vcvs", "E{0} o 0 a b 2"),
+    ("independent source", "V{0} in 0 PULSE(0 1 0 1n 1n 5n 10n)"),
+    ("inductor", "L{0} a b 1n"),
+    ("mosfet", "M{0} d g s b nmos w=1u l=0.1u"),
+    ("resistor", "R{0} a b 1k"),
+    ("subcircuit", "X{0} a b sub1"),
+    (".model", ".MODEL m{0} nmos level=54 vth0=0.4"),
+    (".param", ".PARAM p{0}=1"),
+    (".print", ".PRINT TRAN V(a{0})"),
+    (".tran", ".TRAN 1n 10n"),
+    ("comment", "* comment {0}"),
+]
+
+
+def time_statement(parser_class, line, count):
+    with tempfile.NamedTemporaryFile("w", suffix=".cir", delete=False) as netlist:
+        for i in range(count):
+            netlist.write(line.format(i) + "\n")
+        path = netlist.name
+
+    try:
+        parser = parser_class()
+        parser.open(path, False)
+        parsed = 0
+        start = time.perf_counter()
+        try:
+            while True:
+                parser.next()
+                parsed += 1
+        except StopIteration:
+            pass
+        elapsed = time.perf_counter() - start
+        parser.close()
+    finally:
+        os.remove(path)
+
+    return elapsed, parsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="netlist grammar benchmark")
+    parser.add_argument('--dialect', choices=sorted(PARSERS), action='append',
+                        help='dialect to benchmark (repeatable, default all)')
+    parser.add_argument('--count', type=int, default=5000,
+                        help='statements of each type per netlist')
+    args = parser.parse_args()
+
+    for dialect in args.dialect or sorted(PARSERS):
+        print("%s" % dialect)
+        for name, line in STATEMENTS:
+            elapsed, parsed = time_statement(PARSERS[dialect], line, args.count)
+            print("  %-20s: %8.2f us/statement (%d statements)" % (name, 1e6 * elapsed / max(parsed, 1), parsed))
+
+
+if __name__ == '__main__':
+    main()
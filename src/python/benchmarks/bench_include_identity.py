@@ -0,0 +1,121 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+
+"""
+Include identity benchmark.  Generates an HSPICE deck that includes a model
+file once, and a deck that includes the same file through several names
+("models.inc", "./models.inc", "sub/../models.inc" and a symbolic link to
+it where the file system has them), then times reading each.  Both should
+read the model file once, so take about the same time.
+
+Requires built SpiritCommon and SpiritExprCommon modules on the path.  Run
+from src/python:
+
+    python benchmarks/bench_include_identity.py --models 2000
+"""
+
+
+import argparse
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xdm.index.SRC_LINE_INDEX import SRC_LINE_INDEX
+from xdm.inout.translation import LanguageDefinitions, open_reader
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "xdm", "inout", "xml", "schema")
+
+
+def write_models(work_dir, models):
+    os.mkdir(os.path.join(work_dir, "sub"))
+    with open(os.path.join(work_dir, "models.inc"), "w") as f:
+        f.write("* model file\n")
+        for i in range(models):
+            f.write(".model nch%d nmos level=54 version=4.5\n+ vth0=0.4 u0=0.03 tox=2e-9\n"
+                    "+ k1=0.5 k2=-0.01 nfactor=1.2 cdsc=2.4e-4\n" % i)
+
+
+def include_names(work_dir):
+    names = ["models.inc", "./models.inc", "sub/../models.inc"]
+    try:
+        os.symlink("models.inc", os.path.join(work_dir, "link.inc"))
+        names.append("link.inc")
+    except (AttributeError, NotImplementedError, OSError):
+        pass
+    return names
+
+
+def write_deck(work_dir, name, inc_names):
+    deck = os.path.join(work_dir, name)
+    with open(deck, "w") as f:
+        f.write("* include identity benchmark deck\n")
+        for inc_name in inc_names:
+            f.write(".inc '%s'\n" % inc_name)
+        f.write("m1 d g 0 0 nch0 w=1u l=1u\nv1 d 0 1\nv2 g 0 0.5\n.tran 1n 10n\n.print tran i(v1)\n.end\n")
+    return deck
+
+
+def time_read(deck, languages):
+    start = time.perf_counter()
+    reader = open_reader(deck, "hspice", languages, auto_translate=True)
+    sli = SRC_LINE_INDEX()
+    reader.name_scope_index.add_index(sli)
+    reader.read()
+    elapsed = time.perf_counter() - start
+    files_read = len([fl for fl, _ in sli if fl and os.path.realpath(fl) != os.path.realpath(deck)])
+    return elapsed, files_read
+
+
+def main():
+    parser = argparse.ArgumentParser(description="include identity benchmark")
+    parser.add_argument('--models', type=int, default=2000, help='models in the included file')
+    parser.add_argument('--repeat', type=int, default=3, help='reads timed for each deck')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.CRITICAL)
+    work_dir = tempfile.mkdtemp(prefix="xdm_include_bench")
+    try:
+        write_models(work_dir, args.models)
+        inc_names = include_names(work_dir)
+        languages = LanguageDefinitions(SCHEMA_DIR)
+        languages.preload(["hspice"])
+
+        for label, deck in (("included once", write_deck(work_dir, "once.sp", inc_names[:1])),
+                            ("%d names" % len(inc_names), write_deck(work_dir, "names.sp", inc_names))):
+            runs = [time_read(deck, languages) for _ in range(args.repeat)]
+            print("%-14s %8.1f ms   %d model file(s) read" % (label, 1e3 * min(elapsed for elapsed, _ in runs),
+                                                             runs[0][1]))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
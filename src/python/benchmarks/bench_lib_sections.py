@@ -0,0 +1,122 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+"""
+Library section benchmark.  Generates an HSPICE deck that selects one
+corner of a library with many corner sections, then times reading it with
+the whole library parsed and with only the selected section parsed, as for
+a --prune translation.  Checks that both reads keep the same statements of
+the selected section.
+
+Requires built SpiritCommon and SpiritExprCommon modules on the path.  Run
+from src/python:
+
+    python benchmarks/bench_lib_sections.py --sections 40 --models 50
+"""
+
+
+import argparse
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xdm.index.SRC_LINE_INDEX import SRC_LINE_INDEX
+from xdm.inout.readers.LibrarySectionIndex import section_index
+from xdm.inout.translation import LanguageDefinitions, open_reader
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "xdm", "inout", "xml", "schema")
+
+
+def write_deck(work_dir, sections, models):
+    top = os.path.join(work_dir, "tb.sp")
+    with open(top, "w") as f:
+        f.write("* library section benchmark deck\n.lib 'corners.lib' c%d\n" % (sections // 2))
+        f.write("m1 d g 0 0 nch0 w=1u l=1u\nv1 d 0 1\nv2 g 0 0.5\n.tran 1n 10n\n.print tran i(v1)\n.end\n")
+    with open(os.path.join(work_dir, "corners.lib"), "w") as f:
+        f.write("* corner library\n")
+        for i in range(sections):
+            f.write(".lib c%d\n.param vth_shift=%d.0e-3\n" % (i, i))
+            for j in range(models):
+                f.write(".model nch%d nmos level=54 version=4.5\n+ vth0={0.4+vth_shift} u0=0.03 tox=2e-9\n"
+                        "+ k1=0.5 k2=-0.01 nfactor=1.2 cdsc=2.4e-4\n" % j)
+            f.write(".endl c%d\n\n" % i)
+    return top
+
+
+def time_read(deck, languages, lib_sections_only):
+    start = time.perf_counter()
+    reader = open_reader(deck, "hspice", languages, auto_translate=True, lib_sections_only=lib_sections_only)
+    sli = SRC_LINE_INDEX()
+    reader.name_scope_index.add_index(sli)
+    reader.read()
+    elapsed = time.perf_counter() - start
+    lines = dict((os.path.basename(fl), sorted(_first_line(statement) for statement in objs)) for fl, objs in sli if fl)
+    return elapsed, lines["corners.lib"]
+
+
+def _first_line(statement):
+    line_num = statement.line_num
+    return line_num[0] if isinstance(line_num, list) else line_num
+
+
+def main():
+    parser = argparse.ArgumentParser(description="library section benchmark")
+    parser.add_argument('--sections', type=int, default=40, help='corner sections in the library')
+    parser.add_argument('--models', type=int, default=50, help='models per section')
+    parser.add_argument('--repeat', type=int, default=3, help='reads timed for each mode')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.CRITICAL)
+    work_dir = tempfile.mkdtemp(prefix="xdm_lib_bench")
+    try:
+        deck = write_deck(work_dir, args.sections, args.models)
+        languages = LanguageDefinitions(SCHEMA_DIR)
+        languages.preload(["hspice"])
+        print("library: %d bytes, %d sections of %d models" % (os.path.getsize(os.path.join(work_dir, "corners.lib")),
+                                                               args.sections, args.models))
+
+        results = {}
+        for lib_sections_only in (False, True):
+            runs = [time_read(deck, languages, lib_sections_only) for _ in range(args.repeat)]
+            results[lib_sections_only] = (min(elapsed for elapsed, _ in runs), runs[0][1])
+
+        # the statements outside the unselected sections are the same either way
+        section = section_index(os.path.join(work_dir, "corners.lib")).sections["C%d" % (args.sections // 2)]
+        full, sections_only = results[False], results[True]
+        expected = [line for line in full[1] if line == 1 or section.first_line <= line < section.next_line]
+        print("whole library:    %8.1f ms" % (1e3 * full[0]))
+        print("selected section: %8.1f ms   %s" % (1e3 * sections_only[0],
+                                                  "same statements" if sections_only[1] == expected else "DIFFERS"))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
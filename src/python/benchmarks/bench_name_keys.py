@@ -0,0 +1,114 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+
+"""
+Name key benchmark.  Writes an HSPICE netlist whose devices and .PARAM lines
+spell a small set of names in mixed case, parses it once with the
+SpiritCommon Boost parser, then times looking the names of the parsed tokens
+up in a dict by value.upper(), as the readers did, and by the interned key
+the parser gives each token.  Also reports how many distinct key objects the
+names share.
+
+Requires built SpiritCommon and SpiritExprCommon modules on the path.  Run
+from src/python:
+
+    python benchmarks/bench_name_keys.py --lines 50000
+"""
+
+
+import argparse
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xdm.inout.translation import LanguageDefinitions, parser_interface
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "xdm", "inout", "xml", "schema")
+
+NAMES = ["Width", "LENGTH", "vdd", "Temp_Coef", "nf", "Sa", "sb", "Mult"]
+
+
+def write_deck(work_dir, lines):
+    deck = os.path.join(work_dir, "keys.sp")
+    with open(deck, "w") as f:
+        f.write("* name key benchmark deck\n")
+        f.write(".model nch nmos level=54\n")
+        for i in range(lines):
+            name = NAMES[i % len(NAMES)]
+            spelling = name.lower() if i % 2 else name.upper()
+            f.write(".param %s%d=1 %s=2\n" % (name, i % 100, spelling))
+            f.write("m%d d%d g 0 0 nch w=1u L=0.1u %s=2 nf=1\n" % (i, i, spelling))
+        f.write(".end\n")
+    return deck
+
+
+def time_lookup(parsed_objects, table, by_key, repeats):
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        if by_key:
+            for parsed_object in parsed_objects:
+                table.get(parsed_object.key)
+        else:
+            for parsed_object in parsed_objects:
+                table.get(parsed_object.value.upper())
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="name key benchmark")
+    parser.add_argument('--lines', type=int, default=50000, help='.PARAM and device lines in the netlist')
+    parser.add_argument('--repeats', type=int, default=5, help='lookups timed, the best is reported')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.CRITICAL)
+    languages = LanguageDefinitions(SCHEMA_DIR)
+    work_dir = tempfile.mkdtemp(prefix="xdm_key_bench")
+    try:
+        deck = write_deck(work_dir, args.lines)
+        reader = parser_interface("hspice")(deck, languages.get("hspice"))
+        parsed_objects = [parsed_object for line in reader.line_iter for parsed_object in line.parsed_objects]
+        table = dict((name.upper(), name) for name in NAMES)
+
+        upper_time = time_lookup(parsed_objects, table, False, args.repeats)
+        key_time = time_lookup(parsed_objects, table, True, args.repeats)
+        keys = set(id(parsed_object.key) for parsed_object in parsed_objects)
+        print("%d tokens, %d distinct key objects" % (len(parsed_objects), len(keys)))
+        print("value.upper()  %8.1f ms" % (1e3 * upper_time))
+        print("key            %8.1f ms" % (1e3 * key_time))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#   
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#  
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#   
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+"""
+Benchmark for the per-scope NODE_TABLE.  Simulates the node lookups
+XDMFactory.build_node makes for every device terminal of a flat netlist and
+reports the memory cost of each net and the node lookup rate.
+
+Run from src/python:
+
+    python benchmarks/bench_node_table.py --nets 1000000 --terminals 4
+"""
+
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xdm.index.NAME_SCOPE_INDEX import NAME_SCOPE_INDEX
+
+
+def build_nodes(scope, nets, terminals):
+    for i in range(nets * terminals):
+        node_name = "net" + str(i % nets)
+        node = scope.get_enode(node_name)
+        if node is None:
+            node = scope.add_node(node_name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="NODE_TABLE benchmark")
+    parser.add_argument('--nets', type=int, default=200000)
+    parser.add_argument('--terminals', type=int, default=4,
+                        help='average number of device terminals per net')
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    scope = NAME_SCOPE_INDEX()
+    before = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    build_nodes(scope, args.nets, args.terminals)
+    elapsed = time.perf_counter() - start
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    used = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    lookups = args.nets * args.terminals
+    print("nets                 : %d" % args.nets)
+    print("terminal lookups     : %d" % lookups)
+    print("memory per net       : %.1f bytes" % (float(used) / args.nets))
+    print("nodes/sec            : %.0f" % (lookups / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+"""
+Parameter evaluation benchmark.  Defines a chain of .PARAM statements that
+use a .FUNC and each other, then times compiling them, evaluating all of
+them, and evaluating them again after the first parameter is redefined.
+For comparison it also times parsing each expression once with
+HSPICEExprBoostParser, the least a per expression parse costs.  Checks the
+values against the same chain computed in Python.
+
+Requires a built SpiritExprCommon module on the path.  Run from src/python:
+
+    python benchmarks/bench_param_eval.py --params 20000
+"""
+
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import SpiritExprCommon
+
+from xdm.expr.expr_utils import new_param_evaluator
+
+
+def definitions(params):
+    names = ["p%d" % i for i in range(params)]
+    expressions = ["1.5k"] + ["{p%d*0.999 + scale(%d, 2) + (p%d > 1 ? 1 : -1)}" % (i - 1, i % 7, i - 1)
+                              for i in range(1, params)]
+    return names, expressions
+
+
+def expected_values(params, first):
+    def scale(x, y):
+        return x / y + sqrt_two
+
+    sqrt_two = 2 ** 0.5
+    values = [first]
+    for i in range(1, params):
+        previous = values[-1]
+        values.append(previous * 0.999 + scale(i % 7, 2) + (1 if previous > 1 else -1))
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser(description="parameter evaluation benchmark")
+    parser.add_argument('--params', type=int, default=20000, help='parameters in the chain')
+    args = parser.parse_args()
+
+    names, expressions = definitions(args.params)
+
+    start = time.perf_counter()
+    evaluator = new_param_evaluator("hspice")
+    evaluator.define_function("scale", ["x", "y"], "x/y + sqrt(2)")
+    for name, expression in zip(names, expressions):
+        evaluator.define(name, expression)
+    compiled = time.perf_counter() - start
+
+    start = time.perf_counter()
+    values = evaluator.evaluate_params(names)
+    first = time.perf_counter() - start
+
+    evaluator.define("p0", "2.5k")
+    start = time.perf_counter()
+    redefined = evaluator.evaluate_params(names)
+    second = time.perf_counter() - start
+
+    expr_parser = SpiritExprCommon.HSPICEExprBoostParser()
+    start = time.perf_counter()
+    for expression in expressions:
+        expr_parser.parseExpr(expression)
+    parsed = time.perf_counter() - start
+
+    def same(got, expected):
+        return all(abs(a - b) <= 1e-9 * max(1.0, abs(b)) for a, b in zip(got, expected))
+
+    correct = same(values, expected_values(args.params, 1500.0)) and \
+        same(redefined, expected_values(args.params, 2500.0))
+    print("%d parameters" % args.params)
+    print("compile:               %8.1f ms" % (1e3 * compiled))
+    print("evaluate all:          %8.1f ms" % (1e3 * first))
+    print("evaluate after change: %8.1f ms" % (1e3 * second))
+    print("parse each once:       %8.1f ms" % (1e3 * parsed))
+    print("values %s" % ("correct" if correct else "DIFFER"))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+"""
+Parameter folding benchmark.  Generates an HSPICE deck with a chain of
+.PARAM statements, a temperature dependent parameter and subcircuits with
+parameters of their own, then times reading it and folding its constant
+parameters.  Checks the folded value at the end of the chain against the
+same chain computed in Python.
+
+Requires built SpiritCommon and SpiritExprCommon modules on the path.  Run
+from src/python:
+
+    python benchmarks/bench_param_fold.py --params 5000 --subckts 200
+"""
+
+
+import argparse
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xdm import Types
+from xdm.inout.translation import LanguageDefinitions, open_reader
+from xdm.inout.writers.param_folding import fold_params
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "xdm", "inout", "xml", "schema")
+
+
+def write_deck(work_dir, params, subckts):
+    deck = os.path.join(work_dir, "params.sp")
+    with open(deck, "w") as f:
+        f.write("* parameter folding benchmark deck\n.param p0=1k\n")
+        for i in range(1, params):
+            f.write(".param p%d='p%d*0.999 + sqrt(%d)'\n" % (i, i - 1, i % 7))
+        f.write(".param hot='temper*p0'\n")
+        for i in range(subckts):
+            f.write(".subckt cell%d a b w=1u\n.param k='w*2' m='p%d/2'\nr1 a b 'k+m'\n.ends\n" % (i, i % params))
+            f.write("x%d in 0 cell%d w=2u\n" % (i, i))
+        f.write("v1 in 0 dc 1\n.op\n.end\n")
+    return deck
+
+
+def main():
+    parser = argparse.ArgumentParser(description="parameter folding benchmark")
+    parser.add_argument('--params', type=int, default=5000, help='parameters in the chain')
+    parser.add_argument('--subckts', type=int, default=200, help='subcircuits with parameters of their own')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.CRITICAL)
+    work_dir = tempfile.mkdtemp(prefix="xdm_fold_bench")
+    try:
+        deck = write_deck(work_dir, args.params, args.subckts)
+        languages = LanguageDefinitions(SCHEMA_DIR)
+
+        start = time.perf_counter()
+        reader = open_reader(deck, "hspice", languages)
+        reader.read()
+        read = time.perf_counter() - start
+
+        start = time.perf_counter()
+        folded, total = fold_params(reader.name_scope_index)
+        fold = time.perf_counter() - start
+
+        expected = 1000.0
+        for i in range(1, args.params):
+            expected = expected * 0.999 + (i % 7) ** 0.5
+        last = None
+        for _, commands in reader.name_scope_index.commands_index:
+            for command in commands:
+                params = command.get_prop(Types.paramsList) or {}
+                if "P%d" % (args.params - 1) in params:
+                    last = float(params["P%d" % (args.params - 1)])
+
+        print("%d parameters, %d subcircuits" % (args.params, args.subckts))
+        print("read:  %8.1f ms" % (1e3 * read))
+        print("fold:  %8.1f ms   %d of %d values folded" % (1e3 * fold, folded, total))
+        print("end of chain %s" % ("correct" if last is not None and abs(last - expected) <= 1e-9 * abs(expected)
+                                   else "DIFFERS"))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
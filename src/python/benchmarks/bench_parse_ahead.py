@@ -0,0 +1,91 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+
+"""
+Parse-ahead benchmark.  For each dialect, writes a device heavy netlist and
+times reading it with a GenericReader, with the lines read and parsed as the
+reader asks for them and with them read and parsed ahead on a native thread
+(see GenericReader parse_ahead).  Writing is left out.
+
+Requires built SpiritCommon and SpiritExprCommon modules on the path.  Run
+from src/python:
+
+    python benchmarks/bench_parse_ahead.py --devices 100000 --queue 256
+"""
+
+
+import argparse
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_decks import write_deck
+from xdm.inout.translation import LanguageDefinitions, open_reader
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "xdm", "inout", "xml", "schema")
+
+DIALECTS = ["hspice", "pspice", "spectre", "xyce", "tspice"]
+
+
+def time_read(dialect, deck, languages, parse_ahead, repeats):
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        reader = open_reader(deck, dialect, languages, parse_ahead=parse_ahead)
+        reader.read()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="parse-ahead benchmark")
+    parser.add_argument('--devices', type=int, default=100000, help='devices in each netlist')
+    parser.add_argument('--dialect', nargs='+', default=DIALECTS, choices=DIALECTS, help='dialects to time')
+    parser.add_argument('--queue', type=int, default=256, help='lines read ahead')
+    parser.add_argument('--repeats', type=int, default=3, help='reads timed, the best is reported')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.CRITICAL)
+    languages = LanguageDefinitions(SCHEMA_DIR)
+    work_dir = tempfile.mkdtemp(prefix="xdm_ahead_bench")
+    try:
+        for dialect in args.dialect:
+            deck = write_deck(work_dir, dialect, args.devices, "parse-ahead benchmark deck")
+            inline = time_read(dialect, deck, languages, 0, args.repeats)
+            ahead = time_read(dialect, deck, languages, args.queue, args.repeats)
+            print("%-8s inline %8.2f s  ahead %8.2f s  %5.2fx" % (dialect, inline, ahead, inline / ahead))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
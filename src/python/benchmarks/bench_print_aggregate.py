@@ -0,0 +1,118 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+
+"""
+Aggregated .PRINT benchmark.  Builds the output variable list that a Writer
+collects from the .PRINT and .PROBE statements of a file when it combines
+them, with a share of duplicates differing only in case, then times
+removing the duplicates and building the combined .PRINT variables.  Checks
+the result against a reference built with a dict.
+
+Run from src/python:
+
+    python benchmarks/bench_print_aggregate.py --variables 10000 100000 1000000
+"""
+
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xdm import Types
+from xdm.inout.writers import writer_utils
+from xdm.inout.writers.Writer import Writer
+from xdm.statements.commands import Command
+
+
+class _InputLanguage(object):
+    language = "hspice"
+
+
+class _AggregatingWriter(Writer):
+    """
+    Just enough of a Writer to clean an output variable list
+    """
+
+    def __init__(self):
+        self._input_language = _InputLanguage()
+
+
+def aggregate(variables):
+    """
+    (output variable, line numbers) pairs as a Writer collects them, every
+    fourth one repeating an earlier variable in upper case
+    """
+    in_list = []
+    for i in range(variables):
+        if i % 4 == 3:
+            name = "V(X%d.N%d)" % (i // 8, i // 2)
+        else:
+            name = "v(x%d.n%d)" % (i // 4, i)
+        in_list.append((name, [i + 1]))
+    return in_list
+
+
+def expected(in_list):
+    out = {}
+    for name, _ in in_list:
+        out.setdefault(name.lower(), name)
+    return list(out.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="aggregated .PRINT benchmark")
+    parser.add_argument('--variables', type=int, nargs='+', default=[10000, 100000, 1000000],
+                        help='output variables aggregated')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.CRITICAL)
+    writer = _AggregatingWriter()
+    for variables in args.variables:
+        in_list = aggregate(variables)
+
+        start = time.time()
+        out_list = writer.clean_output_variable_list(in_list, "xyce.xml", [variables])
+        clean_time = time.time() - start
+
+        print_directive = Command({}, {}, "GENERATED", [-1], -1)
+        print_directive.command_type = ".PRINT"
+        print_directive.set_prop(Types.outputVariableList, out_list)
+        start = time.time()
+        line = writer_utils.outputVariableList(None, print_directive, None, None)
+        build_time = time.time() - start
+
+        if out_list != expected(in_list) or line != " ".join(out_list):
+            print("%d variables: WRONG RESULT" % variables)
+            sys.exit(1)
+        print("%8d variables: %d kept, clean %.3f s, .PRINT line %.3f s (%d characters)" %
+              (variables, len(out_list), clean_time, build_time, len(line)))
+
+
+if __name__ == "__main__":
+    main()
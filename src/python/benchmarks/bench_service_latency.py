@@ -0,0 +1,130 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+"""
+Latency benchmark for the translation server (xdm --serve).  Sends translate
+and query requests for a generated PSPICE deck and reports the p50/p99
+round trip time per request type.
+
+By default a server is started in this process on a temporary socket, using
+the XML definitions in xdm/inout/xml/schema.  Use --socket to measure a
+server that is already running.  Requires built SpiritCommon and
+SpiritExprCommon modules on the path.  Run from src/python:
+
+    python benchmarks/bench_service_latency.py --requests 200 --devices 50
+"""
+
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xdm.inout.service import TranslationServer, TranslationClient
+from xdm.inout.translation import LanguageDefinitions
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "xdm", "inout", "xml", "schema")
+
+
+def write_deck(path, devices):
+    with open(path, "w") as f:
+        f.write("* service latency benchmark deck\n")
+        f.write("V1 n0 0 PULSE(0 1 0 1n 1n 5n 10n)\n")
+        for i in range(devices):
+            f.write("R%d n%d n%d 1k\n" % (i, i, i + 1))
+            f.write("C%d n%d 0 1p\n" % (i, i + 1))
+        f.write(".TRAN 1n 100n\n")
+        f.write(".PRINT TRAN V(n%d)\n" % devices)
+        f.write(".END\n")
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def time_requests(send, count, warmup):
+    for i in range(warmup):
+        send()
+    samples = []
+    failures = 0
+    for i in range(count):
+        start = time.perf_counter()
+        response = send()
+        samples.append(time.perf_counter() - start)
+        if response["status"] != "OK":
+            failures += 1
+    return samples, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="translation server latency benchmark")
+    parser.add_argument('--socket', type=str, default=None,
+                        help='socket of a running server (default starts one in this process)')
+    parser.add_argument('--requests', type=int, default=100, help='timed requests of each type')
+    parser.add_argument('--warmup', type=int, default=5, help='untimed requests of each type')
+    parser.add_argument('--devices', type=int, default=20, help='RC sections in the deck')
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="xdm_service_bench")
+    server = None
+    try:
+        deck = os.path.join(work_dir, "deck.cir")
+        write_deck(deck, args.devices)
+
+        socket_path = args.socket
+        if socket_path is None:
+            socket_path = os.path.join(work_dir, "xdm.sock")
+            start = time.perf_counter()
+            server = TranslationServer(socket_path, LanguageDefinitions(SCHEMA_DIR), "bench")
+            server.preload(["pspice", "xyce"])
+            print("server startup (definitions loaded): %.1f ms" % (1e3 * (time.perf_counter() - start)))
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        with TranslationClient(socket_path) as client:
+            requests = [
+                ("ping", lambda: client.ping()),
+                ("translate", lambda: client.translate(deck, "pspice", os.path.join(work_dir, "out"))),
+                ("query", lambda: client.query(deck, "pspice", "R")),
+            ]
+            for name, send in requests:
+                samples, failures = time_requests(send, args.requests, args.warmup)
+                print("%-10s: p50 %8.2f ms   p99 %8.2f ms   (%d requests, %d not OK)"
+                      % (name, 1e3 * percentile(samples, 0.50), 1e3 * percentile(samples, 0.99),
+                         len(samples), failures))
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+"""
+Startup benchmark.  For each dialect, starts a fresh Python process that
+imports the translation modules, loads the dialect's language definition,
+and parses the first line of a small netlist.  Reports the time of each
+phase and the time to the first parsed line, measured from process start.
+It also reports which dialect parser modules and extension modules were
+loaded.  --eager imports every dialect first, as xdm did before dialects
+were loaded on demand.
+
+Requires built SpiritCommon, SpiritExprCommon and XdmRapidXmlReader modules
+on the path.  Run from src/python:
+
+    python benchmarks/bench_startup.py --repeat 5
+"""
+
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCHEMA_DIR = os.path.join(PYTHON_DIR, "xdm", "inout", "xml", "schema")
+
+DECKS = {
+    "pspice": ("deck.cir", "R1 a b 1k\n.END\n"),
+    "hspice": ("deck.sp", "r1 a b 1k\n.end\n"),
+    "tspice": ("deck.sp", "R1 a b 1k\n.END\n"),
+    "xyce": ("deck.cir", "R1 a b 1k\n.END\n"),
+    "spectre": ("deck.scs", "simulator lang=spectre\nr1 (a b) resistor r=1k\n"),
+}
+
+# run in the child process: argv is dialect, deck, schema dir, eager flag,
+# and the parent's clock reading just before it started the process
+CHILD = r"""
+import json, sys, time
+start = float(sys.argv[5])
+from xdm.inout import translation
+if sys.argv[4] == "1":
+    for dialect in translation.INPUT_FORMATS:
+        translation.parser_interface(dialect)
+imported = time.perf_counter()
+languages = translation.LanguageDefinitions(sys.argv[3])
+language_definition = languages.get(sys.argv[1])
+loaded = time.perf_counter()
+parser = translation.parser_interface(sys.argv[1])(sys.argv[2], language_definition, True)
+next(iter(parser))
+parsed = time.perf_counter()
+print(json.dumps({"import": imported - start, "definition": loaded - imported,
+                  "first_line": parsed - loaded, "total": parsed - start,
+                  "modules": sorted(name.split(".")[-1] for name in sys.modules
+                                    if name.endswith("ParserInterface") or name.startswith("Spirit"))}))
+"""
+
+
+def run_child(dialect, deck, eager):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([PYTHON_DIR] + [p for p in [env.get("PYTHONPATH")] if p])
+    start = time.perf_counter()
+    output = subprocess.check_output([sys.executable, "-c", CHILD, dialect, deck, SCHEMA_DIR,
+                                      "1" if eager else "0", repr(start)], env=env)
+    return json.loads(output.decode("utf-8").strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="xdm startup benchmark")
+    parser.add_argument('--dialect', choices=sorted(DECKS), action='append',
+                        help='dialect to benchmark (repeatable, default all)')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per dialect, the fastest is reported')
+    parser.add_argument('--eager', action='store_true', help='import every dialect before the run')
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="xdm_startup_bench")
+    try:
+        print("%-8s %10s %12s %12s %12s   %s" % ("dialect", "import ms", "definition", "first line",
+                                                  "total ms", "modules loaded"))
+        for dialect in args.dialect or sorted(DECKS):
+            file_name, text = DECKS[dialect]
+            deck = os.path.join(work_dir, dialect + "_" + file_name)
+            with open(deck, "w") as f:
+                f.write(text)
+
+            runs = [run_child(dialect, deck, args.eager) for i in range(args.repeat)]
+            best = min(runs, key=lambda run: run["total"])
+            print("%-8s %10.1f %12.1f %12.1f %12.1f   %s" % (dialect, 1e3 * best["import"], 1e3 * best["definition"],
+                                                           1e3 * best["first_line"], 1e3 * best["total"],
+                                                           ", ".join(best["modules"])))
+    finally:
+        for name in os.listdir(work_dir):
+            os.remove(os.path.join(work_dir, name))
+        os.rmdir(work_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+
+"""
+Token conversion benchmark.  For each dialect, writes a device heavy netlist,
+parses it once with the SpiritCommon Boost parser, then times converting the
+parsed tokens into ParsedNetlistLines with the dialect's convert_next_token,
+and reports tokens per second.  Parsing is left out of the timing.
+
+Requires built SpiritCommon and SpiritExprCommon modules on the path.  Run
+from src/python:
+
+    python benchmarks/bench_token_dispatch.py --devices 20000
+"""
+
+
+import argparse
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_decks import write_deck
+from xdm.inout.readers.ParsedNetlistLine import ParsedNetlistLine
+from xdm.inout.translation import LanguageDefinitions, parser_interface
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "xdm", "inout", "xml", "schema")
+
+DIALECTS = ["hspice", "pspice", "spectre", "xyce", "tspice"]
+
+
+def time_dialect(dialect, deck, languages, repeats):
+    reader = parser_interface(dialect)(deck, languages.get(dialect))
+    lines = [(line.filename, line.linenums, list(line.parsed_objects)) for line in reader.line_iter]
+    tokens = sum(len(parsed_objects) for _, _, parsed_objects in lines)
+
+    best = None
+    for _ in range(repeats):
+        synthesized_pnls = []
+        start = time.perf_counter()
+        for filename, linenums, parsed_objects in lines:
+            pnl = ParsedNetlistLine(filename, linenums)
+            parsed_object_iter = iter(parsed_objects)
+            for parsed_object in parsed_object_iter:
+                reader.convert_next_token(parsed_object, parsed_object_iter, pnl, synthesized_pnls)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return tokens, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="token conversion benchmark")
+    parser.add_argument('--devices', type=int, default=20000, help='devices in each netlist')
+    parser.add_argument('--dialect', nargs='+', default=DIALECTS, choices=DIALECTS, help='dialects to time')
+    parser.add_argument('--repeats', type=int, default=5, help='conversions timed, the best is reported')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.CRITICAL)
+    languages = LanguageDefinitions(SCHEMA_DIR)
+    work_dir = tempfile.mkdtemp(prefix="xdm_token_bench")
+    try:
+        for dialect in args.dialect:
+            deck = write_deck(work_dir, dialect, args.devices, "token conversion benchmark deck", diffusion_params=False)
+            tokens, elapsed = time_dialect(dialect, deck, languages, args.repeats)
+            print("%-8s %8d tokens  %8.1f ms  %10.0f tokens/s" % (dialect, tokens, 1e3 * elapsed, tokens / elapsed))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+"""
+Write phase benchmark.  Generates a PSPICE deck that includes many
+subcircuit files, reads it once, then times writing the translated files
+with each number of worker processes given.  Checks that every run writes
+the same files and logs the same messages as the sequential write.
+
+Requires built SpiritCommon and SpiritExprCommon modules on the path.  Run
+from src/python:
+
+    python benchmarks/bench_write_phase.py --files 200 --workers 1 2 4 8
+"""
+
+
+import argparse
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from xdm.index.SRC_LINE_INDEX import SRC_LINE_INDEX
+from xdm.inout.translation import LanguageDefinitions, open_reader, origin_combine_off_dict
+from xdm.inout.writers.emission import write_files
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "xdm", "inout", "xml", "schema")
+
+
+class _Collector(logging.Handler):
+    def __init__(self):
+        logging.Handler.__init__(self, logging.INFO)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append((record.levelname, record.getMessage()))
+
+
+def write_deck(work_dir, files, devices):
+    top = os.path.join(work_dir, "top.cir")
+    with open(top, "w") as f:
+        f.write("* write phase benchmark deck\n")
+        for i in range(files):
+            f.write('.INCLUDE "inc%d.inc"\n' % i)
+        for i in range(files):
+            f.write("X%d a%d 0 sub%d\n" % (i, i, i))
+        f.write("V1 a0 0 PULSE(0 1 0 1n 1n 5n 10n)\n.TRAN 1n 100n\n.PRINT TRAN V(a0)\n.END\n")
+    for i in range(files):
+        with open(os.path.join(work_dir, "inc%d.inc" % i), "w") as f:
+            f.write(".SUBCKT sub%d x y\n" % i)
+            for j in range(devices):
+                f.write("R%d x n%d {%d*2}\nC%d n%d y 1p\nD%d n%d y dmod%d\n" % (j, j, j + 1, j, j, j, j, i))
+            f.write(".MODEL dmod%d D(IS=1e-14 N=1.5)\n.ENDS\n" % i)
+    return top
+
+
+def read_files(deck, languages):
+    reader = open_reader(deck, "pspice", languages, auto_translate=True)
+    sli = SRC_LINE_INDEX()
+    reader.name_scope_index.add_index(sli)
+    reader.read()
+    return [(fl, objs) for fl, objs in sli if fl]
+
+
+def time_write(files, languages, workers):
+    outputs = {}
+    collector = _Collector()
+    logging.getLogger().addHandler(collector)
+    try:
+        start = time.perf_counter()
+        write_files(files, "out", languages.factory("xyce"), languages.get("pspice"), "bench",
+                    languages.xml_file("pspice"), languages.xml_file("xyce"),
+                    combine_off=origin_combine_off_dict["pspice"], outputs=outputs, workers=workers)
+        elapsed = time.perf_counter() - start
+    finally:
+        logging.getLogger().removeHandler(collector)
+
+    # the headers hold the time of the run
+    contents = dict((name, data.split(b"\n", 4)[-1]) for name, data in outputs.items())
+    return elapsed, contents, collector.messages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="write phase benchmark")
+    parser.add_argument('--files', type=int, default=100, help='included subcircuit files')
+    parser.add_argument('--devices', type=int, default=40, help='RCD sections per subcircuit')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4], help='worker counts to time')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.INFO)
+    work_dir = tempfile.mkdtemp(prefix="xdm_write_bench")
+    try:
+        deck = write_deck(work_dir, args.files, args.devices)
+        languages = LanguageDefinitions(SCHEMA_DIR)
+        languages.preload(["pspice", "xyce"])
+        print("cpus: %d" % (os.cpu_count() or 1))
+
+        reference = None
+        for workers in args.workers:
+            # each run writes a freshly read model, as the writer changes it
+            files = read_files(deck, languages)
+            elapsed, contents, messages = time_write(files, languages, workers)
+            if reference is None:
+                reference = (contents, messages)
+            same = (contents, messages) == reference
+            print("workers %3d: %8.1f ms for %d files   %s" % (workers, 1e3 * elapsed, len(contents),
+                                                             "same as first run" if same else "DIFFERS"))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+
+"""
+Tests of the translation of compressed netlists
+(xdm.inout.readers.CompressedInput).
+
+Requires built SpiritCommon and SpiritExprCommon modules on the path.  Run
+from src/python:
+
+    python -m pytest tests
+"""
+
+
+import gzip
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HAVE_PARSERS = all(importlib.util.find_spec(module) is not None for module in ("SpiritCommon", "SpiritExprCommon"))
+
+
+@unittest.skipUnless(HAVE_PARSERS, "SpiritCommon and SpiritExprCommon are not built")
+class TestCompressedNames(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        from xdm import api
+        cls.api = api
+        cls.languages = api.load_languages(dialects=["hspice", "xyce"])
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="xdm_compressed_test")
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def write_gzip(self, name, text):
+        with gzip.open(os.path.join(self.work_dir, name), "wt") as f:
+            f.write(text)
+
+    def test_output_names_drop_compressed_suffix(self):
+        self.write_gzip("top.sp.gz", "* compressed\n.include 'models.inc.gz'\n.lib 'lib.l.gz' tt\n"
+                                     "m1 d g 0 0 nch w=1u l=1u\nv1 d 0 1\n.tran 1n 10n\n.end\n")
+        self.write_gzip("models.inc.gz", ".model nch nmos level=1\n")
+        self.write_gzip("lib.l.gz", ".lib tt\nr9 a 0 1k\n.endl tt\n")
+
+        result = self.api.translate(os.path.join(self.work_dir, "top.sp.gz"), "hspice", languages=self.languages,
+                                    in_memory=True, auto_translate=True)
+        self.assertEqual(result.status, self.api.STATUS_OK, result.diagnostics)
+        self.assertEqual(sorted(result.output_files), ["lib.l", "models.inc", "top.sp"])
+        top = result.outputs["top.sp"].upper()
+        self.assertIn(".INCLUDE MODELS.INC\n", top)
+        self.assertIn(".LIB LIB.L TT\n", top)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+
+"""
+Tests of the parallel write phase (xdm.inout.writers.emission).
+
+Requires built SpiritCommon and SpiritExprCommon modules on the path.  Run
+from src/python:
+
+    python -m pytest tests
+"""
+
+
+import importlib.util
+import logging
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HAVE_PARSERS = all(importlib.util.find_spec(module) is not None for module in ("SpiritCommon", "SpiritExprCommon"))
+
+LEVELS = ['info', 'warning', 'error', 'critical']
+
+
+@unittest.skipUnless(HAVE_PARSERS, "SpiritCommon and SpiritExprCommon are not built")
+@unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), "processes can not be forked")
+class TestWriteWorkers(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        from xdm import api
+        cls.api = api
+        cls.languages = api.load_languages(dialects=["hspice", "xyce"])
+
+    def setUp(self):
+        from xdm.errorHandling.CallCount import CallCount
+        from xdm.inout.writers import emission
+        self.work_dir = tempfile.mkdtemp(prefix="xdm_emission_test")
+        # count the logging calls as a command line run does
+        self.saved_functions = dict((name, getattr(logging, name)) for name in LEVELS)
+        for name in LEVELS:
+            setattr(logging, name, CallCount(self.saved_functions[name]))
+        self.saved_level = logging.getLogger().level
+
+        # one more file than the smallest write done by the pool, each with
+        # a capacitor parameter Xyce does not have, which the writer reports
+        self.deck = os.path.join(self.work_dir, "top.sp")
+        with open(self.deck, "w") as f:
+            f.write("* write workers\n")
+            for i in range(emission.PARALLEL_MIN_FILES + 1):
+                f.write(".include 'inc%d.inc'\n" % i)
+                with open(os.path.join(self.work_dir, "inc%d.inc" % i), "w") as inc:
+                    inc.write("c%d a%d 0 1p tc=0.1\n" % (i, i))
+            f.write(".tran 1n 10n\n.end\n")
+
+    def tearDown(self):
+        for name, function in self.saved_functions.items():
+            setattr(logging, name, function)
+        logging.getLogger().setLevel(self.saved_level)
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def counts(self, workers):
+        before = [getattr(logging, name).currentCount for name in LEVELS]
+        result = self.api.translate(self.deck, "hspice", languages=self.languages, in_memory=True,
+                                    auto_translate=True, write_workers=workers)
+        self.assertEqual(result.status, self.api.STATUS_OK, result.diagnostics)
+        return [getattr(logging, name).currentCount - count for name, count in zip(LEVELS, before)]
+
+    def test_workers_count_messages_below_log_level(self):
+        for level in (logging.WARNING, logging.ERROR):
+            logging.getLogger().setLevel(level)
+            sequential = self.counts(1)
+            self.assertGreater(sequential[0], 0)
+            self.assertEqual(self.counts(4), sequential)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+
+"""
+Tests of the compiled parameter evaluator of SpiritExprCommon.
+
+Requires a built SpiritExprCommon module on the path.  Run from src/python:
+
+    python -m pytest tests
+"""
+
+
+import importlib.util
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HAVE_EVALUATOR = importlib.util.find_spec("SpiritExprCommon") is not None
+
+
+@unittest.skipUnless(HAVE_EVALUATOR, "SpiritExprCommon is not built")
+class TestParamEvaluator(unittest.TestCase):
+
+    def evaluate(self, **params):
+        from xdm.expr.expr_utils import new_param_evaluator
+        values = []
+        for lang in ("hspice", "spectre"):
+            evaluator = new_param_evaluator(lang)
+            for name, expression in params.items():
+                evaluator.define(name, expression)
+            values.append(dict(zip(params, evaluator.evaluate_params(list(params)))))
+        self.assertEqual(values[0], values[1])
+        return values[0]
+
+    def test_builtin_argument_count(self):
+        values = self.evaluate(TWO="max(1,5)", THREE="max(1,5,9)", ONE="min(3)", SQRT="sqrt(4,1)")
+        self.assertEqual(values["TWO"], 5.0)
+        self.assertIsNone(values["THREE"])
+        self.assertIsNone(values["ONE"])
+        self.assertIsNone(values["SQRT"])
+
+    def test_pow_with_fractional_exponent_is_not_constant(self):
+        values = self.evaluate(WHOLE="pow(2,3)", FRACTION="pow(2,2.5)", PWR="pwr(2,2.5)")
+        self.assertEqual(values["WHOLE"], 8.0)
+        self.assertIsNone(values["FRACTION"])
+        self.assertAlmostEqual(values["PWR"], 2 ** 2.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
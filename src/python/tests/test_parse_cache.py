@@ -0,0 +1,106 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+
+"""
+Tests of the cache of parsed include files (xdm.inout.readers.ParseCache).
+
+Requires built SpiritCommon and SpiritExprCommon modules on the path.  Run
+from src/python:
+
+    python -m pytest tests
+"""
+
+
+import importlib.util
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HAVE_PARSERS = all(importlib.util.find_spec(module) is not None for module in ("SpiritCommon", "SpiritExprCommon"))
+
+
+class _Messages(logging.Handler):
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+@unittest.skipUnless(HAVE_PARSERS, "SpiritCommon and SpiritExprCommon are not built")
+class TestParseCacheMessages(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        from xdm import api
+        from xdm.inout import translation
+        cls.api = api
+        cls.translation = translation
+        cls.languages = api.load_languages(dialects=["hspice", "xyce"])
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="xdm_parse_cache_test")
+        self.saved_level = logging.getLogger().level
+        self.deck = os.path.join(self.work_dir, "top.sp")
+        with open(self.deck, "w") as f:
+            f.write("* parse cache\n.include 'inc.inc'\nr1 a 0 1k\n.tran 1n 10n\n.end\n")
+        with open(os.path.join(self.work_dir, "inc.inc"), "w") as f:
+            f.write(".option itl1=300\nr2 a 0 1k\n")
+
+    def tearDown(self):
+        logging.getLogger().setLevel(self.saved_level)
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def translate(self, parse_cache, level):
+        logging.getLogger().setLevel(level)
+        handler = _Messages()
+        logging.getLogger().addHandler(handler)
+        try:
+            result = self.api.translate(self.deck, "hspice", languages=self.languages, in_memory=True,
+                                        auto_translate=True, parse_cache=parse_cache)
+        finally:
+            logging.getLogger().removeHandler(handler)
+        self.assertEqual(result.status, self.api.STATUS_OK, result.diagnostics)
+        return handler.messages
+
+    def test_hit_logs_messages_stored_below_log_level(self):
+        parse_cache = self.translation.open_parse_cache(os.path.join(self.work_dir, "cache"), self.languages,
+                                                        "test")
+        # the entry is written at a level that does not show the info message
+        self.assertNotIn("Converting ITL1 into NONLIN MAXSTEP", self.translate(parse_cache, logging.WARNING))
+        self.assertEqual(parse_cache.stores, 1)
+        self.assertIn("Converting ITL1 into NONLIN MAXSTEP", self.translate(parse_cache, logging.INFO))
+        self.assertEqual(parse_cache.hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
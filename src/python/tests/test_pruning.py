@@ -0,0 +1,96 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+
+"""
+Tests of --prune (xdm.inout.writers.pruning) on translated Xyce decks.
+
+Requires built SpiritCommon and SpiritExprCommon modules on the path.  Run
+from src/python:
+
+    python -m pytest tests
+"""
+
+
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HAVE_PARSERS = all(importlib.util.find_spec(module) is not None for module in ("SpiritCommon", "SpiritExprCommon"))
+
+DECK = """* pruning with a model parameter sweep
+.model used nmos level=1
+.model swept nmos level=1 vto=0.5
+.model unused nmos level=1
+m1 d g 0 0 used w=1u l=1u
+v1 d 0 1
+v2 g 0 0.5
+%s
+.tran 1n 10n
+.end
+"""
+
+
+@unittest.skipUnless(HAVE_PARSERS, "SpiritCommon and SpiritExprCommon are not built")
+class TestPruneSweeps(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        from xdm import api
+        cls.api = api
+        cls.languages = api.load_languages(dialects=["xyce"])
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp(prefix="xdm_prune_test")
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def translate(self, analysis):
+        deck = os.path.join(self.work_dir, "deck.cir")
+        with open(deck, "w") as f:
+            f.write(DECK % analysis)
+        result = self.api.translate(deck, "xyce", languages=self.languages, in_memory=True, prune=True)
+        self.assertEqual(result.status, self.api.STATUS_OK, result.diagnostics)
+        return result.outputs["deck.cir"].upper()
+
+    def test_step_over_model_parameter_keeps_model(self):
+        output = self.translate(".step swept:vto 0.3 0.5 0.1")
+        self.assertIn(".MODEL SWEPT", output)
+        self.assertIn(".MODEL USED", output)
+        self.assertNotIn(".MODEL UNUSED", output)
+
+    def test_dc_over_model_parameter_keeps_model(self):
+        output = self.translate(".dc swept:vto 0.3 0.5 0.1")
+        self.assertIn(".MODEL SWEPT", output)
+        self.assertNotIn(".MODEL UNUSED", output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,247 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+"""
+Translation API for using xdm from Python without the xdm script:
+
+    from xdm import api
+
+    languages = api.load_languages()
+    result = api.translate("deck.cir", "pspice", languages=languages, in_memory=True)
+    if result.status == api.STATUS_OK:
+        text = result.outputs["deck.cir"]
+
+Problems in a netlist do not raise; they are reported in the status, counts
+and diagnostics of the result, which hold what a command line run would
+have logged.  The language definitions are the expensive part of a
+translation, so callers running many translations should load them once
+with load_languages and pass them to every call.
+"""
+
+
+import logging
+import os
+import time
+import traceback
+from collections import namedtuple
+
+from xdm.inout.batch import STATUS_OK, STATUS_ERRORS, STATUS_FAILED
+from xdm.inout.translation import LanguageDefinitions, INPUT_FORMATS, OUTPUT_FORMATS
+from xdm.inout import translation
+
+# version written into the headers of the translated files
+API_VERSION = "api"
+
+TranslationResult = namedtuple('TranslationResult', ['status', 'elapsed', 'critical', 'errors', 'warnings',
+                                                     'diagnostics', 'output_files', 'outputs'])
+QueryResult = namedtuple('QueryResult', ['status', 'elapsed', 'critical', 'errors', 'warnings', 'diagnostics',
+                                         'devices'])
+DeviceInfo = namedtuple('DeviceInfo', ['file', 'line_num', 'name', 'value'])
+
+_default_languages = None
+
+
+class DiagnosticsHandler(logging.Handler):
+    """
+    Logging handler that keeps the messages logged during one call
+    """
+
+    def __init__(self, level=logging.WARNING):
+        logging.Handler.__init__(self, level)
+        self.diagnostics = []
+
+    def emit(self, record):
+        self.diagnostics.append({"level": record.levelname, "message": record.getMessage()})
+
+    def count(self, level_name):
+        return sum(1 for diagnostic in self.diagnostics if diagnostic["level"] == level_name)
+
+
+def default_schema_dir():
+    """
+    Returns the directory holding the XML language definitions: next to the
+    xdm package in an installed bundle, else the schema directory of the
+    source tree
+    """
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    bundle_dir = os.path.dirname(package_dir)
+    if os.path.isfile(os.path.join(bundle_dir, "xyce.xml")):
+        return bundle_dir
+    return os.path.join(package_dir, "inout", "xml", "schema")
+
+
+def load_languages(schema_dir=None, dialects=None):
+    """
+    Loads language definitions, to be passed to translate and
+    query_devices.
+
+    Args:
+       schema_dir (str): Directory holding <dialect>.xml, default
+          default_schema_dir()
+       dialects (list): Dialects to read now, default all of them.  Others
+          are read the first time they are used
+
+    Returns:
+       LanguageDefinitions
+    """
+    languages = LanguageDefinitions(schema_dir or default_schema_dir())
+    languages.preload(INPUT_FORMATS if dialects is None else dialects)
+    return languages
+
+
+def _languages(languages):
+    global _default_languages
+    if languages is not None:
+        return languages
+    if _default_languages is None:
+        _default_languages = LanguageDefinitions(default_schema_dir())
+    return _default_languages
+
+
+def _run(input_file, function, *args, **kwargs):
+    """
+    Calls function with the messages it logs collected.  Returns (status,
+    elapsed seconds, diagnostics handler, return value or None)
+    """
+    start = time.perf_counter()
+    handler = DiagnosticsHandler()
+    root_logger = logging.getLogger()
+    root_logger.addHandler(handler)
+    value = None
+    failed = False
+    try:
+        if not os.path.isfile(input_file):
+            logging.critical('ERROR: Input file ' + input_file + ' was not found. Aborting.')
+            failed = True
+        else:
+            value = function(*args, **kwargs)
+    except (Exception, SystemExit):
+        logging.critical('ERROR: Translation of ' + input_file + ' aborted:\n' + traceback.format_exc())
+        failed = True
+    finally:
+        root_logger.removeHandler(handler)
+
+    if failed:
+        status = STATUS_FAILED
+    elif handler.count("CRITICAL") + handler.count("ERROR") > 0:
+        status = STATUS_ERRORS
+    else:
+        status = STATUS_OK
+    return status, time.perf_counter() - start, handler, value
+
+
+def _check_format(value, formats, name):
+    if value not in formats:
+        raise ValueError("unknown %s '%s', expected one of %s" % (name, value, ", ".join(formats)))
+
+
+def translate(input_file, input_format='pspice', dir_out=None, output_format='xyce', languages=None,
+              auto_translate=False, in_memory=False, xdm_version=API_VERSION, pwl_copy_mode='copy',
+              pwl_format='keep', pwl_copy_threads=None, pwl_search_dirs=None, parse_cache=None,
+              write_workers=1, prune=False, fold_constant_params=False, parse_ahead=0, parse_threads=1):
+    """
+    Translates a netlist and the files it includes.
+
+    Args:
+       input_file (str): Top level netlist
+       input_format (str): One of INPUT_FORMATS
+       dir_out (str): Output directory.  Not used with in_memory
+       output_format (str): One of OUTPUT_FORMATS
+       languages (LanguageDefinitions): From load_languages.  By default a
+          module wide cache is used
+       auto_translate (bool): Translate include and library files too
+       in_memory (bool): Return the translated files in outputs instead of
+          writing them
+       xdm_version (str): Version written into the output file headers
+       pwl_copy_mode, pwl_format, pwl_copy_threads, pwl_search_dirs: see
+          xdm.inout.translation.translate_netlist
+       parse_cache (ParseCache): Cache of parsed include and library files,
+          see xdm.inout.translation.open_parse_cache
+       write_workers (int): Processes writing the translated files, see
+          xdm.inout.writers.emission.write_files
+       prune (bool): Leave out the unused .MODEL, .SUBCKT and .LIB section
+          definitions, see xdm.inout.translation.translate_netlist
+       fold_constant_params (bool): Write constant .PARAM values as numbers,
+          see xdm.inout.translation.translate_netlist
+       parse_ahead (int): Lines read and parsed ahead on a native thread,
+          see xdm.inout.translation.open_reader
+       parse_threads (int): Native threads parsing each file in chunks, see
+          xdm.inout.translation.open_reader
+
+    Returns:
+       TranslationResult.  With in_memory, outputs maps file names to the
+       translated netlist text (str) and to the contents of the referenced
+       PWL files and of the prune report (bytes), and output_files lists the
+       netlist names.
+       Otherwise outputs is None and output_files lists the paths written
+    """
+    _check_format(input_format, INPUT_FORMATS, "input_format")
+    _check_format(output_format, OUTPUT_FORMATS, "output_format")
+    if dir_out is None and not in_memory:
+        raise ValueError("dir_out is needed unless in_memory is set")
+
+    outputs = {} if in_memory else None
+    status, elapsed, handler, output_files = _run(
+        input_file, translation.translate_netlist, input_file, input_format, "" if in_memory else dir_out,
+        _languages(languages), xdm_version, output_format=output_format, auto_translate=auto_translate,
+        pwl_copy_mode=pwl_copy_mode, pwl_format=pwl_format, pwl_copy_threads=pwl_copy_threads,
+        pwl_search_dirs=pwl_search_dirs, outputs=outputs, parse_cache=parse_cache,
+        write_workers=write_workers, prune=prune, fold_constant_params=fold_constant_params,
+        parse_ahead=parse_ahead, parse_threads=parse_threads)
+
+    output_files = output_files or []
+    if in_memory:
+        for file_name in output_files:
+            if file_name in outputs:
+                outputs[file_name] = outputs[file_name].decode('utf-8')
+
+    return TranslationResult(status, elapsed, handler.count("CRITICAL"), handler.count("ERROR"),
+                             handler.count("WARNING"), handler.diagnostics, output_files, outputs)
+
+
+def query_devices(input_file, input_format='pspice', device_type='ALL', languages=None, auto_translate=False,
+                  parse_cache=None):
+    """
+    Lists the devices of a netlist, as the SAW device query (xdm -q) does.
+
+    Args:
+       input_file (str): Top level netlist
+       input_format (str): One of INPUT_FORMATS
+       device_type (str): Device letter (R, C, D, L, X, Q), or 'ALL'
+       languages (LanguageDefinitions): From load_languages.  By default a
+          module wide cache is used
+       auto_translate (bool): Read include and library files too
+       parse_cache (ParseCache): Cache of parsed include and library files
+
+    Returns:
+       QueryResult, with a DeviceInfo per device
+    """
+    _check_format(input_format, INPUT_FORMATS, "input_format")
+
+    status, elapsed, handler, rows = _run(input_file, translation.query_devices, input_file, input_format,
+                                          _languages(languages), device_type, auto_translate=auto_translate,
+                                          parse_cache=parse_cache)
+
+    return QueryResult(status, elapsed, handler.count("CRITICAL"), handler.count("ERROR"),
+                       handler.count("WARNING"), handler.diagnostics, [DeviceInfo(*row) for row in rows or []])
@@ -0,0 +1,169 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+"""
+An expression read from a netlist, carried in the props of a Statement from
+the reader to the writer.  It is the expression text, so everything that
+handles props as strings keeps working, and it keeps the token stream and
+the expression parser's components of that text once they are first needed.
+The reader's operator rewrites and the writer's special variable renaming
+work on the token stream and build the text once, so an expression is
+tokenized once however many phases rewrite it.
+"""
+
+
+import logging
+import os
+import re
+
+from xdm.expr import expr_utils
+
+# the token delimiters of the writer's special variable renaming
+FIELD_DELIMITERS = frozenset(["*", "/", "+", "-", "(", ")", " ", "'", "[", "]", "{", "}"])
+
+_delimiters = re.compile(r"(\*|/|\+|-|\(|\)| |'|\[|\]|\{|\}|\?|:|\^)")
+
+
+class Expression(str):
+    """
+    Expression text with its token stream.  Tokens are the delimiters of
+    FIELD_DELIMITERS, the ternary and power operators, and the text between
+    them.
+    """
+
+    def __new__(cls, text, tokens=None):
+        expression = str.__new__(cls, text)
+        expression._tokens = tokens
+        expression._fields = None
+        expression._components = {}
+        return expression
+
+    def __reduce__(self):
+        return Expression, (str(self), self._tokens)
+
+    @classmethod
+    def of(cls, text):
+        """
+        Returns text as an Expression, text itself if it is one
+        """
+        if isinstance(text, Expression):
+            return text
+        return cls(text)
+
+    @classmethod
+    def from_tokens(cls, tokens):
+        tokens = tuple(tokens)
+        return cls(''.join(tokens), tokens)
+
+    @property
+    def tokens(self):
+        if self._tokens is None:
+            self._tokens = tuple(token for token in _delimiters.split(self) if token)
+        return self._tokens
+
+    @property
+    def fields(self):
+        """
+        The delimiters of FIELD_DELIMITERS and the text between them
+        """
+        if self._fields is None:
+            fields = []
+            word = ""
+            for token in self.tokens:
+                if token in FIELD_DELIMITERS:
+                    if word:
+                        fields.append(word)
+                        word = ""
+                    fields.append(token)
+                else:
+                    word += token
+            if word:
+                fields.append(word)
+            self._fields = fields
+        return self._fields
+
+    def components(self, lang="hspice"):
+        """
+        The expression parser's components of the expression, see
+        find_expr_components.  Parsed once per language
+        """
+        if lang not in self._components:
+            found = []
+            expr_utils.find_expr_components(self, [], found, lang=lang)
+            self._components[lang] = found
+        return self._components[lang]
+
+    def rewrite(self, space_ternary=False, power_operator=False, location=None):
+        """
+        Returns the expression with a space before the colon of each
+        ternary operator, and with the "^" power operator written as "**",
+        as asked.  An expression whose "?" and ":" do not pair up keeps its
+        colons unchanged.  location is the (file name, line number) the
+        expression was read from, reported with that warning
+        """
+        space_ternary = space_ternary and "?" in self and ":" in self
+        power_operator = power_operator and "^" in self
+        if not space_ternary and not power_operator:
+            return self
+
+        tokens = []
+        pending = 0
+        for token in self.tokens:
+            if token == "?" and space_ternary:
+                pending += 1
+            elif token == ":" and space_ternary:
+                if not pending:
+                    self._warn_ternary(location)
+                    return self.rewrite(power_operator=power_operator)
+                pending -= 1
+                if not tokens or tokens[-1] != " ":
+                    tokens.append(" ")
+            elif token == "^" and power_operator:
+                token = "**"
+            tokens.append(token)
+
+        if pending:
+            self._warn_ternary(location)
+            return self.rewrite(power_operator=power_operator)
+        return Expression.from_tokens(tokens)
+
+    def _warn_ternary(self, location):
+        message = "Ternary operator cannot be translated in " + self + ". Continuing."
+        if location is not None:
+            file_name, line_num = location
+            message = "In file:\"" + str(os.path.basename(file_name)) + "\" at line:" + str(line_num) + ". " + message
+        logging.warning(message)
+
+    def without_single_quotes(self):
+        if "'" not in self:
+            return self
+        return Expression.from_tokens(token for token in self.tokens if token != "'")
+
+    def braced(self):
+        """
+        The expression in curly braces
+        """
+        if self._tokens is None:
+            return Expression("{" + self + "}")
+        return Expression.from_tokens(("{",) + self._tokens + ("}",))
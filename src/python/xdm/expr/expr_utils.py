@@ -58,3 +58,13 @@ def find_expr_components(in_expr, search_expr_list, found_list, debug=False, lan
                 elif parsed_expr_object.types[0] == SpiritExprCommon.expr_data_model_type.NUMBER:
                     print(parsed_expr_object.value, "NUMBER")
     return
+
+
+# function to create a parameter evaluator for a language. The evaluator
+# compiles .PARAM and .FUNC definitions once, then evaluates parameters, or
+# expressions that use them, to numbers. A value that is not a constant when
+# translating, such as one depending on TEMPER or a random function, is None
+def new_param_evaluator(lang="hspice"):
+    if lang == "spectre":
+        return SpiritExprCommon.SpectreParamEvaluator()
+    return SpiritExprCommon.HSPICEParamEvaluator()
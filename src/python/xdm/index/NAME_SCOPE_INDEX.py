@@ -21,12 +21,14 @@
 #-------------------------------------------------------------------------
 
 
+import itertools
 import logging
 
 from xdm import Types
 from xdm.exceptions import InvalidTypeException
 from xdm.exceptions import NameConflictException
 from xdm.index import *
+from xdm.index.NODE_TABLE import NODE_TABLE
 from xdm.index.UID import UID
 from xdm.statements.commands import Command
 from xdm.statements.nodes import LAZY_STATEMENT
@@ -58,6 +60,7 @@ class NAME_SCOPE_INDEX(MasterIndex):
         self._lib_command = lib_command
         self._child_scope_lib_sects = []
         self._name_to_statement = {}
+        self._node_table = NODE_TABLE()
 
         if parent is not None:
             self._lsi = parent.lazy_statement_index
@@ -110,6 +113,10 @@ class NAME_SCOPE_INDEX(MasterIndex):
     def all_statements_in_scope(self):
         return self._all_statements_in_scope
 
+    @property
+    def node_table(self):
+        return self._node_table
+
     def push_scope(self, subckt_command=None, lib_command=None):
         """
         .. _push-scope:
@@ -255,10 +262,11 @@ class NAME_SCOPE_INDEX(MasterIndex):
     def add_enode(self, e, case_insensitive=False):
         """
 
-        Adds a ENODE to the scope tree.
+        Adds a ENODE to the scope tree.  The node is stored in the scope's
+        NODE_TABLE with e as its view, so later lookups of the name return e.
 
-        ENODES will not bind to LAZY_STATEMENTs and attempts to add an ENODE that
-        conflicts with a LAZY_STATEMENT will get a NameConflictException
+        Like a node added with add_node(), an ENODE binds to a LAZY_STATEMENT
+        of its name in the scope, and the LAZY_STATEMENT is removed.
 
         Args:
            e (Statement): Statement to add to scoping
@@ -268,11 +276,64 @@ class NAME_SCOPE_INDEX(MasterIndex):
            NameConflictException if the name conflicts with another name within the scope
         """
         if isinstance(e, ENODE):
-            e.set_prop(Types.statementType, "__ENODE__")
-            self._add_statement(e, case_insensitive)
+            self._add_node(e.name, e.uid, e)
         else:
             raise InvalidTypeException(e.name + " is not of type ENODE")
 
+    def add_node(self, name):
+        """
+        Adds a node by name to the scope tree, without building a full ENODE
+        for it.  Node names are always scoped case sensitively.
+
+        Args:
+           name (str): Name of the node
+
+        Returns:
+           ENODE. View of the newly added node
+
+        Throws:
+           NameConflictException if the name conflicts with another name within the scope
+        """
+        return self._add_node(name, self._uid.uid)
+
+    def _add_node(self, name, uid, enode=None):
+        if self.get_enode(name) is not None:
+            # only raise exception and exit if the name scope conflict occurs at the top scope
+            # otherwise, just give warning since child scopes won't affect what's actually to
+            # be simulated
+            if self.is_top_parent():
+                raise NameConflictException(str(name) + " has already been used in this scope")
+            else:
+                logging.warning(str(name) + " duplicated in a child scope. Continuing.")
+
+        enode = self._node_table.enode(self._node_table.add(name, uid, enode))
+
+        d = self.get_object("__LAZYSTATEMENT__" + name)
+        if d:
+            d.bind(enode)
+            self.remove_statement(d)
+
+        return enode
+
+    def get_enode(self, name):
+        """
+        Returns the node named name (if exists) within the scope space, as seen
+        from this scope.
+
+        Args:
+           name (str): Name of the node
+
+        Returns:
+           ENODE.  None if there is no such node within the scope
+        """
+        scope = self
+        while scope is not None:
+            node_id = scope._node_table.get_id(name)
+            if node_id is not None:
+                return scope._node_table.enode(node_id)
+            scope = scope._parent
+        return None
+
     def add_ref(self, st):
         """
 
@@ -428,7 +489,9 @@ class NAME_SCOPE_INDEX(MasterIndex):
         Returns:
            bool. True if the name is within scoped node; else false
         """
-        return nm in self._statements
+        if nm in self._statements:
+            return True
+        return nm.startswith("__ENODE__") and nm[9:] in self._node_table
 
     def get_object(self, nm):
         """
@@ -442,8 +505,12 @@ class NAME_SCOPE_INDEX(MasterIndex):
         Returns:
            Statement.  None if there is no nm within the scope
         """
-        if self.contains(nm):
+        if nm in self._statements:
             return self._statements[nm]
+        if nm.startswith("__ENODE__"):
+            node_id = self._node_table.get_id(nm[9:])
+            if node_id is not None:
+                return self._node_table.enode(node_id)
         if self._parent is None:
             return None
 
@@ -560,7 +627,8 @@ class NAME_SCOPE_INDEX(MasterIndex):
         # dictionary from lower-cased name list of actual cased names
         upper_to_actual = {}
         warning_message_keys = []
-        for statement in self._statements.keys():
+        node_keys = ("__ENODE__" + node_name for node_name in self._node_table)
+        for statement in itertools.chain(self._statements.keys(), node_keys):
             statement_upper = statement.upper()
             if statement_upper in upper_to_actual:
                 warning_message_keys.append(statement_upper)
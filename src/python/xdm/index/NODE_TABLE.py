@@ -0,0 +1,97 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#   
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#  
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#   
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+import sys
+
+from xdm.statements.nodes.ENODE import ENODE
+
+
+class NODE_TABLE(object):
+    """
+    A compact table of the electrical nodes defined within a single
+    NAME_SCOPE_INDEX scope.  Node names are interned and mapped to integer
+    ids, and each id holds the node's ENODE.  An ENODE is a light view that
+    keeps only the name and uid of its node until something needs its props
+    or params, so a net costs a name, an id and a small object.
+    """
+    def __init__(self):
+        self._ids = {}
+        self._nodes = []
+
+    def add(self, name, uid, enode=None):
+        """
+        Adds a node to the table.
+
+        Args:
+           name (str): Name of the node, as it appears in the netlist
+           uid (int): Universal ID of the node
+           enode (ENODE): Optional, already built view for the node
+
+        Returns:
+           int. The id of the node within this table
+        """
+        name = sys.intern(name)
+        if enode is None:
+            enode = ENODE(name, uid)
+        node_id = len(self._nodes)
+        self._ids[name] = node_id
+        self._nodes.append(enode)
+        return node_id
+
+    def get_id(self, name):
+        """
+        Returns the id of the node named name, or None if it is not in the table
+        """
+        return self._ids.get(name)
+
+    def name(self, node_id):
+        return self._nodes[node_id].name
+
+    def uid(self, node_id):
+        return self._nodes[node_id].uid
+
+    def enode(self, node_id):
+        """
+        Returns the ENODE view for a node id.
+
+        Args:
+           node_id (int): Id of the node within this table
+
+        Returns:
+           ENODE. View of the node
+        """
+        return self._nodes[node_id]
+
+    @property
+    def names(self):
+        return list(self._ids)
+
+    def __contains__(self, name):
+        return name in self._ids
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __iter__(self):
+        return iter(self._ids)
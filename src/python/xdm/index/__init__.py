@@ -27,6 +27,7 @@ from xdm.index.LAZY_STATEMENT_INDEX import LAZY_STATEMENT_INDEX
 from xdm.index.MasterIndex import MasterIndex
 from xdm.index.SRC_LINE_INDEX import SRC_LINE_INDEX
 from xdm.index.NAME_SCOPE_INDEX import NAME_SCOPE_INDEX
+from xdm.index.NODE_TABLE import NODE_TABLE
 from xdm.index.REFS_INDEX import REFS_INDEX
 from xdm.index.StatementIndex import StatementIndex
 from xdm.index.UID import UID
@@ -0,0 +1,244 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+import csv
+import logging
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from collections import namedtuple
+
+from xdm.errorHandling.CallCount import CallCount
+from xdm.inout.translation import LanguageDefinitions, translate_netlist, INPUT_FORMATS
+
+BatchJob = namedtuple('BatchJob', ['input_file', 'input_format', 'dir_out'])
+BatchResult = namedtuple('BatchResult', ['job', 'status', 'elapsed', 'critical', 'errors', 'warnings',
+                                         'output_files'])
+
+# job status values; only OK counts towards a successful batch
+STATUS_OK = 'OK'
+STATUS_ERRORS = 'ERRORS'
+STATUS_FAILED = 'FAILED'
+
+# state a pool worker translates with.  Set in the parent before the pool is
+# created, so workers started with fork inherit the language definitions the
+# parent already read; workers started any other way rebuild it in
+# _init_worker.
+_worker_state = {}
+
+
+def read_manifest(manifest_file, default_format='pspice', default_dir_out='default_dir'):
+    """
+    Reads a batch manifest.  Each line is a comma separated job:
+
+        input_file[, input_format[, dir_out]]
+
+    Blank lines and lines starting with '#' are skipped.  Relative paths are
+    taken relative to the directory of the manifest.
+
+    Args:
+       manifest_file (str): Path to the manifest
+       default_format (str): Input format of jobs that do not give one
+       default_dir_out (str): Output directory of jobs that do not give one
+
+    Returns:
+       list. BatchJob per job, in manifest order
+    """
+    manifest_dir = os.path.dirname(os.path.abspath(manifest_file))
+    jobs = []
+    with open(manifest_file, 'r') as f:
+        for line_num, row in enumerate(csv.reader(f), 1):
+            row = [field.strip() for field in row]
+            if not row or not row[0] or row[0].startswith('#'):
+                continue
+            if len(row) > 3:
+                raise ValueError("%s:%d: expected input_file[, input_format[, dir_out]]"
+                                 % (manifest_file, line_num))
+
+            input_file = row[0]
+            input_format = row[1].lower() if len(row) > 1 and row[1] else default_format
+            dir_out = row[2] if len(row) > 2 and row[2] else default_dir_out
+            if input_format not in INPUT_FORMATS:
+                raise ValueError("%s:%d: unknown input format '%s'" % (manifest_file, line_num, input_format))
+
+            jobs.append(BatchJob(os.path.join(manifest_dir, input_file), input_format,
+                                 os.path.join(manifest_dir, dir_out)))
+    return jobs
+
+
+def _call_count(method):
+    if isinstance(method, CallCount):
+        return method.currentCount
+    return 0
+
+
+def _log_counts():
+    return (_call_count(logging.critical), _call_count(logging.error), _call_count(logging.warning))
+
+
+def run_counted(function, *args, **kwargs):
+    """
+    Calls function, counting the critical, error and warning messages logged
+    while it runs through the CallCount wrapped logging functions, as for a
+    single command line run.  Any exception is caught and logged, so one bad
+    netlist does not stop a batch or a server.
+
+    Returns:
+       tuple. (status, elapsed seconds, critical, errors, warnings, return
+       value of function or None if it failed)
+    """
+    start = time.perf_counter()
+    before = _log_counts()
+    value = None
+    failed = False
+
+    try:
+        value = function(*args, **kwargs)
+    except (Exception, SystemExit):
+        logging.critical('ERROR: ' + function.__name__ + ' aborted:\n' + traceback.format_exc())
+        failed = True
+
+    critical, errors, warnings = [after - prior for after, prior in zip(_log_counts(), before)]
+    if failed:
+        status = STATUS_FAILED
+    elif critical + errors > 0:
+        status = STATUS_ERRORS
+    else:
+        status = STATUS_OK
+
+    return status, time.perf_counter() - start, critical, errors, warnings, value
+
+
+def run_job(job, languages, xdm_version, **options):
+    """
+    Translates one job, see run_counted.
+
+    Args:
+       job (BatchJob): Job to run
+       languages (LanguageDefinitions): Language definition cache
+       xdm_version (str): Version written into the output file headers
+       options: Passed on to translate_netlist
+
+    Returns:
+       BatchResult
+    """
+    if not os.path.isfile(job.input_file):
+        logging.critical('ERROR: Input file ' + job.input_file + ' was not found. Aborting.')
+        return BatchResult(job, STATUS_FAILED, 0.0, 1, 0, 0, [])
+
+    status, elapsed, critical, errors, warnings, output_files = \
+        run_counted(translate_netlist, job.input_file, job.input_format, job.dir_out, languages, xdm_version,
+                    **options)
+    return BatchResult(job, status, elapsed, critical, errors, warnings, output_files or [])
+
+
+def _init_worker(schema_dir, dialects, log_level):
+    if _worker_state.get('languages') is not None:
+        return
+
+    logging.basicConfig(stream=sys.stdout, level=log_level,
+                        format='\t%(asctime)s %(levelname)s:  %(message)s',
+                        datefmt='%m/%d/%Y %I:%M:%S %p')
+    for name in ['info', 'warning', 'error', 'critical']:
+        if not isinstance(getattr(logging, name), CallCount):
+            setattr(logging, name, CallCount(getattr(logging, name)))
+
+    languages = LanguageDefinitions(schema_dir)
+    languages.preload(dialects)
+    _worker_state['languages'] = languages
+
+
+def _run_worker_job(args):
+    job, xdm_version, options = args
+    return run_job(job, _worker_state['languages'], xdm_version, **options)
+
+
+def run_batch(jobs, languages, xdm_version, workers=None, **options):
+    """
+    Runs a list of jobs, spread over a pool of worker processes.  Every
+    language definition the jobs need is read once, before the pool starts.
+
+    Args:
+       jobs (list): BatchJob list
+       languages (LanguageDefinitions): Language definition cache
+       xdm_version (str): Version written into the output file headers
+       workers (int): Number of worker processes, default is the number of
+          CPUs.  With 1, the jobs run in this process
+       options: Passed on to translate_netlist
+
+    Returns:
+       list. BatchResult per job, in the order of jobs
+    """
+    output_formats = set([options.get('output_format', 'xyce')])
+    dialects = sorted(set(job.input_format for job in jobs) | output_formats)
+    languages.preload(dialects)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs)))
+
+    if workers == 1:
+        return [run_job(job, languages, xdm_version, **options) for job in jobs]
+
+    _worker_state['languages'] = languages
+    if 'fork' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('fork')
+    else:
+        context = multiprocessing.get_context()
+
+    pool = context.Pool(workers, initializer=_init_worker,
+                        initargs=(languages.schema_dir, dialects, logging.getLogger().level))
+    try:
+        # chunksize of 1 so a long netlist does not hold back the jobs queued behind it
+        results = list(pool.imap(_run_worker_job, [(job, xdm_version, options) for job in jobs], 1))
+    finally:
+        pool.close()
+        pool.join()
+        _worker_state.pop('languages', None)
+    return results
+
+
+def format_summary(results):
+    """
+    Returns a per-job status and timing table for a batch, with totals
+    """
+    lines = ["%-8s %10s %8s %8s %8s  %s" % ("status", "time (s)", "critical", "errors", "warnings", "input")]
+    for result in results:
+        lines.append("%-8s %10.3f %8d %8d %8d  %s" % (result.status, result.elapsed, result.critical,
+                                                     result.errors, result.warnings, result.job.input_file))
+
+    failed = sum(1 for result in results if result.status != STATUS_OK)
+    lines.append("")
+    lines.append("%d jobs, %d succeeded, %d failed, %.3f s total job time"
+                 % (len(results), len(results) - failed, failed, sum(result.elapsed for result in results)))
+    return "\n".join(lines)
+
+
+def batch_status(results):
+    """
+    Returns the exit status of a batch: 1 if any job did not succeed
+    """
+    return 0 if all(result.status == STATUS_OK for result in results) else 1
@@ -137,3 +137,35 @@ boost_xdm_map_dict = {SpiritCommon.data_model_type.DIRECTIVE_NAME: Types.name,
                       SpiritCommon.data_model_type.VARIABLE_EXPR_OR_VALUE: Types.variableExprValue,
                       SpiritCommon.data_model_type.DATA_TABLE_NAME: Types.dataTableName
                       }
+
+
+# lines taken from a parser reading ahead at a time, see parsed_lines
+PARSE_AHEAD_BATCH = 64
+
+# bytes of a file parsed at a time by a parser parsing it in chunks
+PARSE_CHUNK_BYTES = 1 << 20
+
+
+def parsed_lines(internal_parser, batch_size=PARSE_AHEAD_BATCH):
+    """
+    Yields the BoostParsedLines of a SpiritCommon parser, taking them in
+    batches of up to batch_size lines so a parser reading ahead is only
+    waited on when it has no lines ready
+    """
+    lines = internal_parser.next_lines(batch_size)
+    while lines:
+        for line in lines:
+            yield line
+        lines = internal_parser.next_lines(batch_size)
+
+
+def value_adder(add_value):
+    """
+    Returns a token handler, see XyceNetlistBoostParserInterface.token_handlers,
+    that adds the value of the token to the ParsedNetlistLine with the
+    ParsedNetlistLine method add_value
+    """
+    def convert_value(reader, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        add_value(pnl, parsed_object.value)
+
+    return convert_value
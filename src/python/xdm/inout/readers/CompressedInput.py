@@ -0,0 +1,92 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+"""
+Netlist files stored gzip or zstd compressed.  The parser decompresses a
+compressed file as it reads it (see NetlistLineReader::open in the
+SpiritCommon module), so it is never written out decompressed.
+
+A file a netlist names may be stored compressed under that name, or under
+that name with a ".gz" or ".zst" suffix when there is no file of the name
+itself.  It is read under the name the netlist gives it, so the lines read
+from it have the file name and line numbers of the decompressed file.  A
+compressed file is read from start to end, so it is not read in library
+section ranges or parsed in chunks.
+
+The translation of a file is written uncompressed, so it is named, and the
+.INCLUDE and .LIB statements refer to it, without the compressed suffix.
+"""
+
+
+import os
+
+# magic bytes at the start of the files of each compression
+COMPRESSION_MAGIC = ((b'\x1f\x8b', 'gzip'), (b'\x28\xb5\x2f\xfd', 'zstd'))
+
+# suffixes of the compressed copies of a file, in the order they are looked for
+COMPRESSED_SUFFIXES = ('.gz', '.zst')
+
+
+def stored_path(file_name):
+    """
+    Returns the path a netlist file is read from: the file itself, or when
+    there is none, a compressed copy of it
+    """
+    if os.path.isfile(file_name):
+        return file_name
+    for suffix in COMPRESSED_SUFFIXES:
+        if os.path.isfile(file_name + suffix):
+            return file_name + suffix
+    return file_name
+
+
+def output_file_name(file_name):
+    """
+    Returns the name the translation of a netlist file is written under:
+    the name without a ".gz" or ".zst" suffix
+    """
+    for suffix in COMPRESSED_SUFFIXES:
+        if file_name.lower().endswith(suffix):
+            return file_name[:-len(suffix)]
+    return file_name
+
+
+def is_netlist_file(file_name):
+    """
+    Whether a netlist file is there, plain or compressed
+    """
+    return os.path.isfile(stored_path(file_name))
+
+
+def compression(file_name):
+    """
+    Returns "gzip" or "zstd" for a netlist file stored compressed, and None
+    for a plain file or one that can not be read
+    """
+    try:
+        with open(stored_path(file_name), 'rb') as f:
+            head = f.read(4)
+    except (IOError, OSError):
+        return None
+    for magic, name in COMPRESSION_MAGIC:
+        if head.startswith(magic):
+            return name
+    return None
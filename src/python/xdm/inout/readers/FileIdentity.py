@@ -0,0 +1,48 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+"""
+Identity of the files a netlist includes, so a file reached through
+different names is read once.  "./models/a.inc", "models/a.inc", a symbolic
+or hard link to it, and a different case on a case insensitive file system
+all name the same file.
+"""
+
+
+import os
+
+from xdm.inout.readers.CompressedInput import stored_path
+
+
+def file_identity(file_name):
+    """
+    Returns the identity of a netlist file, a hashable value that is the same
+    for every name of the file: its (device, inode), or its resolved real
+    path when it can not be read or the file system has no inode numbers
+    """
+    path = os.path.realpath(stored_path(file_name))
+    try:
+        stat = os.stat(path)
+    except (IOError, OSError):
+        return os.path.normcase(path)
+    if not stat.st_ino:
+        return os.path.normcase(path)
+    return stat.st_dev, stat.st_ino
@@ -21,15 +21,17 @@
 #-------------------------------------------------------------------------
 
 
+import logging
 import ntpath
+import os
 
 import xdm.inout.readers.XDMFactory as XDMFactory
 from xdm import Types
 from xdm.exceptions import InvalidTypeException
+from xdm.inout.readers.CompressedInput import compression, is_netlist_file, output_file_name
+from xdm.inout.readers.FileIdentity import file_identity
 from xdm.inout.readers.GenericReaderState import GenericReaderState
-from xdm.inout.readers.PSPICENetlistBoostParserInterface import *
-from xdm.inout.readers.HSPICENetlistBoostParserInterface import *
-from xdm.inout.readers.SpectreNetlistBoostParserInterface import *
+from xdm.inout.readers.LibrarySectionIndex import section_ranges
 from xdm.inout.xml import *
 from xdm.inout.readers.ParsedNetlistLine import ParsedNetlistLine
 from xdm.statements.commands import Command
@@ -63,13 +65,47 @@ class GenericReader(object):
 
     """
 
-    def __init__(self, filename, grammar, language_definition, pspice_xml=None, spectre_xml=None, tspice_xml=None, hspice_xml=None, reader_state=None, top_reader_state=None, is_top_level_file=True, append_prefix=False, auto_translate=False, lib_sect_list=[]):
+    def __init__(self, filename, grammar, language_definition, pspice_xml=None, spectre_xml=None, tspice_xml=None, hspice_xml=None, reader_state=None, top_reader_state=None, is_top_level_file=True, append_prefix=False, auto_translate=False, lib_sect_list=[], parse_cache=None, lib_sections_only=False, parse_ahead=0, parse_threads=1):
         self._file = filename
+        self._file_identity = file_identity(filename)
 
         self._grammar_type = grammar
         self._language_definition = language_definition
         self._is_top_level_file = is_top_level_file
-        self._grammar = self._grammar_type(self._file, self._language_definition, self._is_top_level_file)
+        # a compressed file is decompressed as it is parsed, from start to end
+        self._compression = compression(filename)
+
+        # a library file read for some of its sections may be parsed without
+        # the other sections, when the caller does not need them
+        self._lib_sections_only = lib_sections_only
+        self._lib_ranges = None
+        skipped_sections = []
+        if lib_sections_only and lib_sect_list and not self._compression and hasattr(grammar, "set_ranges"):
+            ranges = section_ranges(filename, lib_sect_list)
+            if ranges is not None:
+                self._lib_ranges, skipped_sections = ranges
+                logging.debug("Parsing only sections " + ",".join(lib_sect_list) + " of library file \t\"" +
+                              filename + "\"")
+
+        # include and library files may come from the parse cache instead of
+        # being parsed; the top level file is always parsed
+        self._parse_cache = parse_cache
+        self._cache_key = None
+        self._cached_lines = None
+        if parse_cache is not None and not is_top_level_file:
+            self._cache_key = parse_cache.key(filename, grammar, language_definition, self._lib_ranges)
+            self._cached_lines = parse_cache.load(self._cache_key)
+
+        # lines the parser reads ahead of the reader on a native thread,
+        # 0 to read them as they are asked for
+        self._parse_ahead = parse_ahead
+        # threads parsing each file in chunks, 1 to parse it in one piece
+        self._parse_threads = parse_threads
+
+        if self._cached_lines is None:
+            self._grammar = self._open_grammar(self._lib_ranges)
+        else:
+            self._grammar = None
         self._case_insensitive = self._language_definition.is_case_insensitive()
         self._last_line = 0
         self._tspice_xml = tspice_xml
@@ -92,11 +128,98 @@ class GenericReader(object):
             self._top_reader_state = self._reader_state
         else:
             self._top_reader_state = top_reader_state
+        self._reader_state.add_skipped_lib_sections(filename, skipped_sections)
 
     @property
     def reader_state(self):
         return self._reader_state
 
+    def _open_grammar(self, ranges=None):
+        """
+        Opens the file with the grammar type, reading only the given ranges
+        of it if any, and starts parsing it in chunks or reading ahead if
+        asked to.  A file read in ranges or compressed is not parsed in chunks
+        """
+        grammar = self._grammar_type(self._file, self._language_definition, self._is_top_level_file)
+        if ranges is not None:
+            grammar.set_ranges(ranges)
+        elif self._parse_threads > 1 and not self._compression and hasattr(grammar, "parse_parallel"):
+            grammar.parse_parallel(self._parse_threads)
+            return grammar
+        if self._parse_ahead and hasattr(grammar, "parse_ahead"):
+            grammar.parse_ahead(self._parse_ahead)
+        return grammar
+
+    def _include_file_name(self, incfile, debug_incfiles=False):
+        """
+        Returns the path of a file included by this file
+        """
+        import sys
+        platform = sys.platform
+
+        if debug_incfiles is True:
+            print("self._file = '%s'\n" % self._file, file=sys.stderr)
+            print("os.path.dirname(self._file) = '%s'\n" % (os.path.dirname(self._file)), file=sys.stderr)
+            print("os.path.dirname(os.path.abspath(self._file)) = '%s'\n" % (os.path.dirname(os.path.abspath(self._file))), file=sys.stderr)
+            print("incfile = '%s'\n" % incfile, file=sys.stderr)
+
+        # incfile_resolved  = os.path.normpath(os.path.normcase(incfile)).replace('"','')
+        # incfile_case_resolved  = os.path.normcase(incfile)
+        incfile_case_resolved = incfile
+        incfile_quote_resolved = incfile_case_resolved.replace('"', '')
+        incfile_quote_resolved = incfile_quote_resolved.replace("'", '')
+        incfile_path_resolved = os.path.normpath(incfile_quote_resolved)
+        incfile_resolved = incfile_path_resolved
+        if debug_incfiles is True:
+            print("incfile_case_resolved = '%s'\n" % incfile_case_resolved, file=sys.stderr)
+            print("incfile_quote_resolved = '%s'\n" % incfile_quote_resolved, file=sys.stderr)
+            print("incfile_path_resolved = '%s'\n" % incfile_path_resolved, file=sys.stderr)
+
+        dirname_resolved = os.path.normpath(os.path.dirname(os.path.abspath(self._file))).replace('"', '')
+
+        if debug_incfiles:
+            print("incfile_resolved = '%s'\n" % incfile_resolved, file=sys.stderr)
+            print("dirname_resolved = '%s'\n" % dirname_resolved, file=sys.stderr)
+
+        if platform == "Windows":
+            if debug_incfiles:
+                print("On Windows - pre fixed file string = '%s'\n" % incfile_resolved, file=sys.stderr)
+            incfile_resolved_slashes = incfile_resolved.replace('//', '\\')
+            if debug_incfiles:
+                print("On Windows - post fixed file string = '%s'\n" % incfile_resolved, file=sys.stderr)
+        else:
+            if debug_incfiles:
+                print("On Linux or OS X - pre fixed file string = '%s'\n" % incfile_resolved, file=sys.stderr)
+            incfile_resolved_slashes = incfile_resolved.replace('\\', '/')
+            if debug_incfiles:
+                print("On Linux or OS X - post fixed file string = '%s'\n" % incfile_resolved, file=sys.stderr)
+
+        if debug_incfiles:
+            print("incfile_resolved_slashes = '%s'\n" % incfile_resolved_slashes, file=sys.stderr)
+
+        inc_path, incfile_resolved2 = os.path.split(incfile_resolved_slashes)
+        incfile_resolved3 = os.path.join(inc_path, incfile_resolved2)
+
+        if debug_incfiles is True:
+            print("incfile2_resolved = '%s'\n" % incfile_resolved2, file=sys.stderr)
+            print("incfile3_resolved = '%s'\n" % incfile_resolved3, file=sys.stderr)
+
+        filename = os.path.join(dirname_resolved, incfile_resolved3).replace('"', '')
+
+        if debug_incfiles is True:
+            print("filename = '%s'\n" % filename, file=sys.stderr)
+
+        return filename
+
+    def _lib_file_name(self, lib_file):
+        """
+        Returns the path of a library file named by this file
+        """
+        lib_file = lib_file.replace("'", '').replace('"', '')
+        if not is_netlist_file(lib_file):
+            lib_file = os.path.join(os.path.dirname(self._file), lib_file)
+        return lib_file
+
     def read(self):
         """
         .. _reader_read:
@@ -105,14 +228,21 @@ class GenericReader(object):
         statements, and registers relevant components
 
         """
-        import sys
-        inc_files_and_scopes = []
+        # file identity -> (file name, scope) of the files this file includes
+        inc_files_and_scopes = OrderedDict()
         lib_files = []  # tuple list (file name, lib name)
         control_device_handling_list = []
         debug_incfiles = False
-        platform = sys.platform
 
-        grammar_iter = iter(self._grammar)
+        recording = None
+        if self._cached_lines is not None:
+            logging.debug("Using cached parse of file \t\"" + self._file + "\"")
+            grammar_iter = self._parse_cache.replay(self._cached_lines, self._file)
+        elif self._cache_key is not None:
+            grammar_iter = recording = self._parse_cache.record(iter(self._grammar))
+        else:
+            grammar_iter = iter(self._grammar)
+
         # iterates through each grammar "line"
         for parsed_netlist_line in grammar_iter:
             self._last_line = self.read_line(parsed_netlist_line, self._reader_state, self._top_reader_state,
@@ -121,6 +251,10 @@ class GenericReader(object):
             if self._language_changed:
                 break
 
+        # a file that switches language is parsed again below, so it is not cached
+        if recording is not None and not self._language_changed:
+            self._parse_cache.store(self._cache_key, recording)
+
         # Add in default TNOM value, if not the same as Xyce's 27C
         if self._is_top_level_file and not self._grammar.tnom_defined and self._grammar.tnom_value != "27":
             parsed_netlist_line = ParsedNetlistLine(self._file, [0])
@@ -145,7 +279,7 @@ class GenericReader(object):
         if self._language_changed:
 
             self._language_changed = False
-            self._grammar = self._grammar_type(self._file, self._language_definition, self._is_top_level_file)
+            self._grammar = self._open_grammar()
             grammar_iter = iter(self._grammar)
 
             # skip all lines until past simulator statement
@@ -160,76 +294,26 @@ class GenericReader(object):
         logging.debug("Completed parsing file \t\"" + self._file + "\"")
 
         if self._auto_translate:
-            # remove duplicates and re-order to favor translations involving the top
-            # scope first
-            inc_files_and_scopes = list(set(inc_files_and_scopes))
+            # re-order to favor translations involving the top scope first.  The
+            # files are kept in the order they were found, so the files and their
+            # messages come out in a fixed order
+            inc_files = list(inc_files_and_scopes.values())
             if self._reader_state.scope_index.is_top_parent():
                 top_inc_files_and_scopes = []
                 child_inc_files_and_scopes = []
-                for filename, scope in inc_files_and_scopes:
+                for filename, scope in inc_files:
                     if scope.is_top_parent():
                         top_inc_files_and_scopes.append((filename, scope))
                     else:
                         child_inc_files_and_scopes.append((filename, scope))
 
-                inc_files_and_scopes = []
-                inc_files_and_scopes = top_inc_files_and_scopes + child_inc_files_and_scopes
+                inc_files = top_inc_files_and_scopes + child_inc_files_and_scopes
 
-            for incfile_pair in inc_files_and_scopes:
+            for incfile_pair in inc_files:
                 incfile = incfile_pair[0]
                 incfile_scope = incfile_pair[1]
 
-                if debug_incfiles is True:
-                    print("self._file = '%s'\n" % self._file, file=sys.stderr)
-                    print("os.path.dirname(self._file) = '%s'\n" % (os.path.dirname(self._file)), file=sys.stderr)
-                    print("os.path.dirname(os.path.abspath(self._file)) = '%s'\n" % (os.path.dirname(os.path.abspath(self._file))), file=sys.stderr)
-                    print("incfile = '%s'\n" % incfile, file=sys.stderr)
-
-                # incfile_resolved  = os.path.normpath(os.path.normcase(incfile)).replace('"','')
-                # incfile_case_resolved  = os.path.normcase(incfile)
-                incfile_case_resolved = incfile
-                incfile_quote_resolved = incfile_case_resolved.replace('"', '')
-                incfile_quote_resolved = incfile_quote_resolved.replace("'", '')
-                incfile_path_resolved = os.path.normpath(incfile_quote_resolved)
-                incfile_resolved = incfile_path_resolved
-                if debug_incfiles is True:
-                    print("incfile_case_resolved = '%s'\n" % incfile_case_resolved, file=sys.stderr)
-                    print("incfile_quote_resolved = '%s'\n" % incfile_quote_resolved, file=sys.stderr)
-                    print("incfile_path_resolved = '%s'\n" % incfile_path_resolved, file=sys.stderr)
-
-                dirname_resolved = os.path.normpath(os.path.dirname(os.path.abspath(self._file))).replace('"', '')
-
-                if debug_incfiles:
-                    print("incfile_resolved = '%s'\n" % incfile_resolved, file=sys.stderr)
-                    print("dirname_resolved = '%s'\n" % dirname_resolved, file=sys.stderr)
-
-                if platform == "Windows":
-                    if debug_incfiles:
-                        print("On Windows - pre fixed file string = '%s'\n" % incfile_resolved, file=sys.stderr)
-                    incfile_resolved_slashes = incfile_resolved.replace('//', '\\')
-                    if debug_incfiles:
-                        print("On Windows - post fixed file string = '%s'\n" % incfile_resolved, file=sys.stderr)
-                else:
-                    if debug_incfiles:
-                        print("On Linux or OS X - pre fixed file string = '%s'\n" % incfile_resolved, file=sys.stderr)
-                    incfile_resolved_slashes = incfile_resolved.replace('\\', '/')
-                    if debug_incfiles:
-                        print("On Linux or OS X - post fixed file string = '%s'\n" % incfile_resolved, file=sys.stderr)
-
-                if debug_incfiles:
-                    print("incfile_resolved_slashes = '%s'\n" % incfile_resolved_slashes, file=sys.stderr)
-
-                inc_path, incfile_resolved2 = os.path.split(incfile_resolved_slashes)
-                incfile_resolved3 = os.path.join(inc_path, incfile_resolved2)
-
-                if debug_incfiles is True:
-                    print("incfile2_resolved = '%s'\n" % incfile_resolved2, file=sys.stderr)
-                    print("incfile3_resolved = '%s'\n" % incfile_resolved3, file=sys.stderr)
-
-                filename = os.path.join(dirname_resolved, incfile_resolved3).replace('"', '')
-
-                if debug_incfiles is True:
-                    print("filename = '%s'\n" % filename, file=sys.stderr)
+                filename = self._include_file_name(incfile, debug_incfiles)
 
                 logging.debug("Loading include file \t\t\"" + str(filename) + "\"")
 
@@ -238,37 +322,41 @@ class GenericReader(object):
                 include_file_reader = GenericReader(filename, self._grammar_type, self._language_definition,
                                                     reader_state=self._reader_state, top_reader_state=self._top_reader_state, 
                                                     is_top_level_file=False, tspice_xml=self._tspice_xml, pspice_xml=self._pspice_xml,
-                                                    hspice_xml=self._hspice_xml, spectre_xml=self._spectre_xml, auto_translate=self._auto_translate)
+                                                    hspice_xml=self._hspice_xml, spectre_xml=self._spectre_xml, auto_translate=self._auto_translate,
+                                                    parse_cache=self._parse_cache,
+                                                    lib_sections_only=self._lib_sections_only,
+                                                    parse_ahead=self._parse_ahead,
+                                                    parse_threads=self._parse_threads)
                 include_file_reader.read()
                 self._reader_state.scope_index = curr_scope
 
             # re-arranges list of library filename/sections to be parsed. Originally
             # stored as a list of tuples; i.e. [(filname, sect), ... ]. Transfers
-            # into an OrderedDict, with keys be the filenames and a list of library
-            # sections being the dictionary entry
+            # into an OrderedDict, with keys be the file identities and the first
+            # name of the file with a list of library sections being the dictionary entry
             lib_files_aggregated_sects = OrderedDict()
             for libfile in lib_files:
-                if not libfile[0] in lib_files_aggregated_sects:
-                    lib_files_aggregated_sects[libfile[0]] = []
+                lib_identity = file_identity(self._lib_file_name(libfile[0]))
+                if not lib_identity in lib_files_aggregated_sects:
+                    lib_files_aggregated_sects[lib_identity] = (libfile[0], [])
 
-                lib_files_aggregated_sects[libfile[0]].append(libfile[1])
+                lib_files_aggregated_sects[lib_identity][1].append(libfile[1])
              
             #read each library file/section list
-            for libfile in lib_files_aggregated_sects:
-                lib_file_name = libfile
-                lib_names = deepcopy(lib_files_aggregated_sects[libfile])
+            for lib_identity, (lib_file_name, lib_sects) in lib_files_aggregated_sects.items():
+                lib_names = deepcopy(lib_sects)
                 logging.info("Parsing Lib File: " + lib_file_name + " sections: " + ",".join(lib_names))
 
-                filename = lib_file_name.replace("'", '').replace('"', '')
-
-                if not os.path.isfile(filename):
-                    filename = os.path.join(os.path.dirname(self._file), filename)
+                filename = self._reader_state.known_lib_file(lib_identity, self._lib_file_name(lib_file_name))
 
                 library_file_reader = GenericReader(filename, self._grammar_type, self._language_definition,
                                                     reader_state=self._reader_state, top_reader_state=self._top_reader_state,
                                                     is_top_level_file=False, tspice_xml=self._tspice_xml, pspice_xml=self._pspice_xml,
                                                     hspice_xml=self._hspice_xml, spectre_xml=self._spectre_xml, auto_translate=self._auto_translate, 
-                                                    lib_sect_list=lib_names)
+                                                    lib_sect_list=lib_names, parse_cache=self._parse_cache,
+                                                    lib_sections_only=self._lib_sections_only,
+                                                    parse_ahead=self._parse_ahead,
+                                                    parse_threads=self._parse_threads)
                 library_file_reader.read()
 
             # translate .lib files that are in child scope
@@ -277,14 +365,17 @@ class GenericReader(object):
 
                 # list of .lib files in child scope may be growing ...
                 while count < len(self._reader_state.lib_files_not_in_scope):
-                    filename = self._reader_state.lib_files_not_in_scope[count]
+                    filename = list(self._reader_state.lib_files_not_in_scope.values())[count]
                     logging.info("Parsing Lib File: " + filename)
 
                     library_file_reader = GenericReader(filename, self._grammar_type, self._language_definition,
                                                         reader_state=self._reader_state, top_reader_state=self._top_reader_state,
                                                         is_top_level_file=False, tspice_xml=self._tspice_xml, pspice_xml=self._pspice_xml,
                                                         hspice_xml=self._hspice_xml, spectre_xml=self._spectre_xml, auto_translate=self._auto_translate, 
-                                                        lib_sect_list=[])
+                                                        lib_sect_list=[], parse_cache=self._parse_cache,
+                                                        lib_sections_only=self._lib_sections_only,
+                                                        parse_ahead=self._parse_ahead,
+                                                        parse_threads=self._parse_threads)
                     library_file_reader.read()
                     count += 1
 
@@ -296,7 +387,11 @@ class GenericReader(object):
         # and set the type and pass it back to read_line to build the device
         parent_scope = self._reader_state.scope_index
         if self._is_top_level_file:
-            resolved_pnl_list = []
+            # fingerprints of the top level file pnls written so far. An exact
+            # repeat is found with one set lookup, and only distinct pnls are
+            # checked for being contained in an earlier one
+            resolved_pnl_fingerprints = set()
+            resolved_pnl_fingerprint_list = []
             for unknown_pnl, scope in self._reader_state.unknown_pnls.items():
                 duplicate_pnl_flag = False
                 self._reader_state.scope_index = scope
@@ -318,22 +413,21 @@ class GenericReader(object):
                             pass
 
                         elif st_lang == "hspice":
-                            xml_factory = XmlFactory(self._hspice_xml)
+                            xml_factory = read_xml_factory(self._hspice_xml)
 
                         elif st_lang == "pspice":
-                            xml_factory = XmlFactory(self._pspice_xml)
+                            xml_factory = read_xml_factory(self._pspice_xml)
 
                         elif st_lang == "spectre":
-                            xml_factory = XmlFactory(self._spectre_xml)
+                            xml_factory = read_xml_factory(self._spectre_xml)
 
                         elif st_lang == "tspice":
-                            xml_factory = XmlFactory(self._tspice_xml)
+                            xml_factory = read_xml_factory(self._tspice_xml)
 
                         elif st_lang == "xyce":
-                            xml_factory = XmlFactory(self._xyce_xml)
+                            xml_factory = read_xml_factory(self._xyce_xml)
 
                         if st_lang != self._language_definition.language:
-                            xml_factory.read()
                             language_definition = xml_factory.language_definition
 
                         if (language_definition.is_case_insensitive() and 
@@ -348,40 +442,23 @@ class GenericReader(object):
                     resolved_pnl.filename = self._file
                     resolved_pnl.flag_top_pnl = False
 
-                    # check if the top level file pnl is a duplicate. skip if it is
-                    if resolved_pnl_list:
-                        for prev_resolved_pnl in resolved_pnl_list:
-                            match_found_flag = True
-
-                            for key in resolved_pnl.params_dict:
-                                if not key in prev_resolved_pnl.params_dict:
-                                    match_found_flag = False
-                                    break
-
-                                if resolved_pnl.params_dict[key] != prev_resolved_pnl.params_dict[key]:
-                                    match_found_flag = False
-                                    break
-
-                            if not match_found_flag:
-                                continue
-
-                            for key in resolved_pnl.known_objects:
-                                if not key in prev_resolved_pnl.known_objects:
-                                    match_found_flag = False
-                                    break
-
-                                if resolved_pnl.known_objects[key] != prev_resolved_pnl.known_objects[key]:
-                                    match_found_flag = False 
-                                    break
-
-                            if match_found_flag:
+                    # check if the top level file pnl is a duplicate. skip if it is.
+                    # the fingerprint is taken before read_line, which may modify
+                    # the pnl, so no copy of the pnl needs to be kept
+                    fingerprint = resolved_pnl.fingerprint()
+                    if fingerprint in resolved_pnl_fingerprints:
+                        duplicate_pnl_flag = True
+                    else:
+                        for prev_params, prev_known_objects in resolved_pnl_fingerprint_list:
+                            if fingerprint[0] <= prev_params and fingerprint[1] <= prev_known_objects:
                                 duplicate_pnl_flag = True
                                 break
 
                     if duplicate_pnl_flag:
                         continue
 
-                    resolved_pnl_list.append(deepcopy(resolved_pnl))
+                    resolved_pnl_fingerprints.add(fingerprint)
+                    resolved_pnl_fingerprint_list.append(fingerprint)
 
                 else:
                     resolved_pnl = self._reader_state.resolve_unknown_source(unknown_pnl, self._language_definition)
@@ -455,7 +532,10 @@ class GenericReader(object):
             for each library file.
 
         """
-        grammar_iter = iter(self._grammar)
+        if self._cached_lines is not None:
+            grammar_iter = self._parse_cache.replay(self._cached_lines, self._file)
+        else:
+            grammar_iter = iter(self._grammar)
         read_bool = False
         for parsed_netlist_line in grammar_iter:
             if parsed_netlist_line.type == ".LIB" and parsed_netlist_line.known_objects.get(
@@ -558,31 +638,33 @@ class GenericReader(object):
         elif parsed_netlist_line.type == ".MODEL":
             XDMFactory.build_model(parsed_netlist_line, reader_state, language_definition)
         elif parsed_netlist_line.type == ".INC" or parsed_netlist_line.type == ".INCLUDE":
-            if not parsed_netlist_line.known_objects[Types.fileNameValue] in self._reader_state.master_inc_list:
-                self._reader_state.add_master_inc_list(parsed_netlist_line.known_objects[Types.fileNameValue])
-                self._reader_state.add_master_inc_list_scopes(reader_state.scope_index)
-                inc_files_and_scopes.append((parsed_netlist_line.known_objects[Types.fileNameValue], reader_state.scope_index))
-            elif parsed_netlist_line.known_objects[Types.fileNameValue] in self._reader_state.master_inc_list and reader_state.scope_index.is_top_parent():
-                for ind, file_and_scope in enumerate(inc_files_and_scopes):
-                    (filename, scope) = file_and_scope
-                    if parsed_netlist_line.known_objects[Types.fileNameValue] == filename:
-                        inc_files_and_scopes[ind] = (parsed_netlist_line.known_objects[Types.fileNameValue], reader_state.scope_index)
-
-                inc_ind = self._reader_state.master_inc_list.index(parsed_netlist_line.known_objects[Types.fileNameValue])
-                self._reader_state.master_inc_list_scopes[inc_ind] = reader_state.scope_index
-                # For filenames enclosed in single quotes, ntpath doesn't seem to strip trailing
-                # single quote. Therefore, will strip the single quotes before before passing
-                # to ntpath.
+            # the same file may be included through different names
+            inc_file = parsed_netlist_line.known_objects[Types.fileNameValue]
+            inc_identity = file_identity(self._include_file_name(inc_file))
+            if not inc_identity in self._reader_state.master_inc_files:
+                self._reader_state.add_master_inc_file(inc_identity, inc_file, reader_state.scope_index)
+                inc_files_and_scopes[inc_identity] = (inc_file, reader_state.scope_index)
+            elif reader_state.scope_index.is_top_parent():
+                if inc_identity in inc_files_and_scopes:
+                    inc_files_and_scopes[inc_identity] = (inc_files_and_scopes[inc_identity][0], reader_state.scope_index)
+
+                self._reader_state.add_master_inc_file(inc_identity, inc_file, reader_state.scope_index)
+            # the file is translated under the name it was first included by,
+            # without a compressed suffix.
+            # For filenames enclosed in single quotes, ntpath doesn't seem to strip trailing
+            # single quote. Therefore, will strip the single quotes before before passing
+            # to ntpath.
+            inc_file = self._reader_state.master_inc_file_name(inc_identity)
             parsed_netlist_line.known_objects[Types.fileNameValue] = \
-                ntpath.split(parsed_netlist_line.known_objects[Types.fileNameValue].replace("'", "").replace("\"", ""))[1]
+                output_file_name(ntpath.split(inc_file.replace("'", "").replace("\"", ""))[1])
             XDMFactory.build_directive(parsed_netlist_line, reader_state, language_definition, self._lib_sect_list)
         elif parsed_netlist_line.type == ".LIB":
             # Prepare lib_file name
             if parsed_netlist_line.known_objects.get(Types.fileNameValue):
-                lib_file = parsed_netlist_line.known_objects[Types.fileNameValue].replace("'", '').replace('"', '')
-
-                if not os.path.isfile(lib_file):
-                    lib_file = os.path.join(os.path.dirname(self._file), lib_file)
+                lib_file = self._lib_file_name(parsed_netlist_line.known_objects[Types.fileNameValue])
+                lib_identity = file_identity(lib_file)
+                # the file is translated under the name it was first found by
+                lib_file = self._reader_state.known_lib_file(lib_identity, lib_file)
 
             # Only parse .LIB statements if they are on the parent scope (the scope that 
             # includes the stuff that actually needs to be simulated). Other .LIB sections
@@ -592,7 +674,7 @@ class GenericReader(object):
 
                 # if .lib command calls a section within the same file, add it to list of sections to parse 
                 # for the current file. otherwise, add file/section to list of libraries to be parsed later
-                if os.path.normpath(self._file) == os.path.normpath(lib_file):
+                if self._file_identity == lib_identity:
                     self._lib_sect_list.append(parsed_netlist_line.known_objects[Types.libEntry])
                     child = self._reader_state.scope_index.get_child_scope(parsed_netlist_line.known_objects[Types.libEntry])
                     if not child is None:
@@ -606,11 +688,8 @@ class GenericReader(object):
                     lib_files.append((parsed_netlist_line.known_objects[Types.fileNameValue],
                                       parsed_netlist_line.known_objects[Types.fileNameValue]))
 
-                if not lib_file in self._reader_state.lib_files_in_scope:
-                    self._reader_state.add_lib_files_in_scope(lib_file)
-
-                if lib_file in self._reader_state.lib_files_not_in_scope:
-                    self._reader_state.remove_lib_files_not_in_scope(lib_file)
+                self._reader_state.add_lib_files_in_scope(lib_identity, lib_file)
+                self._reader_state.remove_lib_files_not_in_scope(lib_identity)
 
             elif parsed_netlist_line.known_objects.get(Types.fileNameValue) and not reader_state.scope_index.is_top_parent():
                 # for the case of a .lib file that isn't used by the top scope, and in included 
@@ -620,19 +699,18 @@ class GenericReader(object):
 
                 # in case a library section may be added in to top scope by a .lib statement later in the file. save
                 # other .lib sects included, for retroactive processing
-                if os.path.normpath(self._file) == os.path.normpath(lib_file):
+                if self._file_identity == lib_identity:
                     self._reader_state.scope_index.add_child_scope_lib_sects(parsed_netlist_line.known_objects[Types.libEntry])
 
                 # for libraries added in child scope in different files
-                elif os.path.normpath(self._file) != os.path.normpath(lib_file):
-                    if not lib_file in self._reader_state.lib_files_not_in_scope and not lib_file in self._reader_state.lib_files_in_scope:
+                else:
+                    if not lib_identity in self._reader_state.lib_files_in_scope:
                         # only file name needs to be saved - the whole file is outside the top scope,
                         # so the library section doesn't matter
-                        self._reader_state.add_lib_files_not_in_scope(lib_file)
+                        self._reader_state.add_lib_files_not_in_scope(lib_identity, lib_file)
              
             if parsed_netlist_line.known_objects.get(Types.fileNameValue):
-                parsed_netlist_line.known_objects[Types.fileNameValue] = \
-                    ntpath.split(parsed_netlist_line.known_objects[Types.fileNameValue].replace("'", "").replace("\"", ""))[1]
+                parsed_netlist_line.known_objects[Types.fileNameValue] = output_file_name(ntpath.split(lib_file)[1])
             XDMFactory.build_directive(parsed_netlist_line, reader_state, language_definition, self._lib_sect_list)
         elif parsed_netlist_line.type == "DATA":
             XDMFactory.build_data(parsed_netlist_line, reader_state)
@@ -650,16 +728,14 @@ class GenericReader(object):
             # print (lang_type['lang'])
             if 'spice' in lang_type:
                 logging.info("Spectre Simulator Command Found.  Switching parse mode to spice.")
-                xml_factory = XmlFactory(self._hspice_xml)
-                xml_factory.read()
-                self._language_definition = xml_factory.language_definition
+                from xdm.inout.readers.HSPICENetlistBoostParserInterface import HSPICENetlistBoostParserInterface
+                self._language_definition = read_xml_factory(self._hspice_xml).language_definition
                 self._grammar_type = HSPICENetlistBoostParserInterface
                 self._language_changed = True
             elif 'spectre' in lang_type:
                 logging.info("Spectre Simulator Command Found.  Switching parse mode to spectre.")
-                xml_factory = XmlFactory(self._spectre_xml)
-                xml_factory.read()
-                self._language_definition = xml_factory.language_definition
+                from xdm.inout.readers.SpectreNetlistBoostParserInterface import SpectreNetlistBoostParserInterface
+                self._language_definition = read_xml_factory(self._spectre_xml).language_definition
                 self._grammar_type = SpectreNetlistBoostParserInterface
                 self._language_changed = True
         else:
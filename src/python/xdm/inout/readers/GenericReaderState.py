@@ -22,6 +22,7 @@
 
 
 import logging
+from collections import OrderedDict
 from xdm.index import NAME_SCOPE_INDEX
 from xdm.statements.nodes.models import MASTER_MODEL
 from xdm.statements.nodes.devices import Device
@@ -43,14 +44,21 @@ class GenericReaderState(object):
         self._store_device_prefix = store_device_prefix
         self._end_directive = None
         self._pwl_files = []
+        self._pwl_file_set = set()
 
-        # used to track .lib files in the top scope and those not in the top scope. 
+        # used to track .lib files in the top scope and those not in the top scope,
+        # by file identity (see FileIdentity.file_identity) with the file name.
         # those not in the top scope will eventually need to be translated as well.
-        self._lib_files_in_scope = []
-        self._lib_files_not_in_scope = []
-        # used to track .inc files that have already been flagged for translation
-        self._master_inc_list = []
-        self._master_inc_list_scopes = []
+        self._lib_files_in_scope = {}
+        self._lib_files_not_in_scope = OrderedDict()
+        # (file name, LibrarySectionIndex.Section) of the library sections
+        # that were not parsed, as nothing selects them
+        self._skipped_lib_sections = []
+        # used to track .inc files that have already been flagged for translation,
+        # by file identity with the scope each is included in, and the name each
+        # was first included by
+        self._master_inc_files = OrderedDict()
+        self._master_inc_file_names = {}
 
     def add_unknown_pnl(self, pnl):
         self._unknown_pnls[pnl] = self._sc
@@ -252,7 +260,7 @@ class GenericReaderState(object):
         # if model definition not found in current scope, check scopes of include files
         if not modelDef:
 
-            for scope in self._master_inc_list_scopes:
+            for scope in self._master_inc_files.values():
 
                 if scope.modelDefs:
 
@@ -381,39 +389,67 @@ class GenericReaderState(object):
         self._end_directive = end_directive
 
     def add_pwl_file(self, pwl_file):
-        self._pwl_files.append(pwl_file)
+        if pwl_file not in self._pwl_file_set:
+            self._pwl_file_set.add(pwl_file)
+            self._pwl_files.append(pwl_file)
 
     @property
     def pwl_files(self):
         return self._pwl_files
 
-    def add_lib_files_in_scope(self, lib_file):
-        self._lib_files_in_scope.append(lib_file)
+    def add_lib_files_in_scope(self, lib_identity, lib_file):
+        self._lib_files_in_scope.setdefault(lib_identity, lib_file)
 
     @property
     def lib_files_in_scope(self):
+        """
+        File identity -> name of the library files used by the top scope
+        """
         return self._lib_files_in_scope
 
-    def add_lib_files_not_in_scope(self, lib_file):
-        self._lib_files_not_in_scope.append(lib_file)
+    def add_lib_files_not_in_scope(self, lib_identity, lib_file):
+        self._lib_files_not_in_scope.setdefault(lib_identity, lib_file)
+
+    def remove_lib_files_not_in_scope(self, lib_identity):
+        self._lib_files_not_in_scope.pop(lib_identity, None)
 
-    def remove_lib_files_not_in_scope(self, lib_file):
-        self._lib_files_not_in_scope.remove(lib_file)
+    def known_lib_file(self, lib_identity, lib_file):
+        """
+        Returns the name a library file was first found by, lib_file for a
+        library file not found before
+        """
+        return self._lib_files_in_scope.get(lib_identity) or self._lib_files_not_in_scope.get(lib_identity, lib_file)
 
     @property
     def lib_files_not_in_scope(self):
+        """
+        File identity -> name of the library files only used outside the top
+        scope, in the order they were found
+        """
         return self._lib_files_not_in_scope
 
-    def add_master_inc_list(self, inc_file):
-        self._master_inc_list.append(inc_file)
+    def add_skipped_lib_sections(self, lib_file, sections):
+        self._skipped_lib_sections.extend((lib_file, section) for section in sections)
 
     @property
-    def master_inc_list(self):
-        return self._master_inc_list
+    def skipped_lib_sections(self):
+        return self._skipped_lib_sections
+
+    def add_master_inc_file(self, inc_identity, inc_file, scope):
+        """
+        Flags an .inc file for translation, or moves it to the scope it is
+        included in again
+        """
+        self._master_inc_files[inc_identity] = scope
+        self._master_inc_file_names.setdefault(inc_identity, inc_file)
 
-    def add_master_inc_list_scopes(self, scope):
-        self._master_inc_list_scopes.append(scope)
+    def master_inc_file_name(self, inc_identity):
+        return self._master_inc_file_names[inc_identity]
 
     @property
-    def master_inc_list_scopes(self):
-        return self._master_inc_list_scopes
+    def master_inc_files(self):
+        """
+        File identity -> scope of the .inc files flagged for translation, in
+        the order they were found
+        """
+        return self._master_inc_files
@@ -30,7 +30,7 @@ import SpiritExprCommon
 
 
 from xdm import Types
-from xdm.expr import expr_utils
+from xdm.expr.Expression import Expression
 from xdm.inout.readers import BoostParserInterface
 from xdm.inout.readers.ParsedNetlistLine import ParsedNetlistLine
 from xdm.inout.readers.XDMFactory import supported_devices
@@ -116,6 +116,29 @@ class HSPICENetlistBoostParserInterface:
     def __del__(self):
         self.internal_parser.close()
 
+    def set_ranges(self, ranges):
+        """
+        Parses only the (start byte, end byte, first line number) parts of
+        the file, see LibrarySectionIndex.section_ranges
+        """
+        self.internal_parser.set_ranges(ranges)
+
+    def parse_ahead(self, queue_size):
+        """
+        Reads and parses up to queue_size lines of the file ahead on a native
+        thread, while the lines already read are converted
+        """
+        self.internal_parser.parse_ahead(queue_size)
+        self.line_iter = BoostParserInterface.parsed_lines(self.internal_parser)
+
+    def parse_parallel(self, threads, chunk_bytes=BoostParserInterface.PARSE_CHUNK_BYTES):
+        """
+        Parses the file in chunks of about chunk_bytes, split at statement
+        boundaries, on threads native threads
+        """
+        self.internal_parser.parse_parallel(threads, chunk_bytes)
+        self.line_iter = BoostParserInterface.parsed_lines(self.internal_parser)
+
     def __iter__(self):
         return self
 
@@ -135,7 +158,7 @@ class HSPICENetlistBoostParserInterface:
         parsed_object_iter = iter(boost_parsed_line.parsed_objects)
 
         for parsedObject in parsed_object_iter:
-            self.convert_next_token(parsedObject, parsed_object_iter, pnl, self._synthesized_pnls, self._pkg_dict)
+            self.convert_next_token(parsedObject, parsed_object_iter, pnl, self._synthesized_pnls)
 
         # Hack for if statements - comment out line
         if self._if_statement:
@@ -171,162 +194,162 @@ class HSPICENetlistBoostParserInterface:
 
         return pnl
 
-    def convert_next_token(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls, pkg_dict):
+    def convert_next_token(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
         """
         Takes individual parsed objects from the parsed line object
 
         Populate ParsedNetlistLine class with all information necessary to create a Statement
 
-        Many hacks contained here
+        The token is converted by the handler for its type in token_handlers.
+        Many hacks contained in the handlers
         """
+        token_handler = self.token_handlers.get(parsed_object.types[0], XyceNetlistBoostParserInterface.convert_other_token)
+        token_handler(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
+    def convert_option(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        pnl.type = ".OPTIONS"
+        pnl.local_type = ".OPTIONS"
 
-        if (parsed_object.types[0] == SpiritCommon.data_model_type.PARAM_NAME or parsed_object.types[0] == SpiritCommon.data_model_type.DEFAULT_PARAM_NAME) and (pnl.type == ".OPTION" or pnl.local_type == ".OPTIONS"):
-            pnl.type = ".OPTIONS"
-            pnl.local_type = ".OPTIONS"
+        # GITLAB ISSUE #252: all options now will only appear once, at top netlist
+        if not self._top_level_file:
+            pnl.flag_top_pnl = True
 
-            # GITLAB ISSUE #252: all options now will only appear once, at top netlist
-            if not self._top_level_file:
-                pnl.flag_top_pnl = True
+        # find the adm option name
+        orig_param_name = parsed_object.key
+        param_name = orig_param_name
 
-            # find the adm option name
-            orig_param_name = parsed_object.value.upper()
-            param_name = orig_param_name
+        # find all adm packages that use this parameter
+        pkgs = self._pkg_dict.get(param_name)
 
-            # find all adm packages that use this parameter
-            pkgs = pkg_dict.get(param_name.upper())
+        # TODO: Hack Bugzilla 2020, ITL1 => NONLIN MAXSTEP (default 200)
+        # TODO: Hack Bugzilla 2020, ITL4 => NONLIN-TRAN MAXSTEP (default 20)
 
-            # TODO: Hack Bugzilla 2020, ITL1 => NONLIN MAXSTEP (default 200)
-            # TODO: Hack Bugzilla 2020, ITL4 => NONLIN-TRAN MAXSTEP (default 20)
+        # TODO: Hack Bugzilla 2020, VNTOL => ABSTOL
 
-            # TODO: Hack Bugzilla 2020, VNTOL => ABSTOL
+        param_name, pkgs = self.hack_packages_bugzilla_2020(param_name, pkgs)
 
-            param_name, pkgs = self.hack_packages_bugzilla_2020(param_name.upper(), pkgs)
+        if pkgs and param_name in ["TNOM", "SCALE"]:
+            if param_name == "TNOM":
+                self._tnom_defined = True
 
-            if pkgs and param_name.upper() in ["TNOM", "SCALE"]:
-                if param_name.upper() == "TNOM":
-                    self._tnom_defined = True
-
-                pnl.name = ""
-                if parsed_object.types[0] == SpiritCommon.data_model_type.PARAM_NAME:
-                    param_value_parsed_object = next(parsed_object_iter)
-                    param_value = param_value_parsed_object.value
-                else:
-                    param_value = self.get_default(orig_param_name)
+            pnl.name = ""
+            if parsed_object.types[0] == SpiritCommon.data_model_type.PARAM_NAME:
+                param_value_parsed_object = next(parsed_object_iter)
+                param_value = param_value_parsed_object.value
+            else:
+                param_value = self.get_default(orig_param_name)
 
-                pnl.add_known_object(pkgs[0], Types.optionPkgTypeValue)
+            pnl.add_known_object(pkgs[0], Types.optionPkgTypeValue)
 
-                # converting .OPTIONS METHOD=DEFAULT to .OPTIONS TIMEINT METHOD=TRAP
-                if param_name.upper() == "METHOD" and param_value.upper() == "DEFAULT":
-                    param_value = "TRAP"
+            # converting .OPTIONS METHOD=DEFAULT to .OPTIONS TIMEINT METHOD=TRAP
+            if param_name == "METHOD" and param_value.upper() == "DEFAULT":
+                param_value = "TRAP"
 
-                pnl.add_param_value_pair(param_name.upper(), param_value)
-                if "COMMENT" in pnl.params_dict:
-                    pnl.add_inline_comment(pnl.params_dict["COMMENT"])
-                    pnl.params_dict.pop("COMMENT")
+            pnl.add_param_value_pair(param_name, param_value)
+            if "COMMENT" in pnl.params_dict:
+                pnl.add_inline_comment(pnl.params_dict["COMMENT"])
+                pnl.params_dict.pop("COMMENT")
 
-                for otherPkg in pkgs[1:]:
-                    pnl_synth = ParsedNetlistLine(pnl.filename, pnl.linenum)  # what to do with line numbers?
-                    pnl_synth.type = ".OPTIONS"
-                    pnl_synth.add_known_object(otherPkg, Types.optionPkgTypeValue)
-                    pnl_synth.add_param_value_pair(param_name.upper(), param_value)
-                    synthesized_pnls.append(pnl_synth)
+            for otherPkg in pkgs[1:]:
+                pnl_synth = ParsedNetlistLine(pnl.filename, pnl.linenum)  # what to do with line numbers?
+                pnl_synth.type = ".OPTIONS"
+                pnl_synth.add_known_object(otherPkg, Types.optionPkgTypeValue)
+                pnl_synth.add_param_value_pair(param_name, param_value)
+                synthesized_pnls.append(pnl_synth)
 
+        else:
+            logging.warning("In file:\"" + str(os.path.basename(pnl.filename)) + "\" at line:" + str(pnl.linenum) + ". Could not accept .OPTIONS \"" + orig_param_name + "\". Retained (as a comment). Continuing.")
+            param_value_parsed_object = next(parsed_object_iter)
+            if pnl.known_objects:
+                pnl.type = ".OPTIONS"
+                pnl.name = ""
+                if pnl.comment:
+                    pnl.add_inline_comment(pnl.comment + " " + ".OPTIONS " + orig_param_name + " " + param_value_parsed_object.value)
+                else:
+                    pnl.add_inline_comment(".OPTIONS " + orig_param_name + " " + param_value_parsed_object.value)
             else:
-                logging.warning("In file:\"" + str(os.path.basename(pnl.filename)) + "\" at line:" + str(pnl.linenum) + ". Could not accept .OPTIONS \"" + orig_param_name.upper() + "\". Retained (as a comment). Continuing.")
-                param_value_parsed_object = next(parsed_object_iter)
-                if pnl.known_objects:
-                    pnl.type = ".OPTIONS"
-                    pnl.name = ""
-                    if pnl.comment:
-                        pnl.add_inline_comment(pnl.comment + " " + ".OPTIONS " + orig_param_name + " " + param_value_parsed_object.value)
-                    else:
-                        pnl.add_inline_comment(".OPTIONS " + orig_param_name + " " + param_value_parsed_object.value)
+                pnl.type = "COMMENT"
+                pnl.name = ".OPTIONS " + orig_param_name
+                if "COMMENT" in pnl.params_dict:
+                    pnl.add_comment(pnl.params_dict["COMMENT"] + " " + ".OPTIONS " + orig_param_name + " " + param_value_parsed_object.value)
                 else:
-                    pnl.type = "COMMENT"
-                    pnl.name = ".OPTIONS " + orig_param_name
-                    if "COMMENT" in pnl.params_dict:
-                        pnl.add_comment(pnl.params_dict["COMMENT"] + " " + ".OPTIONS " + orig_param_name + " " + param_value_parsed_object.value)
-                    else:
-                        pnl.add_comment(".OPTIONS " + orig_param_name + " " + param_value_parsed_object.value)
-
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.DIRECTIVE_NAME and parsed_object.value.upper() == ".IF":
-
-            pnl.type = "COMMENT"
-            pnl.add_comment(parsed_object.value)
-
-            self._if_statement = True
-            self._nested_if_statement_count += 1
+                    pnl.add_comment(".OPTIONS " + orig_param_name + " " + param_value_parsed_object.value)
 
+    def convert_default_param_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if pnl.type == ".OPTION" or pnl.local_type == ".OPTIONS":
+            self.convert_option(parsed_object, parsed_object_iter, pnl, synthesized_pnls)
+        else:
+            XyceNetlistBoostParserInterface.convert_other_token(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.DIRECTIVE_NAME and parsed_object.value.upper() == ".ELSEIF":
-
-            pnl.type = "COMMENT"
-            pnl.add_comment(parsed_object.value)
-
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.DIRECTIVE_NAME and parsed_object.value.upper() == ".ELSE":
-
-            pnl.type = "COMMENT"
-            pnl.add_comment(parsed_object.value)
-
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.DIRECTIVE_NAME and parsed_object.value.upper() == ".ENDIF":
-
-            pnl.type = "COMMENT"
-            pnl.add_comment(parsed_object.value)
-
-            self._nested_if_statement_count -= 1
-            if self._nested_if_statement_count == 0:
-                self._if_statement = False
-                self._comment_end_of_if_statement = True
-
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.DIRECTIVE_NAME and parsed_object.value.upper() == ".MACRO":
-            pnl.type = ".SUBCKT"
-
+    def convert_directive_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        directive_handler = self.directive_handlers.get(parsed_object.key)
+        if directive_handler is None:
+            XyceNetlistBoostParserInterface.convert_directive_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
+        else:
+            directive_handler(self, parsed_object, pnl)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.DIRECTIVE_NAME and parsed_object.value.upper() == ".EOM":
-            pnl.type = ".ENDS"
+    # Directive handlers, which take the reader, the parsed object and the
+    # ParsedNetlistLine
 
+    def convert_if(self, parsed_object, pnl):
+        pnl.type = "COMMENT"
+        pnl.add_comment(parsed_object.value)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.DIRECTIVE_NAME and parsed_object.value.upper() == ".MEAS":
-            pnl.type = ".MEASURE"
+        self._if_statement = True
+        self._nested_if_statement_count += 1
 
+    def convert_else(self, parsed_object, pnl):
+        pnl.type = "COMMENT"
+        pnl.add_comment(parsed_object.value)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.DIRECTIVE_NAME and (parsed_object.value.upper() == ".TEMP" or parsed_object.value.upper() == ".TEMPERATURE"):
-            pnl.type = parsed_object.value.upper()
-            pnl.local_type = parsed_object.value.upper()
-            self._temp_defined = True
+    def convert_endif(self, parsed_object, pnl):
+        pnl.type = "COMMENT"
+        pnl.add_comment(parsed_object.value)
 
+        self._nested_if_statement_count -= 1
+        if self._nested_if_statement_count == 0:
+            self._if_statement = False
+            self._comment_end_of_if_statement = True
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.DIRECTIVE_NAME and parsed_object.value.upper() == ".PROBE" or parsed_object.value.upper() == ".PROBE64":
-            pnl.type = ".PRINT"
-            pnl.add_known_object("TRAN", Types.analysisTypeValue)  # default tran type
+    def convert_macro(self, parsed_object, pnl):
+        pnl.type = ".SUBCKT"
 
+    def convert_eom(self, parsed_object, pnl):
+        pnl.type = ".ENDS"
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.OUTPUT_VARIABLE:
+    def convert_meas(self, parsed_object, pnl):
+        pnl.type = ".MEASURE"
 
-            #remove [] from HSPICE print variables -- eventually this will be replaced in the writer
-            output_variable_clean = self.clean_hspice_output_variable(parsed_object.value)
+    def convert_temp(self, parsed_object, pnl):
+        pnl.type = parsed_object.key
+        pnl.local_type = parsed_object.key
+        self._temp_defined = True
 
-            pnl.add_output_variable_value(output_variable_clean)
+    def convert_probe(self, parsed_object, pnl):
+        pnl.type = ".PRINT"
+        pnl.add_known_object("TRAN", Types.analysisTypeValue)  # default tran type
 
+    def convert_output_variable(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        #remove [] from HSPICE print variables -- eventually this will be replaced in the writer
+        output_variable_clean = self.clean_hspice_output_variable(parsed_object.value)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.MODEL_TYPE and pnl.type == ".MODEL":
+        pnl.add_output_variable_value(output_variable_clean)
 
+    def convert_model_type(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if pnl.type == ".MODEL":
             # convert hspice type into the general type supported by the ADM
-            adm_type = hspice_to_adm_model_type_map.get(parsed_object.value.upper())
+            adm_type = hspice_to_adm_model_type_map.get(parsed_object.key)
 
             # if not mapped, then use current value
             if not adm_type:
-                adm_type = parsed_object.value.upper()
+                adm_type = parsed_object.key
 
             pnl.add_known_object(adm_type, Types.modelType)
+        else:
+            XyceNetlistBoostParserInterface.convert_other_token(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.GENERALNODE and not pnl.type in [".IC", ".DCVOLT", ".NODESET"]:
+    def convert_general_node(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if not pnl.type in [".IC", ".DCVOLT", ".NODESET"]:
 
             if BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]] in pnl.known_objects and pnl.type == ".GLOBAL":
                 pnl_synth = ParsedNetlistLine(pnl.filename, pnl.linenum)
@@ -337,14 +360,13 @@ class HSPICENetlistBoostParserInterface:
             else:
                 pnl.add_known_object(parsed_object.value, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
 
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.GENERALNODE and pnl.type in [".IC", ".DCVOLT", ".NODESET"]:
+        else:
             if not pnl.initial_conditions_list:
                 initial_condition_dict = {}
                 initial_condition_dict[Types.voltageOrCurrent] = "V"
                 initial_condition_dict[Types.generalNodeName] = parsed_object.value
                 pnl.initial_conditions_list.append(initial_condition_dict)
-                
+
             elif Types.generalNodeName in pnl.initial_conditions_list[-1]:
                 initial_condition_dict = {}
                 initial_condition_dict[Types.voltageOrCurrent] = "V"
@@ -354,208 +376,224 @@ class HSPICENetlistBoostParserInterface:
             else:
                 pnl.initial_conditions_list[-1][Types.generalNodeName] = parsed_object.value
 
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.FUNC_NAME_VALUE:
-            # For lines with mixed parameter and function statements in HSPICE, separate them out
-            # into different ParsedNetlistLine objects and store it in synthesized pnl 
-            if pnl.params_dict or "FUNC_EXPRESSION" in pnl.known_objects:
-                pnl_synth = ParsedNetlistLine(pnl.filename, pnl.linenum)  # what to do with line numbers?
-                pnl_synth.type = ".FUNC"
-                pnl_synth.local_type = ".FUNC"
-                pnl_synth.add_known_object(parsed_object.value, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
+    def convert_func_name_value(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        # For lines with mixed parameter and function statements in HSPICE, separate them out
+        # into different ParsedNetlistLine objects and store it in synthesized pnl
+        if pnl.params_dict or "FUNC_EXPRESSION" in pnl.known_objects:
+            pnl_synth = ParsedNetlistLine(pnl.filename, pnl.linenum)  # what to do with line numbers?
+            pnl_synth.type = ".FUNC"
+            pnl_synth.local_type = ".FUNC"
+            pnl_synth.add_known_object(parsed_object.value, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
+            func_arg_parsed_object = next(parsed_object_iter)
+            while func_arg_parsed_object.types[0] == SpiritCommon.data_model_type.FUNC_ARG_VALUE:
+                pnl_synth.add_func_arg_value(func_arg_parsed_object.value)
                 func_arg_parsed_object = next(parsed_object_iter)
-                while func_arg_parsed_object.types[0] == SpiritCommon.data_model_type.FUNC_ARG_VALUE:
-                    pnl_synth.add_func_arg_value(func_arg_parsed_object.value)
-                    func_arg_parsed_object = next(parsed_object_iter)
-                func_expression_parsed_object = func_arg_parsed_object
+            func_expression_parsed_object = func_arg_parsed_object
 
-                processed_value = self.hack_ternary_operator(func_expression_parsed_object.value)
-                processed_value = self.hack_exponentiation_symbol(processed_value)
+            processed_value = self.convert_operators(func_expression_parsed_object.value, pnl)
 
-                pnl_synth.add_known_object(processed_value, BoostParserInterface.boost_xdm_map_dict[func_expression_parsed_object.types[0]])
-                synthesized_pnls.append(pnl_synth)
-            else:
-                pnl.type = ".FUNC"
-                pnl.local_type = ".FUNC"
-                pnl.add_known_object(parsed_object.value, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
+            pnl_synth.add_known_object(processed_value, BoostParserInterface.boost_xdm_map_dict[func_expression_parsed_object.types[0]])
+            synthesized_pnls.append(pnl_synth)
+        else:
+            pnl.type = ".FUNC"
+            pnl.local_type = ".FUNC"
+            pnl.add_known_object(parsed_object.value, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
+            func_arg_parsed_object = next(parsed_object_iter)
+            while func_arg_parsed_object.types[0] == SpiritCommon.data_model_type.FUNC_ARG_VALUE:
+                pnl.add_func_arg_value(func_arg_parsed_object.value)
                 func_arg_parsed_object = next(parsed_object_iter)
-                while func_arg_parsed_object.types[0] == SpiritCommon.data_model_type.FUNC_ARG_VALUE:
-                    pnl.add_func_arg_value(func_arg_parsed_object.value)
-                    func_arg_parsed_object = next(parsed_object_iter)
-                func_expression_parsed_object = func_arg_parsed_object
-
-                processed_value = self.hack_ternary_operator(func_expression_parsed_object.value)
-                processed_value = self.hack_exponentiation_symbol(processed_value)
+            func_expression_parsed_object = func_arg_parsed_object
 
-                pnl.add_known_object(processed_value, BoostParserInterface.boost_xdm_map_dict[func_expression_parsed_object.types[0]])
+            processed_value = self.convert_operators(func_expression_parsed_object.value, pnl)
 
+            pnl.add_known_object(processed_value, BoostParserInterface.boost_xdm_map_dict[func_expression_parsed_object.types[0]])
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.PARAM_NAME:
-
-            param_value_parsed_object = next(parsed_object_iter)
+    def convert_param_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if pnl.type == ".OPTION" or pnl.local_type == ".OPTIONS":
+            self.convert_option(parsed_object, parsed_object_iter, pnl, synthesized_pnls)
+            return
 
-            if param_value_parsed_object.types[0] != SpiritCommon.data_model_type.PARAM_VALUE:
-                logging.error(
-                    "Line(s):" + str(pnl.linenum) + ". Parser passed wrong token.  Expected PARAM_VALUE.  Got " + str(
-                        param_value_parsed_object.types[0]))
-                raise Exception("Next Token is not a PARAM_VALUE.  Something went wrong!")
+        param_value_parsed_object = next(parsed_object_iter)
 
-            if pnl.type == ".FUNC":
-                # Same as above, for lines with mixed parameter and function statements in HSPICE, separate them out
-                # into different ParsedNetlistLine objects and store it in synthesized pnl 
-                if synthesized_pnls:
-                    processed_value = self.hack_ternary_operator(param_value_parsed_object.value)
-                    processed_value = self.hack_exponentiation_symbol(processed_value)
+        if param_value_parsed_object.types[0] != SpiritCommon.data_model_type.PARAM_VALUE:
+            logging.error(
+                "Line(s):" + str(pnl.linenum) + ". Parser passed wrong token.  Expected PARAM_VALUE.  Got " + str(
+                    param_value_parsed_object.types[0]))
+            raise Exception("Next Token is not a PARAM_VALUE.  Something went wrong!")
 
-                    synthesized_pnls[-1].add_param_value_pair(parsed_object.value.upper(), processed_value)
-                else:
-                    pnl_synth = ParsedNetlistLine(pnl.filename, pnl.linenum)  # what to do with line numbers?
-                    pnl_synth.type = ".PARAM"
-                    pnl_synth.local_type = ".PARAM"
-
-                    processed_value = self.hack_ternary_operator(param_value_parsed_object.value)
-                    processed_value = self.hack_exponentiation_symbol(processed_value)
+        if pnl.type == ".FUNC":
+            # Same as above, for lines with mixed parameter and function statements in HSPICE, separate them out
+            # into different ParsedNetlistLine objects and store it in synthesized pnl
+            if synthesized_pnls:
+                processed_value = self.convert_operators(param_value_parsed_object.value, pnl)
 
-                    pnl_synth.add_param_value_pair(parsed_object.value.upper(), processed_value)
-                    synthesized_pnls.append(pnl_synth)
+                synthesized_pnls[-1].add_param_value_pair(parsed_object.key, processed_value)
             else:
-                processed_value = self.hack_ternary_operator(param_value_parsed_object.value)
-                if pnl.type in [".PARAM", ".SUBCKT", ".MODEL", ".MACRO", ".GLOBAL_PARAM"] or pnl.type in supported_devices:
-                    processed_value = self.curly_braces_for_expressions(processed_value)
-                processed_value = self.hack_exponentiation_symbol(processed_value)
-
-                pnl.add_param_value_pair(parsed_object.value.upper(), processed_value)
-
+                pnl_synth = ParsedNetlistLine(pnl.filename, pnl.linenum)  # what to do with line numbers?
+                pnl_synth.type = ".PARAM"
+                pnl_synth.local_type = ".PARAM"
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.PARAM_VALUE and pnl.params_dict:
-            # Same as above, for lines with mixed parameter and function statements in HSPICE, separate them out
-            # into different ParsedNetlistLine objects and store it in synthesized pnl 
-            if pnl.type == ".FUNC":
-                last_key = synthesized_pnls[-1].params_dict.keys()[-1]
-                prev_param_value = synthesized_pnls[-1].params_dict[last_key]
+                processed_value = self.convert_operators(param_value_parsed_object.value, pnl)
 
-                processed_value = self.hack_ternary_operator(parsed_object.value)
-                processed_value = self.hack_exponentiation_symbol(processed_value)
+                pnl_synth.add_param_value_pair(parsed_object.key, processed_value)
+                synthesized_pnls.append(pnl_synth)
+        else:
+            processed_value = self.convert_operators(param_value_parsed_object.value, pnl)
+            if pnl.type in [".PARAM", ".SUBCKT", ".MODEL", ".MACRO", ".GLOBAL_PARAM"] or pnl.type in supported_devices:
+                processed_value = self.curly_braces_for_expressions(processed_value)
 
-                synthesized_pnls[-1].params_dict[last_key] = prev_param_value+" "+processed_value
+            pnl.add_param_value_pair(parsed_object.key, processed_value)
 
-            else:
-                last_key = pnl.params_dict.keys()[-1]
-                prev_param_value = pnl.params_dict[last_key]
+    def convert_param_value(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if not pnl.params_dict:
+            XyceNetlistBoostParserInterface.convert_other_token(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
-                processed_value = self.hack_ternary_operator(parsed_object.value)
+        # Same as above, for lines with mixed parameter and function statements in HSPICE, separate them out
+        # into different ParsedNetlistLine objects and store it in synthesized pnl
+        elif pnl.type == ".FUNC":
+            last_key = list(synthesized_pnls[-1].params_dict.keys())[-1]
+            prev_param_value = synthesized_pnls[-1].params_dict[last_key]
 
+            processed_value = self.convert_operators(parsed_object.value, pnl)
 
-                if pnl.type in [".PARAM", ".SUBCKT", ".MODEL", ".MACRO", ".GLOBAL_PARAM"] or pnl.type in supported_devices:
-                    processed_value = self.curly_braces_for_expressions(processed_value)
+            synthesized_pnls[-1].params_dict[last_key] = prev_param_value+" "+processed_value
 
+        else:
+            last_key = list(pnl.params_dict.keys())[-1]
+            prev_param_value = pnl.params_dict[last_key]
 
-                processed_value = self.hack_exponentiation_symbol(processed_value)
-
-                pnl.params_dict[last_key] = prev_param_value+" "+processed_value
+            processed_value = self.convert_operators(parsed_object.value, pnl)
 
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.COMMENT:
+            if pnl.type in [".PARAM", ".SUBCKT", ".MODEL", ".MACRO", ".GLOBAL_PARAM"] or pnl.type in supported_devices:
+                processed_value = self.curly_braces_for_expressions(processed_value)
 
-            pnl.type = "COMMENT"
+            pnl.params_dict[last_key] = prev_param_value+" "+processed_value
 
+    def convert_comment(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        pnl.type = "COMMENT"
 
-            if parsed_object.value.startswith("//"):
-                pnl.name = parsed_object.value[2:]
-                pnl.add_comment(parsed_object.value[2:])
 
-            else:
-                pnl.name = parsed_object.value[1:]
-                pnl.add_comment(parsed_object.value[1:])
+        if parsed_object.value.startswith("//"):
+            pnl.name = parsed_object.value[2:]
+            pnl.add_comment(parsed_object.value[2:])
 
+        else:
+            pnl.name = parsed_object.value[1:]
+            pnl.add_comment(parsed_object.value[1:])
 
-        elif parsed_object.types == [SpiritCommon.data_model_type.MODEL_NAME, SpiritCommon.data_model_type.VALUE]:
+    def convert_model_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if parsed_object.types == [SpiritCommon.data_model_type.MODEL_NAME, SpiritCommon.data_model_type.VALUE]:
             lst = []
             for typ in parsed_object.types:
                 lst.append(BoostParserInterface.boost_xdm_map_dict[typ])
 
-            processed_value = self.hack_ternary_operator(parsed_object.value)
-            processed_value = self.hack_exponentiation_symbol(processed_value)
+            processed_value = self.convert_operators(parsed_object.value, pnl)
 
             pnl.add_lazy_statement(processed_value, lst)
-         
-
-        elif parsed_object.types[0] in [SpiritCommon.data_model_type.DC_VALUE_VALUE, SpiritCommon.data_model_type.AC_MAG_VALUE, SpiritCommon.data_model_type.AC_PHASE_VALUE]:
-            processed_value = self.curly_braces_for_expressions(parsed_object.value)
-            
-            pnl.add_known_object(processed_value, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
-
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.DATA_TABLE_NAME:
-
-
-            if pnl.type == ".DATA":
-                pnl.add_known_object(parsed_object.value, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
-
-            elif pnl.type == ".TRAN":
-                pnl_synth = ParsedNetlistLine(pnl.filename, pnl.linenum)
-                pnl_synth.type = ".STEP"
-                pnl_synth.local_type = ".STEP"
-
-                pnl_synth.add_sweep_param_value("DATA")
-                pnl_synth.add_sweep_param_value(parsed_object.value)
-                synthesized_pnls.append(pnl_synth)
-
-            elif pnl.type == ".DC" or pnl.type == ".AC":
-                pnl.add_sweep_param_value("DATA")
-                pnl.add_sweep_param_value(parsed_object.value)
+        else:
+            XyceNetlistBoostParserInterface.convert_model_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
+    def convert_expression_value(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        processed_value = self.curly_braces_for_expressions(parsed_object.value)
+        pnl.add_known_object(processed_value, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.TRANS_REF_NAME:
-            processed_value = self.curly_braces_for_expressions(parsed_object.value)
-            pnl.add_transient_value(processed_value)
+    def convert_data_table_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if pnl.type == ".DATA":
+            pnl.add_known_object(parsed_object.value, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
 
+        elif pnl.type == ".TRAN":
+            pnl_synth = ParsedNetlistLine(pnl.filename, pnl.linenum)
+            pnl_synth.type = ".STEP"
+            pnl_synth.local_type = ".STEP"
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.CONDITIONAL_STATEMENT:
+            pnl_synth.add_sweep_param_value("DATA")
+            pnl_synth.add_sweep_param_value(parsed_object.value)
+            synthesized_pnls.append(pnl_synth)
 
-            comment = pnl.params_dict[Types.comment] + parsed_object.value
-            pnl.add_comment(comment)
+        elif pnl.type == ".DC" or pnl.type == ".AC":
+            pnl.add_sweep_param_value("DATA")
+            pnl.add_sweep_param_value(parsed_object.value)
 
+    def convert_trans_ref_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        processed_value = self.curly_braces_for_expressions(parsed_object.value)
+        pnl.add_transient_value(processed_value)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.SWEEP_TYPE and pnl.type == ".DC":
+    def convert_conditional_statement(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        comment = pnl.params_dict[Types.comment] + parsed_object.value
+        pnl.add_comment(comment)
 
+    def convert_sweep_type(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if pnl.type == ".DC":
             pnl.sweep_param_list.insert(-1, parsed_object.value)
             self._data_driven = True
+        else:
+            XyceNetlistBoostParserInterface.convert_other_token(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
+    def convert_sweep_param_value(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if not self._data_driven:
+            pnl.add_sweep_param_value(parsed_object.value)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.SWEEP_PARAM_VALUE and self._data_driven:
-
-            if self._np < 0:
-                self._np = int(parsed_object.value)
-
-            else:
-                pnl.add_sweep_param_value(parsed_object.value)
-
-                if len(pnl.sweep_param_list) > 3:
-
-                    if pnl.sweep_param_list[-4].upper() == "LIN":
-                        incr = (float(pnl.sweep_param_list[-2]) + float(pnl.sweep_param_list[-1])) / (self._np - 1)
-                        pnl.add_sweep_param_value("%g" % incr)
-
-                        self._data_driven = False
-                        self._np = -1
-
-                    elif pnl.sweep_param_list[-4].upper() in ["DEC", "OCT"]:
-                        pnl.add_sweep_param_value("%s" % self._np)
-
-                        self._data_driven = False
-                        self._np = -1
-
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.EXPRESSION:
-            processed_value = self.curly_braces_for_expressions(parsed_object.value)
-            pnl.add_known_object(processed_value, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
-            
-
+        elif self._np < 0:
+            self._np = int(parsed_object.value)
 
         else:
-            XyceNetlistBoostParserInterface.convert_next_token(parsed_object, parsed_object_iter, pnl, synthesized_pnls)
-
+            pnl.add_sweep_param_value(parsed_object.value)
+
+            if len(pnl.sweep_param_list) > 3:
+
+                if pnl.sweep_param_list[-4].upper() == "LIN":
+                    incr = (float(pnl.sweep_param_list[-2]) + float(pnl.sweep_param_list[-1])) / (self._np - 1)
+                    pnl.add_sweep_param_value("%g" % incr)
+
+                    self._data_driven = False
+                    self._np = -1
+
+                elif pnl.sweep_param_list[-4].upper() in ["DEC", "OCT"]:
+                    pnl.add_sweep_param_value("%s" % self._np)
+
+                    self._data_driven = False
+                    self._np = -1
+
+    # handlers by token type, built once for the dialect.  Tokens not
+    # converted the HSPICE way are converted the Xyce way
+    token_handlers = dict(XyceNetlistBoostParserInterface.token_handlers)
+    token_handlers.update({
+        SpiritCommon.data_model_type.PARAM_NAME: convert_param_name,
+        SpiritCommon.data_model_type.DEFAULT_PARAM_NAME: convert_default_param_name,
+        SpiritCommon.data_model_type.DIRECTIVE_NAME: convert_directive_name,
+        SpiritCommon.data_model_type.OUTPUT_VARIABLE: convert_output_variable,
+        SpiritCommon.data_model_type.MODEL_TYPE: convert_model_type,
+        SpiritCommon.data_model_type.GENERALNODE: convert_general_node,
+        SpiritCommon.data_model_type.FUNC_NAME_VALUE: convert_func_name_value,
+        SpiritCommon.data_model_type.PARAM_VALUE: convert_param_value,
+        SpiritCommon.data_model_type.COMMENT: convert_comment,
+        SpiritCommon.data_model_type.MODEL_NAME: convert_model_name,
+        SpiritCommon.data_model_type.DC_VALUE_VALUE: convert_expression_value,
+        SpiritCommon.data_model_type.AC_MAG_VALUE: convert_expression_value,
+        SpiritCommon.data_model_type.AC_PHASE_VALUE: convert_expression_value,
+        SpiritCommon.data_model_type.EXPRESSION: convert_expression_value,
+        SpiritCommon.data_model_type.DATA_TABLE_NAME: convert_data_table_name,
+        SpiritCommon.data_model_type.TRANS_REF_NAME: convert_trans_ref_name,
+        SpiritCommon.data_model_type.CONDITIONAL_STATEMENT: convert_conditional_statement,
+        SpiritCommon.data_model_type.SWEEP_TYPE: convert_sweep_type,
+        SpiritCommon.data_model_type.SWEEP_PARAM_VALUE: convert_sweep_param_value,
+    })
+
+    # handlers of the DIRECTIVE_NAME tokens by upper case directive
+    directive_handlers = {
+        ".IF": convert_if,
+        ".ELSEIF": convert_else,
+        ".ELSE": convert_else,
+        ".ENDIF": convert_endif,
+        ".MACRO": convert_macro,
+        ".EOM": convert_eom,
+        ".MEAS": convert_meas,
+        ".TEMP": convert_temp,
+        ".TEMPERATURE": convert_temp,
+        ".PROBE": convert_probe,
+        ".PROBE64": convert_probe,
+    }
 
     @staticmethod
     def clean_hspice_output_variable(in_output_variable):
@@ -573,50 +611,13 @@ class HSPICENetlistBoostParserInterface:
 
 
     @staticmethod
-    def hack_ternary_operator(in_expression):
+    def hack_ternary_operator(in_expression, pnl=None):
         """
-        Hack to place in empty space to left of colons in presumed ternary operators
+        Hack to place in empty space to left of colons in presumed ternary operators.
+        pnl is the statement the expression is in, named in warnings
         """
-
-        q_list = []
-        out_expression = ""
-
-        # first check ternary operator is in expression
-        if "?" in in_expression and ":" in in_expression:
-
-            # Next, make sure every "?" is followed by a ":" and that there are equal number of each.
-            # If not, give warning, return the expression, and continue translating. 
-            # TODO: figure out if it's better to comment out? might not be, since expression may be 
-            #       on a line containing multiple expressions, which would end up commenting out everything
-            #       else
-            for char in in_expression:
-                if char == "?":
-                    q_list.append(char)
-                    out_expression += char
-                elif char == ":":
-                    if not q_list:
-                        logging.warning("In file:\"" + str(os.path.basename(pnl.filename)) + "\" at line:" + str(pnl.linenum) + ". Ternary operator cannot be translated. Continuing.")
-                        return in_expression
-                    else:
-                        q_list.pop()
-
-                        # if there's an empty space to the left of ":", no need to add another
-                        if out_expression[-1] == " ":
-                            out_expression += char
-                        else:
-                            out_expression += " "+char
-                else:
-                    out_expression += char
-
-            if q_list:
-                logging.warning("In file:\"" + str(os.path.basename(pnl.filename)) + "\" at line:" + str(pnl.linenum) + ". Ternary operator cannot be translated. Continuing.")
-                return in_expression 
-                
-        # if no ternary operator in expression, return expression unchanged
-        else:
-            return in_expression
-
-        return out_expression
+        location = (pnl.filename, pnl.linenum) if pnl is not None else None
+        return Expression.of(in_expression).rewrite(space_ternary=True, location=location)
 
 
     @staticmethod
@@ -624,6 +625,7 @@ class HSPICENetlistBoostParserInterface:
         """
         Enclose expressions in curly braces for Xyce.
         """
+        in_expression = Expression.of(in_expression)
 
         # first check if expression is already enclosed in single quotes, which is legal in Xyce.
         # if so, just return expression
@@ -632,16 +634,14 @@ class HSPICENetlistBoostParserInterface:
 
         # check if expression is enclosed in double quotes
         if in_expression.startswith('"') and in_expression.endswith('"'):
-            in_expression = in_expression[1:-1]
+            in_expression = Expression(in_expression[1:-1])
 
         # remove single quotes that may be around function arguments
-        expression_fields = in_expression.split("'")
-        out_expression = "".join(expression_fields)
+        out_expression = in_expression.without_single_quotes()
 
         # find expression components. put braces around everything - only exception is if it is a
         # number
-        expr_components = []
-        expr_utils.find_expr_components(out_expression, [], expr_components)
+        expr_components = out_expression.components()
 
         if ((len(expr_components) == 1 and expr_components[0].types[0] == SpiritExprCommon.expr_data_model_type.NUMBER) or
            (len(expr_components) == 2 and (expr_components[0].types[0] == SpiritExprCommon.expr_data_model_type.NUMBER and
@@ -650,9 +650,7 @@ class HSPICENetlistBoostParserInterface:
            len(expr_components) == 0):
             return out_expression
 
-        out_expression = "{" + out_expression + "}"
-
-        return out_expression
+        return out_expression.braced()
 
 
     @staticmethod
@@ -660,10 +658,17 @@ class HSPICENetlistBoostParserInterface:
         """
         Hack to translate "^" math symbol to "**"
         """
+        return Expression.of(in_expression).rewrite(power_operator=True)
 
-        out_expression = in_expression.replace("^", "**")
 
-        return out_expression
+    @staticmethod
+    def convert_operators(in_expression, pnl=None):
+        """
+        hack_ternary_operator and hack_exponentiation_symbol in one pass over
+        the tokens of an expression
+        """
+        location = (pnl.filename, pnl.linenum) if pnl is not None else None
+        return Expression.of(in_expression).rewrite(space_ternary=True, power_operator=True, location=location)
 
 
     @staticmethod
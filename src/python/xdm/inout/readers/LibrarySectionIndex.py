@@ -0,0 +1,212 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+"""
+Index of the .LIB sections of a SPICE library file, so a library used for
+one or two of its sections can be parsed without the others.
+
+The index is built by a line scan that does not parse the file: a line
+".LIB name" starts a section, ".ENDL" ends it, and ".LIB file name" inside
+a section is a reference to another section.  Each section is recorded with
+its byte range and first line number, which the parser uses to seek past
+the sections that are not needed.  Indexes are kept for the life of the
+process, by the hash of the file contents.
+"""
+
+
+import hashlib
+import os
+from collections import namedtuple
+
+from xdm.inout.readers.CompressedInput import is_netlist_file
+from xdm.inout.readers.FileIdentity import file_identity
+
+Section = namedtuple('Section', ['name', 'start', 'end', 'first_line', 'next_line', 'statements', 'references'])
+LibraryIndex = namedtuple('LibraryIndex', ['sections', 'references', 'size'])
+
+_indexes = {}
+_file_digests = {}
+
+
+class _Unindexable(Exception):
+    pass
+
+
+def _tokens(line):
+    """
+    Words of a line up to an inline comment
+    """
+    tokens = []
+    for token in line.split():
+        if token.startswith(b'$'):
+            break
+        tokens.append(token)
+    return tokens
+
+
+def _unquote(name):
+    return name.replace("'", '').replace('"', '')
+
+
+def _scan(data):
+    """
+    Returns the LibraryIndex of the contents of a file, with the sections by
+    upper case name.  Raises _Unindexable for files with nested or
+    unterminated sections, or a simulator statement, which the index can not
+    describe.
+    """
+    sections = {}
+    references = []
+    current = None
+    statements = 0
+    offset = 0
+    line_num = 0
+    # lines end at a newline only, as for the parser
+    for line in data.split(b'\n'):
+        line_num += 1
+        start = offset
+        offset = min(offset + len(line) + 1, len(data))
+        tokens = _tokens(line)
+        if not tokens:
+            continue
+        keyword = tokens[0].lower()
+        # continuation lines are part of the statement before them
+        if not keyword.startswith((b'+', b')')):
+            statements += 1
+
+        if keyword == b'.lib':
+            words = [token.decode('utf-8', 'replace') for token in tokens[1:]]
+            if len(words) == 1 and words[0][0] not in "'\"":
+                if current is not None or words[0].upper() in sections:
+                    raise _Unindexable()
+                current = Section(words[0], start, None, line_num, None, None, [])
+                statements = 1
+            elif len(words) >= 2:
+                (references if current is None else current.references).append(
+                    (_unquote(words[0]), words[1].upper()))
+        elif keyword == b'.endl':
+            if current is None:
+                raise _Unindexable()
+            sections[current.name.upper()] = current._replace(end=offset, next_line=line_num + 1,
+                                                                statements=statements)
+            current = None
+        elif keyword == b'simulator':
+            raise _Unindexable()
+
+    if current is not None:
+        raise _Unindexable()
+    return LibraryIndex(sections, references, len(data))
+
+
+def _digest(file_name):
+    """
+    Hash of the contents of a file, and the contents if they had to be read
+    """
+    stat = os.stat(file_name)
+    identity = (os.path.abspath(file_name), stat.st_size, stat.st_mtime_ns)
+    digest = _file_digests.get(identity)
+    if digest is not None and digest in _indexes:
+        return digest, None
+    with open(file_name, 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+    _file_digests[identity] = digest
+    return digest, data
+
+
+def section_index(file_name):
+    """
+    Returns the LibraryIndex of a library file, or None if it can not be
+    indexed
+    """
+    try:
+        digest, data = _digest(file_name)
+    except (IOError, OSError):
+        return None
+    if data is not None:
+        try:
+            _indexes[digest] = _scan(data)
+        except _Unindexable:
+            _indexes[digest] = None
+    return _indexes[digest]
+
+
+def _same_file(file_name, lib_file):
+    # resolved the way GenericReader resolves .LIB file names
+    if not is_netlist_file(lib_file):
+        lib_file = os.path.join(os.path.dirname(file_name), lib_file)
+    return file_identity(file_name) == file_identity(lib_file)
+
+
+def section_ranges(file_name, section_names):
+    """
+    Returns the parts of a library file to parse for a list of sections:
+    everything but the sections that are neither requested nor referenced
+    from a requested section of the same file.
+
+    Args:
+       file_name (str): Library file
+       section_names (list): Requested section names
+
+    Returns:
+       tuple. ((start byte, end byte, first line number) per part to
+       parse, Sections left out), both in file order, or None if the whole
+       file has to be parsed because it is not indexable or a requested
+       section is not in it
+    """
+    index = section_index(file_name)
+    if index is None or not index.sections:
+        return None
+
+    def same_file_references(references):
+        return [ref_name for ref_file, ref_name in references if _same_file(file_name, ref_file)]
+
+    # the requested sections and the sections they, or the statements
+    # outside any section, select from this file
+    needed = set()
+    pending = [str(name).upper() for name in section_names] + same_file_references(index.references)
+    while pending:
+        name = pending.pop()
+        if name in needed:
+            continue
+        if name not in index.sections:
+            return None
+        needed.add(name)
+        pending.extend(same_file_references(index.sections[name].references))
+
+    skipped = sorted((section for name, section in index.sections.items() if name not in needed),
+                     key=lambda section: section.start)
+    if not skipped:
+        return None
+
+    ranges = []
+    start, first_line = 0, 1
+    for section in skipped:
+        if section.start > start:
+            ranges.append((start, section.start, first_line))
+        start, first_line = section.end, section.next_line
+    if index.size > start:
+        ranges.append((start, index.size, first_line))
+    return ranges, skipped
+
@@ -105,6 +105,22 @@ class PSPICENetlistBoostParserInterface(object):
     def __del__(self):
         self.internal_parser.close()
 
+    def parse_ahead(self, queue_size):
+        """
+        Reads and parses up to queue_size lines of the file ahead on a native
+        thread, while the lines already read are converted
+        """
+        self.internal_parser.parse_ahead(queue_size)
+        self.line_iter = BoostParserInterface.parsed_lines(self.internal_parser)
+
+    def parse_parallel(self, threads, chunk_bytes=BoostParserInterface.PARSE_CHUNK_BYTES):
+        """
+        Parses the file in chunks of about chunk_bytes, split at statement
+        boundaries, on threads native threads
+        """
+        self.internal_parser.parse_parallel(threads, chunk_bytes)
+        self.line_iter = BoostParserInterface.parsed_lines(self.internal_parser)
+
     def __iter__(self):
         return self
 
@@ -124,7 +140,7 @@ class PSPICENetlistBoostParserInterface(object):
         parsed_object_iter = iter(boost_parsed_line.parsed_objects)
 
         for parsedObject in parsed_object_iter:
-            self.convert_next_token(parsedObject, parsed_object_iter, pnl, self._synthesized_pnls, self._pkg_dict)
+            self.convert_next_token(parsedObject, parsed_object_iter, pnl, self._synthesized_pnls)
 
         if not silent:
             if boost_parsed_line.error_type == "critical":
@@ -148,106 +164,135 @@ class PSPICENetlistBoostParserInterface(object):
 
         return pnl
 
-    def convert_next_token(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls, pkg_dict):
+    def convert_next_token(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
         """
         Takes individual parsed objects from the parsed line object
 
         Populate ParsedNetlistLine class with all information necessary to create a Statement
 
-        Many hacks contained here
+        The token is converted by the handler for its type in token_handlers.
+        Many hacks contained in the handlers
         """
+        token_handler = self.token_handlers.get(parsed_object.types[0], XyceNetlistBoostParserInterface.convert_other_token)
+        token_handler(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
-        if (parsed_object.types[0] == SpiritCommon.data_model_type.PARAM_NAME or parsed_object.types[0] == SpiritCommon.data_model_type.DEFAULT_PARAM_NAME) and pnl.type == ".OPTIONS":
-
-            # find the adm option name
-            orig_param_name = parsed_object.value.upper()
-            param_name = orig_param_name
+    def convert_option(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        # find the adm option name
+        orig_param_name = parsed_object.key
+        param_name = orig_param_name
 
-            # find all adm packages that use this parameter
-            pkgs = pkg_dict.get(param_name.upper())
+        # find all adm packages that use this parameter
+        pkgs = self._pkg_dict.get(param_name)
 
-            # TODO: Hack Bugzilla 2020, ITL1 => NONLIN MAXSTEP (default 200)
-            # TODO: Hack Bugzilla 2020, ITL4 => NONLIN-TRAN MAXSTEP (default 20)
+        # TODO: Hack Bugzilla 2020, ITL1 => NONLIN MAXSTEP (default 200)
+        # TODO: Hack Bugzilla 2020, ITL4 => NONLIN-TRAN MAXSTEP (default 20)
 
-            # TODO: Hack Bugzilla 2020, VNTOL => ABSTOL
+        # TODO: Hack Bugzilla 2020, VNTOL => ABSTOL
 
-            param_name, pkgs = self.hack_packages_bugzilla_2020(param_name.upper(), pkgs)
+        param_name, pkgs = self.hack_packages_bugzilla_2020(param_name, pkgs)
 
-            if pkgs:
-                if parsed_object.types[0] == SpiritCommon.data_model_type.PARAM_NAME:
-                    param_value_parsed_object = next(parsed_object_iter)
-                    param_value = param_value_parsed_object.value
-                else:
-                    param_value = self.get_default(orig_param_name)
+        if pkgs:
+            if parsed_object.types[0] == SpiritCommon.data_model_type.PARAM_NAME:
+                param_value_parsed_object = next(parsed_object_iter)
+                param_value = param_value_parsed_object.value
+            else:
+                param_value = self.get_default(orig_param_name)
 
-                pnl.add_known_object(pkgs[0], Types.optionPkgTypeValue)
+            pnl.add_known_object(pkgs[0], Types.optionPkgTypeValue)
 
-                # converting .OPTIONS METHOD=DEFAULT to .OPTIONS TIMEINT METHOD=TRAP
-                if param_name.upper() == "METHOD" and param_value.upper() == "DEFAULT":
-                    param_value = "TRAP"
+            # converting .OPTIONS METHOD=DEFAULT to .OPTIONS TIMEINT METHOD=TRAP
+            if param_name == "METHOD" and param_value.upper() == "DEFAULT":
+                param_value = "TRAP"
 
-                pnl.add_param_value_pair(param_name.upper(), param_value)
+            pnl.add_param_value_pair(param_name, param_value)
 
-                for otherPkg in pkgs[1:]:
-                    pnl_synth = ParsedNetlistLine(pnl.filename, pnl.linenum)  # what to do with line numbers?
-                    pnl_synth.type = ".OPTIONS"
-                    pnl_synth.add_known_object(otherPkg, Types.optionPkgTypeValue)
-                    pnl_synth.add_param_value_pair(param_name.upper(), param_value)
-                    synthesized_pnls.append(pnl_synth)
+            for otherPkg in pkgs[1:]:
+                pnl_synth = ParsedNetlistLine(pnl.filename, pnl.linenum)  # what to do with line numbers?
+                pnl_synth.type = ".OPTIONS"
+                pnl_synth.add_known_object(otherPkg, Types.optionPkgTypeValue)
+                pnl_synth.add_param_value_pair(param_name, param_value)
+                synthesized_pnls.append(pnl_synth)
 
-            else:
-                logging.warning("In file:\"" + str(os.path.basename(pnl.filename)) + "\" at line:" + str(pnl.linenum) + ". Could not accept .OPTIONS \"" + orig_param_name.upper() + "\". Retained (as a comment). Continuing.")
-                pnl.type = "COMMENT"
-                pnl.name = ".OPTIONS " + orig_param_name
-                pnl.add_comment(".OPTIONS " + orig_param_name)
+        else:
+            logging.warning("In file:\"" + str(os.path.basename(pnl.filename)) + "\" at line:" + str(pnl.linenum) + ". Could not accept .OPTIONS \"" + orig_param_name + "\". Retained (as a comment). Continuing.")
+            pnl.type = "COMMENT"
+            pnl.name = ".OPTIONS " + orig_param_name
+            pnl.add_comment(".OPTIONS " + orig_param_name)
+
+    def convert_param_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if pnl.type == ".OPTIONS":
+            self.convert_option(parsed_object, parsed_object_iter, pnl, synthesized_pnls)
+        else:
+            XyceNetlistBoostParserInterface.convert_param_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
+    def convert_default_param_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if pnl.type == ".OPTIONS":
+            self.convert_option(parsed_object, parsed_object_iter, pnl, synthesized_pnls)
+        else:
+            XyceNetlistBoostParserInterface.convert_other_token(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.DIRECTIVE_NAME and parsed_object.value.upper() == ".LIB":
+    def convert_directive_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        directive = parsed_object.key
+        if directive == ".LIB":
             pnl.type = ".INC"
 
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.DIRECTIVE_NAME and parsed_object.value == ".PARAM":
+        # only an upper case .PARAM is global
+        elif parsed_object.value == ".PARAM":
             pnl.type = ".GLOBAL_PARAM"
 
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.DIRECTIVE_NAME and (parsed_object.value.upper() == ".PROBE" or parsed_object.value.upper() == ".PROBE64"):
+        elif directive == ".PROBE" or directive == ".PROBE64":
             pnl.type = ".PRINT"
             pnl.add_known_object("TRAN", Types.analysisTypeValue)  # default tran type
 
+        else:
+            XyceNetlistBoostParserInterface.convert_directive_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.OUTPUT_VARIABLE:
-
-            # remove [] from PSPICE print variables -- eventually this will be replaced in the writer
-            output_variable_clean = self.clean_pspice_output_variable(parsed_object.value)
-
-            pnl.add_output_variable_value(output_variable_clean)
-
+    def convert_output_variable(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        # remove [] from PSPICE print variables -- eventually this will be replaced in the writer
+        output_variable_clean = self.clean_pspice_output_variable(parsed_object.value)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.MODEL_TYPE and pnl.type == ".MODEL":
+        pnl.add_output_variable_value(output_variable_clean)
 
+    def convert_model_type(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if pnl.type == ".MODEL":
             # convert pspice type into the general type supported by the ADM
-            adm_type = pspice_to_adm_model_type_map.get(parsed_object.value.upper())
+            adm_type = pspice_to_adm_model_type_map.get(parsed_object.key)
 
             # if not mapped, then use current value
             if not adm_type:
-                adm_type = parsed_object.value.upper()
+                adm_type = parsed_object.key
 
             pnl.add_known_object(adm_type, Types.modelType)
+        else:
+            XyceNetlistBoostParserInterface.convert_other_token(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.GENERALNODE and not pnl.type in [".IC", ".DCVOLT", ".NODESET"]:
+    def convert_general_node(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if not pnl.type in [".IC", ".DCVOLT", ".NODESET"]:
             output_node = parsed_object.value.replace(".", ":")
             pnl.add_known_object(output_node, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
+        else:
+            XyceNetlistBoostParserInterface.convert_general_node(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.PARAM_VALUE and pnl.params_dict and pnl.type == "R":
+    def convert_param_value(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if pnl.params_dict and pnl.type == "R":
             last_key = list(pnl.params_dict.keys())[-1]
             prev_param_value = pnl.params_dict[last_key]
             pnl.params_dict[last_key] = prev_param_value + "," + parsed_object.value
-
-
         else:
-            XyceNetlistBoostParserInterface.convert_next_token(parsed_object, parsed_object_iter, pnl, synthesized_pnls)
+            XyceNetlistBoostParserInterface.convert_param_value(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
+
+    # handlers by token type, built once for the dialect.  Tokens not
+    # converted the PSPICE way are converted the Xyce way
+    token_handlers = dict(XyceNetlistBoostParserInterface.token_handlers)
+    token_handlers.update({
+        SpiritCommon.data_model_type.PARAM_NAME: convert_param_name,
+        SpiritCommon.data_model_type.DEFAULT_PARAM_NAME: convert_default_param_name,
+        SpiritCommon.data_model_type.DIRECTIVE_NAME: convert_directive_name,
+        SpiritCommon.data_model_type.OUTPUT_VARIABLE: convert_output_variable,
+        SpiritCommon.data_model_type.MODEL_TYPE: convert_model_type,
+        SpiritCommon.data_model_type.GENERALNODE: convert_general_node,
+        SpiritCommon.data_model_type.PARAM_VALUE: convert_param_value,
+    })
 
     @staticmethod
     def clean_pspice_output_variable(in_output_variable):
@@ -0,0 +1,314 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+import hashlib
+import logging
+import os
+import pickle
+import stat
+import sys
+import tempfile
+
+from xdm.inout.readers.CompressedInput import stored_path
+
+# bump when the layout of a cache entry changes
+CACHE_FORMAT = "2"
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+# modules whose code decides what a parsed line holds, besides the parser
+# interface of the dialect
+_PARSER_MODULES = ['xdm.inout.readers.BoostParserInterface', 'xdm.inout.readers.ParsedNetlistLine', 'SpiritCommon']
+
+
+def _private(file_stat):
+    """
+    True when only the user running xdm can change a file or directory.
+    Loading a cache entry runs code named in it, so entries are only
+    trusted in a directory nobody else can write
+    """
+    if not hasattr(os, 'getuid'):
+        return True
+    return file_stat.st_uid == os.getuid() and not file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _file_digest(file_name):
+    digest = hashlib.sha256()
+    # the digest of a compressed file is of its compressed contents
+    with open(stored_path(file_name), 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class _LogRecorder(object):
+    """
+    Collects the messages the parser logs for one line, so a cache hit can
+    log them again.  The logging functions are wrapped while the line is
+    parsed, so the messages are collected whatever the log level; the
+    replay leaves them to the level of the run that uses the entry
+    """
+
+    LEVELS = ('debug', 'info', 'warning', 'error', 'critical')
+
+    def __init__(self):
+        self.messages = []
+        self._functions = {}
+
+    def __enter__(self):
+        for level in self.LEVELS:
+            self._functions[level] = getattr(logging, level)
+            setattr(logging, level, self._recording(level, self._functions[level]))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        for level, function in self._functions.items():
+            setattr(logging, level, function)
+
+    def _recording(self, level, function):
+        def log(msg, *args, **kwargs):
+            self.messages.append((level, str(msg) % args if args else str(msg)))
+            return function(msg, *args, **kwargs)
+        return log
+
+
+class _RecordingIterator(object):
+    """
+    Wraps a parser interface and keeps a pickled copy of each parsed line as
+    it is produced, before the reader changes it
+    """
+
+    def __init__(self, grammar_iter):
+        self._grammar_iter = grammar_iter
+        self.lines = []
+        self.cacheable = True
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        with _LogRecorder() as recorder:
+            pnl = next(self._grammar_iter)
+
+        if self.cacheable:
+            try:
+                self.lines.append((pickle.dumps(pnl, pickle.HIGHEST_PROTOCOL), recorder.messages))
+            except (pickle.PicklingError, TypeError, AttributeError):
+                self.cacheable = False
+                self.lines = []
+        return pnl
+
+
+class ParseCache(object):
+    """
+    Content-addressed cache of parsed include and library files, shared
+    between runs and projects through a directory.  An entry holds the
+    ParsedNetlistLines a file produced, keyed by a hash of the file contents,
+    the grammar and language definition that parsed it, the XDM version and
+    the XML language definitions.  On a hit, GenericReader feeds the cached
+    lines through read_line instead of parsing the file, so the file
+    contributes the same statements and names to the NAME_SCOPE_INDEX.
+
+    Entries are written atomically, so several processes can share a cache
+    directory.  When the directory grows past max_bytes, the least recently
+    used entries are removed.
+
+    Entries are pickles, and loading a pickle can run code, so the cache
+    directory and its entries must belong to the user running xdm and be
+    writable by nobody else.  The cache is shared between the projects and
+    concurrent runs of one user, not between users.
+
+    Member variables:
+        cache_dir (str): Cache directory, created if needed
+        max_bytes (int): Size bound of the cache directory
+        hits, misses, stores (int): Counts for this process
+    """
+
+    def __init__(self, cache_dir, xdm_version, xml_files=(), max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self._total_bytes = None
+        self._grammar_digests = {}
+
+        salt = hashlib.sha256()
+        salt.update(CACHE_FORMAT.encode('utf-8'))
+        salt.update(xdm_version.encode('utf-8'))
+        for xml_file in sorted(xml_files):
+            if os.path.isfile(xml_file):
+                salt.update(_file_digest(xml_file).encode('utf-8'))
+        self._salt = salt.hexdigest()
+
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir, mode=0o700)
+        if not _private(os.stat(cache_dir)):
+            raise ValueError("parse cache directory " + cache_dir + " must belong to you and not be "
+                             "writable by group or others")
+        self._foreign_entries = 0
+
+    def __getstate__(self):
+        # batch workers get their own size estimate
+        state = dict(self.__dict__)
+        state['_total_bytes'] = None
+        return state
+
+    def _grammar_digest(self, grammar_type):
+        """
+        Digest of the code that turns a file into ParsedNetlistLines: the
+        parser interface module, the modules it shares with the other
+        dialects, including the pickled ParsedNetlistLine class, and the
+        SpiritCommon extension module
+        """
+        digest = self._grammar_digests.get(grammar_type)
+        if digest is None:
+            parts = [grammar_type.__module__, grammar_type.__name__]
+            for module_name in [grammar_type.__module__] + _PARSER_MODULES:
+                module_file = getattr(sys.modules.get(module_name), '__file__', None)
+                if module_file and os.path.isfile(module_file):
+                    module_stat = os.stat(module_file)
+                    parts.append("%s:%d:%d" % (module_file, module_stat.st_size, module_stat.st_mtime_ns))
+            digest = hashlib.sha256("\n".join(parts).encode('utf-8')).hexdigest()
+            self._grammar_digests[grammar_type] = digest
+        return digest
+
+    def key(self, file_name, grammar_type, language_definition, ranges=None):
+        """
+        Returns the cache key of a file, or None if it can not be read.
+        ranges are the parts of the file parsed, None for all of it
+        """
+        try:
+            content_digest = _file_digest(file_name)
+        except (IOError, OSError):
+            return None
+        key = hashlib.sha256()
+        for part in [self._salt, self._grammar_digest(grammar_type), language_definition.language,
+                     str(language_definition.version), content_digest, repr(ranges)]:
+            key.update(part.encode('utf-8'))
+            key.update(b'\0')
+        return key.hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key[2:] + ".pnl")
+
+    def load(self, key):
+        """
+        Returns the cached lines for key, or None on a miss.  An entry that
+        can not be loaded, say one written before a class it holds was
+        renamed, or one that is not private to the user, is a miss
+        """
+        if key is None:
+            return None
+        path = self._entry_path(key)
+        try:
+            with open(path, 'rb') as f:
+                if not _private(os.fstat(f.fileno())):
+                    self._foreign_entry(path)
+                    self.misses += 1
+                    return None
+                lines = [(pickle.loads(data), messages) for data, messages in pickle.load(f)]
+            os.utime(path)
+        except (IOError, OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError,
+                AttributeError, ImportError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return lines
+
+    def _foreign_entry(self, path):
+        if not self._foreign_entries:
+            logging.warning("Parse cache entry " + path + " belongs to another user or is writable by "
+                            "others. It is not used, nor are other such entries")
+        self._foreign_entries += 1
+
+    def record(self, grammar_iter):
+        """
+        Wraps a parser interface iterator so that what it produces can be
+        stored with store()
+        """
+        return _RecordingIterator(grammar_iter)
+
+    def store(self, key, recording):
+        if key is None or not recording.cacheable:
+            return
+        path = self._entry_path(key)
+        data = pickle.dumps(recording.lines, pickle.HIGHEST_PROTOCOL)
+        try:
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), delete=False) as f:
+                f.write(data)
+            os.replace(f.name, path)
+        except (IOError, OSError) as e:
+            logging.debug("Could not write parse cache entry " + path + ": " + str(e))
+            return
+        self.stores += 1
+
+        if self._total_bytes is None:
+            self._total_bytes = self._scan()[0]
+        else:
+            self._total_bytes += len(data)
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+
+    @staticmethod
+    def replay(lines, file_name):
+        """
+        Yields the cached ParsedNetlistLines of a file, logging again what
+        the parser logged for each of them
+        """
+        for pnl, messages in lines:
+            for level, message in messages:
+                getattr(logging, level, logging.warning)(message)
+            pnl.filename = file_name
+            yield pnl
+
+    def _scan(self):
+        total = 0
+        entries = []
+        for sub_dir in os.listdir(self.cache_dir):
+            sub_path = os.path.join(self.cache_dir, sub_dir)
+            if not os.path.isdir(sub_path):
+                continue
+            for entry in os.scandir(sub_path):
+                try:
+                    entry_stat = entry.stat()
+                except OSError:
+                    continue
+                total += entry_stat.st_size
+                entries.append((entry_stat.st_mtime, entry_stat.st_size, entry.path))
+        return total, entries
+
+    def _evict(self):
+        total, entries = self._scan()
+        for mtime, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        self._total_bytes = total
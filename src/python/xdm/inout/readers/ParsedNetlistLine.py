@@ -25,6 +25,14 @@ from collections import OrderedDict
 from xdm import Types
 
 
+def _hashable(value):
+    if isinstance(value, list):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, dict):
+        return frozenset((k, _hashable(v)) for k, v in value.items())
+    return value
+
+
 class ParsedNetlistLine(object):
     """
     Intermediate data storage for a given netlist statement, which is then
@@ -171,6 +179,18 @@ class ParsedNetlistLine(object):
     def flag_top_pnl(self):
         return self._flag_top_pnl
 
+    def fingerprint(self):
+        """
+        Returns a hashable, order independent fingerprint of the parameters
+        and known objects of the line.  Two lines with equal fingerprints
+        have equal params_dict and known_objects contents.
+
+        Returns:
+           tuple. (frozenset of params_dict items, frozenset of known_objects items)
+        """
+        return (frozenset((k, _hashable(v)) for k, v in self._params_dict.items()),
+                frozenset((k, _hashable(v)) for k, v in self._known_objects.items()))
+
     @flag_top_pnl.setter
     def flag_top_pnl(self, x):
         self._flag_top_pnl = x
@@ -29,7 +29,7 @@ import SpiritCommon
 import SpiritExprCommon
 
 from xdm import Types
-from xdm.expr import expr_utils
+from xdm.expr.Expression import Expression
 from xdm.inout.readers import BoostParserInterface
 from xdm.inout.readers.ParsedNetlistLine import ParsedNetlistLine
 from xdm.inout.readers.XyceNetlistBoostParserInterface import XyceNetlistBoostParserInterface
@@ -96,8 +96,7 @@ def is_a_number(in_expression):
 
     # find expression components. put braces around everything - only exception is if it is a
     # number
-    expr_components = []
-    expr_utils.find_expr_components(in_expression, [], expr_components, lang="spectre")
+    expr_components = Expression.of(in_expression).components("spectre")
 
     if ((len(expr_components) == 1 and expr_components[0].types[0] == SpiritExprCommon.expr_data_model_type.NUMBER) or
        (len(expr_components) == 2 and (expr_components[0].types[0] == SpiritExprCommon.expr_data_model_type.NUMBER and
@@ -269,6 +268,22 @@ class SpectreNetlistBoostParserInterface(object):
     def __del__(self):
         self.internal_parser.close()
 
+    def parse_ahead(self, queue_size):
+        """
+        Reads and parses up to queue_size lines of the file ahead on a native
+        thread, while the lines already read are converted
+        """
+        self.internal_parser.parse_ahead(queue_size)
+        self.line_iter = BoostParserInterface.parsed_lines(self.internal_parser)
+
+    def parse_parallel(self, threads, chunk_bytes=BoostParserInterface.PARSE_CHUNK_BYTES):
+        """
+        Parses the file in chunks of about chunk_bytes, split at statement
+        boundaries, on threads native threads
+        """
+        self.internal_parser.parse_parallel(threads, chunk_bytes)
+        self.line_iter = BoostParserInterface.parsed_lines(self.internal_parser)
+
     def __iter__(self):
         return self
 
@@ -519,482 +534,486 @@ class SpectreNetlistBoostParserInterface(object):
 
         Populate ParsedNetlistLine class with all information necessary to create a Statement
 
-        Many hacks contained here
+        Inside an if statement every token but a block delimiter is commented
+        out, and in a .DC statement every token after the name is a sweep
+        parameter.  Other tokens are converted by the handler for their type
+        in token_handlers.  Many hacks contained in the handlers
         """
+        token_type = parsed_object.types[0]
 
-        if parsed_object.types[0] == SpiritCommon.data_model_type.BLOCK_DELIMITER:
+        if self._if_statement and token_type != SpiritCommon.data_model_type.BLOCK_DELIMITER:
+            pnl.type = "COMMENT"
 
-            if parsed_object.value == "{":
+        elif pnl.type == ".DC" and token_type not in self.statement_token_types:
+            self.convert_dc_token(parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
-                self._delimited_block = True
+        else:
+            token_handler = self.token_handlers.get(token_type, SpectreNetlistBoostParserInterface.convert_other_token)
+            token_handler(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
-            else:
-                self._delimited_block = False
+    def convert_block_delimiter(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if parsed_object.value == "{":
 
-                if self._if_statement:
+            self._delimited_block = True
 
-                    self._if_statement = False
-                    self._comment_end_of_if_statement = True
+        else:
+            self._delimited_block = False
+
+            if self._if_statement:
 
+                self._if_statement = False
+                self._comment_end_of_if_statement = True
 
-        elif self._if_statement:
+    def convert_directive_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if spectre_to_adm_model_type_map.get(parsed_object.value):
 
-            pnl.type = "COMMENT"
-            
+            pnl.type = spectre_to_adm_model_type_map[parsed_object.value]
+            pnl.local_type = parsed_object.value
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.DIRECTIVE_NAME or parsed_object.types[
-            0] == SpiritCommon.data_model_type.DEVICE_TYPE:
+        else:
 
-            if spectre_to_adm_model_type_map.get(parsed_object.value):
+            logging.warning("Possible error. Spectre type not recognized: " + str(parsed_object.value))
 
-                pnl.type = spectre_to_adm_model_type_map[parsed_object.value]
-                pnl.local_type = parsed_object.value
+        # If directive is .GLOBAL, for now get rid of first listed node. This first node is
+        # considered a ground node.
+        if pnl.type == ".GLOBAL":
 
-            else:
+            next(parsed_object_iter)
 
-                logging.warning("Possible error. Spectre type not recognized: " + str(parsed_object.value))
+        if pnl.type == ".IF":
+
+            pnl.type = "COMMENT"
+            pnl.add_comment(parsed_object.value)
 
-            # If directive is .GLOBAL, for now get rid of first listed node. This first node is
-            # considered a ground node.
-            if pnl.type == ".GLOBAL":
+            self._if_statement = True
 
-                next(parsed_object_iter)
+        elif pnl.type == ".ELSE":
 
-            if pnl.type == ".IF":
+            pnl.type = "COMMENT"
+            pnl.add_comment(parsed_object.value)
 
-                pnl.type = "COMMENT"
-                pnl.add_comment(parsed_object.value)
+            self._if_statement = True
+            self._comment_end_of_if_statement = False
 
-                self._if_statement = True
+        elif pnl.type == ".ELSEIF":
 
-            elif pnl.type == ".ELSE":
+            pnl.type = "COMMENT"
+            pnl.add_comment(parsed_object.value)
 
-                pnl.type = "COMMENT"
-                pnl.add_comment(parsed_object.value)
+            self._if_statement = True
+            self._comment_end_of_if_statement = False
 
-                self._if_statement = True
-                self._comment_end_of_if_statement = False
+    def convert_model_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if pnl.type == ".MODEL":
 
-            elif pnl.type == ".ELSEIF":
+            pnl.name = parsed_object.value
 
-                pnl.type = "COMMENT"
-                pnl.add_comment(parsed_object.value)
+        elif spectre_to_adm_model_type_map.get(parsed_object.value):
 
-                self._if_statement = True
-                self._comment_end_of_if_statement = False
+            pnl.type = spectre_to_adm_model_type_map[parsed_object.value]
+            pnl.local_type = parsed_object.value
 
+        else:
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.MODEL_NAME and not pnl.type == ".MODEL":
+            pnl.add_known_object(parsed_object.value, Types.modelName)
 
-            if spectre_to_adm_model_type_map.get(parsed_object.value):
+    def convert_model_type(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if not pnl.type == ".MODEL":
 
-                pnl.type = spectre_to_adm_model_type_map[parsed_object.value]
-                pnl.local_type = parsed_object.value
+            self.convert_other_token(parsed_object, parsed_object_iter, pnl, synthesized_pnls)
+            return
 
-            else:
+        adm_type = spectre_to_adm_model_type_map.get(parsed_object.value)
 
-                pnl.add_known_object(parsed_object.value, Types.modelName)
+        # For Spectre, different models aren't distinguished by a "LEVEL" parameter. Instead,
+        # it uses a name to distinguish what model is being used (ex., bsimsoi instead of
+        # LEVEL=10, or vbic instead of LEVEL=10).
+        if adm_type == "M" or adm_type == "Q" or adm_type == "J":
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.MODEL_TYPE and pnl.type == ".MODEL":
+            pnl.add_param_value_pair("LEVEL", parsed_object.value)
 
-            adm_type = spectre_to_adm_model_type_map.get(parsed_object.value)
+        if not adm_type:
 
-            # For Spectre, different models aren't distinguished by a "LEVEL" parameter. Instead,
-            # it uses a name to distinguish what model is being used (ex., bsimsoi instead of
-            # LEVEL=10, or vbic instead of LEVEL=10).
-            if adm_type == "M" or adm_type == "Q" or adm_type == "J":
+            adm_type = parsed_object.value
 
-                pnl.add_param_value_pair("LEVEL", parsed_object.value)
 
-            if not adm_type:
+        # Default to NMOS for type
+        if adm_type == "M":
 
-                adm_type = parsed_object.value
+            pnl.add_known_object("NMOS", Types.modelType)
+            pnl.add_param_value_pair("type", "N")
 
+        elif adm_type == "J":
 
-            # Default to NMOS for type
-            if adm_type == "M":
+            pnl.add_known_object("NJF", Types.modelType)
+            pnl.add_param_value_pair("type", "N")
 
-                pnl.add_known_object("NMOS", Types.modelType)
-                pnl.add_param_value_pair("type", "N")
+        else:
 
-            elif adm_type == "J":
+            pnl.add_known_object(adm_type, Types.modelType)
 
-                pnl.add_known_object("NJF", Types.modelType)
-                pnl.add_param_value_pair("type", "N")
+    def convert_dc_token(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        # .DC and .AC directives need four PARAM_NAME/PARAM_VALUE pairs - a sweep variable name,
+        # a start value, a stop value, and a step value
+        if not pnl.sweep_param_list:
 
-            else:
+            pnl.add_unused_sweep_params("dc")
+            sweep_list = ["", "", "", ""]
 
-                pnl.add_known_object(adm_type, Types.modelType)
+            for sweep_item in sweep_list:
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.DEVICE_NAME or (
-                parsed_object.types[0] == SpiritCommon.data_model_type.MODEL_NAME and pnl.type == ".MODEL"):
+                pnl.add_sweep_param_value(sweep_item)
 
-            pnl.name = parsed_object.value
+        if parsed_object.types[0] == SpiritCommon.data_model_type.DC_SWEEP_DEV:
 
-        elif pnl.type == ".DC":
+            pnl.add_unused_sweep_params("dev=" + parsed_object.value)
 
-            # .DC and .AC directives need four PARAM_NAME/PARAM_VALUE pairs - a sweep variable name,
-            # a start value, a stop value, and a step value
-            if not pnl.sweep_param_list:
+            # Only save if dc analysis does not involve a param
+            if not pnl.sweep_param_list[0]:
+                pnl.sweep_param_list[0] = parsed_object.value
+                pnl.flag_unresolved_device = True
 
-                pnl.add_unused_sweep_params("dc")
-                sweep_list = ["", "", "", ""]
+        elif parsed_object.types[0] == SpiritCommon.data_model_type.DC_SWEEP_PARAM:
 
-                for sweep_item in sweep_list:
+            pnl.add_unused_sweep_params("param=" + parsed_object.value)
 
-                    pnl.add_sweep_param_value(sweep_item)
+            if not parsed_object.value == "dc":
 
-            if parsed_object.types[0] == SpiritCommon.data_model_type.DC_SWEEP_DEV:
-                
-                pnl.add_unused_sweep_params("dev=" + parsed_object.value)
+                # Overwrite dc analysis with dev if it exists, reset unresolved
+                # device flag to False
+                pnl.sweep_param_list[0] = parsed_object.value
+                pnl.flag_unresolved_device = False
 
-                # Only save if dc analysis does not involve a param
-                if not pnl.sweep_param_list[0]:
-                    pnl.sweep_param_list[0] = parsed_object.value
-                    pnl.flag_unresolved_device = True
+        elif parsed_object.types[0] == SpiritCommon.data_model_type.DC_SWEEP_START:
 
-            elif parsed_object.types[0] == SpiritCommon.data_model_type.DC_SWEEP_PARAM:
-                
-                pnl.add_unused_sweep_params("param=" + parsed_object.value)
+            pnl.sweep_param_list[1] = parsed_object.value
 
-                if not parsed_object.value == "dc":
+        elif parsed_object.types[0] == SpiritCommon.data_model_type.DC_SWEEP_STOP:
 
-                    # Overwrite dc analysis with dev if it exists, reset unresolved
-                    # device flag to False
-                    pnl.sweep_param_list[0] = parsed_object.value
-                    pnl.flag_unresolved_device = False
+            pnl.sweep_param_list[2] = parsed_object.value
 
-            elif parsed_object.types[0] == SpiritCommon.data_model_type.DC_SWEEP_START:
-                
-                pnl.sweep_param_list[1] = parsed_object.value
+        elif parsed_object.types[0] == SpiritCommon.data_model_type.DC_SWEEP_STEP:
 
-            elif parsed_object.types[0] == SpiritCommon.data_model_type.DC_SWEEP_STOP:
-                
-                pnl.sweep_param_list[2] = parsed_object.value
+            pnl.sweep_param_list[3] = parsed_object.value
 
-            elif parsed_object.types[0] == SpiritCommon.data_model_type.DC_SWEEP_STEP:
-                
-                pnl.sweep_param_list[3] = parsed_object.value
+        elif parsed_object.types[0] == SpiritCommon.data_model_type.PARAM_NAME:
 
-            elif parsed_object.types[0] == SpiritCommon.data_model_type.PARAM_NAME:
-                
-                sweep_param_name = parsed_object.value
-                sweep_parsed_object = next(parsed_object_iter)
+            sweep_param_name = parsed_object.value
+            sweep_parsed_object = next(parsed_object_iter)
 
-                if not sweep_parsed_object.types[0] == SpiritCommon.data_model_type.PARAM_VALUE:
+            if not sweep_parsed_object.types[0] == SpiritCommon.data_model_type.PARAM_VALUE:
 
-                    logging.error(
-                        "Line(s):" + str(pnl.linenum) + ". Parser passed wrong token.  Expected PARAM_VALUE.  Got " + str(
-                            sweep_parsed_object.types[0]))
-                    raise Exception("Next Token is not a PARAM_VALUE.  Something went wrong!")
+                logging.error(
+                    "Line(s):" + str(pnl.linenum) + ". Parser passed wrong token.  Expected PARAM_VALUE.  Got " + str(
+                        sweep_parsed_object.types[0]))
+                raise Exception("Next Token is not a PARAM_VALUE.  Something went wrong!")
 
-                sweep_param_value = sweep_parsed_object.value
-                pnl.add_unused_sweep_params(sweep_param_name + "=" + sweep_param_value)
+            sweep_param_value = sweep_parsed_object.value
+            pnl.add_unused_sweep_params(sweep_param_name + "=" + sweep_param_value)
 
+    def convert_port_param(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
         # For translation of port instance parameters to names recognized internally by XDM
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.PARAM_NAME and pnl.type == "P":
+        param_value_parsed_object = next(parsed_object_iter)
 
-            param_value_parsed_object = next(parsed_object_iter)
+        if parsed_object.value == "num":
 
-            if parsed_object.value == "num":
+            pnl.add_param_value_pair("PORT", param_value_parsed_object.value)
 
-                pnl.add_param_value_pair("PORT", param_value_parsed_object.value)
-                
-            elif parsed_object.value == "r":
+        elif parsed_object.value == "r":
 
-                pnl.add_param_value_pair("Z0", param_value_parsed_object.value)
-                
-            elif parsed_object.value == "mag":
+            pnl.add_param_value_pair("Z0", param_value_parsed_object.value)
 
-                pnl.add_param_value_pair("AC", param_value_parsed_object.value)
-                
-            elif parsed_object.value == "type":
+        elif parsed_object.value == "mag":
 
-                pass
-                
-            else:
+            pnl.add_param_value_pair("AC", param_value_parsed_object.value)
 
-                pnl.add_param_value_pair(parsed_object.value.upper(), param_value_parsed_object.value)
+        elif parsed_object.value == "type":
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.GENERALNODE and not pnl.type in [".IC", ".DCVOLT", ".NODESET"]:
+            pass
 
-            output_node = parsed_object.value
+        else:
 
-            if BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]] in pnl.known_objects and pnl.type == ".GLOBAL":
+            pnl.add_param_value_pair(parsed_object.key, param_value_parsed_object.value)
 
-                pnl_synth = ParsedNetlistLine(pnl.filename, pnl.linenum)
-                pnl_synth.type = ".GLOBAL"
-                pnl_synth.local_type = ".GLOBAL"
-                pnl_synth.add_known_object(output_node, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
-                synthesized_pnls.append(pnl_synth)
+    def convert_general_node(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if pnl.type in [".IC", ".DCVOLT", ".NODESET"]:
 
-            else:
+            self.convert_other_token(parsed_object, parsed_object_iter, pnl, synthesized_pnls)
+            return
 
-                pnl.add_known_object(output_node, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
+        output_node = parsed_object.value
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.PARAM_NAME:
+        if BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]] in pnl.known_objects and pnl.type == ".GLOBAL":
 
-            # For Spectre, the polarity of the device (ex. NMOS or PMOS, or NPN or PNP) 
-            # isn't declared as a separate identifier in the .MODEL statement. Instead, 
-            # it is saved as a model parameter called "type". The polarity needs to be
-            # extracted and saved in the data model consistent with SPICE parsing
-            if pnl.type == ".MODEL" and parsed_object.value.upper() == "TYPE":
+            pnl_synth = ParsedNetlistLine(pnl.filename, pnl.linenum)
+            pnl_synth.type = ".GLOBAL"
+            pnl_synth.local_type = ".GLOBAL"
+            pnl_synth.add_known_object(output_node, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
+            synthesized_pnls.append(pnl_synth)
 
-                param_value_parsed_object = next(parsed_object_iter)
+        else:
 
-                if pnl.known_objects.get(Types.modelType).endswith("MOS"):
+            pnl.add_known_object(output_node, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
 
-                    pnl.add_known_object(param_value_parsed_object.value.upper()+"MOS", Types.modelType)
+    def convert_param_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if pnl.type == "P":
 
-                elif pnl.known_objects.get(Types.modelType).endswith("JF"):
+            self.convert_port_param(parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
-                    pnl.add_known_object(param_value_parsed_object.value.upper()+"JF", Types.modelType)
+        # For Spectre, the polarity of the device (ex. NMOS or PMOS, or NPN or PNP) 
+        # isn't declared as a separate identifier in the .MODEL statement. Instead, 
+        # it is saved as a model parameter called "type". The polarity needs to be
+        # extracted and saved in the data model consistent with SPICE parsing
+        elif pnl.type == ".MODEL" and parsed_object.key == "TYPE":
 
-                else:
+            param_value_parsed_object = next(parsed_object_iter)
 
-                    pnl.add_known_object(param_value_parsed_object.value, Types.modelType)
+            if pnl.known_objects.get(Types.modelType).endswith("MOS"):
 
-                pnl.add_param_value_pair(parsed_object.value, param_value_parsed_object.value)
+                pnl.add_known_object(param_value_parsed_object.key+"MOS", Types.modelType)
 
-            elif pnl.type == ".MODEL" and parsed_object.value.upper() == "VERSION":
+            elif pnl.known_objects.get(Types.modelType).endswith("JF"):
 
-                param_value_parsed_object = next(parsed_object_iter)
-                pnl.add_param_value_pair(parsed_object.value.upper(), param_value_parsed_object.value)
+                pnl.add_known_object(param_value_parsed_object.key+"JF", Types.modelType)
 
-            elif not parsed_object.value == "wave":
+            else:
 
-                param_value_parsed_object = next(parsed_object_iter)
+                pnl.add_known_object(param_value_parsed_object.value, Types.modelType)
 
-                if pnl.type and pnl.type == ".TRAN":
+            pnl.add_param_value_pair(parsed_object.value, param_value_parsed_object.value)
 
-                    self.set_tran_param(pnl, parsed_object.value, param_value_parsed_object.value)
+        elif pnl.type == ".MODEL" and parsed_object.key == "VERSION":
 
-                elif pnl.type and pnl.type == "V" or pnl.type == "I":
+            param_value_parsed_object = next(parsed_object_iter)
+            pnl.add_param_value_pair(parsed_object.key, param_value_parsed_object.value)
 
-                    processed_value = param_value_parsed_object.value
+        elif not parsed_object.value == "wave":
 
-                    # Some source paramters don't need curly braces, such as:
-                    # The "type" parameter indicates source type, such as PULSE or PWL.
-                    # The "file" parameter indicates the file to be opened.
-                    if not parsed_object.value == "type" and not parsed_object.value == "file":
+            param_value_parsed_object = next(parsed_object_iter)
 
-                        processed_value, msg = convert_to_xyce(processed_value)
+            if pnl.type and pnl.type == ".TRAN":
 
-                    processed_value = self.hack_ternary_operator(processed_value)
-                    pnl.source_params[parsed_object.value] = processed_value
+                self.set_tran_param(pnl, parsed_object.value, param_value_parsed_object.value)
 
-                else:
+            elif pnl.type and pnl.type == "V" or pnl.type == "I":
 
-                    if param_value_parsed_object.types[0] != SpiritCommon.data_model_type.PARAM_VALUE:
+                processed_value = param_value_parsed_object.value
 
-                        raise Exception("Next Token is not a PARAM_VALUE.  Something went wrong!")
+                # Some source paramters don't need curly braces, such as:
+                # The "type" parameter indicates source type, such as PULSE or PWL.
+                # The "file" parameter indicates the file to be opened.
+                if not parsed_object.value == "type" and not parsed_object.value == "file":
 
-                    if (parsed_object.value.upper() == "M") and pnl.type not in ['R', 'L', 'C']:
+                    processed_value, msg = convert_to_xyce(processed_value)
 
-                        pnl.m_param = param_value_parsed_object.value
+                processed_value = self.hack_ternary_operator(processed_value, pnl)
+                pnl.source_params[parsed_object.value] = processed_value
 
-                    msg = None
-                    # expression = None
-                    if param_value_parsed_object.value.startswith('[') and param_value_parsed_object.value.endswith(
-                            ']'):
+            else:
 
-                        expression = param_value_parsed_object.value
+                if param_value_parsed_object.types[0] != SpiritCommon.data_model_type.PARAM_VALUE:
 
-                    elif is_a_number(param_value_parsed_object.value):
+                    raise Exception("Next Token is not a PARAM_VALUE.  Something went wrong!")
 
-                        processed_value = param_value_parsed_object.value
-                        expression = convert_si_unit_prefix(processed_value)
+                if (parsed_object.key == "M") and pnl.type not in ['R', 'L', 'C']:
 
-                    else:
+                    pnl.m_param = param_value_parsed_object.value
 
-                        # For parameters that refer to control devices, skip convert_to_xyce
-                        # In the future, this will include cccs, etc.
-                        processed_value, msg = convert_to_xyce(param_value_parsed_object.value)
-                        expression = self.hack_ternary_operator(processed_value)
+                msg = None
+                # expression = None
+                if param_value_parsed_object.value.startswith('[') and param_value_parsed_object.value.endswith(
+                        ']'):
 
-                    if expression:
+                    expression = param_value_parsed_object.value
 
-                        pnl.add_param_value_pair(parsed_object.value, expression)
+                elif is_a_number(param_value_parsed_object.value):
 
-                    else:
+                    processed_value = param_value_parsed_object.value
+                    expression = convert_si_unit_prefix(processed_value)
 
-                        pnl.add_param_value_pair(parsed_object.value, param_value_parsed_object.value)
+                else:
 
-                    if msg:
+                    # For parameters that refer to control devices, skip convert_to_xyce
+                    # In the future, this will include cccs, etc.
+                    processed_value, msg = convert_to_xyce(param_value_parsed_object.value)
+                    expression = self.hack_ternary_operator(processed_value, pnl)
 
-                        logging.warning("Error in expression: " + msg + str(parsed_object.value))
+                if expression:
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.DC_VALUE_VALUE:
+                    pnl.add_param_value_pair(parsed_object.value, expression)
 
-            processed_value, msg = convert_to_xyce(parsed_object.value)
-            processed_value = self.hack_ternary_operator(processed_value)
-            
-            pnl.add_lazy_statement(processed_value, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
+                else:
 
-        elif parsed_object.types[0] in [SpiritCommon.data_model_type.AC_MAG_VALUE, SpiritCommon.data_model_type.AC_PHASE_VALUE]:
+                    pnl.add_param_value_pair(parsed_object.value, param_value_parsed_object.value)
 
-            processed_value, msg = convert_to_xyce(parsed_object.value)
-            processed_value = self.hack_ternary_operator(processed_value)
+                if msg:
 
-            if parsed_object.types[0] == SpiritCommon.data_model_type.AC_MAG_VALUE:
-                pnl.add_known_object("AC", Types.acValue)
-            
-            pnl.add_known_object(processed_value, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
+                    logging.warning("Error in expression: " + msg + str(parsed_object.value))
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.CONTROL_DEVICE:
+    def convert_dc_value(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        processed_value, msg = convert_to_xyce(parsed_object.value)
+        processed_value = self.hack_ternary_operator(processed_value, pnl)
 
-            control_dev_name_obj = next(parsed_object_iter)
+        pnl.add_lazy_statement(processed_value, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
 
-            if control_dev_name_obj.types[0] != SpiritCommon.data_model_type.CONTROL_DEVICE_NAME:
-                logging.error("Line(s):" + str(
-                    pnl.linenum) + ". Parser passed wrong token.  Expected CONTROL_DEVICE_NAME.  Got " + str(
-                    control_dev_name_obj.types[0]))
-                raise Exception("Next Token is not a CONTROL_DEVICE_NAME.  Something went wrong!")
+    def convert_ac_value(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        processed_value, msg = convert_to_xyce(parsed_object.value)
+        processed_value = self.hack_ternary_operator(processed_value, pnl)
 
-            pnl.add_control_param_value(control_dev_name_obj.value)
+        if parsed_object.types[0] == SpiritCommon.data_model_type.AC_MAG_VALUE:
+            pnl.add_known_object("AC", Types.acValue)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.OUTPUT_VARIABLE:
+        pnl.add_known_object(processed_value, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
 
-            formatted_output_variable = format_output_variable(parsed_object.value)
-            pnl.add_output_variable_value(formatted_output_variable)
+    def convert_control_device(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        control_dev_name_obj = next(parsed_object_iter)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.UNKNOWN_NODE:
+        if control_dev_name_obj.types[0] != SpiritCommon.data_model_type.CONTROL_DEVICE_NAME:
+            logging.error("Line(s):" + str(
+                pnl.linenum) + ". Parser passed wrong token.  Expected CONTROL_DEVICE_NAME.  Got " + str(
+                control_dev_name_obj.types[0]))
+            raise Exception("Next Token is not a CONTROL_DEVICE_NAME.  Something went wrong!")
 
-            pnl.add_unknown_node(parsed_object.value)
+        pnl.add_control_param_value(control_dev_name_obj.value)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.COMMENT:
+    def convert_output_variable(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        formatted_output_variable = format_output_variable(parsed_object.value)
+        pnl.add_output_variable_value(formatted_output_variable)
 
-            # If a comment comes in the middle of a delimited block, synthesize a PNL
-            # object for the comment and leave the original PNL unmolested
-            if self._delimited_block:
-                pnl_synth = ParsedNetlistLine(pnl.filename, [pnl.linenum[-1]])
-                pnl_synth.type = "COMMENT"
-                pnl_synth.name = parsed_object.value
-                pnl_synth.add_comment(parsed_object.value)
-                synthesized_pnls.append(pnl_synth)
+    def convert_comment(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        # If a comment comes in the middle of a delimited block, synthesize a PNL
+        # object for the comment and leave the original PNL unmolested
+        if self._delimited_block:
+            pnl_synth = ParsedNetlistLine(pnl.filename, [pnl.linenum[-1]])
+            pnl_synth.type = "COMMENT"
+            pnl_synth.name = parsed_object.value
+            pnl_synth.add_comment(parsed_object.value)
+            synthesized_pnls.append(pnl_synth)
 
-            else:
-                pnl.type = "COMMENT"
-                pnl.name = parsed_object.value
-                pnl.add_comment(parsed_object.value)
+        else:
+            pnl.type = "COMMENT"
+            pnl.name = parsed_object.value
+            pnl.add_comment(parsed_object.value)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.LIB_ENTRY and pnl.type and not pnl.type == ".ENDL":
+    def convert_lib_entry(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if pnl.type and not pnl.type == ".ENDL":
 
             # convert to .lib from .include
             pnl.type = ".LIB"
             pnl.add_known_object(parsed_object.value, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.FUNC_EXPRESSION:
-
-            processed_value, msg = convert_to_xyce(parsed_object.value)
-            processed_value = self.hack_ternary_operator(processed_value)
-
-            if not processed_value.startswith("{"):
-                processed_value = "{" + processed_value + "}"
-
-            pnl.add_known_object(processed_value, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
+        else:
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.CONDITIONAL_STATEMENT:
+            self.convert_other_token(parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
-            comment = pnl.params_dict[Types.comment] + parsed_object.value
-            pnl.add_comment(comment)
+    def convert_func_expression(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        processed_value, msg = convert_to_xyce(parsed_object.value)
+        processed_value = self.hack_ternary_operator(processed_value, pnl)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.BINNED_MODEL_NAME:
+        if not processed_value.startswith("{"):
+            processed_value = "{" + processed_value + "}"
 
-            # if "." already in model name, need to create synthesized pnl for next
-            # binned model
-            if "." in pnl.name:
+        pnl.add_known_object(processed_value, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
 
-                model_name = pnl.name.split(".")[0]
-                pnl_synth = ParsedNetlistLine(pnl.filename, [pnl.linenum[-1]])
-                pnl_synth.type = ".MODEL"
-                pnl_synth.local_type = "model"
-                pnl_synth.name = model_name + "." + parsed_object.value
-                pnl_synth.add_param_value_pair("LEVEL", pnl.params_dict["LEVEL"])
-                pnl_synth.add_known_object(pnl.known_objects["MODEL_TYPE"], Types.modelType)
-                synthesized_pnls.append(pnl_synth)
-                self._modify_synth_pnl = True
-                
-            else:
+    def convert_conditional_statement(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        comment = pnl.params_dict[Types.comment] + parsed_object.value
+        pnl.add_comment(comment)
 
-                pnl.name = pnl.name + "." + parsed_object.value
+    def convert_binned_model_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        # if "." already in model name, need to create synthesized pnl for next
+        # binned model
+        if "." in pnl.name:
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.VOLTAGE or parsed_object.types[0] == SpiritCommon.data_model_type.CURRENT:
+            model_name = pnl.name.split(".")[0]
+            pnl_synth = ParsedNetlistLine(pnl.filename, [pnl.linenum[-1]])
+            pnl_synth.type = ".MODEL"
+            pnl_synth.local_type = "model"
+            pnl_synth.name = model_name + "." + parsed_object.value
+            pnl_synth.add_param_value_pair("LEVEL", pnl.params_dict["LEVEL"])
+            pnl_synth.add_known_object(pnl.known_objects["MODEL_TYPE"], Types.modelType)
+            synthesized_pnls.append(pnl_synth)
+            self._modify_synth_pnl = True
 
-            expression_obj = next(parsed_object_iter)
+        else:
 
-            if expression_obj.types[0] != SpiritCommon.data_model_type.EXPRESSION:
+            pnl.name = pnl.name + "." + parsed_object.value
 
-                logging.error("Line(s):" + str(
-                    pnl.linenum) + ". Parser passed wrong token.  Expected EXPRESSION.  Got " + str(
-                    expression_obj.types[0]))
-                raise Exception("Next Token is not a EXPRESSION.  Something went wrong!")
+    def convert_source_expression(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        expression_obj = next(parsed_object_iter)
 
-            processed_value, msg = convert_to_xyce(expression_obj.value)
-            processed_value = self.hack_ternary_operator(processed_value)
-            pnl.add_known_object(processed_value, Types.expression)
+        if expression_obj.types[0] != SpiritCommon.data_model_type.EXPRESSION:
 
-            if parsed_object.types[0] == SpiritCommon.data_model_type.VOLTAGE:
+            logging.error("Line(s):" + str(
+                pnl.linenum) + ". Parser passed wrong token.  Expected EXPRESSION.  Got " + str(
+                expression_obj.types[0]))
+            raise Exception("Next Token is not a EXPRESSION.  Something went wrong!")
 
-                pnl.add_known_object(processed_value, Types.voltage)
+        processed_value, msg = convert_to_xyce(expression_obj.value)
+        processed_value = self.hack_ternary_operator(processed_value, pnl)
+        pnl.add_known_object(processed_value, Types.expression)
 
-            if parsed_object.types[0] == SpiritCommon.data_model_type.CURRENT:
+        if parsed_object.types[0] == SpiritCommon.data_model_type.VOLTAGE:
 
-                pnl.add_known_object(processed_value, Types.current)
+            pnl.add_known_object(processed_value, Types.voltage)
 
-        else:
+        if parsed_object.types[0] == SpiritCommon.data_model_type.CURRENT:
 
-            if is_a_number(parsed_object.value):
+            pnl.add_known_object(processed_value, Types.current)
 
-                parsed_object.value = convert_si_unit_prefix(parsed_object.value)
-
-            XyceNetlistBoostParserInterface.convert_next_token(parsed_object, parsed_object_iter, pnl, synthesized_pnls)
+    def convert_other_token(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        """
+        Converts a token that has no Spectre handler the Xyce way, with
+        Spectre scale factors in numbers converted
+        """
+        if is_a_number(parsed_object.value):
+
+            parsed_object.value = convert_si_unit_prefix(parsed_object.value)
+
+        token_handler = XyceNetlistBoostParserInterface.token_handlers.get(parsed_object.types[0], XyceNetlistBoostParserInterface.convert_other_token)
+        token_handler(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
+
+    # handlers by token type, built once for the dialect
+    token_handlers = {
+        SpiritCommon.data_model_type.BLOCK_DELIMITER: convert_block_delimiter,
+        SpiritCommon.data_model_type.DIRECTIVE_NAME: convert_directive_name,
+        SpiritCommon.data_model_type.DEVICE_TYPE: convert_directive_name,
+        SpiritCommon.data_model_type.MODEL_NAME: convert_model_name,
+        SpiritCommon.data_model_type.MODEL_TYPE: convert_model_type,
+        SpiritCommon.data_model_type.DEVICE_NAME: XyceNetlistBoostParserInterface.convert_device_name,
+        SpiritCommon.data_model_type.PARAM_NAME: convert_param_name,
+        SpiritCommon.data_model_type.GENERALNODE: convert_general_node,
+        SpiritCommon.data_model_type.DC_VALUE_VALUE: convert_dc_value,
+        SpiritCommon.data_model_type.AC_MAG_VALUE: convert_ac_value,
+        SpiritCommon.data_model_type.AC_PHASE_VALUE: convert_ac_value,
+        SpiritCommon.data_model_type.CONTROL_DEVICE: convert_control_device,
+        SpiritCommon.data_model_type.OUTPUT_VARIABLE: convert_output_variable,
+        SpiritCommon.data_model_type.UNKNOWN_NODE: BoostParserInterface.value_adder(ParsedNetlistLine.add_unknown_node),
+        SpiritCommon.data_model_type.COMMENT: convert_comment,
+        SpiritCommon.data_model_type.LIB_ENTRY: convert_lib_entry,
+        SpiritCommon.data_model_type.FUNC_EXPRESSION: convert_func_expression,
+        SpiritCommon.data_model_type.CONDITIONAL_STATEMENT: convert_conditional_statement,
+        SpiritCommon.data_model_type.BINNED_MODEL_NAME: convert_binned_model_name,
+        SpiritCommon.data_model_type.VOLTAGE: convert_source_expression,
+        SpiritCommon.data_model_type.CURRENT: convert_source_expression,
+    }
+
+    # tokens that name a statement, converted before the rest of a .DC
+    # statement is taken as its sweep parameters.  A MODEL_TYPE is only one
+    # in a .MODEL statement
+    statement_token_types = frozenset([SpiritCommon.data_model_type.BLOCK_DELIMITER,
+                                       SpiritCommon.data_model_type.DIRECTIVE_NAME,
+                                       SpiritCommon.data_model_type.DEVICE_TYPE,
+                                       SpiritCommon.data_model_type.MODEL_NAME,
+                                       SpiritCommon.data_model_type.DEVICE_NAME])
 
     @staticmethod
-    def hack_ternary_operator(in_expression):
+    def hack_ternary_operator(in_expression, pnl=None):
         """
-        Hack to place in empty space to left of colons in presumed ternary operators
+        Hack to place in empty space to left of colons in presumed ternary operators.
+        pnl is the statement the expression is in, named in warnings
         """
-
-        q_list = []
-        out_expression = ""
-
-        # first check ternary operator is in expression
-        if "?" in in_expression and ":" in in_expression:
-
-            # Next, make sure every "?" is followed by a ":" and that there are equal number of each.
-            # If not, give warning, return the expression, and continue translating. 
-            # TODO: figure out if it's better to comment out? might not be, since expression may be 
-            #       on a line containing multiple expressions, which would end up commenting out everything
-            #       else
-            for char in in_expression:
-                if char == "?":
-                    q_list.append(char)
-                    out_expression += char
-                elif char == ":":
-                    if not q_list:
-                        logging.warning("In file:\"" + str(os.path.basename(pnl.filename)) + "\" at line:" + str(pnl.linenum) + ". Ternary operator cannot be translated. Continuing.")
-                        return in_expression
-                    else:
-                        q_list.pop()
-
-                        # if there's an empty space to the left of ":", no need to add another
-                        if out_expression[-1] == " ":
-                            out_expression += char
-                        else:
-                            out_expression += " "+char
-                else:
-                    out_expression += char
-
-            if q_list:
-                logging.warning("In file:\"" + str(os.path.basename(pnl.filename)) + "\" at line:" + str(pnl.linenum) + ". Ternary operator cannot be translated. Continuing.")
-                return in_expression 
-                
-        # if no ternary operator in expression, return expression unchanged
-        else:
-            return in_expression
-
-        return out_expression
+        location = (pnl.filename, pnl.linenum) if pnl is not None else None
+        return Expression.of(in_expression).rewrite(space_ternary=True, location=location)
 
     @property
     def tnom_defined(self):
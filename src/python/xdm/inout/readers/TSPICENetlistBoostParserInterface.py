@@ -25,6 +25,7 @@ import xdm.Types as Types
 
 import SpiritCommon
 
+from xdm.inout.readers import BoostParserInterface
 from xdm.inout.readers.XyceNetlistBoostParserInterface import XyceNetlistBoostParserInterface
 from xdm.inout.readers.ParsedNetlistLine import ParsedNetlistLine
 
@@ -68,6 +69,29 @@ class TSPICENetlistBoostParserInterface(object):
     def __del__(self):
         self.internal_parser.close()
 
+    def set_ranges(self, ranges):
+        """
+        Parses only the (start byte, end byte, first line number) parts of
+        the file, see LibrarySectionIndex.section_ranges
+        """
+        self.internal_parser.set_ranges(ranges)
+
+    def parse_ahead(self, queue_size):
+        """
+        Reads and parses up to queue_size lines of the file ahead on a native
+        thread, while the lines already read are converted
+        """
+        self.internal_parser.parse_ahead(queue_size)
+        self.line_iter = BoostParserInterface.parsed_lines(self.internal_parser)
+
+    def parse_parallel(self, threads, chunk_bytes=BoostParserInterface.PARSE_CHUNK_BYTES):
+        """
+        Parses the file in chunks of about chunk_bytes, split at statement
+        boundaries, on threads native threads
+        """
+        self.internal_parser.parse_parallel(threads, chunk_bytes)
+        self.line_iter = BoostParserInterface.parsed_lines(self.internal_parser)
+
     def __iter__(self):
         return self
 
@@ -84,7 +108,7 @@ class TSPICENetlistBoostParserInterface(object):
         parsed_object_iter = iter(boost_parsed_line.parsed_objects)
 
         for parsedObject in parsed_object_iter:
-            self.convert_next_token(parsedObject, parsed_object_iter, pnl, self._synthesized_pnls, self._pkg_dict)
+            self.convert_next_token(parsedObject, parsed_object_iter, pnl, self._synthesized_pnls)
 
         if boost_parsed_line.error_type == "critical":
             pnl.error_type = boost_parsed_line.error_type
@@ -107,75 +131,97 @@ class TSPICENetlistBoostParserInterface(object):
 
         return pnl
 
-    @staticmethod
-    def convert_next_token(parsed_object, parsed_object_iter, pnl, synthesized_pnls, pkg_dict):
+    def convert_next_token(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        """
+        Takes individual parsed objects from the parsed line object
+
+        The token is converted by the handler for its type in token_handlers
+        """
+        token_handler = self.token_handlers.get(parsed_object.types[0], XyceNetlistBoostParserInterface.convert_other_token)
+        token_handler(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
-        if parsed_object.types[0] == SpiritCommon.data_model_type.PARAM_NAME and pnl.type == ".OPTIONS":
+    def convert_param_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if pnl.type != ".OPTIONS":
+            XyceNetlistBoostParserInterface.convert_param_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
+            return
 
-            # find the adm option name
-            mapped_name = tspice_to_adm_opt_name_map.get(parsed_object.value.upper(), parsed_object.value.upper())
+        # find the adm option name
+        mapped_name = tspice_to_adm_opt_name_map.get(parsed_object.key, parsed_object.key)
 
-            # find all adm packages that use this parameter
-            pkgs = pkg_dict.get(mapped_name.upper())
+        # find all adm packages that use this parameter
+        pkgs = self._pkg_dict.get(mapped_name)
 
-            if pkgs:
-                param_value_parsed_object = next(parsed_object_iter)
+        if pkgs:
+            param_value_parsed_object = next(parsed_object_iter)
 
-                if param_value_parsed_object.types[0] != SpiritCommon.data_model_type.PARAM_VALUE:
-                    logging.error("In file:\"" + pnl.filename + "\" at line:" + str(pnl.linenum) + ". Parser passed wrong token.  Expected PARAM_VALUE.  Got " + str(param_value_parsed_object.types[0]))
-                    raise Exception("Next Token is not a PARAM_VALUE.  Something went wrong!")
+            if param_value_parsed_object.types[0] != SpiritCommon.data_model_type.PARAM_VALUE:
+                logging.error("In file:\"" + pnl.filename + "\" at line:" + str(pnl.linenum) + ". Parser passed wrong token.  Expected PARAM_VALUE.  Got " + str(param_value_parsed_object.types[0]))
+                raise Exception("Next Token is not a PARAM_VALUE.  Something went wrong!")
 
-                pnl.add_known_object(pkgs[0], Types.optionPkgTypeValue)
+            pnl.add_known_object(pkgs[0], Types.optionPkgTypeValue)
 
-                param_value = param_value_parsed_object.value
+            param_value = param_value_parsed_object.value
 
-                # converting .OPTIONS METHOD=DEFAULT to .OPTIONS TIMEINT METHOD=TRAP
-                if mapped_name.upper() == "METHOD" and param_value.upper() == "DEFAULT":
-                    param_value = "TRAP"
+            # converting .OPTIONS METHOD=DEFAULT to .OPTIONS TIMEINT METHOD=TRAP
+            if mapped_name == "METHOD" and param_value.upper() == "DEFAULT":
+                param_value = "TRAP"
 
-                pnl.add_param_value_pair(mapped_name.upper(), param_value)
+            pnl.add_param_value_pair(mapped_name, param_value)
 
-                for otherPkg in pkgs[1:]:
-                    pnl_synth = ParsedNetlistLine(pnl.filename, pnl.linenum)  # what to do with line numbers?
-                    pnl_synth.type = ".OPTIONS"
-                    pnl_synth.add_known_object(otherPkg, Types.optionPkgTypeValue)
-                    pnl_synth.add_param_value_pair(mapped_name.upper(), param_value)
-                    synthesized_pnls.append(pnl_synth)
-            else:
-                logging.warn("In file:\"" + pnl.filename + "\" at line:" + str(pnl.linenum) + ". Could not accept .OPTIONS \"" + mapped_name.upper() + "\". Retained (as a comment). Continuing.")
-                pnl.type = "COMMENT"
-                pnl.name = ".OPTIONS " + mapped_name
-                pnl.add_comment(".OPTIONS " + mapped_name)
+            for otherPkg in pkgs[1:]:
+                pnl_synth = ParsedNetlistLine(pnl.filename, pnl.linenum)  # what to do with line numbers?
+                pnl_synth.type = ".OPTIONS"
+                pnl_synth.add_known_object(otherPkg, Types.optionPkgTypeValue)
+                pnl_synth.add_param_value_pair(mapped_name, param_value)
+                synthesized_pnls.append(pnl_synth)
+        else:
+            logging.warn("In file:\"" + pnl.filename + "\" at line:" + str(pnl.linenum) + ". Could not accept .OPTIONS \"" + mapped_name + "\". Retained (as a comment). Continuing.")
+            pnl.type = "COMMENT"
+            pnl.name = ".OPTIONS " + mapped_name
+            pnl.add_comment(".OPTIONS " + mapped_name)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.DIRECTIVE_NAME and parsed_object.value.upper() == ".LIB":
+    def convert_directive_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if parsed_object.key == ".LIB":
             pnl.type = ".INC"
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.DIRECTIVE_NAME and parsed_object.value == ".PARAM":
+        elif parsed_object.value == ".PARAM":
             pnl.type = ".GLOBAL_PARAM"
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.OUTPUT_VARIABLE:
-
-            # remove [] from PSPICE print variables -- eventually this will be replaced in the writer
-            output_variable_clean = parsed_object.value
-            output_variable_clean = output_variable_clean.replace("[", "")
-            output_variable_clean = output_variable_clean.replace("]", "")
-            output_variable_clean = output_variable_clean.replace("N(", "V(")
-            output_variable_clean = output_variable_clean.replace("N(", "V(")
+        else:
+            XyceNetlistBoostParserInterface.convert_directive_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
-            pnl.add_output_variable_value(output_variable_clean)
+    def convert_output_variable(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        # remove [] from PSPICE print variables -- eventually this will be replaced in the writer
+        output_variable_clean = parsed_object.value
+        output_variable_clean = output_variable_clean.replace("[", "")
+        output_variable_clean = output_variable_clean.replace("]", "")
+        output_variable_clean = output_variable_clean.replace("N(", "V(")
+        output_variable_clean = output_variable_clean.replace("N(", "V(")
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.MODEL_TYPE and pnl.type == ".MODEL":
+        pnl.add_output_variable_value(output_variable_clean)
 
+    def convert_model_type(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if pnl.type == ".MODEL":
             # convert pspice type into the general type supported by the ADM
-            adm_type = tspice_to_adm_model_type_map.get(parsed_object.value.upper())
+            adm_type = tspice_to_adm_model_type_map.get(parsed_object.key)
 
             # if not mapped, then use current value
             if adm_type is None:
-                adm_type = parsed_object.value.upper()
+                adm_type = parsed_object.key
 
             pnl.add_known_object(adm_type, Types.modelType)
         else:
-            XyceNetlistBoostParserInterface.convert_next_token(parsed_object, parsed_object_iter, pnl, synthesized_pnls)
+            XyceNetlistBoostParserInterface.convert_other_token(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
+
+    # handlers by token type, built once for the dialect.  Tokens not
+    # converted the TSPICE way are converted the Xyce way
+    token_handlers = dict(XyceNetlistBoostParserInterface.token_handlers)
+    token_handlers.update({
+        SpiritCommon.data_model_type.PARAM_NAME: convert_param_name,
+        SpiritCommon.data_model_type.DIRECTIVE_NAME: convert_directive_name,
+        SpiritCommon.data_model_type.OUTPUT_VARIABLE: convert_output_variable,
+        SpiritCommon.data_model_type.MODEL_TYPE: convert_model_type,
+    })
 
     @property
     def tnom_defined(self):
@@ -76,7 +76,7 @@ def build_node(parsed_netlist_line, reader_state, language_device_type, props, l
             parsed_netlist_line.linenum) + ". No node type defined in Types: " + label + ", from XML definition")
     node_name = parsed_netlist_line.known_objects.get(node_type)
     if node_name:
-        node = reader_state.scope_index.get_object("__ENODE__" + node_name)
+        node = reader_state.scope_index.get_enode(node_name)
         # check if ground node synonyms are present. 
         # if so, put into parsed netlist line object preprocess directive
         if node_name.lower() in ["gnd", "gnd!", "ground"]:
@@ -92,8 +92,7 @@ def build_node(parsed_netlist_line, reader_state, language_device_type, props, l
             if not "REPLACEGROUND TRUE" in parsed_netlist_line.preprocess_keyword_value and not is_interface_node:
                 parsed_netlist_line.add_preprocess_keyword_value("REPLACEGROUND TRUE")
         if node is None:
-            node = ENODE(node_name, reader_state.scope_index.uid_index.uid)
-            reader_state.scope_index.add(node, case_insensitive=reader_state.is_case_insensitive())
+            node = reader_state.scope_index.add_node(node_name)
         props[node_type] = node
 
 
@@ -301,7 +300,7 @@ def build_value_expression(parsed_netlist_line, reader_state, language_device_ty
 def build_table_expression(parsed_netlist_line, reader_state, language_device_type, props, label, value):
     if Types.table in parsed_netlist_line.known_objects:
         table_expression = build_value_prop(parsed_netlist_line, Types.expression)
-        table_pairs = convert_list_to_list_of_pairs(parsed_netlist_line.table_param_list)
+        table_pairs = POINTS(parsed_netlist_line.table_param_list)
         del parsed_netlist_line.known_objects[Types.table]
         del parsed_netlist_line.known_objects[Types.expression]
         props[Types.tableExpression] = TABLE(table_expression, table_pairs)
@@ -585,10 +584,9 @@ def build_parameters(parsed_netlist_line, props):
 
 
 def build_node_by_value(parsed_netlist_line, node_name, reader_state):
-    node = reader_state.scope_index.get_object("__ENODE__" + node_name)
+    node = reader_state.scope_index.get_enode(node_name)
     if node is None:
-        node = ENODE(node_name, reader_state.scope_index.uid_index.uid)
-        reader_state.scope_index.add(node, case_insensitive=reader_state.is_case_insensitive())
+        node = reader_state.scope_index.add_node(node_name)
     return node
 
 
@@ -60,6 +60,29 @@ class XyceNetlistBoostParserInterface(object):
     def __del__(self):
         self.internal_parser.close()
 
+    def set_ranges(self, ranges):
+        """
+        Parses only the (start byte, end byte, first line number) parts of
+        the file, see LibrarySectionIndex.section_ranges
+        """
+        self.internal_parser.set_ranges(ranges)
+
+    def parse_ahead(self, queue_size):
+        """
+        Reads and parses up to queue_size lines of the file ahead on a native
+        thread, while the lines already read are converted
+        """
+        self.internal_parser.parse_ahead(queue_size)
+        self.line_iter = BoostParserInterface.parsed_lines(self.internal_parser)
+
+    def parse_parallel(self, threads, chunk_bytes=BoostParserInterface.PARSE_CHUNK_BYTES):
+        """
+        Parses the file in chunks of about chunk_bytes, split at statement
+        boundaries, on threads native threads
+        """
+        self.internal_parser.parse_parallel(threads, chunk_bytes)
+        self.line_iter = BoostParserInterface.parsed_lines(self.internal_parser)
+
     def __iter__(self):
         return self
 
@@ -76,198 +99,162 @@ class XyceNetlistBoostParserInterface(object):
 
         return pnl
 
-    @staticmethod
-    def convert_next_token(parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+    def convert_next_token(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
         """
         Takes individual parsed objects from the parsed line object
 
         Populate ParsedNetlistLine class with all information necessary to create a Statement
 
-        Many hacks contained here
+        The token is converted by the handler for its type in token_handlers
         """
+        token_handler = self.token_handlers.get(parsed_object.types[0], XyceNetlistBoostParserInterface.convert_other_token)
+        token_handler(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
+
+    # Token handlers.  All of them take the reader, the parsed object, the
+    # iterator over the rest of the parsed line, the ParsedNetlistLine and the
+    # list of synthesized ParsedNetlistLines.  The readers of the other
+    # dialects use them for the tokens they convert the Xyce way, so they
+    # must not use the state of the reader.
+
+    def convert_directive_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        directive = parsed_object.key
+        pnl.local_type = directive
+        if directive == ".TR":
+            pnl.type = ".TRAN"
+        elif directive == ".INITCOND":
+            pnl.type = ".IC"
+        else:
+            pnl.type = directive
 
-        if parsed_object.types[0] == SpiritCommon.data_model_type.DIRECTIVE_NAME or parsed_object.types[0] == SpiritCommon.data_model_type.DEVICE_TYPE:
-
-            pnl.local_type = parsed_object.value.upper()
-            if parsed_object.value.upper() == ".TR":
-                pnl.type = ".TRAN"
-            elif parsed_object.value.upper() == ".INITCOND":
-                pnl.type = ".IC"
-            else:
-                pnl.type = parsed_object.value.upper()
+    def convert_device_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        pnl.name = parsed_object.value
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.DEVICE_NAME or (
-                parsed_object.types[0] == SpiritCommon.data_model_type.MODEL_NAME and pnl.type == ".MODEL"):
+    def convert_model_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if pnl.type == ".MODEL":
             pnl.name = parsed_object.value
+        else:
+            XyceNetlistBoostParserInterface.convert_other_token(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.PARAM_NAME:
-
-            param_value_parsed_object = next(parsed_object_iter)
-
-            if param_value_parsed_object.types[0] != SpiritCommon.data_model_type.PARAM_VALUE:
-                logging.error(
-                    "Line(s):" + str(pnl.linenum) + ". Parser passed wrong token.  Expected PARAM_VALUE.  Got " + str(
-                        param_value_parsed_object.types[0]))
-                raise Exception("Next Token is not a PARAM_VALUE.  Something went wrong!")
-
-            pnl.add_param_value_pair(parsed_object.value.upper(), param_value_parsed_object.value)
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.STANDALONE_PARAM:
+    def convert_param_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        param_value_parsed_object = next(parsed_object_iter)
 
-            pnl.add_param_value_pair(parsed_object.value.upper(), "1")
+        if param_value_parsed_object.types[0] != SpiritCommon.data_model_type.PARAM_VALUE:
+            logging.error(
+                "Line(s):" + str(pnl.linenum) + ". Parser passed wrong token.  Expected PARAM_VALUE.  Got " + str(
+                    param_value_parsed_object.types[0]))
+            raise Exception("Next Token is not a PARAM_VALUE.  Something went wrong!")
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.MEASURE_PARAM_NAME:
+        pnl.add_param_value_pair(parsed_object.key, param_value_parsed_object.value)
 
-            param_value_parsed_object = next(parsed_object_iter)
+    def convert_standalone_param(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        pnl.add_param_value_pair(parsed_object.key, "1")
 
-            if param_value_parsed_object.types[0] != SpiritCommon.data_model_type.MEASURE_PARAM_VALUE:
-                logging.error(
-                    "Line(s):" + str(pnl.linenum) + ". Parser passed wrong token.  Expected MEASURE_PARAM_VALUE.  Got " + str(
-                        param_value_parsed_object.types[0]))
-                raise Exception("Next Token is not a MEASURE_PARAM_VALUE.  Something went wrong!")
+    def convert_measure_param_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        param_value_parsed_object = next(parsed_object_iter)
 
-            pnl.add_meas_param_value_pair(list(pnl.meas_dict.items())[-1][0], parsed_object.value.upper(), param_value_parsed_object.value)
+        if param_value_parsed_object.types[0] != SpiritCommon.data_model_type.MEASURE_PARAM_VALUE:
+            logging.error(
+                "Line(s):" + str(pnl.linenum) + ". Parser passed wrong token.  Expected MEASURE_PARAM_VALUE.  Got " + str(
+                    param_value_parsed_object.types[0]))
+            raise Exception("Next Token is not a MEASURE_PARAM_VALUE.  Something went wrong!")
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.VARIABLE_EXPR_OR_VALUE:
+        pnl.add_meas_param_value_pair(list(pnl.meas_dict.items())[-1][0], parsed_object.key, param_value_parsed_object.value)
 
-            sentinel = object()
-            param_value_parsed_object = next(parsed_object_iter, sentinel)
-            hasNext = param_value_parsed_object is not sentinel
+    def convert_variable_expr_or_value(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        sentinel = object()
+        param_value_parsed_object = next(parsed_object_iter, sentinel)
+        hasNext = param_value_parsed_object is not sentinel
 
-            if not hasNext:
-                pnl.add_meas_param_value_pair(list(pnl.meas_dict.items())[-1][0], parsed_object.value.upper(), "")
+        if not hasNext:
+            pnl.add_meas_param_value_pair(list(pnl.meas_dict.items())[-1][0], parsed_object.key, "")
 
-            else:
-                if param_value_parsed_object.types[0] == SpiritCommon.data_model_type.VARIABLE_EXPR_OR_VALUE:
-                    pnl.add_meas_param_value_pair(list(pnl.meas_dict.items())[-1][0], parsed_object.value.upper(), param_value_parsed_object.value)
+        else:
+            if param_value_parsed_object.types[0] == SpiritCommon.data_model_type.VARIABLE_EXPR_OR_VALUE:
+                pnl.add_meas_param_value_pair(list(pnl.meas_dict.items())[-1][0], parsed_object.key, param_value_parsed_object.value)
 
-                elif param_value_parsed_object.types[0] == SpiritCommon.data_model_type.MEASURE_PARAM_NAME:
-                    pnl.add_meas_param_value_pair(list(pnl.meas_dict.items())[-1][0], parsed_object.value.upper(), "")
+            elif param_value_parsed_object.types[0] == SpiritCommon.data_model_type.MEASURE_PARAM_NAME:
+                pnl.add_meas_param_value_pair(list(pnl.meas_dict.items())[-1][0], parsed_object.key, "")
 
-                    param_value_parsed_object_2 = next(parsed_object_iter)
+                param_value_parsed_object_2 = next(parsed_object_iter)
 
-                    if param_value_parsed_object_2.types[0] != SpiritCommon.data_model_type.MEASURE_PARAM_VALUE:
-                        logging.error(
-                            "Line(s):" + str(pnl.linenum) + ". Parser passed wrong token.  Expected MEASURE_PARAM_VALUE.  Got " + str(
-                                param_value_parsed_object_2.types[0]))
-                        raise Exception("Next Token is not a MEASURE_PARAM_VALUE.  Something went wrong!")
+                if param_value_parsed_object_2.types[0] != SpiritCommon.data_model_type.MEASURE_PARAM_VALUE:
+                    logging.error(
+                        "Line(s):" + str(pnl.linenum) + ". Parser passed wrong token.  Expected MEASURE_PARAM_VALUE.  Got " + str(
+                            param_value_parsed_object_2.types[0]))
+                    raise Exception("Next Token is not a MEASURE_PARAM_VALUE.  Something went wrong!")
 
-                    pnl.add_meas_param_value_pair(list(pnl.meas_dict.items())[-1][0], param_value_parsed_object.value.upper(), param_value_parsed_object_2.value)
+                pnl.add_meas_param_value_pair(list(pnl.meas_dict.items())[-1][0], param_value_parsed_object.key, param_value_parsed_object_2.value)
 
-                else:
-                    logging.error(
-                        "Line(s):" + str(pnl.linenum) + ". Parser passed wrong token.  Expected VARIABLE_EXPR_OR_VALUE or MEASURE_PARAM_VALUE.  Got " + str(
-                            param_value_parsed_object.types[0]))
-                    raise Exception("Next Token is not a VARIABLE_EXPR_OR_VALUE or MEASURE_PARAM_VALUE.  Something went wrong!")
+            else:
+                logging.error(
+                    "Line(s):" + str(pnl.linenum) + ". Parser passed wrong token.  Expected VARIABLE_EXPR_OR_VALUE or MEASURE_PARAM_VALUE.  Got " + str(
+                        param_value_parsed_object.types[0]))
+                raise Exception("Next Token is not a VARIABLE_EXPR_OR_VALUE or MEASURE_PARAM_VALUE.  Something went wrong!")
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.PARAM_VALUE and pnl.params_dict:
+    def convert_param_value(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if pnl.params_dict:
             last_key = list(pnl.params_dict.keys())[-1]
             prev_param_value = pnl.params_dict[last_key]
             pnl.params_dict[last_key] = prev_param_value+" "+parsed_object.value
+        else:
+            XyceNetlistBoostParserInterface.convert_other_token(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.CONTROL_DEVICE:
-
-            control_dev_name_obj = next(parsed_object_iter)
-
-            if control_dev_name_obj.types[0] != SpiritCommon.data_model_type.CONTROL_DEVICE_NAME:
-                logging.error("Line(s):" + str(
-                    pnl.linenum) + ". Parser passed wrong token.  Expected CONTROL_DEVICE_NAME.  Got " + str(
-                    control_dev_name_obj.types[0]))
-                raise Exception("Next Token is not a CONTROL_DEVICE_NAME.  Something went wrong!")
-
-            pnl.add_control_param_value(parsed_object.value + control_dev_name_obj.value)
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.SWEEP_PARAM_VALUE:
-
-            pnl.add_sweep_param_value(parsed_object.value)
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.SCHEDULE_PARAM_VALUE:
-
-            pnl.add_schedule_param_value(parsed_object.value)
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.LIST_PARAM_VALUE:
-
-            pnl.add_value_to_value_list(parsed_object.value)
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.TABLE_PARAM_VALUE:
-
-            pnl.add_table_param_value(parsed_object.value)
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.POLY_PARAM_VALUE:
-
-            pnl.add_poly_param_value(parsed_object.value)
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.DATA_PARAM_NAME:
-
-            pnl.add_value_to_value_list(parsed_object.value)
-
-            pnl_synth = ParsedNetlistLine(pnl.filename, [pnl.linenum[0]-1])
-            pnl_synth.type = ".GLOBAL_PARAM"
-            pnl_synth.local_type = ".GLOBAL_PARAM"
-
-            pnl_synth.add_param_value_pair(parsed_object.value.upper(), "0")
-            synthesized_pnls.append(pnl_synth)
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.DATA_PARAM_VALUE:
-
-            if not pnl.type:
-                pnl.type = "DATA"
-                pnl.name = parsed_object.value
-            else:
-                pnl.name += " "+parsed_object.value
-
-            pnl.add_value_to_value_list(parsed_object.value)
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.MEASURE_TYPE or parsed_object.types[0] == SpiritCommon.data_model_type.MEASURE_QUALIFIER:
-
-            pnl.add_meas_analysis_condition(parsed_object.value)
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.CONTROL_PARAM_VALUE:
-
-            pnl.add_control_param_value(parsed_object.value)
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.SUBCKT_DIRECTIVE_PARAM_VALUE:
-
-            pnl.add_subckt_directive_param_value(parsed_object.value)
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.SUBCKT_DEVICE_PARAM_VALUE:
+    def convert_control_device(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        control_dev_name_obj = next(parsed_object_iter)
 
-            pnl.add_subckt_device_param_value(parsed_object.value)
+        if control_dev_name_obj.types[0] != SpiritCommon.data_model_type.CONTROL_DEVICE_NAME:
+            logging.error("Line(s):" + str(
+                pnl.linenum) + ". Parser passed wrong token.  Expected CONTROL_DEVICE_NAME.  Got " + str(
+                control_dev_name_obj.types[0]))
+            raise Exception("Next Token is not a CONTROL_DEVICE_NAME.  Something went wrong!")
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.TRANS_REF_NAME:
-            pnl.add_transient_value(parsed_object.value)
+        pnl.add_control_param_value(parsed_object.value + control_dev_name_obj.value)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.OUTPUT_VARIABLE:
-            pnl.add_output_variable_value(parsed_object.value)
+    def convert_data_param_name(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        pnl.add_value_to_value_list(parsed_object.value)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.FUNC_ARG_VALUE:
-            pnl.add_func_arg_value(parsed_object.value)
+        pnl_synth = ParsedNetlistLine(pnl.filename, [pnl.linenum[0]-1])
+        pnl_synth.type = ".GLOBAL_PARAM"
+        pnl_synth.local_type = ".GLOBAL_PARAM"
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.INLINE_COMMENT:
-            pnl.add_inline_comment(parsed_object.value)
+        pnl_synth.add_param_value_pair(parsed_object.key, "0")
+        synthesized_pnls.append(pnl_synth)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.TITLE:
-            pnl.type = "TITLE"
+    def convert_data_param_value(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if not pnl.type:
+            pnl.type = "DATA"
             pnl.name = parsed_object.value
-            pnl.add_comment(parsed_object.value)
-
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.COMMENT:
-            pnl.type = "COMMENT"
-            try:
-                pnl.name = parsed_object.value[1:]
-                pnl.add_comment(parsed_object.value[1:])
-            except UnicodeDecodeError as e:
-                logging.warning("Non-ASCII character detected in the comment within file '" + str(os.path.basename(pnl.filename)) + "' " + "at line number(s) " + str(pnl.linenum) )
-                warning_msg = " Non-ascii character encountered on line " + str(pnl.linenum) +". Omitting... "
-                pnl.name = warning_msg
-                pnl.add_comment(warning_msg)
-
-        elif parsed_object.types[0] in [SpiritCommon.data_model_type.VOLTAGE, parsed_object.types[0] == SpiritCommon.data_model_type.CURRENT] and pnl.type in [".IC", ".DCVOLT", ".NODESET"]:
+        else:
+            pnl.name += " "+parsed_object.value
+
+        pnl.add_value_to_value_list(parsed_object.value)
+
+    def convert_title(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        pnl.type = "TITLE"
+        pnl.name = parsed_object.value
+        pnl.add_comment(parsed_object.value)
+
+    def convert_comment(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        pnl.type = "COMMENT"
+        try:
+            pnl.name = parsed_object.value[1:]
+            pnl.add_comment(parsed_object.value[1:])
+        except UnicodeDecodeError as e:
+            logging.warning("Non-ASCII character detected in the comment within file '" + str(os.path.basename(pnl.filename)) + "' " + "at line number(s) " + str(pnl.linenum) )
+            warning_msg = " Non-ascii character encountered on line " + str(pnl.linenum) +". Omitting... "
+            pnl.name = warning_msg
+            pnl.add_comment(warning_msg)
+
+    def convert_voltage(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if pnl.type in [".IC", ".DCVOLT", ".NODESET"]:
             initial_condition_dict = {}
             initial_condition_dict[Types.voltageOrCurrent] = parsed_object.value
             pnl.initial_conditions_list.append(initial_condition_dict)
+        else:
+            XyceNetlistBoostParserInterface.convert_other_token(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.GENERALNODE and pnl.type in [".IC", ".DCVOLT", ".NODESET"]:
+    def convert_general_node(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if pnl.type in [".IC", ".DCVOLT", ".NODESET"]:
             output_node = parsed_object.value.replace(".", ":")
 
             if not pnl.initial_conditions_list:
@@ -275,7 +262,7 @@ class XyceNetlistBoostParserInterface(object):
                 initial_condition_dict[Types.voltageOrCurrent] = "V"
                 initial_condition_dict[Types.generalNodeName] = output_node
                 pnl.initial_conditions_list.append(initial_condition_dict)
-                
+
             elif Types.generalNodeName in pnl.initial_conditions_list[-1]:
                 initial_condition_dict = {}
                 initial_condition_dict[Types.voltageOrCurrent] = "V"
@@ -284,11 +271,21 @@ class XyceNetlistBoostParserInterface(object):
 
             else:
                 pnl.initial_conditions_list[-1][Types.generalNodeName] = output_node
+        else:
+            XyceNetlistBoostParserInterface.convert_other_token(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
-        elif parsed_object.types[0] == SpiritCommon.data_model_type.GENERAL_VALUE and pnl.type in [".IC", ".DCVOLT", ".NODESET"]:
+    def convert_general_value(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        if pnl.type in [".IC", ".DCVOLT", ".NODESET"]:
             pnl.initial_conditions_list[-1][Types.generalValue] = parsed_object.value
+        else:
+            XyceNetlistBoostParserInterface.convert_other_token(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls)
 
-        elif len(parsed_object.types) == 1:
+    def convert_other_token(self, parsed_object, parsed_object_iter, pnl, synthesized_pnls):
+        """
+        Converts a token that has no handler of its own: a known object if
+        its type is known, else a lazy statement to be resolved later
+        """
+        if len(parsed_object.types) == 1:
             pnl.add_known_object(parsed_object.value, BoostParserInterface.boost_xdm_map_dict[parsed_object.types[0]])
 
             if parsed_object.types[0] == SpiritCommon.data_model_type.TEMPERATURENODE:
@@ -300,7 +297,40 @@ class XyceNetlistBoostParserInterface(object):
                 lst.append(BoostParserInterface.boost_xdm_map_dict[typ])
             pnl.add_lazy_statement(parsed_object.value, lst)
 
-        return
+    # handlers by token type, built once for the dialect
+    token_handlers = {
+        SpiritCommon.data_model_type.DIRECTIVE_NAME: convert_directive_name,
+        SpiritCommon.data_model_type.DEVICE_TYPE: convert_directive_name,
+        SpiritCommon.data_model_type.DEVICE_NAME: convert_device_name,
+        SpiritCommon.data_model_type.MODEL_NAME: convert_model_name,
+        SpiritCommon.data_model_type.PARAM_NAME: convert_param_name,
+        SpiritCommon.data_model_type.STANDALONE_PARAM: convert_standalone_param,
+        SpiritCommon.data_model_type.MEASURE_PARAM_NAME: convert_measure_param_name,
+        SpiritCommon.data_model_type.VARIABLE_EXPR_OR_VALUE: convert_variable_expr_or_value,
+        SpiritCommon.data_model_type.PARAM_VALUE: convert_param_value,
+        SpiritCommon.data_model_type.CONTROL_DEVICE: convert_control_device,
+        SpiritCommon.data_model_type.SWEEP_PARAM_VALUE: BoostParserInterface.value_adder(ParsedNetlistLine.add_sweep_param_value),
+        SpiritCommon.data_model_type.SCHEDULE_PARAM_VALUE: BoostParserInterface.value_adder(ParsedNetlistLine.add_schedule_param_value),
+        SpiritCommon.data_model_type.LIST_PARAM_VALUE: BoostParserInterface.value_adder(ParsedNetlistLine.add_value_to_value_list),
+        SpiritCommon.data_model_type.TABLE_PARAM_VALUE: BoostParserInterface.value_adder(ParsedNetlistLine.add_table_param_value),
+        SpiritCommon.data_model_type.POLY_PARAM_VALUE: BoostParserInterface.value_adder(ParsedNetlistLine.add_poly_param_value),
+        SpiritCommon.data_model_type.DATA_PARAM_NAME: convert_data_param_name,
+        SpiritCommon.data_model_type.DATA_PARAM_VALUE: convert_data_param_value,
+        SpiritCommon.data_model_type.MEASURE_TYPE: BoostParserInterface.value_adder(ParsedNetlistLine.add_meas_analysis_condition),
+        SpiritCommon.data_model_type.MEASURE_QUALIFIER: BoostParserInterface.value_adder(ParsedNetlistLine.add_meas_analysis_condition),
+        SpiritCommon.data_model_type.CONTROL_PARAM_VALUE: BoostParserInterface.value_adder(ParsedNetlistLine.add_control_param_value),
+        SpiritCommon.data_model_type.SUBCKT_DIRECTIVE_PARAM_VALUE: BoostParserInterface.value_adder(ParsedNetlistLine.add_subckt_directive_param_value),
+        SpiritCommon.data_model_type.SUBCKT_DEVICE_PARAM_VALUE: BoostParserInterface.value_adder(ParsedNetlistLine.add_subckt_device_param_value),
+        SpiritCommon.data_model_type.TRANS_REF_NAME: BoostParserInterface.value_adder(ParsedNetlistLine.add_transient_value),
+        SpiritCommon.data_model_type.OUTPUT_VARIABLE: BoostParserInterface.value_adder(ParsedNetlistLine.add_output_variable_value),
+        SpiritCommon.data_model_type.FUNC_ARG_VALUE: BoostParserInterface.value_adder(ParsedNetlistLine.add_func_arg_value),
+        SpiritCommon.data_model_type.INLINE_COMMENT: BoostParserInterface.value_adder(ParsedNetlistLine.add_inline_comment),
+        SpiritCommon.data_model_type.TITLE: convert_title,
+        SpiritCommon.data_model_type.COMMENT: convert_comment,
+        SpiritCommon.data_model_type.VOLTAGE: convert_voltage,
+        SpiritCommon.data_model_type.GENERALNODE: convert_general_node,
+        SpiritCommon.data_model_type.GENERAL_VALUE: convert_general_value,
+    }
 
     @property
     def tnom_defined(self):
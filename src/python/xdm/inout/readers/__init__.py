@@ -21,9 +21,8 @@
 #-------------------------------------------------------------------------
 
 
+# The dialect parser interfaces (xdm.inout.readers.<Dialect>NetlistBoostParserInterface)
+# are not imported here, so that a run only loads the dialects it reads; see
+# xdm.inout.translation.parser_interface.
 from xdm.inout.readers.GenericReaderState                 import GenericReaderState
-from xdm.inout.readers.TSPICENetlistBoostParserInterface  import TSPICENetlistBoostParserInterface
-from xdm.inout.readers.PSPICENetlistBoostParserInterface  import PSPICENetlistBoostParserInterface
-from xdm.inout.readers.SpectreNetlistBoostParserInterface import SpectreNetlistBoostParserInterface
-from xdm.inout.readers.XyceNetlistBoostParserInterface    import XyceNetlistBoostParserInterface
 from xdm.inout.readers.ParsedNetlistLine                  import ParsedNetlistLine
@@ -0,0 +1,255 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+"""
+Translation service over a Unix domain socket.  A long running server keeps
+the language definitions loaded, so a request only pays for reading and
+writing its own netlist.
+
+The protocol is one JSON object per line in each direction.  Requests:
+
+    {"command": "translate", "input_file": ..., "input_format": ..., "dir_out": ...,
+     "auto_translate": ..., "pwl_copy_mode": ..., "pwl_format": ..., "prune": ...,
+     "fold_constant_params": ..., "parse_ahead": ..., "parse_threads": ...}
+    {"command": "query", "input_file": ..., "input_format": ..., "device_type": ...}
+    {"command": "ping"}
+    {"command": "shutdown"}
+
+Every response has "status" (OK, ERRORS or FAILED), "elapsed", the
+"critical"/"errors"/"warnings" counts and the "diagnostics" logged while the
+request ran.  Translate responses add "output_files"; query responses add
+"devices", a [file, line, name, value] list per device.
+"""
+
+
+import json
+import os
+import socket
+import socketserver
+import threading
+
+from xdm import api
+from xdm.inout.batch import STATUS_OK, STATUS_FAILED
+from xdm.inout.translation import INPUT_FORMATS
+
+
+class TranslationRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Answers the requests of one client connection, one per line, until the
+    client closes it
+    """
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line.decode('utf-8'))
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+            except ValueError as e:
+                response = _failure("bad request: " + str(e))
+            else:
+                response = self.server.handle_request_dict(request)
+            self.wfile.write((json.dumps(response) + "\n").encode('utf-8'))
+            self.wfile.flush()
+
+
+def _failure(message):
+    return {"status": STATUS_FAILED, "elapsed": 0.0, "critical": 0, "errors": 0, "warnings": 0,
+            "diagnostics": [{"level": "CRITICAL", "message": message}]}
+
+
+class TranslationServer(socketserver.UnixStreamServer):
+    """
+    Serves translate and query requests on a Unix domain socket.  Requests
+    are run one at a time, since translations share the process wide logging.
+
+    Member variables:
+        languages (LanguageDefinitions): Language definition cache, kept for
+           the life of the server
+        xdm_version (str): Version written into the output file headers
+        parse_cache (ParseCache): Cache of parsed include and library files,
+           or None
+        defaults (dict): Request fields used when a request leaves them out
+    """
+
+    def __init__(self, socket_path, languages, xdm_version, parse_cache=None, **defaults):
+        self.languages = languages
+        self.xdm_version = xdm_version
+        self.parse_cache = parse_cache
+        self.defaults = {"input_format": "pspice", "dir_out": "default_dir", "output_format": "xyce",
+                         "auto_translate": False, "pwl_copy_mode": "copy", "pwl_format": "keep",
+                         "device_type": "ALL", "prune": False,
+                         "fold_constant_params": False, "parse_ahead": 0, "parse_threads": 1}
+        self.defaults.update(defaults)
+
+        _remove_stale_socket(socket_path)
+        socketserver.UnixStreamServer.__init__(self, socket_path, TranslationRequestHandler)
+        os.chmod(socket_path, 0o600)
+
+    def preload(self, dialects=None):
+        """
+        Reads the language definitions of dialects, by default all of them,
+        before the first request needs them
+        """
+        self.languages.preload(dialects or INPUT_FORMATS)
+
+    def server_close(self):
+        socketserver.UnixStreamServer.server_close(self)
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+
+    def handle_request_dict(self, request):
+        command = request.get("command")
+        if command == "ping":
+            return {"status": STATUS_OK, "elapsed": 0.0, "critical": 0, "errors": 0, "warnings": 0,
+                    "diagnostics": [], "xdm_version": self.xdm_version}
+        if command == "shutdown":
+            threading.Thread(target=self.shutdown).start()
+            return {"status": STATUS_OK, "elapsed": 0.0, "critical": 0, "errors": 0, "warnings": 0,
+                    "diagnostics": []}
+        if command not in ("translate", "query"):
+            return _failure("unknown command: " + str(command))
+
+        fields = dict(self.defaults)
+        fields.update(request)
+        if fields.get("input_file") is None:
+            return _failure("no input_file given")
+
+        try:
+            if command == "translate":
+                result = api.translate(fields["input_file"], fields["input_format"], fields["dir_out"],
+                                       output_format=fields["output_format"], languages=self.languages,
+                                       auto_translate=fields["auto_translate"], xdm_version=self.xdm_version,
+                                       pwl_copy_mode=fields["pwl_copy_mode"], pwl_format=fields["pwl_format"],
+                                       pwl_search_dirs=[self.languages.schema_dir],
+                                       parse_cache=self.parse_cache, prune=fields["prune"],
+                                       fold_constant_params=fields["fold_constant_params"],
+                                       parse_ahead=fields["parse_ahead"],
+                                       parse_threads=fields["parse_threads"])
+                response = {"output_files": result.output_files}
+            else:
+                result = api.query_devices(fields["input_file"], fields["input_format"], fields["device_type"],
+                                           languages=self.languages, auto_translate=fields["auto_translate"],
+                                           parse_cache=self.parse_cache)
+                response = {"devices": [list(device) for device in result.devices]}
+        except ValueError as e:
+            return _failure(str(e))
+
+        response.update({"status": result.status, "elapsed": result.elapsed, "critical": result.critical,
+                         "errors": result.errors, "warnings": result.warnings,
+                         "diagnostics": result.diagnostics})
+        return response
+
+
+def _remove_stale_socket(socket_path):
+    """
+    Removes a socket file left behind by a server that is no longer running.
+    Raises IOError if a server is still listening on it.
+    """
+    if not os.path.exists(socket_path):
+        return
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except socket.error:
+        os.remove(socket_path)
+    else:
+        raise IOError("an xdm server is already listening on " + socket_path)
+    finally:
+        probe.close()
+
+
+class TranslationClient(object):
+    """
+    Client for a TranslationServer.  The connection is opened on the first
+    request and reused until close().
+
+    Member variables:
+        socket_path (str): Socket the server listens on
+        timeout (float): Seconds to wait for a response, None to wait forever
+    """
+
+    def __init__(self, socket_path, timeout=None):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._sock = None
+        self._rfile = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    def close(self):
+        if self._sock is not None:
+            self._rfile.close()
+            self._sock.close()
+            self._sock = None
+            self._rfile = None
+
+    def request(self, command, **fields):
+        """
+        Sends one request and returns the decoded response
+        """
+        if self._sock is None:
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._sock.settimeout(self.timeout)
+            self._sock.connect(self.socket_path)
+            self._rfile = self._sock.makefile('rb')
+
+        fields["command"] = command
+        self._sock.sendall((json.dumps(fields) + "\n").encode('utf-8'))
+        line = self._rfile.readline()
+        if not line:
+            self.close()
+            raise IOError("xdm server closed the connection")
+        return json.loads(line.decode('utf-8'))
+
+    def translate(self, input_file, input_format=None, dir_out=None, **options):
+        """
+        Translates input_file on the server.  Paths are made absolute, since
+        the server may run in a different directory.
+        """
+        fields = dict(options, input_file=os.path.abspath(input_file))
+        if input_format is not None:
+            fields["input_format"] = input_format
+        if dir_out is not None:
+            fields["dir_out"] = os.path.abspath(dir_out)
+        return self.request("translate", **fields)
+
+    def query(self, input_file, input_format=None, device_type="ALL", **options):
+        fields = dict(options, input_file=os.path.abspath(input_file), device_type=device_type)
+        if input_format is not None:
+            fields["input_format"] = input_format
+        return self.request("query", **fields)
+
+    def ping(self):
+        return self.request("ping")
+
+    def shutdown(self):
+        return self.request("shutdown")
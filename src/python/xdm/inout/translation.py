@@ -0,0 +1,351 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+import importlib
+import logging
+import os
+
+from xdm.index.COMMANDS_INDEX import COMMANDS_INDEX
+from xdm.index.DEVICES_INDEX import DEVICES_INDEX
+from xdm.index.SRC_LINE_INDEX import SRC_LINE_INDEX
+from xdm.inout.readers.GenericReader import GenericReader
+from xdm.inout.readers.ParseCache import ParseCache, DEFAULT_MAX_BYTES
+from xdm.inout.writers.emission import write_files
+from xdm.inout.writers.param_folding import fold_params
+from xdm.inout.writers.pruning import prune_unreachable, format_report, PRUNE_REPORT
+from xdm.inout.writers.pwl_relocation import relocate_pwl_files, read_pwl_files
+from xdm.inout.xml import read_xml_factory
+
+INPUT_FORMATS = ['hspice', 'tspice', 'pspice', 'spectre', 'xyce']
+OUTPUT_FORMATS = ['xyce']
+
+# parser interface class of each input format, in xdm.inout.readers.  They are
+# imported by parser_interface the first time a format is read.
+file_types = {
+    'xyce': 'XyceNetlistBoostParserInterface',
+    'pspice': 'PSPICENetlistBoostParserInterface',
+    'hspice': 'HSPICENetlistBoostParserInterface',
+    'tspice': 'TSPICENetlistBoostParserInterface',
+    'spectre': 'SpectreNetlistBoostParserInterface'
+}
+
+origin_combine_off_dict = {
+    'xyce': False,
+    'pspice': False,
+    'hspice': False,
+    'tspice': False,
+    'spectre': True
+}
+
+# input formats whose device names are written with the device type prepended
+append_list = ['spectre']
+
+
+def parser_interface(input_format):
+    """
+    Returns the parser interface class for input_format, importing its
+    module on first use
+    """
+    class_name = file_types[input_format.lower()]
+    module = importlib.import_module('xdm.inout.readers.' + class_name)
+    return getattr(module, class_name)
+
+
+class LanguageDefinitions(object):
+    """
+    Loads the XML language definition of each dialect the first time it is
+    asked for, and keeps it for the rest of the process.  Several
+    translations in one process, or batch workers forked from it, share the
+    one copy instead of parsing the XML file again.
+
+    Member variables:
+        schema_dir (str): Directory holding <dialect>.xml
+    """
+
+    def __init__(self, schema_dir):
+        self.schema_dir = schema_dir
+        self._factories = {}
+
+    def xml_file(self, dialect):
+        return os.path.join(self.schema_dir, dialect + ".xml")
+
+    def factory(self, dialect):
+        """
+        Returns the XmlFactory for dialect, reading its XML file on first use
+        """
+        factory = self._factories.get(dialect)
+        if factory is None:
+            factory = read_xml_factory(self.xml_file(dialect))
+            self._factories[dialect] = factory
+        return factory
+
+    def get(self, dialect):
+        return self.factory(dialect).language_definition
+
+    def preload(self, dialects):
+        for dialect in dialects:
+            self.factory(dialect)
+
+
+def open_parse_cache(cache_dir, languages, xdm_version, max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Opens the shared cache of parsed include and library files in cache_dir.
+    Entries are only used by runs with the same XDM version and XML language
+    definitions.  Returns None, after a warning, for a directory that other
+    users can write, see ParseCache.
+    """
+    try:
+        return ParseCache(cache_dir, xdm_version, [languages.xml_file(dialect) for dialect in INPUT_FORMATS],
+                          max_bytes=max_bytes)
+    except ValueError as e:
+        logging.warning("Not using the parse cache: " + str(e))
+        return None
+
+
+def open_reader(input_file, input_format, languages, auto_translate=False, parse_cache=None,
+                lib_sections_only=False, parse_ahead=0, parse_threads=1):
+    """
+    Creates the GenericReader for a top level netlist.
+
+    Args:
+       input_file (str): Top level netlist
+       input_format (str): One of INPUT_FORMATS
+       languages (LanguageDefinitions): Language definition cache
+       auto_translate (bool): Translate include and library files too
+       parse_cache (ParseCache): Cache of parsed include and library files,
+          see open_parse_cache
+       lib_sections_only (bool): Parse only the requested sections of the
+          library files, for when the other sections are not written
+       parse_ahead (int): Lines of each file read and parsed ahead on a
+          native thread while the lines before them are processed, 0 to
+          read them as they are needed
+       parse_threads (int): Native threads parsing each file in chunks
+          split at statement boundaries, 1 to parse it in one piece
+
+    Returns:
+       GenericReader, or None if the file could not be opened
+    """
+    try:
+        return GenericReader(input_file,
+                             parser_interface(input_format),
+                             languages.get(input_format),
+                             languages.xml_file('pspice'), languages.xml_file('spectre'),
+                             languages.xml_file('tspice'), languages.xml_file('hspice'),
+                             append_prefix=input_format in append_list,
+                             auto_translate=auto_translate,
+                             parse_cache=parse_cache,
+                             lib_sections_only=lib_sections_only,
+                             parse_ahead=parse_ahead,
+                             parse_threads=parse_threads)
+    except IOError:
+        logging.critical('ERROR: Input file ' + input_file + ' was not found. Aborting.')
+        return None
+
+
+def translate_netlist(input_file, input_format, dir_out, languages, xdm_version, output_format='xyce',
+                      auto_translate=False, pwl_copy_mode='copy', pwl_format='keep', pwl_copy_threads=None,
+                      pwl_search_dirs=None, outputs=None, parse_cache=None, write_workers=1, prune=False,
+                      fold_constant_params=False, parse_ahead=0, parse_threads=1):
+    """
+    Translates a netlist, and the files it includes, into dir_out, then
+    relocates the PWL files it references.  Problems are reported through
+    logging, as for a command line run.
+
+    Args:
+       input_file (str): Top level netlist
+       input_format (str): One of INPUT_FORMATS
+       dir_out (str): Output directory, created if needed
+       languages (LanguageDefinitions): Language definition cache
+       xdm_version (str): Version written into the output file headers
+       output_format (str): One of OUTPUT_FORMATS
+       auto_translate (bool): Translate include and library files too
+       pwl_copy_mode, pwl_format, pwl_copy_threads: see relocate_pwl_files
+       pwl_search_dirs (list): Directories searched for PWL files before the
+          directory of input_file
+       outputs (dict): If given, nothing is written to the file system.  The
+          translated files are stored in it by path (dir_out joined with the
+          file name) and the PWL files by file name, all as bytes
+       parse_cache (ParseCache): Cache of parsed include and library files
+       write_workers (int): Processes writing the translated files, see
+          write_files
+       prune (bool): Leave out the .MODEL, .SUBCKT and .LIB section
+          definitions the netlist does not use, and list them in
+          PRUNE_REPORT in dir_out
+       fold_constant_params (bool): Write the .PARAM and .GLOBAL_PARAM
+          values that are constants as numbers, see fold_params
+       parse_ahead (int): Lines read and parsed ahead, see open_reader
+       parse_threads (int): Threads parsing each file, see open_reader
+
+    Returns:
+       list. Paths of the translated files written
+    """
+    # the library sections not selected are pruned, so they need not be parsed
+    reader = open_reader(input_file, input_format, languages, auto_translate, parse_cache, lib_sections_only=prune,
+                         parse_ahead=parse_ahead, parse_threads=parse_threads)
+    if reader is None:
+        return []
+
+    sli = SRC_LINE_INDEX()
+    reader.name_scope_index.add_index(sli)
+    reader.name_scope_index.add_index(DEVICES_INDEX())
+    reader.name_scope_index.add_index(COMMANDS_INDEX())
+    reader.read()
+
+    if outputs is None and not os.path.isdir(dir_out):
+        os.makedirs(dir_out)
+
+    if fold_constant_params:
+        fold_params(reader.name_scope_index, "spectre" if input_format == "spectre" else "hspice",
+                    languages.get(input_format).is_case_insensitive())
+
+    files = [(fl, objs) for fl, objs in sli if fl]
+    if prune:
+        files, pruned = prune_unreachable(files, reader.reader_state.skipped_lib_sections)
+        write_prune_report(pruned, os.path.join(dir_out, PRUNE_REPORT), outputs)
+
+    written = write_files(files, dir_out, languages.factory(output_format),
+                          languages.get(input_format), xdm_version, languages.xml_file(input_format),
+                          languages.xml_file(output_format), combine_off=origin_combine_off_dict[input_format],
+                          outputs=outputs, workers=write_workers)
+
+    files_to_copy = reader.reader_state.pwl_files
+    if files_to_copy:
+        search_dirs = list(pwl_search_dirs or []) + [os.path.dirname(input_file)]
+        if outputs is None:
+            relocate_pwl_files(files_to_copy, search_dirs, dir_out, mode=pwl_copy_mode,
+                               pwl_format=pwl_format, workers=pwl_copy_threads)
+        else:
+            outputs.update(read_pwl_files(files_to_copy, search_dirs, pwl_format=pwl_format))
+
+    return written
+
+
+def write_prune_report(pruned, report_file, outputs=None):
+    """
+    Writes the list of pruned definitions, see prune_unreachable, and logs
+    how many there were
+    """
+    report = format_report(pruned).encode('utf-8')
+    if outputs is None:
+        with open(report_file, 'wb') as f:
+            f.write(report)
+    else:
+        outputs[report_file] = report
+
+    counts = {}
+    for definition in pruned:
+        counts[definition.kind] = counts.get(definition.kind, 0) + 1
+    logging.info("Pruned %d unused .MODEL, %d .SUBCKT and %d .LIB section definitions, listed in %s"
+                 % (counts.get(".MODEL", 0), counts.get(".SUBCKT", 0), counts.get(".LIB", 0), report_file))
+
+
+def get_value(current_device):
+    """
+    Returns the value reported for a device by a SAW device query
+    """
+    device_type = current_device.device_type
+    if device_type == 'R':
+        return current_device.get_param('R')
+    elif device_type == 'C':
+        return current_device.get_param('C')
+    elif device_type == 'L':
+        return current_device.get_param('L')
+    elif device_type == 'X':
+        return current_device.get_prop('SUBCIRCUITNAME_VALUE').name
+    elif device_type == 'D' or device_type == 'Q':
+        if hasattr(current_device.model, 'name'):
+            return current_device.model.name
+        elif len(current_device.lazy_statements) > 0:
+            return current_device.lazy_statements.keys()[0]  # help me
+        else:
+            return 'Unknown'
+    elif device_type == 'V':
+        if 'DC_VALUE' in current_device.props:
+            return current_device.get_prop('DC_VALUE').dc_value
+        elif 'TRANSIENT' in current_device.props and 'I2' in \
+                current_device.get_prop('TRANSIENT').trans_params:
+            return current_device.get_prop('TRANSIENT').trans_params['I2']
+        else:
+            return 'Unknown'
+    elif hasattr(current_device.model, 'get_name'):
+        return current_device.model.name
+    else:
+        return 'Unknown'
+
+
+def query_devices(input_file, input_format, languages, device_type='ALL', auto_translate=False, parse_cache=None):
+    """
+    Reads a netlist and lists its devices of one type, for the SAW device
+    query.  Devices are grouped by device type in order of first appearance,
+    and sorted by line number within each group, so the output order does not
+    depend on index ordering (see issues #157 and #139 on XDM gitlab).
+
+    Args:
+       input_file (str): Top level netlist
+       input_format (str): One of INPUT_FORMATS
+       languages (LanguageDefinitions): Language definition cache
+       device_type (str): Device letter, or 'ALL'
+       auto_translate (bool): Read include and library files too
+       parse_cache (ParseCache): Cache of parsed include and library files
+
+    Returns:
+       list. (file name, line number, device name, value) per device
+    """
+    sli = SRC_LINE_INDEX()
+    dev_index = DEVICES_INDEX()
+
+    reader = open_reader(input_file, input_format, languages, auto_translate, parse_cache)
+    if reader is not None:
+        reader.name_scope_index.add_index(sli)
+        reader.name_scope_index.add_index(dev_index)
+        reader.read()
+
+    if device_type == "ALL":
+        devices = [item for sublist in dev_index.statement_dict.values()
+                   for item in sublist]
+    else:
+        devices = dev_index.get_statements(device_type)
+
+    device_types = []
+    grouped = []
+    for device in devices:
+        if device.device_type not in device_types:
+            device_types.append(device.device_type)
+            grouped.append([])
+        grouped[device_types.index(device.device_type)].append(
+            (os.path.basename(device.file), device.line_num[0],
+             device.device_type + device.get_prop('MY_NAME'), get_value(device)))
+
+    rows = []
+    for group in grouped:
+        rows.extend(sorted(group, key=lambda row: (row[1], format_query_row(row))))
+    return rows
+
+
+def format_query_row(row):
+    """
+    Formats a query_devices row the way the SAW environment reads it
+    """
+    file_name, line_num, name, value = row
+    return file_name + ' ,\t' + str(line_num) + ' ,\t' + name + ' ,\t' + value
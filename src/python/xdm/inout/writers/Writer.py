@@ -21,12 +21,14 @@
 #-------------------------------------------------------------------------
 
 from copy import deepcopy
+import io
 import logging
 import ntpath
 import os
 
 from xdm import Types
 from xdm.exceptions import NotImplementedException
+from xdm.inout.readers.CompressedInput import output_file_name
 from xdm.inout.writers.writer_utils import *
 from xdm.inout.xml import XmlFactory, XmlDeviceToken
 from xdm.statements import Statement
@@ -75,14 +77,20 @@ class Writer(object):
         XyceRESISTOR) and an error will get written to the Logger.
     """
 
-    def __init__(self, dir_name, xml_lang_file, input_language_definition, log=None, combine_off=False):
+    def __init__(self, dir_name, xml_lang_file, input_language_definition, log=None, combine_off=False,
+                 outputs=None):
         """
         Args:
            dir_name (str): Output dir (full path)
 
-           xml_lang_file (str): Full path to XML file defining the output language
+           xml_lang_file (str): Full path to XML file defining the output language, or
+              an XmlFactory that has already read it
+
+           outputs (dict): If given, translated files are stored in it (path -> bytes)
+              instead of being written to dir_name
         """
         self._cur_file_path = None
+        self._outputs = outputs
 
         if isinstance(dir_name, str):
             self._dir_name = dir_name
@@ -92,7 +100,10 @@ class Writer(object):
             self._f = dir_name
         self.log = log
 
-        self._output_language_factory = XmlFactory(xml_lang_file)
+        if isinstance(xml_lang_file, XmlFactory):
+            self._output_language_factory = xml_lang_file
+        else:
+            self._output_language_factory = XmlFactory(xml_lang_file)
         self._output_language = self._output_language_factory.language_definition
         self._input_language_factory = input_language_definition
         self._input_language = input_language_definition
@@ -117,7 +128,8 @@ class Writer(object):
         return self._options_list_aggregate
 
     def _construct_map_dict(self):
-        self._output_language_factory.read()
+        if self._output_language_factory.language_definition is None:
+            self._output_language_factory.read()
         self._output_language = self._output_language_factory.language_definition
 
         self._device_dict = {}
@@ -186,18 +198,18 @@ class Writer(object):
 
         """
         # Update files if new file and we know directory
-        if (self._cur_file_path is None or not ntpath.basename(self._cur_file_path) == ntpath.basename(ws.file)) and self._dir_name is not None:
+        if (self._cur_file_path is None or not ntpath.basename(self._cur_file_path) == output_file_name(ntpath.basename(ws.file))) and self._dir_name is not None:
 
             if ws.file is None or 1 > len(ws.file):
                 logging.error('Object at ' + ws.line_num[0] + ' : ' + ws + ' has no file attributed.')
                 raise Exception('*****FATAL ERROR*****')
 
             # Reset file paths
-            self._cur_file_path = os.path.join(self._dir_name, ntpath.basename(ws.file))
+            self._cur_file_path = self._output_path(ws.file)
 
             # print "RRL debug: Writer:136 self._cur_file_path opened for wb = " + self._cur_file_path + ", ws.get_file = " + ws.file
 
-            self._f = open(self._cur_file_path, 'wb')
+            self._f = self._open_output(self._cur_file_path)
 
             self.write_version(xdm_version, from_version, to_version)
             # Reset file line
@@ -540,7 +552,7 @@ class Writer(object):
                 print_directive.add_param("FILE", print_aggregate_file[1])
             print_directive.set_prop(Types.outputVariableList, self.clean_output_variable_list(self._output_variable_list_aggregate[print_aggregate_file], to_version, self._final_line_num[print_aggregate_file]))
 
-            self._cur_file_path = os.path.join(self._dir_name, ntpath.basename(print_aggregate_file[0]))
+            self._cur_file_path = self._output_path(print_aggregate_file[0])
 
             directive_writer = self._directive_writer[".PRINT"]
 
@@ -550,24 +562,24 @@ class Writer(object):
 
             return_string = return_string.encode('utf-8')
 
-            with open(self._cur_file_path, 'rb') as original_file:
+            original_lines = self._read_output_lines(self._cur_file_path)
+            original_lines.insert(self._output_variable_list_line, return_string + "\n".encode('utf-8'))
 
-                original_lines = original_file.readlines()
-                original_lines.insert(self._output_variable_list_line, return_string + "\n".encode('utf-8'))
+            # NOTE: the code in the comments should be logging.warning, if it's ever uncommented
+            # TODO: remove the commented out code below once it's deemed not helpful/informational
+            # superseded by bug fix for Bugzilla 2023
+            # if "XYCE" in to_version.upper() and "*" in return_string:
+            #     logging.warn("Writing line that will not work in Xyce. Output line " + str(self._output_variable_list_line + 1))
+            #     logging.warn("File: " + str(self._cur_file_path))
+            #     logging.warn("Line text: " + return_string)
 
-                # NOTE: the code in the comments should be logging.warning, if it's ever uncommented
-                # TODO: remove the commented out code below once it's deemed not helpful/informational
-                # superseded by bug fix for Bugzilla 2023
-                # if "XYCE" in to_version.upper() and "*" in return_string:
-                #     logging.warn("Writing line that will not work in Xyce. Output line " + str(self._output_variable_list_line + 1))
-                #     logging.warn("File: " + str(self._cur_file_path))
-                #     logging.warn("Line text: " + return_string)
-
-            with open(self._cur_file_path, 'wb') as altered_file:
-                altered_file.writelines(original_lines)
+            self._write_output_lines(self._cur_file_path, original_lines)
 
     def clean_output_variable_list(self, in_list, to_version, line_num):
         out_list = []
+        # lower case of the output variables in out_list
+        seen = set()
+        is_hspice = self.input_language.language == "hspice"
 
         # Iterate through list of output variables and the line numbers they appear on,
         # ex., "('v(x1.a1)', [18])"
@@ -575,7 +587,6 @@ class Writer(object):
             # Check if * is in an delimited expression. If it is in delimited expression, it's allowed.
             # If not, it is a wildcard and not allowed.
             is_expression = self._is_expression(item[0])
-            is_hspice = self.input_language.language == "hspice"
 
 
             if not is_expression:
@@ -612,7 +623,9 @@ class Writer(object):
 
 
             # Remove any duplicate output variables
-            if item[0].lower() not in (x.lower() for x in out_list):
+            key = item[0].lower()
+            if key not in seen:
+                seen.add(key)
                 out_list.append(item[0])
 
         if "xyce.xml" in to_version and not out_list:
@@ -637,7 +650,7 @@ class Writer(object):
                 logging.error('During combine_options : Object at ' + str(self._options_last_line_num) + ' has no file attributed.')
                 raise Exception('*****FATAL ERROR*****')
 
-            self._cur_file_path = os.path.join(self._dir_name, ntpath.basename(self._options_last_file))
+            self._cur_file_path = self._output_path(self._options_last_file)
 
             directive_writer = self._directive_writer[".OPTIONS"]
 
@@ -647,19 +660,15 @@ class Writer(object):
             return_string = return_string.encode('utf-8')
             lines_to_add.append(return_string)
 
-        with open(self._cur_file_path, 'rb') as original_file:
-
-            original_lines = original_file.readlines()
-            original_lines[self._options_last_line_num:self._options_last_line_num] = lines_to_add
+        original_lines = self._read_output_lines(self._cur_file_path)
+        original_lines[self._options_last_line_num:self._options_last_line_num] = lines_to_add
 
-
-        with open(self._cur_file_path, 'wb') as altered_file:
-            altered_file.writelines(original_lines)
+        self._write_output_lines(self._cur_file_path, original_lines)
 
     def combine_temperatures(self, to_version):
         for aggregate_file in self._temperature_list_aggregate:
 
-            self._cur_file_path = os.path.join(self._dir_name, ntpath.basename(aggregate_file[0]))
+            self._cur_file_path = self._output_path(aggregate_file[0])
 
             # If no temperature present, special variable TEMP is used,  and the output language is Xyce,
             # use special processing for single output .STEP statement
@@ -733,16 +742,36 @@ class Writer(object):
 
             return_string = return_string.encode('utf-8')
 
-            with open(self._cur_file_path, 'rb') as original_file:
-
-                original_lines = original_file.readlines()
-                original_lines.insert(self._temperature_final_line_num[aggregate_file], return_string + "\n".encode('utf-8'))
+            original_lines = self._read_output_lines(self._cur_file_path)
+            original_lines.insert(self._temperature_final_line_num[aggregate_file], return_string + "\n".encode('utf-8'))
 
-            with open(self._cur_file_path, 'wb') as altered_file:
-                altered_file.writelines(original_lines)
+            self._write_output_lines(self._cur_file_path, original_lines)
 
             return
 
+    def _output_path(self, file_name):
+        return os.path.join(self._dir_name, output_file_name(ntpath.basename(file_name)))
+
+    def _open_output(self, file_path):
+        if self._f is not None:
+            self._f.close()
+        if self._outputs is None:
+            return open(file_path, 'wb')
+        return _MemoryOutputFile(self._outputs, file_path)
+
+    def _read_output_lines(self, file_path):
+        if self._outputs is None:
+            with open(file_path, 'rb') as original_file:
+                return original_file.readlines()
+        return io.BytesIO(self._outputs[file_path]).readlines()
+
+    def _write_output_lines(self, file_path, lines):
+        if self._outputs is None:
+            with open(file_path, 'wb') as altered_file:
+                altered_file.writelines(lines)
+        else:
+            self._outputs[file_path] = b"".join(lines)
+
     def write_objects(self, wss, xdm_version, from_version, to_version):
         """ Writes a list of WritableStatements to the file.
         Typically, we would create a writer (say XyceWriter),
@@ -886,3 +915,20 @@ class Writer(object):
                     return_string += r + ' '
 
         return return_string
+
+
+class _MemoryOutputFile(io.BytesIO):
+    """
+    In-memory output file of a Writer; stores its contents in outputs when
+    it is closed
+    """
+
+    def __init__(self, outputs, file_path):
+        io.BytesIO.__init__(self)
+        self._outputs = outputs
+        self._file_path = file_path
+
+    def close(self):
+        if not self.closed:
+            self._outputs[self._file_path] = self.getvalue()
+        io.BytesIO.close(self)
@@ -0,0 +1,166 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+"""
+Write phase of a translation: one Writer per translated source file.
+
+Once the reader has bound every statement, the files are independent of
+each other (the .PRINT/.OPTIONS/.TEMP aggregation is kept per Writer), so
+they can be written by a pool of forked worker processes that share the
+data model read by the parent.  Each worker records what it logs, and the
+parent logs it again file by file, in source order, so the output files and
+the diagnostics are the same as for a sequential write.
+"""
+
+
+import logging
+import multiprocessing
+import os
+
+from xdm.inout.readers.CompressedInput import output_file_name
+from xdm.inout.writers.Writer import Writer
+
+# fewer files than this are written in the calling process, as starting the
+# pool would cost more than it saves
+PARALLEL_MIN_FILES = 8
+
+_worker_state = {}
+
+
+class _LogRecorder(logging.Handler):
+    """
+    Collects what a worker logs while it writes one file
+    """
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append((record.levelname.lower(), record.getMessage()))
+
+
+def _write_file(file_name, statements, settings, outputs):
+    """
+    Writes the statements of one source file, returns the output path
+    """
+    writer = Writer(settings['dir_out'], settings['output_factory'], settings['input_language'],
+                    combine_off=settings['combine_off'], outputs=outputs)
+    writer.write_objects(statements, settings['xdm_version'], settings['from_version'], settings['to_version'])
+    return os.path.join(settings['dir_out'], output_file_name(os.path.basename(file_name)))
+
+
+def _init_worker():
+    # what a worker logs goes to the parent instead of the inherited handlers
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    recorder = _LogRecorder()
+    root_logger.addHandler(recorder)
+    # record the info messages even below the parent's level: the parent
+    # counts every call when it logs them again, and drops what its level
+    # does not show
+    root_logger.setLevel(min(root_logger.getEffectiveLevel(), logging.INFO))
+    _worker_state['recorder'] = recorder
+
+
+def _run_worker_file(index):
+    """
+    Writes file index of the shared file list.  Returns (messages logged,
+    in-memory outputs or None, exception or None)
+    """
+    recorder = _worker_state['recorder']
+    recorder.messages = []
+    settings = _worker_state['settings']
+    file_name, statements = _worker_state['files'][index]
+    outputs = {} if settings['in_memory'] else None
+    try:
+        _write_file(file_name, statements, settings, outputs)
+    except Exception as e:
+        return recorder.messages, outputs, e
+    return recorder.messages, outputs, None
+
+
+def _replay(messages):
+    for level, message in messages:
+        getattr(logging, level, logging.warning)(message)
+
+
+def write_files(files, dir_out, output_factory, input_language, xdm_version, from_version, to_version,
+                combine_off=False, outputs=None, workers=1):
+    """
+    Writes the translated source files.
+
+    Args:
+       files (list): (source file name, statements) per file, in the order
+          they are written
+       dir_out (str): Output directory
+       output_factory (XmlFactory): Output language
+       input_language (LanguageDefinition): Input language
+       xdm_version (str): Version written into the output file headers
+       from_version, to_version (str): XML definitions named in the headers
+       combine_off (bool): See Writer
+       outputs (dict): If given, the files are stored in it instead of being
+          written, see translate_netlist
+       workers (int): Number of worker processes, None for the number of
+          CPUs.  Files are written in this process with 1, with fewer than
+          PARALLEL_MIN_FILES files, inside a daemonic process such as a
+          --batch worker, or where processes can not be forked
+
+    Returns:
+       list. Paths of the translated files, in the order of files
+    """
+    settings = {'dir_out': dir_out, 'output_factory': output_factory, 'input_language': input_language,
+                'combine_off': combine_off, 'xdm_version': xdm_version, 'from_version': from_version,
+                'to_version': to_version, 'in_memory': outputs is not None}
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(files)))
+    if (workers == 1 or len(files) < PARALLEL_MIN_FILES or multiprocessing.current_process().daemon or
+            'fork' not in multiprocessing.get_all_start_methods()):
+        return [_write_file(file_name, statements, settings, outputs) for file_name, statements in files]
+
+    # the workers are forked, so they share the data model instead of pickling it
+    _worker_state['files'] = files
+    _worker_state['settings'] = settings
+    pool = multiprocessing.get_context('fork').Pool(workers, initializer=_init_worker)
+    written = []
+    try:
+        # results come back in file order; chunksize of 1 balances files of
+        # very different sizes
+        for (file_name, statements), (messages, file_outputs, error) in \
+                zip(files, pool.imap(_run_worker_file, range(len(files)), 1)):
+            _replay(messages)
+            if error is not None:
+                raise error
+            if file_outputs is not None:
+                outputs.update(file_outputs)
+            written.append(os.path.join(dir_out, output_file_name(os.path.basename(file_name))))
+    finally:
+        pool.terminate()
+        pool.join()
+        _worker_state.pop('files', None)
+        _worker_state.pop('settings', None)
+    return written
@@ -0,0 +1,238 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+"""
+Replaces the .PARAM and .GLOBAL_PARAM values that are constants by their
+numeric values before the translated files are written, so the simulator
+does not evaluate long parameter chains when it loads the netlist.  The
+original expression is kept as an inline comment.
+
+The parameters of each NAME_SCOPE_INDEX scope are compiled into a
+ParamEvaluator, which evaluates them in dependency order with memoized
+values.  A scope sees the parameters and functions of the scopes around it,
+and a subcircuit's own parameters hide them.  A value is folded only if it
+does not depend on:
+
+* a parameter swept by .DC, .STEP or a .DATA table
+* a parameter defined more than once in its scope
+* a subcircuit parameter, or a parameter inside a subcircuit that an
+  instance sets, as in Spectre
+* a name the netlist does not define, such as the temperature
+* a random function
+* pow with a fractional exponent, which HSPICE truncates and Xyce does not
+
+Library sections that are not selected are left alone, as their values
+depend on where they are selected from.
+"""
+
+
+import logging
+import math
+import re
+from collections import ChainMap
+
+from xdm import Types
+from xdm.expr.expr_utils import new_param_evaluator
+from xdm.statements.commands import Command
+from xdm.statements.nodes.devices.Device import Device
+
+PARAM_COMMANDS = (".PARAM", ".GLOBAL_PARAM")
+
+_number = re.compile(r'^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?[a-zA-Z]*$')
+_identifier = re.compile(r'[A-Za-z_][A-Za-z0-9_.]*')
+
+
+def _format_value(value):
+    text = repr(value)
+    return text[:-2] if text.endswith(".0") else text
+
+
+def _swept_names(commands, normalize):
+    """
+    Names of the parameters swept by an analysis or a .DATA table
+    """
+    swept = set()
+    for command in commands:
+        sweep = command.get_prop(Types.sweep)
+        if sweep is not None:
+            for sweep_entry in sweep.sweep_list:
+                swept.add(normalize(str(sweep_entry.sweep_variable_name)))
+        if command.command_type == ".DATA":
+            for value in command.get_prop(Types.valueList) or []:
+                swept.add(normalize(str(value)))
+    return swept
+
+
+def _walk_scopes(scope):
+    """
+    Scopes of the netlist, outer scopes first, without the library sections
+    that are not selected
+    """
+    yield scope
+    for child in scope.children:
+        if child.lib_command is None:
+            for descendant in _walk_scopes(child):
+                yield descendant
+
+
+class _ScopeParams(object):
+    """
+    The .PARAM, .GLOBAL_PARAM and .FUNC commands of a scope
+    """
+
+    def __init__(self, scope):
+        self.scope = scope
+        self.params = []
+        self.functions = []
+
+
+def _scope_params(top, commands, normalize):
+    """
+    Returns a _ScopeParams per scope, outer scopes first, and the names of
+    the parameters set by subcircuit instances.  A command merged into an
+    outer scope, as a library section selected after it was read, is in the
+    outermost scope it appears in
+    """
+    wanted = set(id(command) for command in commands
+                 if command.command_type in PARAM_COMMANDS or command.command_type == ".FUNC")
+    placed = set()
+    scopes = []
+    instance_params = set()
+    for scope in _walk_scopes(top):
+        scope_params = _ScopeParams(scope)
+        for statement in scope.all_statements_in_scope.values():
+            if isinstance(statement, Device):
+                instance_params.update(normalize(key) for key in statement.get_prop(Types.subcircuitParamsList) or {})
+            if id(statement) not in wanted or id(statement) in placed:
+                continue
+            placed.add(id(statement))
+            if statement.command_type == ".FUNC":
+                scope_params.functions.append(statement)
+            else:
+                scope_params.params.append(statement)
+        scopes.append(scope_params)
+    return scopes, instance_params
+
+
+def fold_params(name_scope_index, lang="hspice", case_insensitive=True):
+    """
+    Folds the constant .PARAM and .GLOBAL_PARAM values of a netlist that has
+    been read.
+
+    Args:
+       name_scope_index (NAME_SCOPE_INDEX): Top scope of the netlist
+       lang (str): Expression dialect, "hspice" or "spectre"
+       case_insensitive (bool): Whether names are case insensitive
+
+    Returns:
+       tuple. (values folded, parameter values looked at)
+    """
+    def normalize(name):
+        name = str(name).strip()
+        return name.upper() if case_insensitive else name
+
+    commands = [command for _, scope_commands in name_scope_index.commands_index for command in scope_commands
+                if isinstance(command, Command)]
+    swept = _swept_names(commands, normalize)
+
+    # name -> value (None if not a constant) and name -> (arguments, body)
+    # of the scopes around a scope
+    visible = {}
+    visible_functions = {}
+    folded = 0
+    total = 0
+    scopes, instance_params = _scope_params(name_scope_index, commands, normalize)
+    for scope_params in scopes:
+        scope = scope_params.scope
+        outer_values = visible.get(id(scope.parent), ChainMap())
+        outer_functions = visible_functions.get(id(scope.parent), ChainMap())
+
+        definitions = {}
+        for command in scope_params.params:
+            for key, expression in (command.get_prop(Types.paramsList) or {}).items():
+                definitions.setdefault(normalize(key), []).append((command, key, expression))
+        functions = {}
+        for command in scope_params.functions:
+            functions[normalize(command.get_prop(Types.funcNameValue))] = (
+                [str(arg) for arg in command.get_prop(Types.funcArgList) or []],
+                str(command.get_prop(Types.funcExpression)))
+
+        hidden = set()
+        if scope.subckt_command is not None:
+            hidden.update(normalize(key) for key in scope.subckt_command.get_prop(Types.subcircuitParamsList) or {})
+            hidden.update(name for name in definitions if name in instance_params)
+
+        evaluator = new_param_evaluator(lang)
+        local_functions = outer_functions.new_child(functions)
+        for name, (args, body) in local_functions.items():
+            evaluator.define_function(name, args, body)
+
+        # the values of the outer scopes are only needed for the names used here
+        used = set()
+        for entries in definitions.values():
+            used.update(_identifier.findall(str(entries[0][2])))
+        for _, body in local_functions.values():
+            used.update(_identifier.findall(body))
+        for name in used:
+            name = normalize(name)
+            if name in outer_values and name not in definitions and name not in hidden:
+                value = outer_values[name]
+                evaluator.define(name, "" if value is None else repr(value))
+
+        constant_names = []
+        for name, entries in definitions.items():
+            if len(entries) > 1 or name in swept or name in hidden:
+                evaluator.define(name, "")
+            else:
+                evaluator.define(name, str(entries[0][2]))
+                constant_names.append(name)
+        # an empty definition is never a constant
+        for name in hidden:
+            evaluator.define(name, "")
+
+        values = dict(zip(constant_names, evaluator.evaluate_params(constant_names)))
+        local_values = dict((name, values.get(name)) for name in definitions)
+        local_values.update((name, None) for name in hidden)
+        visible[id(scope)] = outer_values.new_child(local_values)
+        visible_functions[id(scope)] = local_functions
+
+        total += sum(len(entries) for entries in definitions.values())
+        originals = {}
+        for name in constant_names:
+            value = values[name]
+            command, key, expression = definitions[name][0]
+            if value is None or math.isinf(value) or _number.match(str(expression).strip()):
+                continue
+            command.get_prop(Types.paramsList)[key] = _format_value(value)
+            originals.setdefault(id(command), (command, []))[1].append("%s=%s" % (key, expression))
+            folded += 1
+
+        for command, folded_params in originals.values():
+            comment = "folded by xdm from " + " ".join(folded_params)
+            if command.inline_comment:
+                comment += " " + command.inline_comment.strip()
+            command.inline_comment = comment
+
+    logging.info("Folded %d of %d .PARAM values to constants" % (folded, total))
+    return folded, total
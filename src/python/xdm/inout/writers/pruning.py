@@ -0,0 +1,314 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+"""
+Removes the .MODEL, .SUBCKT and .LIB section definitions that the netlist
+never uses before the translated files are written.
+
+Statements outside any subcircuit or library section are always used.  A
+used statement makes the models and subcircuits it names (device to model,
+X device to subcircuit) and the library sections it selects used, and a used
+subcircuit or section makes the statements in its body used.  A .STEP or
+.DC sweep of a model parameter (MODEL:PARAM or MODEL(PARAM)) uses the
+model, and a sweep that can not be resolved keeps every model.  Names are
+matched case insensitively and without regard to scope, and a used model
+keeps all of its bins (NAME.1, NAME.2, ...), so a definition is only
+removed when no used statement could refer to it.
+"""
+
+
+import logging
+import os
+import re
+from collections import namedtuple
+
+from xdm import Types
+from xdm.inout.readers.CompressedInput import output_file_name
+from xdm.statements.commands import Command
+from xdm.statements.nodes.devices.Device import Device
+from xdm.statements.nodes.models.modeldefs import ModelDef
+from xdm.statements.refs import COMMENT
+from xdm.statements.structures.SWEEP import DATA_SWEEP
+
+PRUNE_REPORT = "xdm_pruned.txt"
+
+PrunedDefinition = namedtuple('PrunedDefinition', ['file', 'line_num', 'kind', 'name', 'statements'])
+
+_model_bin = re.compile(r'^(.+)\.\d+$')
+
+# the model of a swept model parameter, MODEL:PARAM or MODEL(PARAM), with an
+# optional device type before it (NMOS MODEL(PARAM))
+_swept_model = re.compile(r'^(?:\S+\s+)?([^\s:()]+)\s*[:(]')
+
+
+def _model_key(name):
+    """
+    Name of a model with any bin suffix removed
+    """
+    name = str(name).upper()
+    match = _model_bin.match(name)
+    return match.group(1) if match else name
+
+
+def _lib_file(file_name):
+    return output_file_name(os.path.basename(file_name.replace("'", '').replace('"', ''))).upper()
+
+
+class _Block(object):
+    """
+    A .SUBCKT or .LIB section body, or the top level of a file
+    """
+
+    def __init__(self, kind, key, parent, header=None):
+        self.kind = kind
+        self.key = key
+        self.parent = parent
+        self.header = header
+        self.statements = []
+        self.models = []
+        self.children = []
+        self.used = parent is None
+
+    @property
+    def name(self):
+        if self.kind == ".SUBCKT":
+            return self.header.name
+        return self.header.get_prop(Types.libEntry)
+
+
+def _build_blocks(file_name, statements):
+    """
+    Splits the statements of a file into its nested blocks, returns the top
+    level block.  The opening and closing statements of a block belong to it
+    """
+    top = _Block(None, None, None)
+    block = top
+    for statement in statements:
+        command_type = statement.command_type if isinstance(statement, Command) else None
+
+        if command_type == ".SUBCKT":
+            block = _open_block(block, ".SUBCKT", str(statement.name).upper(), statement)
+        elif command_type == ".LIB" and statement.get_prop(Types.fileNameValue) is None \
+                and statement.get_prop(Types.libEntry) is not None:
+            block = _open_block(block, ".LIB", (_lib_file(file_name), str(statement.get_prop(Types.libEntry)).upper()),
+                                statement)
+
+        if isinstance(statement, ModelDef):
+            block.models.append(statement)
+        else:
+            block.statements.append(statement)
+
+        if command_type in (".ENDS", ".ENDL") and block.parent is not None:
+            block = block.parent
+    return top
+
+
+def _open_block(block, kind, key, header):
+    child = _Block(kind, key, block, header)
+    block.children.append(child)
+    return child
+
+
+def _sweep_models(statement):
+    """
+    Returns the names of the models whose parameters a .STEP or .DC
+    statement sweeps, or None if one of its sweeps can not be resolved
+    """
+    sweep = statement.get_prop(Types.sweep)
+    if sweep is None:
+        return []
+    sweep_list = getattr(sweep, 'sweep_list', None)
+    if sweep_list is None:
+        return None
+    models = []
+    for sweep_entry in sweep_list:
+        # a .DATA sweep steps through parameters, not models
+        if isinstance(sweep_entry, DATA_SWEEP):
+            continue
+        name = getattr(sweep_entry, 'sweep_variable_name', None)
+        if name is None:
+            return None
+        match = _swept_model.match(str(name))
+        if match:
+            models.append(_model_key(match.group(1)))
+    return models
+
+
+def _references(statement):
+    """
+    Returns (model names, subcircuit names, library sections) that a
+    statement refers to.  The model names are None when the statement may
+    refer to models that can not be determined
+    """
+    models, subckts, sections = [], [], []
+    if isinstance(statement, Device):
+        model = statement.get_prop(Types.modelName)
+        if model is not None:
+            models.append(_model_key(getattr(model, 'name', model)))
+        subckt = statement.get_prop(Types.subcircuitNameValue)
+        if subckt is not None:
+            subckts.append(str(getattr(subckt, 'name', subckt)).upper())
+        # names not resolved at the end of parsing may still be models or
+        # subcircuits
+        for name in statement.lazy_statements:
+            models.append(_model_key(name))
+            subckts.append(str(name).upper())
+    elif isinstance(statement, Command) and statement.command_type in (".STEP", ".DC"):
+        models = _sweep_models(statement)
+    elif isinstance(statement, Command) and statement.command_type == ".LIB":
+        lib_file = statement.get_prop(Types.fileNameValue)
+        if lib_file is not None and statement.get_prop(Types.libEntry) is not None:
+            sections.append((_lib_file(lib_file), str(statement.get_prop(Types.libEntry)).upper()))
+    return models, subckts, sections
+
+
+def _walk(block):
+    yield block
+    for child in block.children:
+        for descendant in _walk(child):
+            yield descendant
+
+
+def prune_unreachable(files, skipped_lib_sections=()):
+    """
+    Removes the unused definitions from the statements of the files to be
+    written.
+
+    Args:
+       files (list): (source file name, statements) per file, as passed to
+          write_files
+       skipped_lib_sections (list): (file name, LibrarySectionIndex.Section)
+          of the library sections left out when the files were read, which
+          are reported with the definitions removed here
+
+    Returns:
+       tuple. (files with the unused definitions removed, list of
+       PrunedDefinition in file order)
+    """
+    files = [(file_name, list(statements)) for file_name, statements in files]
+    tops = [_build_blocks(file_name, statements) for file_name, statements in files]
+
+    blocks_by_key = {}
+    for top in tops:
+        for block in _walk(top):
+            if block.parent is not None:
+                blocks_by_key.setdefault(block.key, []).append(block)
+
+    used_models = set()
+    keep_all_models = False
+    used_keys = set()
+    pending = list(tops)
+    while pending:
+        block = pending.pop()
+        newly_used = []
+        for statement in block.statements:
+            statement_models, subckts, sections = _references(statement)
+            if statement_models is None:
+                if not keep_all_models:
+                    logging.info("Could not resolve the models swept by the " + statement.command_type +
+                                 " statement at line " + str(statement.line_num) + ". No models are pruned")
+                keep_all_models = True
+            else:
+                used_models.update(statement_models)
+            for key in subckts + sections:
+                if key not in used_keys:
+                    used_keys.add(key)
+                    newly_used.extend(blocks_by_key.get(key, []))
+        # a block is used once its name is used and the block around it is
+        for child in block.children + newly_used:
+            if not child.used and child.parent.used and child.key in used_keys:
+                child.used = True
+                pending.append(child)
+
+    pruned = []
+    kept_files = []
+    for (file_name, statements), top in zip(files, tops):
+        removed = set()
+        file_pruned = []
+        for block in _walk(top):
+            if not block.used:
+                # the blocks inside an unused block go with it
+                if block.parent.used:
+                    block_statements = _block_statements(block)
+                    removed.update(id(statement) for statement in block_statements)
+                    file_pruned.append(PrunedDefinition(file_name, block.header.line_num, block.kind, block.name,
+                                                        len(block_statements)))
+                continue
+            for model in block.models:
+                if not keep_all_models and _model_key(model.name) not in used_models:
+                    removed.add(id(model))
+                    file_pruned.append(PrunedDefinition(file_name, model.line_num, ".MODEL", model.name, 1))
+
+        # a library read more than once may have had a section skipped by one
+        # read and parsed by another
+        parsed_sections = set(block.key[1] for block in _walk(top) if block.kind == ".LIB")
+        for lib_file, section in skipped_lib_sections:
+            if lib_file == file_name and section.name.upper() not in parsed_sections:
+                parsed_sections.add(section.name.upper())
+                file_pruned.append(PrunedDefinition(file_name, section.first_line, ".LIB", section.name,
+                                                    section.statements))
+
+        kept = [statement for statement in statements if id(statement) not in removed]
+        if not kept and statements:
+            kept = [_placeholder(statements[0], file_name)]
+        kept_files.append((file_name, kept))
+        pruned.extend(sorted(file_pruned, key=_line))
+
+    return kept_files, pruned
+
+
+def _block_statements(block):
+    statements = []
+    for descendant in _walk(block):
+        statements.extend(descendant.statements)
+        statements.extend(descendant.models)
+    return statements
+
+
+def _line(definition):
+    line_num = definition.line_num
+    if isinstance(line_num, (list, tuple)):
+        line_num = line_num[0] if line_num else 0
+    return line_num or 0
+
+
+def _placeholder(statement, file_name):
+    """
+    Comment written in place of a file whose definitions were all removed,
+    so the files including it still find it
+    """
+    text = " All definitions in this file are unused and were removed by xdm"
+    return COMMENT({Types.name: text, Types.comment: text}, file_name, statement.line_num, statement.uid)
+
+
+def format_report(pruned):
+    """
+    Formats the removed definitions, one per line
+    """
+    lines = ["* Definitions removed by xdm because the netlist does not use them",
+             "* file\tline\ttype\tname\tstatements"]
+    for definition in pruned:
+        lines.append("%s\t%s\t%s\t%s\t%d" % (os.path.basename(definition.file), _line(definition), definition.kind,
+                                            definition.name, definition.statements))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,228 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#   
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#  
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#   
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+import logging
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Linux ioctl request for cloning a file's extents (reflink)
+FICLONE = 0x40049409
+
+COPY_MODES = ['copy', 'hardlink', 'reflink']
+PWL_FORMATS = ['keep', 'csv']
+
+
+def resolve_pwl_files(pwl_files, search_dirs):
+    """
+    Finds each PWL file name in the first directory of search_dirs that holds
+    it, and removes duplicates: the same file, by resolved (real) path,
+    referenced by the same base name.  A file is relocated under the base name
+    the netlist references it by, which for a symbolic link is not the base
+    name of the resolved path.
+
+    Args:
+       pwl_files (list): PWL file names, as they appear in the netlist
+       search_dirs (list): Directories to search, in order of preference
+
+    Returns:
+       tuple. (list of (resolved source path, base name) in first-seen
+       order, list of file names that could not be found)
+    """
+    sources = []
+    missing = []
+    seen = set()
+    for pwl_file in pwl_files:
+        pwl_file = pwl_file.replace('"', '')
+        for search_dir in search_dirs:
+            candidate = os.path.join(search_dir, pwl_file)
+            try:
+                if not os.path.isfile(candidate):
+                    continue
+            except OSError:
+                continue
+            source = (os.path.realpath(candidate), os.path.basename(pwl_file))
+            if source not in seen:
+                seen.add(source)
+                sources.append(source)
+            break
+        else:
+            missing.append(pwl_file)
+    return sources, missing
+
+
+def _csv_line(line):
+    fields = line.split()
+    if len(fields) == 2 and not line.lstrip().startswith(('*', '#', ';')):
+        return fields[0] + ',' + fields[1] + '\n'
+    return line
+
+
+def convert_to_csv(src, dst):
+    """
+    Streams a whitespace separated PWL file into the comma separated
+    form, one time/value pair per line.  Comment lines and lines that are
+    already comma separated are written unchanged.
+    """
+    with open(src, 'r') as in_file, open(dst, 'w') as out_file:
+        lines = []
+        for line in in_file:
+            lines.append(_csv_line(line))
+            if len(lines) >= 8192:
+                out_file.write(''.join(lines))
+                lines = []
+        out_file.write(''.join(lines))
+
+
+def _reflink(src, dst):
+    import fcntl
+    with open(src, 'rb') as in_file, open(dst, 'wb') as out_file:
+        fcntl.ioctl(out_file.fileno(), FICLONE, in_file.fileno())
+
+
+def _relocate_one(src, base_name, dir_out, mode, pwl_format):
+    dst = os.path.join(dir_out, base_name)
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        return os.path.getsize(src)
+
+    if pwl_format == 'csv':
+        convert_to_csv(src, dst)
+        return os.path.getsize(dst)
+
+    if mode != 'copy':
+        try:
+            if os.path.lexists(dst):
+                os.remove(dst)
+            if mode == 'hardlink':
+                os.link(src, dst)
+            else:
+                _reflink(src, dst)
+            return os.path.getsize(dst)
+        except (OSError, ImportError) as e:
+            # links are not allowed across devices or on every file system,
+            # fall back on a plain copy
+            logging.debug('Could not ' + mode + ' ' + src + ' (' + str(e) + '), copying it instead')
+    shutil.copyfile(src, dst)
+    shutil.copymode(src, dst)
+    return os.path.getsize(dst)
+
+
+def relocate_pwl_files(pwl_files, search_dirs, dir_out, mode='copy', pwl_format='keep', workers=None):
+    """
+    Copies (or links) the PWL files referenced by a translation into the
+    output directory.  Files are found through search_dirs, de-duplicated by
+    resolved path and relocated concurrently on a thread pool.  Warnings are
+    reported in the order the files were referenced, whatever order the
+    copies finish in.
+
+    Args:
+       pwl_files (list): PWL file names, as they appear in the netlist
+       search_dirs (list): Directories to search, in order of preference
+       dir_out (str): Output directory
+       mode (str): One of 'copy', 'hardlink' or 'reflink'.  Links fall back
+          on a copy where they are not allowed
+       pwl_format (str): 'keep' to relocate files unchanged, 'csv' to
+          convert whitespace separated pairs to comma separated pairs
+       workers (int): Number of copy threads, None for the default
+
+    Returns:
+       dict. Statistics for the stage: files, bytes, seconds, files_per_sec
+       and bytes_per_sec
+    """
+    start = time.time()
+    sources, missing = resolve_pwl_files(pwl_files, search_dirs)
+    for pwl_file in missing:
+        logging.warning('Could not find file ' + pwl_file)
+
+    targets = {}
+    for src, base_name in sources:
+        if base_name in targets:
+            logging.warning('PWL files ' + targets[base_name] + ' and ' + src +
+                            ' have the same name. Only ' + targets[base_name] + ' was copied')
+        else:
+            targets[base_name] = src
+    sources = [(src, base_name) for src, base_name in sources if targets[base_name] == src]
+
+    total_bytes = 0
+    copied = 0
+    if sources:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_relocate_one, src, base_name, dir_out, mode, pwl_format)
+                       for src, base_name in sources]
+            for (src, _), future in zip(sources, futures):
+                try:
+                    total_bytes += future.result()
+                    copied += 1
+                except OSError as e:
+                    logging.warning('Could not copy file ' + src + ': ' + str(e))
+
+    elapsed = time.time() - start
+    stats = {'files': copied,
+             'bytes': total_bytes,
+             'seconds': elapsed,
+             'files_per_sec': copied / elapsed if elapsed > 0 else 0.0,
+             'bytes_per_sec': total_bytes / elapsed if elapsed > 0 else 0.0}
+    if copied:
+        logging.info('Relocated %d PWL file(s), %d bytes in %.3f s (%.1f files/s, %.1f MB/s)' %
+                     (copied, total_bytes, elapsed, stats['files_per_sec'], stats['bytes_per_sec'] / 1e6))
+    return stats
+
+
+def read_pwl_files(pwl_files, search_dirs, pwl_format='keep'):
+    """
+    Reads the PWL files referenced by a translation into memory, for
+    translations that do not write an output directory.  Files are found and
+    reported as in relocate_pwl_files.
+
+    Args:
+       pwl_files (list): PWL file names, as they appear in the netlist
+       search_dirs (list): Directories to search, in order of preference
+       pwl_format (str): 'keep' or 'csv', see relocate_pwl_files
+
+    Returns:
+       dict. File contents (bytes) by base name
+    """
+    sources, missing = resolve_pwl_files(pwl_files, search_dirs)
+    for pwl_file in missing:
+        logging.warning('Could not find file ' + pwl_file)
+
+    contents = {}
+    targets = {}
+    for src, base_name in sources:
+        if base_name in targets:
+            logging.warning('PWL files ' + targets[base_name] + ' and ' + src +
+                            ' have the same name. Only ' + targets[base_name] + ' was copied')
+            continue
+        targets[base_name] = src
+        try:
+            if pwl_format == 'csv':
+                with open(src, 'r') as in_file:
+                    contents[base_name] = ''.join(_csv_line(line) for line in in_file).encode('utf-8')
+            else:
+                with open(src, 'rb') as in_file:
+                    contents[base_name] = in_file.read()
+        except (OSError, UnicodeDecodeError) as e:
+            logging.warning('Could not copy file ' + src + ': ' + str(e))
+    return contents
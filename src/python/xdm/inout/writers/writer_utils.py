@@ -22,9 +22,9 @@
 
 import logging
 import os
-import re
 
 from xdm import Types
+from xdm.expr.Expression import Expression
 from xdm.statements.nodes.devices import Device
 from xdm.statements.commands import Command
 
@@ -360,12 +360,11 @@ def interfaceNodeList(c, obj, d, lang, delimiter=' '):
 
 
 def outputVariableList(c, obj, d, lang, delimiter=' '):
-    return_string = ''
+    # joined in one pass, an aggregated .PRINT line can have a very large
+    # number of variables
     if obj.props.get(Types.outputVariableList):
-        for variable in obj.props[Types.outputVariableList]:
-            return_string += variable
-            return_string += delimiter
-    return return_string.strip()
+        return delimiter.join(obj.props[Types.outputVariableList]).strip()
+    return ''
 
 
 def initialConditionsList(c, obj, d, lang, delimiter=' '):
@@ -577,8 +576,11 @@ def handle_output_variables(ws, target_lang_conflict_dict, source_lang_specials_
     return convBool, unsupported_vars
 
 def token_conversion(item, target_lang_conflict_dict, source_lang_specials_dict):
-    item_fields = re.split("(\*|/|\+|-|\(|\)| |'|\[|\]|\{|\})", item)
+    # an Expression from the reader has been tokenized already
+    item = Expression.of(item)
+    item_fields = item.fields
     converted_item_fields = []
+    converted = False
     convBool = True
     master_convBool = True
     unsupported_var = ""
@@ -608,7 +610,11 @@ def token_conversion(item, target_lang_conflict_dict, source_lang_specials_dict)
 
             converted_item_field = source_lang_specials_dict[item_field_lower]
 
+        converted = converted or converted_item_field != item_field
         converted_item_fields.append(converted_item_field)
 
-    converted_item = ''.join(converted_item_fields)
+    if not converted:
+        return master_convBool, unsupported_var, conflicting_var, item
+
+    converted_item = Expression(''.join(converted_item_fields))
     return master_convBool, unsupported_var, conflicting_var, converted_item
@@ -20,6 +20,8 @@
 #   If not, see <http://www.gnu.org/licenses/>.
 #-------------------------------------------------------------------------
 
+import os
+
 from xdm.inout.xml.XmlDeviceModel import XmlDeviceModel
 from xdm.inout.xml.XmlDeviceParam import XmlDeviceParam
 from xdm.inout.xml.XmlDeviceToken import XmlDeviceToken
@@ -32,6 +34,9 @@ from xdm.inout.xml.XmlWriter import XmlWriter
 
 import XdmRapidXmlReader
 
+# factories already read by read_xml_factory, by absolute XML file path
+_read_factories = {}
+
 
 class XmlIgnoreParamList(object):
     def __init__(self, name_list):
@@ -219,3 +224,21 @@ def create_writer(writerTokenList, nameLevelTuple):
         token_list.append(newToken)
     xml_writer = XmlWriter(token_list)
     return xml_writer
+
+
+def read_xml_factory(xml_file):
+    """
+    Returns an XmlFactory that has read xml_file.  Each file is read once per
+    process; later calls, including the language switches inside a netlist,
+    share the same language definition.
+
+    :param xml_file: path of the XML language definition
+    :return: XmlFactory
+    """
+    key = os.path.abspath(xml_file)
+    factory = _read_factories.get(key)
+    if factory is None:
+        factory = XmlFactory(xml_file)
+        factory.read()
+        _read_factories[key] = factory
+    return factory
@@ -21,7 +21,7 @@
 #-------------------------------------------------------------------------
 
 
-from xdm.inout.xml.XmlFactory import XmlFactory
+from xdm.inout.xml.XmlFactory import XmlFactory, read_xml_factory
 from xdm.inout.xml.XmlDeviceType import XmlDeviceType
 from xdm.inout.xml.XmlDirectiveType import XmlDirectiveType
 from xdm.inout.xml.XmlLanguageDefinition import XmlLanguageDefinition
@@ -0,0 +1,180 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#   
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#  
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#   
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+import functools
+import json
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+class Profiler(object):
+    """
+    Collects wall and CPU time per translation phase, along with counters
+    for events on the hot paths (lines, tokens, devices, ...).
+
+    Phases are timed inclusively: a phase that runs inside another phase is
+    counted in both.  Functions are usually profiled by wrapping them with
+    wrap() or instrument(), so that nothing is added to a run that was not
+    asked to be profiled.
+
+    Member variables:
+        phases (OrderedDict of phase name to [calls, wall seconds, cpu seconds])
+        counters (OrderedDict of counter name to int)
+    """
+
+    def __init__(self):
+        self._phases = OrderedDict()
+        self._counters = OrderedDict()
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.process_time()
+
+    @property
+    def phases(self):
+        return self._phases
+
+    @property
+    def counters(self):
+        return self._counters
+
+    def add_time(self, name, wall, cpu, calls=1):
+        entry = self._phases.get(name)
+        if entry is None:
+            entry = [0, 0.0, 0.0]
+            self._phases[name] = entry
+        entry[0] += calls
+        entry[1] += wall
+        entry[2] += cpu
+
+    def count(self, name, n=1):
+        self._counters[name] = self._counters.get(name, 0) + n
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Context manager that times the enclosed block as the phase name
+        """
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - wall, time.process_time() - cpu)
+
+    def wrap(self, func, name, key=None, counter=None):
+        """
+        Returns func wrapped so that each call is timed as the phase name.
+
+        Args:
+           func (function): Function to time
+           name (str): Phase name
+           key (function): Optional, called with the arguments of func and
+              returns a sub-phase label; the call is then timed as
+              "name: label"
+           counter (str): Optional counter incremented once per call
+        """
+        profiler = self
+
+        @functools.wraps(func)
+        def profiled(*args, **kwargs):
+            phase_name = name
+            if key is not None:
+                phase_name = name + ": " + str(key(*args, **kwargs))
+            if counter is not None:
+                profiler.count(counter)
+            wall = time.perf_counter()
+            cpu = time.process_time()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.add_time(phase_name, time.perf_counter() - wall, time.process_time() - cpu)
+
+        return profiled
+
+    def instrument(self, owner, attr, name, key=None, counter=None):
+        """
+        Replaces owner.attr (a class or module attribute) by its wrapped
+        version.  See wrap().
+        """
+        setattr(owner, attr, self.wrap(getattr(owner, attr), name, key, counter))
+
+    def timed_iter(self, iterable, name, counter=None):
+        """
+        Returns an iterator over iterable that times each step as the phase name
+        """
+        iterator = iter(iterable)
+        while True:
+            wall = time.perf_counter()
+            cpu = time.process_time()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add_time(name, time.perf_counter() - wall, time.process_time() - cpu)
+                return
+            self.add_time(name, time.perf_counter() - wall, time.process_time() - cpu)
+            if counter is not None:
+                self.count(counter)
+            yield item
+
+    def report(self):
+        """
+        Returns the collected profile as a dictionary suitable for JSON output
+        """
+        phases = OrderedDict()
+        for name, (calls, wall, cpu) in self._phases.items():
+            phases[name] = OrderedDict([("calls", calls), ("wall", wall), ("cpu", cpu)])
+
+        return OrderedDict([("total", OrderedDict([("wall", time.perf_counter() - self._start_wall),
+                                                    ("cpu", time.process_time() - self._start_cpu)])),
+                            ("phases", phases),
+                            ("counters", OrderedDict(self._counters))])
+
+    def write_json(self, file_name, extra=None):
+        """
+        Writes the report to file_name.  Entries of the dictionary extra (e.g.,
+        version, input file) are added at the top level of the report.
+        """
+        report = OrderedDict()
+        if extra:
+            report.update(extra)
+        report.update(self.report())
+        with open(file_name, 'w') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+
+    def format_report(self):
+        """
+        Returns the report as a human readable table
+        """
+        report = self.report()
+        lines = ["=== xdm profile (inclusive times): \n",
+                 "    %-52s %10s %12s %12s" % ("phase", "calls", "wall (s)", "cpu (s)")]
+        for name, entry in report["phases"].items():
+            lines.append("    %-52s %10d %12.4f %12.4f" % (name[:52], entry["calls"], entry["wall"], entry["cpu"]))
+        lines.append("    %-52s %10s %12.4f %12.4f" % ("total", "", report["total"]["wall"], report["total"]["cpu"]))
+        lines.append("")
+        lines.append("    %-52s %10s" % ("counter", "count"))
+        for name, value in report["counters"].items():
+            lines.append("    %-52s %10d" % (name[:52], value))
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,116 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#   
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#  
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#   
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+import functools
+import os
+
+import xdm.inout.readers.XDMFactory as XDMFactory
+from xdm.expr import expr_utils
+from xdm.index.NAME_SCOPE_INDEX import NAME_SCOPE_INDEX
+from xdm.inout.readers.GenericReader import GenericReader
+from xdm.inout.readers.GenericReaderState import GenericReaderState
+from xdm.inout.readers.HSPICENetlistBoostParserInterface import HSPICENetlistBoostParserInterface
+from xdm.inout.readers.PSPICENetlistBoostParserInterface import PSPICENetlistBoostParserInterface
+from xdm.inout.readers.SpectreNetlistBoostParserInterface import SpectreNetlistBoostParserInterface
+from xdm.inout.readers.TSPICENetlistBoostParserInterface import TSPICENetlistBoostParserInterface
+from xdm.inout.readers.XyceNetlistBoostParserInterface import XyceNetlistBoostParserInterface
+from xdm.inout.writers.Writer import Writer
+from xdm.inout.xml import XmlFactory
+from xdm.statements.nodes.devices import Device
+
+parser_interfaces = [HSPICENetlistBoostParserInterface,
+                     PSPICENetlistBoostParserInterface,
+                     SpectreNetlistBoostParserInterface,
+                     TSPICENetlistBoostParserInterface,
+                     XyceNetlistBoostParserInterface]
+
+
+def _statement_type(reader, parsed_netlist_line, *args, **kwargs):
+    if parsed_netlist_line.type:
+        return parsed_netlist_line.type
+    return "(untyped)"
+
+
+def _instrument_parser_interface(profiler, interface):
+    original_init = interface.__init__
+
+    @functools.wraps(original_init)
+    def profiled_init(self, filename, *args, **kwargs):
+        with profiler.phase("Boost open: " + os.path.basename(filename)):
+            original_init(self, filename, *args, **kwargs)
+        self.line_iter = profiler.timed_iter(self.line_iter, "Boost parse: " + os.path.basename(filename),
+                                             counter="lines")
+
+    interface.__init__ = profiled_init
+    profiler.instrument(interface, "convert_next_token", "convert_next_token", counter="tokens")
+
+
+def _instrument_node_lookups(profiler):
+    original_get_enode = NAME_SCOPE_INDEX.get_enode
+
+    @functools.wraps(original_get_enode)
+    def counted_get_enode(self, name):
+        node = original_get_enode(self, name)
+        if node is None:
+            profiler.count("node table misses")
+        else:
+            profiler.count("node table hits")
+        return node
+
+    NAME_SCOPE_INDEX.get_enode = counted_get_enode
+
+
+def instrument_translation(profiler):
+    """
+    Wraps the hot paths of a translation so that they report to profiler.
+    This changes the classes and modules involved for the rest of the
+    process, so it should only be called for a profiled run.
+
+    Args:
+       profiler (Profiler): Profiler that collects the timings and counts
+    """
+    profiler.instrument(XmlFactory, "read", "XML load")
+
+    for interface in parser_interfaces:
+        _instrument_parser_interface(profiler, interface)
+
+    profiler.instrument(GenericReader, "read", "read file (incl. nested files)")
+    profiler.instrument(GenericReader, "read_line", "read_line", key=_statement_type, counter="statements read")
+    profiler.instrument(XDMFactory, "build_device", "build device", counter="devices")
+    profiler.instrument(XDMFactory, "build_model", "build model", counter="models")
+    profiler.instrument(XDMFactory, "build_directive", "build directive", counter="directives")
+    profiler.instrument(expr_utils, "find_expr_components", "expression parse", counter="expression parses")
+
+    profiler.instrument(GenericReaderState, "resolve_unknown_pnl", "unknown PNL resolution")
+    profiler.instrument(GenericReaderState, "resolve_unknown_source", "unknown PNL resolution")
+    profiler.instrument(Device, "resolve_lazy_bind", "lazy binding", counter="lazy binds")
+    profiler.instrument(Device, "resolve_control_device_list", "control device resolution")
+
+    profiler.instrument(Writer, "write_objects", "write file", counter="files written")
+    profiler.instrument(Writer, "write_object", "writer emission", counter="statements written")
+    profiler.instrument(Writer, "combine_print", "post-pass: combine_print")
+    profiler.instrument(Writer, "combine_options", "post-pass: combine_options")
+    profiler.instrument(Writer, "combine_temperatures", "post-pass: combine_temperatures")
+
+    _instrument_node_lookups(profiler)
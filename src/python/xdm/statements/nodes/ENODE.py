@@ -21,13 +21,60 @@
 #-------------------------------------------------------------------------
 
 
+from collections import OrderedDict
+
+from xdm import Types
 from xdm.statements import Statement
 
 
 class ENODE(Statement):
     """
     ENODE represents an electrical node in a circuit.
+
+    Nodes are held by the NODE_TABLE of their scope, and an ENODE is only a
+    light view over a table entry: its props and params dictionaries are not
+    built until they are first used.
     """
+    _inline_comment = None
+    _st_language = None
+    _node_lazy_statements = None
+    _node_amb_types = None
+
     def __init__(self, name, uid):
-        Statement.__init__(self, None, None, uid, name) # None as file number and uid
+        # Statement.__init__ is deliberately not called, see the properties below
+        self._fl = None
+        self._line_num = None
+        self._uid = uid
+        self._node_name = name
+        self._node_props = None
+        self._node_params = None
+
+    @property
+    def name(self):
+        return self._node_name
+
+    @property
+    def _props(self):
+        if self._node_props is None:
+            self._node_props = OrderedDict()
+            self._node_props[Types.name] = self._node_name
+            self._node_props[Types.statementType] = "__ENODE__"
+        return self._node_props
+
+    @property
+    def _params(self):
+        if self._node_params is None:
+            self._node_params = OrderedDict()
+        return self._node_params
+
+    @property
+    def _lazy_statements(self):
+        if self._node_lazy_statements is None:
+            self._node_lazy_statements = {}
+        return self._node_lazy_statements
 
+    @property
+    def _amb_types(self):
+        if self._node_amb_types is None:
+            self._node_amb_types = {}
+        return self._node_amb_types
@@ -0,0 +1,84 @@
+#-------------------------------------------------------------------------
+#   Copyright 2002-2020 National Technology & Engineering Solutions of
+#   Sandia, LLC (NTESS).  Under the terms of Contract DE-NA0003525 with
+#   NTESS, the U.S. Government retains certain rights in this software.
+#
+#   This file is part of the Xyce(TM) XDM Netlist Translator.
+#   
+#   Xyce(TM) XDM is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#  
+#   Xyce(TM) XDM is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#   
+#   You should have received a copy of the GNU General Public License
+#   along with the Xyce(TM) XDM Netlist Translator.
+#   If not, see <http://www.gnu.org/licenses/>.
+#-------------------------------------------------------------------------
+
+
+
+class POINTS(object):
+    """
+    A compact container for the (x, y) points of PWL sources and TABLE
+    expressions.  The original tokens are kept interleaved in a single flat
+    list, x0, y0, x1, y1, ..., rather than as one tuple per point, and are
+    written out with a single join instead of repeated concatenation.
+
+    Iterating over POINTS, or indexing it, gives (x, y) tuples so it can be
+    used wherever a list of pairs was used before.
+    """
+
+    def __init__(self, tokens=None):
+        if tokens is None:
+            self._tokens = []
+        else:
+            # an unpaired trailing token has no point to belong to
+            self._tokens = list(tokens[:len(tokens) - len(tokens) % 2])
+
+    @property
+    def tokens(self):
+        return self._tokens
+
+    def append(self, x, y):
+        self._tokens.append(x)
+        self._tokens.append(y)
+
+    def __len__(self):
+        return len(self._tokens) // 2
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if i < 0 or 2 * i >= len(self._tokens):
+            raise IndexError("point index out of range")
+        return self._tokens[2 * i], self._tokens[2 * i + 1]
+
+    def __setitem__(self, i, pair):
+        if i < 0:
+            i += len(self)
+        if i < 0 or 2 * i >= len(self._tokens):
+            raise IndexError("point index out of range")
+        self._tokens[2 * i] = pair[0]
+        self._tokens[2 * i + 1] = pair[1]
+
+    def __iter__(self):
+        tokens = iter(self._tokens)
+        return zip(tokens, tokens)
+
+    def join(self, delimiter=' '):
+        """
+        Returns all of the tokens, in order, separated by delimiter
+        """
+        return delimiter.join(self._tokens)
+
+    def join_pairs(self, pair_format, delimiter=' '):
+        """
+        Returns every point formatted with pair_format (e.g., '(%s,%s)'),
+        separated by delimiter
+        """
+        return delimiter.join([pair_format % pair for pair in self])
@@ -22,6 +22,7 @@
 
 
 from xdm.inout.writers.writer_utils import replace_inner_curly_braces
+from xdm.statements.structures.POINTS import POINTS
 
 
 class TABLE(object):
@@ -49,7 +50,12 @@ class TABLE(object):
     def __init__(self, table_expression, table_pairs):
         # TODO: link this to an actual expression object
         self._table_expression = table_expression
-        self._table_pairs = table_pairs
+        if isinstance(table_pairs, POINTS):
+            self._table_pairs = table_pairs
+        else:
+            self._table_pairs = POINTS()
+            for table_pair in table_pairs:
+                self._table_pairs.append(table_pair[0], table_pair[1])
 
     @property
     def table_expression(self):
@@ -60,25 +66,13 @@ class TABLE(object):
         return self._table_pairs
 
     def spice_string(self, delimiter=' '):
-        formatted_pairs = ''
-
-        for table_pair in self._table_pairs:
-            formatted_pair = ''
-            formatted_pair += '('
-            formatted_pair += table_pair[0]
-            formatted_pair += ','
-            formatted_pair += table_pair[1]
-            formatted_pair += ')'
-            formatted_pair += delimiter
-            formatted_pairs += formatted_pair
-
-        formatted_pairs = formatted_pairs
+        formatted_pairs = self._table_pairs.join_pairs('(%s,%s)', delimiter)
 
         return_string = ''
         return_string += 'TABLE'
         return_string += delimiter
         return_string += replace_inner_curly_braces(self._table_expression)
         return_string += '='
-        return_string += formatted_pairs.strip()
+        return_string += formatted_pairs
 
         return return_string
@@ -23,10 +23,10 @@
 
 from collections import OrderedDict
 from os.path import basename
-from copy import deepcopy
 
 from xdm.exceptions import InvalidParametersException
 from xdm.exceptions import InvalidTypeException
+from xdm.statements.structures.POINTS import POINTS
 
 transient_value_map = {"PULSE": ["I1", "I2", "TD", "TR", "TF", "PW", "PER"],
                        "SIN": ["I0", "IA", "FREQ", "TD", "THETA", "PHASE"],
@@ -54,6 +54,7 @@ class TRANSIENT(object):
             raise InvalidTypeException(trans_type + " is not a valid type of transient")
         self._transType = trans_type.upper()
         self._transParams = OrderedDict()
+        self._pwl_file_index = None
 
     @property
     def trans_type(self):
@@ -69,9 +70,11 @@ class TRANSIENT(object):
         # PWL plays by different rules - you can get pairs of values instead of expecting a
         # fixed number of values
         if self._transType == "PWL":
-            # must come in pairs, creates list of pairs
-            param_list = [(x,y) for x, y in zip(trans_list[::2], trans_list[1::2])]
-            self._transParams = deepcopy(param_list)
+            # must come in pairs, kept as a flat list of the original tokens
+            self._transParams = POINTS(trans_list)
+            for i, trans_param in enumerate(self._transParams):
+                if trans_param[0].upper() == "FILE":
+                    self._pwl_file_index = i
         else:
             self._transParams = OrderedDict()
 
@@ -92,20 +95,12 @@ class TRANSIENT(object):
         return_string = ''
         params_string = ''
         if self._transType == "PWL":
-            file_bool = False
+            file_bool = self._pwl_file_index is not None
 
-            for pair in self._transParams:
-                if pair[0].upper() == "FILE":
-                    file_bool = True
-
-            for pair in self._transParams:
-                params_string += pair[0]
-                params_string += delimiter
-                if file_bool:
-                    params_string += '"' + pair[1] + '"'
-                else:
-                    params_string += pair[1]
-                params_string += delimiter
+            if file_bool:
+                params_string = self._transParams.join_pairs('%s' + delimiter + '"%s"', delimiter)
+            else:
+                params_string = self._transParams.join(delimiter)
 
             return_string += self._transType.strip()
             if file_bool:
@@ -131,15 +126,11 @@ class TRANSIENT(object):
     @property
     def pwl_file(self):
         if self._transType == "PWL":
-            found_file = None
-            for i, trans_param in enumerate(self._transParams):
-                if trans_param[0].upper() == "FILE":
-                    found_file = (trans_param[1], i)
-                    # trans_param = (trans_param[0], basename(trans_param[1]))
-            if found_file:
-                self._transParams[found_file[1]] = (
-                    self._transParams[found_file[1]][0], basename(self._transParams[found_file[1]][1].replace('"', '')))
-                return found_file[0]
+            if self._pwl_file_index is not None:
+                found_file = self._transParams[self._pwl_file_index]
+                self._transParams[self._pwl_file_index] = (found_file[0],
+                                                           basename(found_file[1].replace('"', '')))
+                return found_file[1]
         return None
 
     # The following code likely will be useful in the formulation of properties, but
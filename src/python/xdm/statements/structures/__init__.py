@@ -24,6 +24,7 @@
 from xdm.statements.structures.AC import AC
 from xdm.statements.structures.DC import DC
 from xdm.statements.structures.IC import IC
+from xdm.statements.structures.POINTS import POINTS
 from xdm.statements.structures.POLY import POLY
 from xdm.statements.structures.SCHEDULE import SCHEDULE
 from xdm.statements.structures.SWEEP import SWEEP